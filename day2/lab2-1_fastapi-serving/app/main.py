@@ -9,9 +9,11 @@ Endpoints:
     - GET  /health     : Health check
     - POST /predict    : 단일 예측
     - POST /predict/batch : 배치 예측
+    - POST /predict/batch/columnar : 컬럼형 배치 예측 (대용량 배치용)
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import List
 import joblib
@@ -38,6 +40,8 @@ app = FastAPI(
 # 모델 로드
 MODEL_PATH = Path(__file__).parent.parent / "model.joblib"
 IRIS_SPECIES = {0: "setosa", 1: "versicolor", 2: "virginica"}
+IRIS_SPECIES_NAMES = np.array([IRIS_SPECIES[i] for i in sorted(IRIS_SPECIES)])
+FEATURE_MIN, FEATURE_MAX = 0.0, 10.0
 
 try:
     logger.info(f"모델 로드 시도: {MODEL_PATH}")
@@ -115,6 +119,21 @@ class BatchPredictionResponse(BaseModel):
     predictions: List[PredictionResponse]
 
 
+class ColumnarBatchRequest(BaseModel):
+    """컬럼형 배치 예측 입력 모델"""
+    instances: List[List[float]] = Field(
+        ...,
+        description="샘플별 [sepal_length, sepal_width, petal_length, petal_width]",
+        example=[[5.1, 3.5, 1.4, 0.2], [6.7, 3.0, 5.2, 2.3]]
+    )
+
+
+class ColumnarBatchResponse(BaseModel):
+    """컬럼형 배치 예측 결과 모델 (샘플별 객체 없이 병렬 배열)"""
+    predictions: List[str] = Field(..., description="예측된 Iris 품종 배열")
+    confidences: List[float] = Field(..., description="예측 신뢰도 배열 (0-1)")
+
+
 class HealthResponse(BaseModel):
     """Health check 응답 모델"""
     status: str
@@ -128,6 +147,30 @@ class InfoResponse(BaseModel):
     model_loaded: bool
 
 
+# ============================================================
+# 추론 헬퍼
+# ============================================================
+
+def predict_with_confidence(input_data: np.ndarray):
+    """
+    predict_proba 한 번으로 품종과 신뢰도 계산
+
+    predict()와 predict_proba()를 각각 호출하면 포레스트를 두 번 순회하므로
+    확률만 계산한 뒤 argmax로 클래스를 구함
+
+    Args:
+        input_data: (n_samples, 4) 입력 배열
+
+    Returns:
+        (품종 이름 배열, 신뢰도 배열)
+    """
+    probabilities = model.predict_proba(input_data)
+    best = probabilities.argmax(axis=1)
+    classes = model.classes_[best]
+    confidences = probabilities[np.arange(len(best)), best]
+    return IRIS_SPECIES_NAMES[classes], confidences
+
+
 # ============================================================
 # API 엔드포인트
 # ============================================================
@@ -198,12 +241,11 @@ async def predict(features: IrisFeatures):
         ]])
         
         # 예측
-        prediction = model.predict(input_data)[0]
-        probabilities = model.predict_proba(input_data)[0]
+        species, confidences = predict_with_confidence(input_data)
         
         result = PredictionResponse(
-            prediction=IRIS_SPECIES[prediction],
-            confidence=float(probabilities[prediction])
+            prediction=species[0],
+            confidence=float(confidences[0])
         )
         
         logger.info(
@@ -252,16 +294,13 @@ async def predict_batch(features_list: List[IrisFeatures]):
         ])
         
         # 배치 예측
-        predictions = model.predict(input_data)
-        probabilities = model.predict_proba(input_data)
+        species, confidences = predict_with_confidence(input_data)
         
         # 결과 생성
-        results = []
-        for pred, probs in zip(predictions, probabilities):
-            results.append(PredictionResponse(
-                prediction=IRIS_SPECIES[pred],
-                confidence=float(probs[pred])
-            ))
+        results = [
+            PredictionResponse(prediction=name, confidence=conf)
+            for name, conf in zip(species.tolist(), confidences.tolist())
+        ]
         
         logger.info(f"배치 예측 성공: {len(results)}개 샘플")
         
@@ -275,6 +314,64 @@ async def predict_batch(features_list: List[IrisFeatures]):
         )
 
 
+@app.post("/predict/batch/columnar", response_model=ColumnarBatchResponse)
+async def predict_batch_columnar(request: ColumnarBatchRequest):
+    """
+    컬럼형 배치 예측
+    
+    대용량 배치용 경로. 입력을 한 번에 배열로 변환하고 predict_proba를
+    한 번만 실행하며, 샘플별 응답 객체 없이 병렬 배열로 직렬화
+    
+    Args:
+        request: 샘플별 4개 피처 배열 리스트
+        
+    Returns:
+        품종 배열과 신뢰도 배열
+        
+    Raises:
+        HTTPException: 모델이 로드되지 않은 경우 (503), 입력 오류 (422)
+    """
+    if not MODEL_LOADED:
+        logger.error("컬럼형 배치 예측 요청 실패: 모델이 로드되지 않음")
+        raise HTTPException(
+            status_code=503,
+            detail="Model not loaded. Please check server logs."
+        )
+    
+    # 행 길이가 다르면 (ragged) numpy가 ValueError를 내므로 피처 수 오류로 처리
+    try:
+        input_data = np.asarray(request.instances, dtype=np.float64)
+    except ValueError:
+        input_data = None
+    if input_data is None or input_data.ndim != 2 or input_data.shape[1] != 4:
+        raise HTTPException(
+            status_code=422,
+            detail="Each instance must have exactly 4 features"
+        )
+    if ((input_data < FEATURE_MIN) | (input_data > FEATURE_MAX)).any():
+        raise HTTPException(
+            status_code=422,
+            detail=f"Feature values must be between {FEATURE_MIN} and {FEATURE_MAX}"
+        )
+    
+    try:
+        species, confidences = predict_with_confidence(input_data)
+        logger.info(f"컬럼형 배치 예측 성공: {len(species)}개 샘플")
+        
+        # response_model 검증을 거치지 않고 배열을 그대로 직렬화
+        return JSONResponse({
+            "predictions": species.tolist(),
+            "confidences": confidences.tolist()
+        })
+        
+    except Exception as e:
+        logger.error(f"컬럼형 배치 예측 중 오류 발생: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch prediction error: {str(e)}"
+        )
+
+
 # ============================================================
 # 앱 시작/종료 이벤트
 # ============================================================
@@ -0,0 +1 @@
+"""Tests for the Iris FastAPI serving lab"""
@@ -0,0 +1,88 @@
+"""
+FastAPI 서빙 앱 테스트
+"""
+
+import pytest
+import numpy as np
+
+testclient = pytest.importorskip("fastapi.testclient")
+
+from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
+
+import app.main as main
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """sklearn 내장 Iris 데이터로 학습한 모델을 주입한 클라이언트"""
+    X, y = load_iris(return_X_y=True)
+    model = LogisticRegression(max_iter=500).fit(X, y)
+    monkeypatch.setattr(main, "model", model)
+    monkeypatch.setattr(main, "MODEL_LOADED", True)
+    return testclient.TestClient(main.app)
+
+
+class TestColumnarBatch:
+    """/predict/batch/columnar 엔드포인트 테스트"""
+
+    def test_predict(self, client):
+        """정상 배치 예측 테스트"""
+        instances = [[5.1, 3.5, 1.4, 0.2], [6.7, 3.0, 5.2, 2.3]]
+
+        response = client.post("/predict/batch/columnar", json={"instances": instances})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["predictions"] == ["setosa", "virginica"]
+        assert len(body["confidences"]) == 2
+        assert all(0 < c <= 1 for c in body["confidences"])
+
+    def test_matches_batch_endpoint(self, client):
+        """샘플별 배치 엔드포인트와 같은 결과인지 테스트"""
+        instances = [[5.1, 3.5, 1.4, 0.2], [5.9, 3.0, 4.2, 1.5]]
+        keys = ["sepal_length", "sepal_width", "petal_length", "petal_width"]
+
+        columnar = client.post("/predict/batch/columnar", json={"instances": instances}).json()
+        batch = client.post(
+            "/predict/batch", json=[dict(zip(keys, row)) for row in instances]
+        ).json()
+
+        assert columnar["predictions"] == [p["prediction"] for p in batch["predictions"]]
+        np.testing.assert_allclose(
+            columnar["confidences"], [p["confidence"] for p in batch["predictions"]]
+        )
+
+    def test_ragged_rows(self, client):
+        """행 길이가 다른 입력은 422"""
+        response = client.post(
+            "/predict/batch/columnar", json={"instances": [[1, 2, 3, 4], [1, 2]]}
+        )
+
+        assert response.status_code == 422
+
+    def test_wrong_width(self, client):
+        """피처 수가 4가 아닌 입력은 422"""
+        response = client.post(
+            "/predict/batch/columnar", json={"instances": [[1, 2, 3], [4, 5, 6]]}
+        )
+
+        assert response.status_code == 422
+
+    def test_out_of_range(self, client):
+        """범위를 벗어난 피처 값은 422"""
+        response = client.post(
+            "/predict/batch/columnar", json={"instances": [[1, 2, 3, 11]]}
+        )
+
+        assert response.status_code == 422
+
+    def test_model_not_loaded(self, client, monkeypatch):
+        """모델이 없으면 503"""
+        monkeypatch.setattr(main, "MODEL_LOADED", False)
+
+        response = client.post(
+            "/predict/batch/columnar", json={"instances": [[5.1, 3.5, 1.4, 0.2]]}
+        )
+
+        assert response.status_code == 503
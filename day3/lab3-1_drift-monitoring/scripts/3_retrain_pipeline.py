@@ -105,13 +105,31 @@ def retrain_model(train_size: int, mlflow_uri: str) -> str:
     from sklearn.metrics import mean_absolute_error
     import json
     import os
+    import time
     import uuid
+    import resource
+    from contextlib import contextmanager
+    
+    # 단계별 wall/CPU 시간과 단계 종료 시점의 프로세스 최대 RSS 기록 (파이프라인 지연 원인 추적용)
+    # 컴포넌트는 독립 실행되므로 src.model.profiling.TrainingProfiler와 같은 wall/CPU 메트릭 이름을 인라인으로 기록.
+    # 최대 RSS는 단계마다 초기화하지 않으므로 phase_*_peak_rss_mb와 구분되는 이름 사용
+    phases = {}
+    
+    @contextmanager
+    def phase(name):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        yield
+        phases[f"phase_{name}_wall_s"] = time.perf_counter() - wall_start
+        phases[f"phase_{name}_cpu_s"] = time.process_time() - cpu_start
+        # ru_maxrss는 단계별 값이 아니라 프로세스 시작 이후 최대 RSS (누적)
+        phases[f"phase_{name}_process_peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
     
     print(f"Loading training data...")
     
     # Load data
-    data = fetch_california_housing(as_frame=True)
-    df = data.frame
+    with phase("load"):
+        data = fetch_california_housing(as_frame=True)
+        df = data.frame
     
     # Sample training data
     train_data = df.sample(n=train_size, random_state=42)
@@ -128,11 +146,13 @@ def retrain_model(train_size: int, mlflow_uri: str) -> str:
     # Train model
     print("Training RandomForest model...")
     model = RandomForestRegressor(n_estimators=100, random_state=42)
-    model.fit(X_train, y_train)
+    with phase("train"):
+        model.fit(X_train, y_train)
     
     # Evaluate
-    predictions = model.predict(X_test)
-    mae = mean_absolute_error(y_test, predictions)
+    with phase("evaluate"):
+        predictions = model.predict(X_test)
+        mae = mean_absolute_error(y_test, predictions)
     
     # Model version
     model_version = str(uuid.uuid4())[:8]
@@ -140,6 +160,8 @@ def retrain_model(train_size: int, mlflow_uri: str) -> str:
     print(f"Training Results:")
     print(f"  Model version: {model_version}")
     print(f"  MAE: {mae:.4f}")
+    for name, value in phases.items():
+        print(f"  {name}: {value:.3f}")
     
     # Log to MLflow
     try:
@@ -157,6 +179,7 @@ def retrain_model(train_size: int, mlflow_uri: str) -> str:
         
         with mlflow.start_run(run_name="retrained-model"):
             mlflow.log_metric("mae", mae)
+            mlflow.log_metrics(phases)
             mlflow.log_param("n_estimators", 100)
             mlflow.log_param("train_size", train_size)
             model_version = mlflow.active_run().info.run_id[:8]
@@ -169,6 +192,7 @@ def retrain_model(train_size: int, mlflow_uri: str) -> str:
     result = {
         'model_version': str(model_version),
         'mae': float(mae),
+        'phases': phases,
         'status': 'trained'
     }
     
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 트리 앙상블 양자화
+
+학습된 Random Forest / Gradient Boosting 모델의 분할 경계를 uint8 절단점 인덱스로,
+리프 값을 float16으로 저장하고 검증 세트에서 정확도 변화를 보고합니다.
+(onnxruntime quantize_dynamic은 가중치 행렬만 양자화하므로 트리 앙상블에는 효과가 거의 없음)
+
+사용법:
+    python scripts/10_quantize_model.py --model-path model.joblib --output model_quantized.chm
+    python scripts/10_quantize_model.py --model-path model.joblib --max-cuts 64 --output model_q64.chm
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.model_selection import train_test_split
+
+from src.model.dataset import load_california_housing
+from src.model.trainer import CaliforniaHousingModel
+
+
+def main():
+    parser = argparse.ArgumentParser(description="트리 앙상블 양자화")
+    parser.add_argument("--model-path", required=True, help="학습된 모델 경로")
+    parser.add_argument("--max-cuts", type=int, default=255, help="특성당 최대 절단점 수")
+    parser.add_argument("--val-size", type=float, default=0.5, help="테스트 세트 중 검증 비율")
+    parser.add_argument("--output", required=True, help="양자화 모델 저장 경로 (.chm 권장)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    model = CaliforniaHousingModel.load(args.model_path)
+    dataset = load_california_housing()
+    # 검증 (양자화 비교) / 테스트 (최종 보고)를 나눠 사용
+    X_val, X_test, y_val, y_test = train_test_split(
+        dataset.X_test, dataset.y_test, train_size=args.val_size, random_state=42
+    )
+
+    quantized, report = model.quantize(X_val, y_val, max_cuts=args.max_cuts)
+    test_mae = model.evaluate(X_test, y_test)["mae"]
+    quantized_test_mae = quantized.evaluate(X_test, y_test)["mae"]
+
+    print(f"✅ 트리 {report['n_trees']}개, 노드 {report['n_nodes']}개 양자화")
+    print(f"   크기: {report['original_bytes'] / 2 ** 20:.2f}MB -> "
+          f"{report['quantized_bytes'] / 2 ** 20:.2f}MB ({report['compression_ratio']:.1f}x)")
+    print(f"   분할 일치: {'정확' if report['exact_splits'] else '근사'} "
+          f"(특성별 절단점 최대 {max(report['n_cuts_per_feature'])}개)")
+    print(f"   검증 MAE: {report['val_mae']:.4f} -> {report['quantized_val_mae']:.4f} "
+          f"({report['mae_delta']:+.4f})")
+    print(f"   테스트 MAE: {test_mae:.4f} -> {quantized_test_mae:.4f}")
+
+    quantized.save(args.output)
+    report_path = os.path.splitext(args.output)[0] + ".quantization.json"
+    with open(report_path, "w") as f:
+        json.dump({**report, "test_mae": test_mae, "quantized_test_mae": quantized_test_mae}, f, indent=2)
+    print(f"📁 {args.output}, {report_path}")
+
+
+if __name__ == "__main__":
+    main()
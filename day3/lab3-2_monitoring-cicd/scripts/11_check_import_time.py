@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 서빙 콜드 스타트 import 시간 검사
+
+새 인터프리터에서 `python -X importtime`으로 서빙 진입점 모듈의 import 시간을
+측정하고, 예산을 넘거나 학습/분석 전용 패키지 (sklearn, scipy, pandas 등)가
+읽히면 종료 코드 1로 실패합니다. CI에서 콜드 스타트 회귀를 막는 용도입니다.
+
+사용법:
+    python scripts/11_check_import_time.py
+    python scripts/11_check_import_time.py --budget-ms 500 --top 20
+    python scripts/11_check_import_time.py --module src.model.trainer --allow sklearn
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.serving.coldstart import (
+    DEFAULT_BUDGET_MS,
+    FORBIDDEN_PACKAGES,
+    SERVING_IMPORTS,
+    check_import_budget
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서빙 import 시간 예산 검사")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="허용 import 시간 (ms)")
+    parser.add_argument("--module", action="append", help="측정할 모듈 (기본: 서빙 진입점 모듈)")
+    parser.add_argument("--allow", action="append", default=[], help="금지 목록에서 제외할 패키지")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (가장 빠른 결과 사용)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 느린 모듈 수")
+    args = parser.parse_args()
+
+    modules = args.module or list(SERVING_IMPORTS)
+    forbidden = [p for p in FORBIDDEN_PACKAGES if p not in args.allow]
+    profile, violations = check_import_budget(
+        budget_ms=args.budget_ms, modules=modules, forbidden=forbidden, repeat=args.repeat
+    )
+
+    print(f"📦 {len(profile.modules)}개 모듈, import {profile.total_ms:.1f}ms (예산 {args.budget_ms:.0f}ms)")
+    print("   느린 모듈 (self):")
+    for name, self_ms in profile.slowest(args.top):
+        print(f"   {self_ms:8.1f}ms  {name}")
+
+    if violations:
+        for violation in violations:
+            print(f"❌ {violation}")
+        sys.exit(1)
+    print("✅ 예산 내")
+
+
+if __name__ == "__main__":
+    main()
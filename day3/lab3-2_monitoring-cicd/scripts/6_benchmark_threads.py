@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 추론 스레드 예산 벤치마크
+
+동시 요청 환경에서 기존 설정 (n_jobs=-1)과 스레드 예산 적용 후의
+예측 처리량을 비교합니다. 네트워크 없이 합성 데이터로 실행됩니다.
+
+사용법:
+    python scripts/6_benchmark_threads.py --concurrency 8 --requests 400
+    python scripts/6_benchmark_threads.py --workers 2 --batch-size 16
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.trainer import CaliforniaHousingModel
+from src.serving.threads import apply_thread_budget, plan_thread_budget, set_estimator_n_jobs
+
+
+def build_model(n_estimators):
+    """합성 데이터로 기본 설정 (n_jobs=-1) Random Forest 학습"""
+    rng = np.random.RandomState(42)
+    X = rng.rand(5000, 8)
+    y = X @ rng.rand(8) + rng.randn(5000) * 0.1
+
+    model = CaliforniaHousingModel(model_type="random_forest")
+    model.model_params["n_estimators"] = n_estimators
+    model.train(X, y)
+    return model, X
+
+
+def measure_throughput(model, X, concurrency, n_requests, batch_size):
+    """동시 요청으로 예측 처리량 측정 (requests/sec, p99 ms)"""
+    rng = np.random.RandomState(0)
+    batches = [
+        X[rng.randint(0, len(X), size=batch_size)] for _ in range(n_requests)
+    ]
+    latencies = []
+
+    def call(batch):
+        start = time.perf_counter()
+        model.predict(batch)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(call, batches))
+    elapsed = time.perf_counter() - start
+
+    return n_requests / elapsed, float(np.percentile(latencies, 99))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추론 스레드 예산 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=400, help="총 요청 수")
+    parser.add_argument("--batch-size", type=int, default=1, help="요청당 샘플 수")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수 (가정)")
+    parser.add_argument("--n-estimators", type=int, default=100, help="트리 수")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  추론 스레드 예산 벤치마크")
+    print("=" * 60)
+
+    model, X = build_model(args.n_estimators)
+
+    # 기존 동작: n_jobs=-1
+    set_estimator_n_jobs(model, -1)
+    base_rps, base_p99 = measure_throughput(
+        model, X, args.concurrency, args.requests, args.batch_size
+    )
+
+    # 스레드 예산 적용
+    budget = plan_thread_budget(n_workers=args.workers, concurrency=args.concurrency)
+    report = apply_thread_budget(budget, model)
+    tuned_rps, tuned_p99 = measure_throughput(
+        model, X, args.concurrency, args.requests, args.batch_size
+    )
+
+    print(f"\n📊 설정: cores={report['n_cores']}, workers={report['n_workers']}, "
+          f"concurrency={report['concurrency']}, batch={args.batch_size}")
+    print(f"\n{'Config':<22} {'req/s':>10} {'p99 (ms)':>10}")
+    print("-" * 44)
+    print(f"{'n_jobs=-1 (기존)':<22} {base_rps:>10.1f} {base_p99:>10.2f}")
+    print(f"{'n_jobs=' + str(report['joblib_n_jobs']) + ' (예산)':<22} "
+          f"{tuned_rps:>10.1f} {tuned_p99:>10.2f}")
+    print(f"\n✅ 처리량 변화: x{tuned_rps / base_rps:.2f}")
+
+
+if __name__ == "__main__":
+    main()
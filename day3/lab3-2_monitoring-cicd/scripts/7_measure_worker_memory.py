@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 워커 메모리 측정 (워커별 로드 vs pre-fork 로드)
+
+워커마다 모델을 로드하는 방식과 부모 프로세스에서 한 번 로드한 뒤
+fork하는 방식의 전체 PSS (공유 페이지를 나눠 계산한 실제 메모리)를 비교합니다.
+Linux (/proc) 전용이며, 네트워크 없이 합성 데이터로 실행됩니다.
+
+사용법:
+    python scripts/7_measure_worker_memory.py --workers 4
+    python scripts/7_measure_worker_memory.py --workers 4 --n-estimators 300
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.trainer import CaliforniaHousingModel
+from src.serving.prefork import freeze_for_fork, memory_usage
+
+
+def build_model_file(path, n_estimators):
+    """합성 데이터로 Random Forest를 학습하여 비압축 저장"""
+    rng = np.random.RandomState(42)
+    X = rng.rand(20000, 8)
+    y = X @ rng.rand(8) + rng.randn(20000) * 0.1
+
+    model = CaliforniaHousingModel(
+        model_type="random_forest",
+        model_params={"n_estimators": n_estimators, "max_depth": 10, "random_state": 42}
+    )
+    model.train(X, y)
+    model.save(path)
+    return X[:100]
+
+
+def run_workers(model_path, sample, n_workers, prefork):
+    """워커를 fork하고 예측 후 전체 PSS 측정 (kB)"""
+    model = None
+    if prefork:
+        model = CaliforniaHousingModel.load(model_path, mmap_mode="r")
+        freeze_for_fork()
+
+    pids, ready_fds, release_fds = [], [], []
+    for _ in range(n_workers):
+        ready_r, ready_w = os.pipe()
+        release_r, release_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            worker_model = model or CaliforniaHousingModel.load(model_path, mmap_mode="r")
+            for _ in range(10):
+                worker_model.predict(sample)
+            os.write(ready_w, b"1")
+            os.read(release_r, 1)
+            os._exit(0)
+        pids.append(pid)
+        ready_fds.append(ready_r)
+        release_fds.append(release_w)
+
+    for fd in ready_fds:
+        os.read(fd, 1)
+
+    per_worker = [memory_usage(pid) for pid in pids]
+    total_pss = sum(usage["Pss"] for usage in per_worker) + memory_usage()["Pss"]
+
+    for fd in release_fds:
+        os.write(fd, b"1")
+    for pid in pids:
+        os.waitpid(pid, 0)
+
+    return total_pss, per_worker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커 메모리 측정")
+    parser.add_argument("--workers", type=int, default=4, help="워커 수")
+    parser.add_argument("--n-estimators", type=int, default=100, help="트리 수")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  워커 메모리 측정: 워커별 로드 vs pre-fork 로드")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model_path = os.path.join(tmpdir, "model.joblib")
+        sample = build_model_file(model_path, args.n_estimators)
+        size_mb = os.path.getsize(model_path) / 1024 / 1024
+        print(f"\n📦 모델 파일: {size_mb:.1f} MB, 워커 {args.workers}개")
+
+        results = {}
+        for mode, prefork in (("워커별 로드", False), ("pre-fork 로드", True)):
+            # 각 모드를 별도 프로세스에서 측정 (부모 상태 격리)
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                total, per_worker = run_workers(model_path, sample, args.workers, prefork)
+                rss = per_worker[0]["Rss"]
+                os.write(write_fd, f"{total},{rss}".encode())
+                os._exit(0)
+            os.waitpid(pid, 0)
+            total, rss = map(int, os.read(read_fd, 64).decode().split(","))
+            results[mode] = total
+            print(f"\n  {mode:<14} 전체 PSS: {total / 1024:8.1f} MB   "
+                  f"(워커 1개 RSS: {rss / 1024:.1f} MB)")
+
+    saving = 1 - results["pre-fork 로드"] / results["워커별 로드"]
+    print(f"\n✅ 메모리 절감: {saving * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
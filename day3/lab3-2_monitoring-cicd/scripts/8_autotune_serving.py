@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 서빙 설정 오토튜너
+
+create_app을 프로세스 안에서 띄우고 기록된 (또는 합성) 요청을 동시 요청 수를
+늘려가며 재생하여, p99 목표를 지키면서 처리량이 가장 높은 설정을 찾습니다.
+
+워크로드:
+  - batch-size: 요청당 행 수 (클라이언트 측 배치 크기, 서버 설정 아님).
+    배치 크기마다 따로 최적 설정을 찾고, --workload-batch-size의 결과를 추천
+
+탐색 공간:
+  - backend: sklearn / onnx (skl2onnx, onnxruntime 설치 시)
+  - threads: 요청당 추론 스레드 수 (n_jobs, OpenMP/BLAS, onnx intra-op)
+  - admission-limit: 동시 처리 한도 (AdmissionController)
+
+결과:
+  - <output>/autotune_results.csv : 전체 측정 테이블
+  - <output>/serving_config.json  : 추천 설정 (SERVING_CONFIG 환경 변수로 main.py에 전달)
+
+사용법:
+    python scripts/8_autotune_serving.py --p99-target 50
+    python scripts/8_autotune_serving.py --model-path model.joblib --requests-from /data/prediction-logs
+    python scripts/8_autotune_serving.py --backends sklearn onnx --threads 1 2 4 --batch-sizes 1 16 64
+    python scripts/8_autotune_serving.py --batch-sizes 1 16 --workload-batch-size 16
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.trainer import CaliforniaHousingModel
+from src.serving.autotune import (
+    best_config,
+    config_grid,
+    load_request_mix,
+    sweep,
+    synthetic_request_mix,
+    write_results,
+)
+
+
+def build_model(n_estimators):
+    """합성 데이터로 Random Forest 학습 (--model-path가 없을 때)"""
+    X = synthetic_request_mix(n_rows=5000, seed=0)
+    rng = np.random.RandomState(42)
+    y = (X - X.mean(axis=0)) / X.std(axis=0) @ rng.rand(8) + rng.randn(len(X)) * 0.1
+
+    model = CaliforniaHousingModel(model_type="random_forest")
+    model.model_params["n_estimators"] = n_estimators
+    model.train(X, y)
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서빙 설정 오토튜너")
+    parser.add_argument("--model-path", help="저장된 모델 경로 (없으면 합성 데이터로 학습)")
+    parser.add_argument("--n-estimators", type=int, default=100, help="합성 모델 트리 수")
+    parser.add_argument("--requests-from", help="예측 로그 디렉토리 또는 JSONL 요청 파일")
+    parser.add_argument("--p99-target", type=float, default=50.0, help="목표 p99 지연시간 (ms)")
+    parser.add_argument("--requests", type=int, default=200, help="측정당 총 요청 수")
+    parser.add_argument("--backends", nargs="+", default=["sklearn", "onnx"])
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 8, 32],
+                        help="측정할 요청당 행 수 (워크로드)")
+    parser.add_argument("--workload-batch-size", type=int,
+                        help="추천 설정을 고를 워크로드 배치 크기 (기본: --batch-sizes의 첫 값)")
+    parser.add_argument("--threads", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--admission-limits", nargs="+", type=int, default=[2, 8])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--output", default="autotune", help="결과 저장 디렉토리")
+    args = parser.parse_args()
+    workload_batch_size = args.workload_batch_size or args.batch_sizes[0]
+    if workload_batch_size not in args.batch_sizes:
+        parser.error(f"--workload-batch-size {workload_batch_size} is not in --batch-sizes")
+
+    logging.basicConfig(level=logging.WARNING)
+
+    print("=" * 60)
+    print("  서빙 설정 오토튜너")
+    print("=" * 60)
+
+    if args.model_path:
+        model = CaliforniaHousingModel.load(args.model_path)
+    else:
+        model = build_model(args.n_estimators)
+
+    if args.requests_from:
+        rows = load_request_mix(args.requests_from)
+    else:
+        rows = synthetic_request_mix()
+
+    configs = config_grid(
+        backends=args.backends,
+        batch_sizes=args.batch_sizes,
+        threads=args.threads,
+        admission_limits=args.admission_limits
+    )
+    print(f"\n🔍 {len(configs)}개 설정 x 동시 요청 {args.concurrency}, "
+          f"p99 목표 {args.p99_target}ms")
+
+    results = sweep(
+        model, configs, rows,
+        concurrency_levels=args.concurrency,
+        n_requests=args.requests,
+        p99_target_ms=args.p99_target
+    )
+    best_by_batch = {
+        batch_size: best_config(results, args.p99_target, batch_size=batch_size)
+        for batch_size in sorted(set(args.batch_sizes))
+    }
+    best = best_by_batch[workload_batch_size]
+    paths = write_results(results, best, args.p99_target, args.output)
+
+    print(f"\n{'backend':<8} {'batch':>5} {'thr':>4} {'limit':>5} {'conc':>5} "
+          f"{'req/s':>10} {'rows/s':>10} {'p99 (ms)':>10} {'rej':>5}")
+    print("-" * 71)
+    for r in results:
+        c = r.config
+        mark = " ⭐" if r is best_by_batch.get(c.batch_size) else ""
+        print(f"{c.backend:<8} {c.batch_size:>5} {c.threads:>4} {c.admission_limit:>5} "
+              f"{r.concurrency:>5} {r.requests_per_s:>10.1f} {r.rows_per_s:>10.1f} {r.p99_ms:>10.2f} "
+              f"{r.rejected:>5}{mark}")
+
+    print("\n⭐ 배치 크기별 최적 설정 (같은 워크로드 안에서 requests/s 기준)")
+    for batch_size, r in best_by_batch.items():
+        if r is None:
+            print(f"   batch {batch_size:>3}: p99 {args.p99_target}ms를 만족하는 설정 없음")
+        else:
+            c = r.config
+            print(f"   batch {batch_size:>3}: backend={c.backend}, threads={c.threads}, "
+                  f"limit={c.admission_limit} -> {r.requests_per_s:.1f} req/s, p99 {r.p99_ms:.2f}ms")
+
+    if best is None:
+        print(f"\n⚠️ 워크로드 batch {workload_batch_size}에서 p99 {args.p99_target}ms를 만족하는 설정이 없습니다")
+    else:
+        c = best.config
+        print(f"\n✅ 추천 설정 (워크로드 batch {workload_batch_size}, 동시 요청 {best.concurrency}): "
+              f"backend={c.backend}, threads={c.threads}, admission_limit={c.admission_limit}")
+        print(f"   {best.requests_per_s:.1f} req/s ({best.rows_per_s:.1f} rows/s), p99 {best.p99_ms:.2f}ms")
+    print(f"\n📁 측정 테이블: {paths['table']}")
+    print(f"📁 추천 설정:   {paths['config']}  (SERVING_CONFIG={paths['config']})")
+
+
+if __name__ == "__main__":
+    main()
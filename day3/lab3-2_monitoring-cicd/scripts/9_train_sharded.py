@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: Shard 분할 Random Forest 학습
+
+학습 데이터를 shard로 나눠 shard마다 서브 포레스트를 학습하고 하나의 모델로 병합합니다.
+각 shard 작업은 데이터셋 캐시 (메모리 맵)에서 자기 행만 읽으므로 작업당 메모리는
+shard 크기로 제한됩니다.
+
+모드:
+  - local     : 한 노드의 프로세스 풀에서 모든 shard 학습 후 병합
+  - fit-shard : shard 하나만 학습하여 저장 (KFP ParallelFor 태스크 / 노드별 실행)
+  - merge     : fit-shard 결과 파일들을 병합하고 테스트 세트로 평가
+
+사용법:
+    python scripts/9_train_sharded.py local --n-shards 4 --n-estimators 200 --output model.joblib
+    python scripts/9_train_sharded.py fit-shard --shard 0 --n-shards 4 --n-estimators 200 --output shards/0.joblib
+    python scripts/9_train_sharded.py merge --inputs shards/*.joblib --output model.joblib
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.dataset import load_california_housing
+from src.model.sharded import (
+    fit_shard,
+    merge_models,
+    shard_estimators,
+    shard_rows,
+    train_sharded,
+)
+from src.model.trainer import CaliforniaHousingModel
+
+
+def run_local(args, dataset):
+    model = train_sharded(
+        dataset.X_train, dataset.y_train,
+        n_shards=args.n_shards,
+        n_estimators=args.n_estimators,
+        n_workers=args.workers,
+        random_state=args.seed
+    )
+    print(f"✅ {args.n_shards}개 shard 학습 완료 ({model.metrics['fit_time_s']:.1f}s)")
+    return model
+
+
+def run_fit_shard(args, dataset):
+    rows = shard_rows(len(dataset.X_train), args.n_shards, args.shard, args.seed)
+    n_estimators = shard_estimators(args.n_estimators, args.n_shards)[args.shard]
+    model = fit_shard(
+        dataset.X_train[rows], dataset.y_train[rows],
+        shard=args.shard, n_estimators=n_estimators, random_state=args.seed
+    )
+    print(f"✅ shard {args.shard}/{args.n_shards}: {len(rows)}행, 트리 {n_estimators}개")
+    return model
+
+
+def run_merge(args):
+    models = [CaliforniaHousingModel.load(path) for path in args.inputs]
+    model = merge_models(models)
+    print(f"✅ {len(models)}개 서브 포레스트 병합: 트리 {len(model.model.estimators_)}개")
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shard 분할 Random Forest 학습")
+    parser.add_argument("mode", choices=["local", "fit-shard", "merge"])
+    parser.add_argument("--n-shards", type=int, default=4)
+    parser.add_argument("--shard", type=int, default=0, help="fit-shard: 학습할 shard 번호")
+    parser.add_argument("--n-estimators", type=int, default=100, help="전체 트리 수")
+    parser.add_argument("--workers", type=int, help="local: 프로세스 수")
+    parser.add_argument("--inputs", nargs="+", default=[], help="merge: shard 모델 파일")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", required=True, help="모델 저장 경로")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    dataset = load_california_housing()
+    if args.mode == "local":
+        model = run_local(args, dataset)
+    elif args.mode == "fit-shard":
+        model = run_fit_shard(args, dataset)
+    else:
+        model = run_merge(args)
+
+    if args.mode != "fit-shard":
+        metrics = model.evaluate(dataset.X_test, dataset.y_test)
+        model.metrics.update(metrics)
+        print(f"   MAE={metrics['mae']:.4f}, R²={metrics['r2']:.4f}")
+
+    model.save(args.output)
+    print(f"📁 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
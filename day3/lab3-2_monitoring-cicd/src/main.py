@@ -7,7 +7,10 @@ KServe/Knative 환경에서 모델 서빙을 위한 진입점
 
 import os
 import sys
+import json
 import logging
+from dataclasses import replace
+from functools import partial
 
 # Configure logging
 logging.basicConfig(
@@ -20,38 +23,150 @@ logger = logging.getLogger(__name__)
 def main():
     """서버 시작"""
     try:
+        # 콜드 스타트 (scale-from-zero) 단축: 추론에 필요한 모듈만 import하고
+        # sklearn 학습 모듈은 모델 로드/학습 분기에서 import
         import uvicorn
-        from src.model.trainer import train_model
         from src.serving.api import create_app
+        from src.serving.admission import AdmissionController
+        from src.serving.threads import apply_thread_budget, plan_thread_budget
+        from src.serving.prefork import memory_usage, serve_prefork
+        from src.monitoring.prediction_log import PredictionLogger
+        
+        # 오토튜너 결과 (serving_config.json)가 있으면 명시되지 않은 환경 변수의 기본값으로 사용
+        serving_config = os.environ.get("SERVING_CONFIG")
+        if serving_config:
+            with open(serving_config) as f:
+                for key, value in json.load(f).get("env", {}).items():
+                    os.environ.setdefault(key, value)
+            logger.info(f"Serving config loaded from {serving_config}")
         
         # 환경 변수에서 설정 읽기
         port = int(os.environ.get("PORT", 8080))
         model_name = os.environ.get("MODEL_NAME", "california-housing")
         model_version = os.environ.get("MODEL_VERSION", "v1.0")
+        model_path = os.environ.get("MODEL_PATH")
+        n_workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+        prediction_log_dir = os.environ.get("PREDICTION_LOG_DIR")
+        grpc_port = os.environ.get("GRPC_PORT")
+        if grpc_port and n_workers > 1:
+            # gRPC 서버는 fork 후 워커마다 같은 포트를 바인딩할 수 없으므로 단일 프로세스에서만 사용
+            logger.warning("GRPC_PORT is ignored when WEB_CONCURRENCY > 1 (pre-fork mode)")
+            grpc_port = None
+        profile_token = os.environ.get("PROFILE_TOKEN")
+        feature_store_path = os.environ.get("FEATURE_STORE_PATH")
+        model_backend = os.environ.get("MODEL_BACKEND", "sklearn")
         
         logger.info(f"=" * 50)
         logger.info(f"Starting Model Server")
         logger.info(f"  Model: {model_name}")
         logger.info(f"  Version: {model_version}")
         logger.info(f"  Port: {port}")
+        logger.info(f"  Workers: {n_workers}")
+        logger.info(f"  Backend: {model_backend}")
+        if grpc_port:
+            logger.info(f"  gRPC Port: {grpc_port}")
+        if profile_token:
+            logger.info(f"  Profiler: /debug/profile enabled")
+        if feature_store_path:
+            logger.info(f"  Feature store: {feature_store_path}")
         logger.info(f"=" * 50)
         
-        # 모델 학습
-        logger.info("Training model...")
-        model, metrics = train_model(model_type="random_forest")
-        logger.info(f"Model trained successfully!")
-        logger.info(f"  MAE: {metrics['mae']:.4f}")
-        logger.info(f"  R²: {metrics['r2']:.4f}")
+        if model_backend not in ("sklearn", "onnx"):
+            raise ValueError(f"Unknown MODEL_BACKEND: {model_backend}. Supported: ['sklearn', 'onnx']")
+        if model_backend == "onnx" and not model_path:
+            raise ValueError("MODEL_BACKEND=onnx requires MODEL_PATH (export_onnx() output next to it)")
+        
+        # ONNX 세션은 스레드 예산이 정해진 뒤 생성
+        model = None
+        if model_backend == "sklearn" and model_path:
+            from src.model.trainer import CaliforniaHousingModel
+
+            # 저장된 모델 로드 (워커 fork 전 부모 프로세스에서 한 번만 로드)
+            logger.info(f"Loading model from {model_path}...")
+            model = CaliforniaHousingModel.load(model_path, mmap_mode="r")
+            logger.info(f"  RSS after load: {memory_usage()['Rss']} kB")
+        elif model_backend == "sklearn":
+            from src.model.trainer import train_model
+
+            # 모델 학습
+            logger.info("Training model...")
+            model, metrics = train_model(model_type="random_forest")
+            logger.info(f"Model trained successfully!")
+            logger.info(f"  MAE: {metrics['mae']:.4f}")
+            logger.info(f"  R²: {metrics['r2']:.4f}")
         
         # FastAPI 앱 생성
         logger.info("Creating FastAPI application...")
-        app = create_app(model=model, model_version=model_version)
+        admission = AdmissionController.from_env()
+        logger.info(
+            f"Admission control: SLO={admission.latency_slo_ms}ms, "
+            f"limit={admission.effective_limit}, queue={admission.max_queue}"
+        )
+        # 추론 스레드 예산 (n_jobs=-1 과다 구독 방지)
+        budget = plan_thread_budget(concurrency=admission.effective_limit)
+        inference_threads = os.environ.get("INFERENCE_THREADS")
+        if inference_threads:
+            threads = int(inference_threads)
+            budget = replace(
+                budget,
+                joblib_n_jobs=threads,
+                openmp_threads=threads,
+                blas_threads=threads,
+                onnx_intra_op_threads=threads
+            )
+        apply_thread_budget(budget, model)
+        
+        if model_backend == "onnx":
+            # 일치 보고서 (export_onnx)가 통과한 그래프만 로드. 최적화된 그래프는 모델 옆에 캐시
+            from src.serving.onnx_session import load_onnx_model
+
+            logger.info(f"Loading ONNX model for {model_path}...")
+            model = load_onnx_model(model_path, budget)
+            logger.info(f"  ONNX session: {model.get_stats()}")
+        
+        # 예측 로그 (Parquet). 기록 스레드는 fork 후 사라지므로 앱 startup에서
+        # 워커마다 기록기를 만듦 (파일 이름에 pid가 포함되어 워커별 파일로 기록)
+        prediction_logger_factory = None
+        if prediction_log_dir:
+            import pyarrow  # noqa: F401  (워커 startup이 아닌 여기서 의존성 누락을 보고)
+
+            logger.info(f"Prediction logging to {prediction_log_dir}")
+            prediction_logger_factory = partial(
+                PredictionLogger,
+                prediction_log_dir,
+                feature_names=model.FEATURE_NAMES
+            )
+        
+        # 온라인 피처 조회 (/predict/entities). 인덱스는 메모리 맵이라 워커 간 페이지 캐시 공유
+        feature_lookup = None
+        if feature_store_path:
+            from src.model.feature_store import FeatureStore
+
+            # 다시 materialize된 피처를 반영하도록 FEATURE_REFRESH_S 간격으로 새 버전 확인
+            feature_lookup = FeatureStore(feature_store_path).online(
+                cache_size=int(os.environ.get("FEATURE_CACHE_SIZE", 10000)),
+                refresh_interval_s=float(os.environ.get("FEATURE_REFRESH_S", 30))
+            )
+        
+        app = create_app(
+            model=model,
+            model_version=model_version,
+            admission=admission,
+            prediction_logger_factory=prediction_logger_factory,
+            grpc_port=int(grpc_port) if grpc_port else None,
+            profile_token=profile_token,
+            feature_lookup=feature_lookup
+        )
         
         if app is None:
             logger.error("Failed to create FastAPI app")
             sys.exit(1)
         
         # 서버 시작
+        if n_workers > 1:
+            serve_prefork(app, n_workers, host="0.0.0.0", port=port)
+            return
+        
         logger.info(f"Starting uvicorn server on 0.0.0.0:{port}...")
         uvicorn.run(
             app,
@@ -1,5 +1,76 @@
-"""Model training and inference module"""
+"""
+Model training and inference module
 
-from .trainer import CaliforniaHousingModel, train_model
+하위 모듈은 처음 접근할 때 import (PEP 562). 서빙 경로에서
+`from src.model.trainer import ...`가 학습 전용 모듈 (탐색, 압축, 피처 저장소 등)과
+그 의존성 (pandas, sklearn.metrics)을 함께 읽지 않도록 함
+"""
 
-__all__ = ["CaliforniaHousingModel", "train_model"]
+import importlib
+
+# 공개 이름 -> 정의된 하위 모듈
+_EXPORTS = {
+    "ModelArtifact": "artifact",
+    "FeatureBinner": "binning",
+    "CompressionResult": "compress",
+    "compress_forest": "compress",
+    "CVResult": "cv",
+    "cross_validate": "cv",
+    "CachedDataset": "dataset",
+    "cached_dataset": "dataset",
+    "load_california_housing": "dataset",
+    "FeatureStore": "feature_store",
+    "FeatureTransform": "features",
+    "california_housing_transform": "features",
+    "export_onnx": "onnx_export",
+    "TrainingProfiler": "profiling",
+    "QuantizedForest": "quantize",
+    "quantize_model": "quantize",
+    "SearchResult": "search",
+    "search_models": "search",
+    "merge_models": "sharded",
+    "train_sharded": "sharded",
+    "evaluate_streaming": "streaming",
+    "train_streaming": "streaming",
+    "CaliforniaHousingModel": "trainer",
+    "train_model": "trainer",
+}
+
+__all__ = [
+    "CaliforniaHousingModel",
+    "train_model",
+    "FeatureTransform",
+    "california_housing_transform",
+    "CachedDataset",
+    "cached_dataset",
+    "load_california_housing",
+    "SearchResult",
+    "search_models",
+    "FeatureBinner",
+    "train_streaming",
+    "evaluate_streaming",
+    "CVResult",
+    "cross_validate",
+    "ModelArtifact",
+    "TrainingProfiler",
+    "train_sharded",
+    "merge_models",
+    "FeatureStore",
+    "CompressionResult",
+    "compress_forest",
+    "export_onnx",
+    "QuantizedForest",
+    "quantize_model"
+]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,261 @@
+"""
+Model Artifact Module
+
+버전이 있는 자체 기술 (self-describing) 모델 아티팩트 포맷
+
+파일 구성:
+    MAGIC (8 bytes) | 헤더 길이 (uint32, little-endian) | JSON 헤더 | zip 페이로드
+
+JSON 헤더에는 모델 유형, 하이퍼파라미터, 메트릭, 특성 스키마, 페이로드 체크섬이
+들어 있어 헤더만 읽으면 모델을 로드하지 않고 메타데이터를 확인할 수 있음.
+zip 페이로드에는 트리 노드 배열이 압축된 .npy 블록으로, 나머지 estimator 구조가
+작은 pickle로 저장되며 load_estimator() 호출 시에만 읽음.
+"""
+
+import io
+import os
+import json
+import pickle
+import struct
+import hashlib
+import logging
+import zipfile
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CHMODEL\x00"
+FORMAT_VERSION = 1
+ARTIFACT_SUFFIX = ".chm"
+
+_LENGTH = struct.Struct("<I")
+_CHUNK_SIZE = 1 << 20
+
+
+def is_artifact(filepath: str) -> bool:
+    """파일이 아티팩트 포맷인지 확인 (앞 8바이트만 읽음)"""
+    with open(filepath, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _json_default(value):
+    """numpy 스칼라/배열을 JSON 값으로 변환"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class _TreePickler(pickle.Pickler):
+    """sklearn Tree 객체를 pickle 스트림 밖의 배열 블록으로 분리"""
+
+    def __init__(self, file, trees: List):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.trees = trees
+
+    def persistent_id(self, obj):
+        from sklearn.tree._tree import Tree
+
+        if isinstance(obj, Tree):
+            self.trees.append(obj)
+            return ("tree", len(self.trees) - 1)
+        return None
+
+
+class _TreeUnpickler(pickle.Unpickler):
+    """배열 블록에서 sklearn Tree 객체 복원"""
+
+    def __init__(self, file, archive: zipfile.ZipFile):
+        super().__init__(file)
+        self.archive = archive
+
+    def persistent_load(self, pid):
+        from sklearn.tree._tree import Tree
+
+        kind, index = pid
+        if kind != "tree":
+            raise pickle.UnpicklingError(f"Unknown persistent id: {pid}")
+        prefix = f"trees/{index:05d}"
+        meta = json.loads(self.archive.read(f"{prefix}/meta.json"))
+        tree = Tree(
+            meta["n_features"],
+            _read_array(self.archive, f"{prefix}/n_classes.npy"),
+            meta["n_outputs"]
+        )
+        tree.__setstate__({
+            "max_depth": meta["max_depth"],
+            "node_count": meta["node_count"],
+            "nodes": _read_array(self.archive, f"{prefix}/nodes.npy"),
+            "values": _read_array(self.archive, f"{prefix}/values.npy"),
+        })
+        return tree
+
+
+def _read_array(archive: zipfile.ZipFile, name: str) -> np.ndarray:
+    with archive.open(name) as f:
+        return np.lib.format.read_array(f, allow_pickle=False)
+
+
+def _write_array(archive: zipfile.ZipFile, name: str, array: np.ndarray) -> None:
+    with archive.open(name, "w", force_zip64=True) as f:
+        np.lib.format.write_array(f, np.ascontiguousarray(array), allow_pickle=False)
+
+
+def _write_payload(fileobj, estimator, compresslevel: int) -> int:
+    """estimator를 zip 페이로드로 기록하고 분리된 트리 수를 반환"""
+    skeleton = io.BytesIO()
+    trees: List = []
+    _TreePickler(skeleton, trees).dump(estimator)
+
+    with zipfile.ZipFile(
+        fileobj, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+    ) as archive:
+        archive.writestr("estimator.pkl", skeleton.getvalue())
+        for index, tree in enumerate(trees):
+            _, (n_features, n_classes, n_outputs), state = tree.__reduce__()
+            prefix = f"trees/{index:05d}"
+            archive.writestr(f"{prefix}/meta.json", json.dumps({
+                "n_features": int(n_features),
+                "n_outputs": int(n_outputs),
+                "max_depth": int(state["max_depth"]),
+                "node_count": int(state["node_count"]),
+            }))
+            _write_array(archive, f"{prefix}/n_classes.npy", n_classes)
+            _write_array(archive, f"{prefix}/nodes.npy", state["nodes"])
+            _write_array(archive, f"{prefix}/values.npy", state["values"])
+    return len(trees)
+
+
+def write_artifact(
+    filepath: str,
+    estimator,
+    metadata: Dict,
+    compresslevel: int = 6
+) -> Dict:
+    """
+    아티팩트 파일 저장
+
+    페이로드를 임시 파일에 먼저 쓰고 체크섬을 계산한 뒤, 헤더와 함께
+    최종 경로로 원자적으로 교체
+
+    Args:
+        filepath: 저장 경로
+        estimator: 학습된 sklearn estimator
+        metadata: 헤더에 기록할 메타데이터 (JSON 직렬화 가능)
+        compresslevel: zip deflate 압축 수준 (0 ~ 9)
+
+    Returns:
+        기록된 헤더
+    """
+    import sklearn
+
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    payload_path = f"{filepath}.{os.getpid()}.payload"
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    try:
+        with open(payload_path, "w+b") as payload:
+            n_trees = _write_payload(payload, estimator, compresslevel)
+            size = payload.tell()
+
+            digest = hashlib.sha256()
+            payload.seek(0)
+            for chunk in iter(lambda: payload.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+            header = {
+                "format_version": FORMAT_VERSION,
+                **metadata,
+                "estimator_class": type(estimator).__name__,
+                "sklearn_version": sklearn.__version__,
+                "created_at": datetime.now().isoformat(),
+                "payload": {"sha256": digest.hexdigest(), "size": size, "n_trees": n_trees},
+            }
+            header_bytes = json.dumps(header, default=_json_default).encode("utf-8")
+
+            with open(tmp_path, "wb") as f:
+                f.write(MAGIC)
+                f.write(_LENGTH.pack(len(header_bytes)))
+                f.write(header_bytes)
+                payload.seek(0)
+                for chunk in iter(lambda: payload.read(_CHUNK_SIZE), b""):
+                    f.write(chunk)
+        os.replace(tmp_path, filepath)
+    finally:
+        for path in (payload_path, tmp_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    logger.info(f"Artifact written: {filepath} ({n_trees} trees, {size} payload bytes)")
+    return json.loads(header_bytes)
+
+
+class ModelArtifact:
+    """
+    아티팩트 파일 리더
+
+    생성 시 헤더만 읽으며, 페이로드 (estimator)는 load_estimator() 호출 시 로드
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Args:
+            filepath: 아티팩트 파일 경로
+        """
+        self.filepath = filepath
+        with open(filepath, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a model artifact: {filepath}")
+            (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+            self.header: Dict = json.loads(f.read(length))
+        self.payload_offset = len(MAGIC) + _LENGTH.size + length
+
+        version = self.header.get("format_version")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported artifact format version: {version} (expected {FORMAT_VERSION})"
+            )
+
+    def verify(self) -> bool:
+        """페이로드 체크섬 검증"""
+        digest = hashlib.sha256()
+        size = 0
+        with open(self.filepath, "rb") as f:
+            f.seek(self.payload_offset)
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+                size += len(chunk)
+        expected = self.header["payload"]
+        return size == expected["size"] and digest.hexdigest() == expected["sha256"]
+
+    def load_estimator(self, verify: bool = True):
+        """
+        페이로드에서 estimator 복원
+
+        Args:
+            verify: 로드 전 체크섬 검증 여부
+
+        Returns:
+            sklearn estimator
+        """
+        if verify and not self.verify():
+            raise ValueError(f"Artifact payload checksum mismatch: {self.filepath}")
+
+        # zip 오프셋은 페이로드 기준이지만 zipfile이 앞쪽 헤더 길이를 보정함
+        with zipfile.ZipFile(self.filepath) as archive:
+            with archive.open("estimator.pkl") as skeleton:
+                estimator = _TreeUnpickler(skeleton, archive).load()
+
+        logger.info(
+            f"Artifact estimator loaded: {self.filepath} "
+            f"({self.header['payload']['n_trees']} trees)"
+        )
+        return estimator
+
+
+def read_header(filepath: str) -> Dict:
+    """아티팩트 헤더 (메타데이터)만 읽기"""
+    return ModelArtifact(filepath).header
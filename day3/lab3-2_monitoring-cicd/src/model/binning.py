@@ -0,0 +1,156 @@
+"""
+Feature Binning Module
+
+히스토그램 기반 부스팅용 분위수 binning.
+학습 데이터의 bin 코드를 uint8 배열로 데이터셋 캐시에 저장하여 재사용
+"""
+
+import os
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAX_BINS = 255
+
+
+class FeatureBinner:
+    """
+    특성별 분위수 경계로 값을 uint8 bin 코드로 변환
+
+    경계 계산은 HistGradientBoostingRegressor와 같은 규칙을 따름
+    (고유값이 max_bins 이하이면 인접 고유값의 중간점, 아니면 분위수).
+    값 x는 thresholds[i-1] < x <= thresholds[i]일 때 bin i.
+    """
+
+    def __init__(
+        self,
+        max_bins: int = MAX_BINS,
+        subsample: Optional[int] = 200000,
+        random_state: int = 42
+    ):
+        """
+        Args:
+            max_bins: 특성당 최대 bin 수 (2 ~ 255)
+            subsample: 경계 계산에 사용할 최대 행 수 (None이면 전체)
+            random_state: 부분 표본 랜덤 시드
+        """
+        if not 2 <= max_bins <= MAX_BINS:
+            raise ValueError(f"max_bins must be between 2 and {MAX_BINS}")
+        self.max_bins = max_bins
+        self.subsample = subsample
+        self.random_state = random_state
+        self.thresholds: Optional[List[np.ndarray]] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.thresholds is not None
+
+    def fit(self, X: np.ndarray) -> "FeatureBinner":
+        """특성별 bin 경계 계산"""
+        X = np.asarray(X, dtype=np.float64)
+        if self.subsample is not None and len(X) > self.subsample:
+            rng = np.random.RandomState(self.random_state)
+            X = X[rng.choice(len(X), self.subsample, replace=False)]
+
+        self.thresholds = [self._column_thresholds(X[:, j]) for j in range(X.shape[1])]
+        return self
+
+    def _column_thresholds(self, column: np.ndarray) -> np.ndarray:
+        distinct = np.unique(column)
+        if len(distinct) <= 1:
+            return np.empty(0)
+        if len(distinct) <= self.max_bins:
+            return (distinct[:-1] + distinct[1:]) / 2
+        percentiles = np.linspace(0, 100, num=self.max_bins + 1)[1:-1]
+        thresholds = np.percentile(column, percentiles, method="averaged_inverted_cdf")
+        return np.unique(thresholds)
+
+    def transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        bin 코드로 변환
+
+        Args:
+            X: 원본 특성 (n_samples, n_features)
+            out: 결과를 기록할 uint8 배열 (선택, 메모리 맵 가능)
+
+        Returns:
+            uint8 bin 코드 (n_samples, n_features)
+        """
+        if not self.is_fitted:
+            raise RuntimeError("FeatureBinner is not fitted. Call fit() first.")
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != len(self.thresholds):
+            raise ValueError(f"Expected {len(self.thresholds)} features, got {X.shape[1]}")
+
+        if out is None:
+            out = np.empty(X.shape, dtype=np.uint8)
+        for j, thresholds in enumerate(self.thresholds):
+            out[:, j] = np.searchsorted(thresholds, X[:, j], side="left")
+        return out
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        return self.fit(X).transform(X)
+
+    def to_dict(self) -> Dict:
+        return {
+            "max_bins": self.max_bins,
+            "thresholds": [t.tolist() for t in self.thresholds or []],
+        }
+
+    @classmethod
+    def from_dict(cls, spec: Dict) -> "FeatureBinner":
+        binner = cls(max_bins=spec["max_bins"])
+        binner.thresholds = [np.asarray(t, dtype=np.float64) for t in spec["thresholds"]]
+        return binner
+
+
+def cached_binned_features(
+    dataset,
+    max_bins: int = MAX_BINS
+) -> Tuple[FeatureBinner, np.ndarray, np.ndarray]:
+    """
+    데이터셋의 학습/테스트 bin 코드 (uint8, 메모리 맵)
+
+    학습 세트로 경계를 계산하고 결과를 데이터셋 캐시 디렉토리에 저장.
+    데이터셋 디렉토리는 내용 해시로 결정되므로 데이터가 바뀌면 다시 계산됨.
+
+    Args:
+        dataset: CachedDataset (src.model.dataset)
+        max_bins: 특성당 최대 bin 수
+
+    Returns:
+        (binner, X_train bin 코드, X_test bin 코드)
+    """
+    codes_path = os.path.join(dataset.path, f"X_binned_{max_bins}.npy")
+    spec_path = os.path.join(dataset.path, f"bins_{max_bins}.json")
+
+    if os.path.exists(codes_path) and os.path.exists(spec_path):
+        with open(spec_path) as f:
+            binner = FeatureBinner.from_dict(json.load(f))
+    else:
+        binner = FeatureBinner(max_bins=max_bins).fit(dataset.X_train)
+        # 경계 파일을 먼저 원자적으로 쓰고 코드 파일을 마지막에 교체하므로
+        # 코드 파일이 보이면 경계 파일도 완전함 (중단/동시 읽기 시 잘린 파일 없음)
+        tmp_spec_path = f"{spec_path}.{os.getpid()}.tmp"
+        with open(tmp_spec_path, "w") as f:
+            json.dump(binner.to_dict(), f)
+        os.replace(tmp_spec_path, spec_path)
+
+        tmp_path = f"{codes_path}.{os.getpid()}.tmp"
+        codes = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=np.uint8, shape=dataset.X.shape
+        )
+        binner.transform(dataset.X, out=codes)
+        codes.flush()
+        del codes
+        os.replace(tmp_path, codes_path)
+        logger.info(f"Binned features cached: {codes_path}")
+
+    codes = np.load(codes_path, mmap_mode="r")
+    return binner, codes[:dataset.n_train], codes[dataset.n_train:]
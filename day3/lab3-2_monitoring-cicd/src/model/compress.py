@@ -0,0 +1,354 @@
+"""
+Model Compression Module
+
+학습된 Random Forest를 지연시간 예산에 맞게 축소.
+트리 부분집합 (검증 MAE 기준 greedy 순서), 깊이 절단, (선택) 작은 모델로의
+distillation 후보를 만들고, 실제 추론 경로 (CaliforniaHousingModel.predict)로
+지연시간을 측정하여 MAE 허용 범위 안에서 가장 작은 모델을 선택
+"""
+
+import copy
+import time
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sklearn.metrics import mean_absolute_error
+
+logger = logging.getLogger(__name__)
+
+TREE_LEAF = -1
+TREE_UNDEFINED = -2
+
+
+@dataclass
+class Candidate:
+    """압축 후보 하나의 측정 결과"""
+    name: str
+    method: str
+    n_trees: int
+    max_depth: Optional[int]
+    n_nodes: int
+    mae: float
+    mae_increase: float
+    p50_ms: float
+    p99_ms: float
+    params: Dict = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+@dataclass
+class CompressionResult:
+    """압축 결과"""
+    model: object
+    selected: Candidate
+    baseline: Candidate
+    candidates: List[Candidate]
+    frontier: List[Candidate]
+
+    def frontier_table(self) -> List[Dict]:
+        """지연시간-정확도 frontier (p99 오름차순)"""
+        return [c.to_dict() for c in self.frontier]
+
+
+def truncate_tree(tree, max_depth: int):
+    """
+    sklearn 회귀 트리를 max_depth에서 잘라 새 Tree 생성
+
+    회귀 트리의 내부 노드 value는 해당 노드 학습 샘플의 평균이므로 잘린 노드를
+    리프로 바꾸면 얕은 트리의 예측과 같음. 도달하지 않는 노드는 제거하여 배열을 압축
+
+    Args:
+        tree: sklearn.tree._tree.Tree
+        max_depth: 최대 깊이 (루트 = 0)
+
+    Returns:
+        새 Tree
+    """
+    from sklearn.tree._tree import Tree
+
+    _, (n_features, n_classes, n_outputs), state = tree.__reduce__()
+    nodes, values = state["nodes"], state["values"]
+    left, right = nodes["left_child"], nodes["right_child"]
+
+    # 너비 우선으로 남길 노드와 깊이 수집
+    keep, depths = [0], [0]
+    i = 0
+    while i < len(keep):
+        node, depth = keep[i], depths[i]
+        if depth < max_depth and left[node] != TREE_LEAF:
+            keep.extend((left[node], right[node]))
+            depths.extend((depth + 1, depth + 1))
+        i += 1
+
+    keep = np.asarray(keep, dtype=np.intp)
+    depths = np.asarray(depths)
+    remap = np.full(len(nodes), TREE_LEAF, dtype=np.intp)
+    remap[keep] = np.arange(len(keep))
+
+    new_nodes = nodes[keep].copy()
+    is_leaf = (new_nodes["left_child"] == TREE_LEAF) | (depths >= max_depth)
+    new_nodes["left_child"] = np.where(is_leaf, TREE_LEAF, remap[new_nodes["left_child"]])
+    new_nodes["right_child"] = np.where(is_leaf, TREE_LEAF, remap[new_nodes["right_child"]])
+    new_nodes["feature"][is_leaf] = TREE_UNDEFINED
+    new_nodes["threshold"][is_leaf] = TREE_UNDEFINED
+
+    truncated = Tree(n_features, n_classes, n_outputs)
+    truncated.__setstate__({
+        "max_depth": int(min(state["max_depth"], max_depth)),
+        "node_count": len(keep),
+        "nodes": new_nodes,
+        "values": np.ascontiguousarray(values[keep]),
+    })
+    return truncated
+
+
+def greedy_tree_order(forest, X: np.ndarray, y: np.ndarray) -> List[int]:
+    """
+    앞에서부터 k개를 평균했을 때 검증 MAE가 작도록 트리 순서 결정 (forward selection)
+
+    Args:
+        forest: 학습된 RandomForestRegressor
+        X, y: 선택용 검증 데이터 (모델 입력 공간)
+
+    Returns:
+        트리 인덱스 순서
+    """
+    predictions = np.stack([tree.predict(X) for tree in forest.estimators_])
+    remaining = list(range(len(predictions)))
+    total = np.zeros(len(y))
+    order = []
+    for k in range(1, len(predictions) + 1):
+        averaged = (total + predictions[remaining]) / k
+        best = remaining[int(np.argmin(np.abs(averaged - y).mean(axis=1)))]
+        order.append(best)
+        remaining.remove(best)
+        total += predictions[best]
+    return order
+
+
+def subset_forest(forest, tree_indices: Sequence[int], max_depth: Optional[int] = None):
+    """선택한 트리 (선택적으로 깊이 절단)로 새 RandomForestRegressor 생성"""
+    estimators = []
+    for index in tree_indices:
+        estimator = copy.copy(forest.estimators_[index])
+        if max_depth is not None and estimator.tree_.max_depth > max_depth:
+            estimator.tree_ = truncate_tree(estimator.tree_, max_depth)
+            estimator.max_depth = max_depth
+        estimators.append(estimator)
+
+    subset = copy.copy(forest)
+    subset.estimators_ = estimators
+    subset.n_estimators = len(estimators)
+    if max_depth is not None:
+        subset.max_depth = max_depth
+    return subset
+
+
+def measure_latency(model, X: np.ndarray, n_requests: int = 200) -> Dict[str, float]:
+    """
+    단일 행 요청의 predict() 지연시간 (서빙 경로와 같음)
+
+    Returns:
+        {"p50_ms", "p99_ms"}
+    """
+    rows = X[np.arange(n_requests) % len(X)]
+    model.predict(rows[:1])  # 워밍업
+    latencies = np.empty(n_requests)
+    for i in range(n_requests):
+        start = time.perf_counter()
+        model.predict(rows[i:i + 1])
+        latencies[i] = (time.perf_counter() - start) * 1000
+    return {
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+    }
+
+
+def _count_nodes(estimator) -> int:
+    if hasattr(estimator, "estimators_"):
+        return int(sum(e.tree_.node_count for e in np.ravel(estimator.estimators_)))
+    if hasattr(estimator, "tree_"):
+        return int(estimator.tree_.node_count)
+    return 0
+
+
+def pareto_frontier(candidates: List[Candidate]) -> List[Candidate]:
+    """p99가 더 작으면서 MAE도 더 작은 후보가 없는 후보들 (p99 오름차순)"""
+    frontier = []
+    best_mae = np.inf
+    for candidate in sorted(candidates, key=lambda c: (c.p99_ms, c.mae)):
+        if candidate.mae < best_mae:
+            frontier.append(candidate)
+            best_mae = candidate.mae
+    return frontier
+
+
+def compress_forest(
+    model,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+    tolerance: float = 0.02,
+    p99_budget_ms: Optional[float] = None,
+    tree_counts: Optional[Sequence[int]] = None,
+    depths: Optional[Sequence[int]] = None,
+    X_train: Optional[np.ndarray] = None,
+    distill_configs: Optional[List[Dict]] = None,
+    n_latency_requests: int = 200,
+    n_jobs: int = 1,
+    X_select: Optional[np.ndarray] = None,
+    y_select: Optional[np.ndarray] = None
+) -> CompressionResult:
+    """
+    MAE 허용 범위 안에서 가장 작은 (노드 수 기준) 모델 탐색
+
+    Args:
+        model: 학습된 random_forest CaliforniaHousingModel
+        X_val, y_val: 검증 데이터 (원본 특성). 후보 MAE 측정과 frontier에 사용되므로
+            최종 보고용 테스트 세트와 분리할 것
+        tolerance: 허용 MAE 증가율 (0.02 = 기준 MAE의 2%)
+        p99_budget_ms: 단일 행 p99 지연시간 예산 (선택)
+        tree_counts: 트리 수 후보 (기본: 전체의 1/20 ~ 전체)
+        depths: 깊이 절단 후보 (기본: 원래 깊이보다 2, 4 얕은 깊이)
+        X_train: distillation 학습 데이터 (주어지면 distillation 후보 추가)
+        distill_configs: distillation 학생 모델 설정
+            (기본: n_estimators 5/10, max_depth 8 Random Forest)
+        n_latency_requests: 후보당 지연시간 측정 요청 수
+        n_jobs: 측정 및 결과 모델의 n_jobs (서빙 스레드 예산)
+        X_select, y_select: 트리 순서 (greedy_tree_order) 선택용 데이터. 순서를 고른
+            데이터로 MAE를 재면 낙관적이므로 X_val과 겹치지 않아야 함
+            (기본: X_val/y_val을 무작위로 절반씩 나눠 한쪽을 사용)
+
+    Returns:
+        CompressionResult (선택된 모델, 전체 후보, frontier)
+    """
+    from sklearn.ensemble import RandomForestRegressor
+
+    from .trainer import CaliforniaHousingModel
+
+    if model.model_type != "random_forest":
+        raise ValueError(f"Compression supports random_forest only, got {model.model_type}")
+    if not model.is_fitted:
+        raise RuntimeError("Model is not fitted. Call train() first.")
+    model.check_not_quantized("compress")
+
+    X_val, y_val = np.asarray(X_val), np.asarray(y_val)
+    if X_select is None:
+        if len(X_val) < 2:
+            raise ValueError("X_val needs at least 2 rows to split off tree-order selection data")
+        perm = np.random.RandomState(42).permutation(len(X_val))
+        select, val = perm[:len(perm) // 2], perm[len(perm) // 2:]
+        X_select, y_select = X_val[select], y_val[select]
+        X_val, y_val = X_val[val], y_val[val]
+    elif y_select is None:
+        raise ValueError("y_select is required when X_select is given")
+
+    forest = copy.copy(model.model)
+    forest.n_jobs = n_jobs
+    n_trees = len(forest.estimators_)
+    full_depth = max(e.tree_.max_depth for e in forest.estimators_)
+
+    # 트리는 모델 입력 공간 (피처 변환/binning 후)에서 평가
+    X_input = np.asarray(X_select)
+    if model.feature_transform is not None:
+        X_input = model.feature_transform.transform(X_input)
+    if model.binner is not None:
+        X_input = model.binner.transform(X_input)
+
+    if tree_counts is None:
+        tree_counts = [n_trees // 20, n_trees // 10, n_trees // 4, n_trees // 2, n_trees]
+    tree_counts = sorted({min(n_trees, max(1, int(k))) for k in tree_counts})
+    if depths is None:
+        depths = [full_depth - 2, full_depth - 4]
+    depths = [None] + sorted({d for d in depths if 0 < d < full_depth}, reverse=True)
+    order = greedy_tree_order(forest, X_input, np.asarray(y_select))
+
+    def wrap(estimator, params: Dict):
+        wrapped = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={**model.model_params, **params, "n_jobs": n_jobs},
+            feature_transform=model.feature_transform
+        )
+        wrapped.binner = model.binner
+        wrapped.model = estimator
+        wrapped.is_fitted = True
+        return wrapped
+
+    def evaluate(name: str, method: str, wrapped, params: Dict) -> Candidate:
+        mae = float(mean_absolute_error(y_val, wrapped.predict(X_val)))
+        latency = measure_latency(wrapped, X_val, n_latency_requests)
+        estimator = wrapped.model
+        return Candidate(
+            name=name,
+            method=method,
+            n_trees=len(getattr(estimator, "estimators_", [estimator])),
+            max_depth=params.get("max_depth"),
+            n_nodes=_count_nodes(estimator),
+            mae=mae,
+            mae_increase=0.0,
+            p50_ms=latency["p50_ms"],
+            p99_ms=latency["p99_ms"],
+            params=params
+        )
+
+    params = {"n_estimators": n_trees, "max_depth": model.model_params.get("max_depth")}
+    models = {"baseline": wrap(forest, params)}
+    baseline = evaluate("baseline", "baseline", models["baseline"], params)
+    candidates = [baseline]
+
+    for depth in depths:
+        for k in tree_counts:
+            if depth is None and k == n_trees:
+                continue
+            name = f"subset_{k}" + (f"_depth_{depth}" if depth is not None else "")
+            params = {"n_estimators": k, "max_depth": depth or model.model_params.get("max_depth")}
+            wrapped = wrap(subset_forest(forest, order[:k], depth), params)
+            candidates.append(evaluate(name, "subset" if depth is None else "truncate", wrapped, params))
+            models[name] = wrapped
+
+    if X_train is not None:
+        # 학생 모델은 원본 레이블 대신 교사 (원래 포레스트) 예측을 학습
+        teacher = model.predict(X_train)
+        X_student = np.asarray(X_train)
+        if model.feature_transform is not None:
+            X_student = model.feature_transform.transform(X_student)
+        if model.binner is not None:
+            X_student = model.binner.transform(X_student)
+        for config in distill_configs or [
+            {"n_estimators": 5, "max_depth": 8}, {"n_estimators": 10, "max_depth": 8}
+        ]:
+            params = {"random_state": 42, **config}
+            student = RandomForestRegressor(**params, n_jobs=n_jobs).fit(X_student, teacher)
+            name = f"distill_{params['n_estimators']}_depth_{params.get('max_depth')}"
+            wrapped = wrap(student, params)
+            candidates.append(evaluate(name, "distill", wrapped, params))
+            models[name] = wrapped
+
+    for candidate in candidates:
+        candidate.mae_increase = candidate.mae / baseline.mae - 1 if baseline.mae > 0 else 0.0
+
+    feasible = [
+        c for c in candidates
+        if c.mae <= baseline.mae * (1 + tolerance)
+        and (p99_budget_ms is None or c.p99_ms <= p99_budget_ms)
+    ]
+    if not feasible:
+        logger.warning("No candidate meets the tolerance/latency budget. Keeping the baseline.")
+        feasible = [baseline]
+    selected = min(feasible, key=lambda c: (c.n_nodes, c.p99_ms))
+
+    logger.info(
+        f"Compression: {baseline.name} ({baseline.n_nodes} nodes, p99={baseline.p99_ms:.2f}ms, "
+        f"MAE={baseline.mae:.4f}) -> {selected.name} ({selected.n_nodes} nodes, "
+        f"p99={selected.p99_ms:.2f}ms, MAE={selected.mae:.4f})"
+    )
+    return CompressionResult(
+        model=models[selected.name],
+        selected=selected,
+        baseline=baseline,
+        candidates=candidates,
+        frontier=pareto_frontier(candidates)
+    )
@@ -0,0 +1,202 @@
+"""
+Cross Validation Module
+
+fold 인덱스를 한 번 계산해 두고, 각 fold를 프로세스 풀에서 동시에 학습/평가.
+특성/타겟/fold 배열은 공유 메모리로 워커에 전달됨
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .shared import attach_worker, shared_arrays, worker_array
+
+logger = logging.getLogger(__name__)
+
+METRIC_NAMES = ("mae", "mse", "rmse", "r2")
+
+# (n_samples, n_splits, random_state) -> fold 번호 배열
+_fold_cache: Dict[Tuple[int, int, int], np.ndarray] = {}
+
+
+@dataclass
+class CVResult:
+    """교차 검증 결과"""
+    folds: List[Dict]
+    mean: Dict[str, float]
+    std: Dict[str, float]
+    elapsed_s: float
+
+    def summary(self) -> Dict[str, float]:
+        """MLflow 등에 기록하기 좋은 평평한 dict (cv_mae_mean, cv_mae_std, ...)"""
+        flat = {}
+        for name in METRIC_NAMES:
+            flat[f"cv_{name}_mean"] = self.mean[name]
+            flat[f"cv_{name}_std"] = self.std[name]
+        return flat
+
+
+def fold_assignments(
+    n_samples: int,
+    n_splits: int = 5,
+    random_state: int = 42,
+    cache_dir: Optional[str] = None
+) -> np.ndarray:
+    """
+    행별 fold 번호 (KFold(shuffle=True)와 같은 분할)
+
+    프로세스 안에서 캐시되며, cache_dir (예: CachedDataset.path)가 주어지면
+    .npy로 저장하여 다른 작업도 재사용
+
+    Args:
+        n_samples: 행 수
+        n_splits: fold 수
+        random_state: 셔플 랜덤 시드
+        cache_dir: fold 배열 저장 디렉토리 (선택)
+
+    Returns:
+        (n_samples,) 정수 배열 (n_splits <= 128이면 int8, 아니면 int32),
+        값은 0 ~ n_splits-1
+    """
+    key = (n_samples, n_splits, random_state)
+    if key in _fold_cache:
+        return _fold_cache[key]
+
+    path = None
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, f"folds_{n_samples}_{n_splits}_{random_state}.npy")
+        if os.path.exists(path):
+            _fold_cache[key] = np.load(path)
+            return _fold_cache[key]
+
+    from sklearn.model_selection import KFold
+
+    # fold 번호가 int8 범위를 넘으면 조용히 overflow되지 않도록 더 큰 타입 사용
+    dtype = np.int8 if n_splits <= np.iinfo(np.int8).max + 1 else np.int32
+    folds = np.empty(n_samples, dtype=dtype)
+    splitter = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    for fold, (_, test_index) in enumerate(splitter.split(np.empty((n_samples, 1)))):
+        folds[test_index] = fold
+
+    if path is not None:
+        tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, folds)
+        os.replace(tmp_path, path)
+
+    _fold_cache[key] = folds
+    return folds
+
+
+def _run_fold(
+    fold: int,
+    model_type: str,
+    model_params: Dict,
+    transform_spec: Optional[Dict]
+) -> Dict:
+    """워커에서 fold 하나를 학습하고 평가"""
+    from .features import FeatureTransform
+    from .trainer import CaliforniaHousingModel
+
+    X, y, folds = worker_array("X"), worker_array("y"), worker_array("folds")
+    test_mask = folds == fold
+
+    params = dict(model_params)
+    # fold 수만큼 프로세스가 병렬이므로 fold 내부 병렬화는 끔
+    if "n_jobs" in CaliforniaHousingModel.SUPPORTED_MODELS[model_type]().get_params():
+        params["n_jobs"] = 1
+
+    model = CaliforniaHousingModel(
+        model_type=model_type,
+        model_params=params,
+        feature_transform=(
+            FeatureTransform.from_dict(transform_spec) if transform_spec else None
+        )
+    )
+    start = time.perf_counter()
+    model.train(X[~test_mask], y[~test_mask])
+    fit_time_s = time.perf_counter() - start
+
+    metrics = model.evaluate(X[test_mask], y[test_mask])
+    return {
+        "fold": fold,
+        "n_train": int((~test_mask).sum()),
+        "n_test": int(test_mask.sum()),
+        "fit_time_s": fit_time_s,
+        **{name: float(metrics[name]) for name in METRIC_NAMES}
+    }
+
+
+def cross_validate(
+    X: np.ndarray,
+    y: np.ndarray,
+    model_type: str = "random_forest",
+    model_params: Optional[Dict] = None,
+    feature_transform=None,
+    n_splits: int = 5,
+    n_workers: Optional[int] = None,
+    random_state: int = 42,
+    cache_dir: Optional[str] = None
+) -> CVResult:
+    """
+    k-fold 교차 검증 (fold 병렬 실행)
+
+    Args:
+        X: 특성 (n_samples, 8)
+        y: 타겟
+        model_type: 모델 유형
+        model_params: 모델 하이퍼파라미터 (기본: 모델 유형 기본값)
+        feature_transform: 피처 변환 그래프 (fold마다 학습 데이터로 다시 fit)
+        n_splits: fold 수
+        n_workers: 프로세스 수 (기본: min(n_splits, CPU 수))
+        random_state: fold 셔플 랜덤 시드
+        cache_dir: fold 인덱스 저장 디렉토리 (선택)
+
+    Returns:
+        CVResult (fold별 메트릭, 평균, 표준편차)
+    """
+    from .trainer import CaliforniaHousingModel
+
+    if n_splits < 2:
+        raise ValueError("n_splits must be >= 2")
+    if model_params is None:
+        model_params = CaliforniaHousingModel(model_type=model_type).model_params
+
+    folds = fold_assignments(len(X), n_splits, random_state, cache_dir)
+    transform_spec = feature_transform.to_dict() if feature_transform is not None else None
+    n_workers = n_workers or min(n_splits, os.cpu_count() or 1)
+
+    start = time.perf_counter()
+    arrays = {
+        "X": np.asarray(X, dtype=np.float64),
+        "y": np.asarray(y, dtype=np.float64),
+        "folds": folds,
+    }
+    with shared_arrays(arrays) as specs:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=attach_worker, initargs=(specs,)
+        ) as executor:
+            futures = [
+                executor.submit(_run_fold, fold, model_type, model_params, transform_spec)
+                for fold in range(n_splits)
+            ]
+            fold_results = [future.result() for future in futures]
+    elapsed_s = time.perf_counter() - start
+
+    values = {name: np.array([r[name] for r in fold_results]) for name in METRIC_NAMES}
+    result = CVResult(
+        folds=fold_results,
+        mean={name: float(v.mean()) for name, v in values.items()},
+        std={name: float(v.std(ddof=1)) for name, v in values.items()},
+        elapsed_s=elapsed_s
+    )
+    logger.info(
+        f"{n_splits}-fold CV ({model_type}) in {elapsed_s:.1f}s: "
+        f"MAE={result.mean['mae']:.4f}±{result.std['mae']:.4f}, "
+        f"R²={result.mean['r2']:.4f}±{result.std['r2']:.4f}"
+    )
+    return result
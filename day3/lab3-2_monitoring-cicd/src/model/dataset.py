@@ -0,0 +1,272 @@
+"""
+Dataset Cache Module
+
+데이터셋을 한 번 내려받아 분할한 결과를 메모리 맵 .npy 파일로 로컬 캐시하여
+학습/드리프트/재학습 작업이 매번 데이터를 다시 파싱하고 분할하지 않도록 함
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+INDEX_FILE = "index.json"
+
+# loader() -> (X, y, feature_names)
+Loader = Callable[[], Tuple[np.ndarray, np.ndarray, List[str]]]
+
+
+def default_cache_dir() -> str:
+    """캐시 디렉토리 (DATASET_CACHE_DIR 환경 변수 또는 ~/.cache/mlops-datasets)"""
+    return os.environ.get(
+        "DATASET_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "mlops-datasets")
+    )
+
+
+def content_hash(*arrays: np.ndarray) -> str:
+    """배열 dtype/shape/내용 기반 SHA-256"""
+    digest = hashlib.sha256()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(memoryview(array).cast("B"))
+    return digest.hexdigest()
+
+
+@dataclass
+class CachedDataset:
+    """
+    캐시된 데이터셋
+
+    X, y는 [학습 행..., 테스트 행...] 순서로 저장되어 있으므로 학습/테스트 세트는
+    복사 없는 슬라이스 (메모리 맵 뷰). 행 순서는 train_test_split 결과와 같음.
+    """
+    X: np.ndarray
+    y: np.ndarray
+    n_train: int
+    train_index: np.ndarray
+    test_index: np.ndarray
+    feature_names: List[str]
+    content_hash: str
+    path: str
+
+    @property
+    def X_train(self) -> np.ndarray:
+        return self.X[:self.n_train]
+
+    @property
+    def X_test(self) -> np.ndarray:
+        return self.X[self.n_train:]
+
+    @property
+    def y_train(self) -> np.ndarray:
+        return self.y[:self.n_train]
+
+    @property
+    def y_test(self) -> np.ndarray:
+        return self.y[self.n_train:]
+
+    def split(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """X_train, X_test, y_train, y_test (train_test_split과 같은 순서)"""
+        return self.X_train, self.X_test, self.y_train, self.y_test
+
+    def to_frame(self, part: str = "all"):
+        """
+        pandas DataFrame으로 변환 (target 컬럼 포함)
+
+        Args:
+            part: "all", "train", "test"
+        """
+        import pandas as pd
+
+        X, y = {
+            "all": (self.X, self.y),
+            "train": (self.X_train, self.y_train),
+            "test": (self.X_test, self.y_test),
+        }[part]
+        df = pd.DataFrame(X, columns=self.feature_names)
+        df["target"] = y
+        return df
+
+
+def _index_key(name: str, test_size: float, random_state: int) -> str:
+    return f"{name}:test_size={test_size}:random_state={random_state}"
+
+
+def _read_index(cache_dir: str) -> dict:
+    try:
+        with open(os.path.join(cache_dir, INDEX_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index(cache_dir: str, index: dict) -> None:
+    # 여러 작업이 동시에 써도 파일이 깨지지 않도록 임시 파일 후 교체
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, os.path.join(cache_dir, INDEX_FILE))
+
+
+def _open(path: str, mmap_mode: Optional[str]) -> CachedDataset:
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    if meta.get("version") != CACHE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported dataset cache version: {meta.get('version')}")
+
+    order = np.load(os.path.join(path, "order.npy"))
+    n_train = meta["n_train"]
+    return CachedDataset(
+        X=np.load(os.path.join(path, "X.npy"), mmap_mode=mmap_mode),
+        y=np.load(os.path.join(path, "y.npy"), mmap_mode=mmap_mode),
+        n_train=n_train,
+        train_index=order[:n_train],
+        test_index=order[n_train:],
+        feature_names=meta["feature_names"],
+        content_hash=meta["content_hash"],
+        path=path
+    )
+
+
+def _build(
+    cache_dir: str,
+    name: str,
+    loader: Loader,
+    test_size: float,
+    random_state: int
+) -> str:
+    """원본 로드, 분할, .npy 기록 후 캐시 경로 반환"""
+    from sklearn.model_selection import train_test_split
+
+    X, y, feature_names = loader()
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    train_index, test_index = train_test_split(
+        np.arange(len(X)), test_size=test_size, random_state=random_state
+    )
+    order = np.concatenate([train_index, test_index])
+
+    data_hash = content_hash(X, y)
+    key = hashlib.sha256(
+        f"{data_hash}:{test_size}:{random_state}".encode()
+    ).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"{name}-{key}")
+    if os.path.exists(os.path.join(path, "meta.json")):
+        return path
+
+    tmp_path = tempfile.mkdtemp(dir=cache_dir, prefix=f".{name}-")
+    try:
+        np.save(os.path.join(tmp_path, "X.npy"), X[order])
+        np.save(os.path.join(tmp_path, "y.npy"), y[order])
+        np.save(os.path.join(tmp_path, "order.npy"), order)
+        with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+            json.dump({
+                "version": CACHE_FORMAT_VERSION,
+                "name": name,
+                "content_hash": data_hash,
+                "test_size": test_size,
+                "random_state": random_state,
+                "n_train": len(train_index),
+                "feature_names": list(feature_names),
+            }, f, indent=2)
+        os.rename(tmp_path, path)
+    except OSError:
+        # 다른 작업이 먼저 같은 캐시를 만든 경우
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not os.path.exists(os.path.join(path, "meta.json")):
+            raise
+
+    logger.info(f"Dataset cached: {name} -> {path}")
+    return path
+
+
+def cached_dataset(
+    name: str,
+    loader: Loader,
+    test_size: float = 0.2,
+    random_state: int = 42,
+    cache_dir: Optional[str] = None,
+    mmap_mode: Optional[str] = "r",
+    refresh: bool = False
+) -> CachedDataset:
+    """
+    캐시된 데이터셋 반환 (없으면 loader로 만들어 저장)
+
+    캐시 디렉토리는 데이터 내용 해시 + 분할 설정으로 결정되고, index.json이
+    (이름, 분할 설정)을 해당 디렉토리에 연결함
+
+    Args:
+        name: 데이터셋 이름
+        loader: (X, y, feature_names)를 반환하는 원본 로더
+        test_size: 테스트 세트 비율
+        random_state: 분할 랜덤 시드
+        cache_dir: 캐시 디렉토리 (기본: default_cache_dir())
+        mmap_mode: np.load mmap_mode (None이면 메모리로 읽음)
+        refresh: 캐시를 무시하고 원본에서 다시 생성
+
+    Returns:
+        CachedDataset
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+    key = _index_key(name, test_size, random_state)
+
+    path = None if refresh else _read_index(cache_dir).get(key)
+    if path and os.path.exists(os.path.join(cache_dir, path, "meta.json")):
+        try:
+            return _open(os.path.join(cache_dir, path), mmap_mode)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dataset cache unreadable, rebuilding: {e}")
+
+    full_path = _build(cache_dir, name, loader, test_size, random_state)
+    index = _read_index(cache_dir)
+    index[key] = os.path.basename(full_path)
+    _write_index(cache_dir, index)
+    return _open(full_path, mmap_mode)
+
+
+def _fetch_california_housing() -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    from sklearn.datasets import fetch_california_housing
+
+    data = fetch_california_housing()
+    return data.data, data.target, list(data.feature_names)
+
+
+def load_california_housing(
+    test_size: float = 0.2,
+    random_state: int = 42,
+    cache_dir: Optional[str] = None,
+    mmap_mode: Optional[str] = "r"
+) -> CachedDataset:
+    """
+    California Housing 데이터셋 (캐시 사용)
+
+    Args:
+        test_size: 테스트 세트 비율
+        random_state: 분할 랜덤 시드
+        cache_dir: 캐시 디렉토리
+        mmap_mode: np.load mmap_mode
+
+    Returns:
+        CachedDataset
+    """
+    return cached_dataset(
+        "california_housing",
+        _fetch_california_housing,
+        test_size=test_size,
+        random_state=random_state,
+        cache_dir=cache_dir,
+        mmap_mode=mmap_mode
+    )
@@ -0,0 +1,446 @@
+"""
+Feature Store Module
+
+Gold 레이어 (엔티티별 집계 테이블)에서 계산한 피처를 한 번 저장하고
+학습과 서빙이 같은 값을 재사용하기 위한 로컬 피처 저장소
+
+디렉토리 구성:
+    <root>/metadata.json                 엔티티/타임스탬프 컬럼, 피처 이름, 변환 그래프
+    <root>/offline/date=YYYY-MM-DD/*.parquet   피처 이력 (날짜 파티션)
+    <root>/online/CURRENT                현재 온라인 인덱스 버전
+    <root>/online/<version>/             엔티티별 최신 피처 (정렬된 .npy, 메모리 맵)
+
+학습: get_historical_features()로 이벤트 시점 이전의 최신 피처를 조인 (point-in-time)
+서빙: online()으로 엔티티별 최신 피처 조회 (LRU 캐시 + 메모리 맵 인덱스)
+"""
+
+import os
+import json
+import time
+import uuid
+import shutil
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .features import FeatureTransform
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILE = "metadata.json"
+PARTITION_COLUMN = "date"
+FEATURE_TIMESTAMP = "feature_timestamp"
+
+
+class FeatureStore:
+    """오프라인 (Parquet) + 온라인 (메모리 맵 인덱스) 피처 저장소"""
+
+    def __init__(
+        self,
+        root: str,
+        entity_column: str = "entity_id",
+        timestamp_column: str = "event_timestamp"
+    ):
+        """
+        Args:
+            root: 저장소 디렉토리
+            entity_column: 엔티티 ID 컬럼 (정수)
+            timestamp_column: 피처 관측 시각 컬럼
+        """
+        self.root = root
+        self.entity_column = entity_column
+        self.timestamp_column = timestamp_column
+        self.offline_path = os.path.join(root, "offline")
+        self.online_path = os.path.join(root, "online")
+        self.metadata: Optional[Dict] = None
+
+        metadata_path = os.path.join(root, METADATA_FILE)
+        if os.path.exists(metadata_path):
+            with open(metadata_path) as f:
+                self.metadata = json.load(f)
+            self.entity_column = self.metadata["entity_column"]
+            self.timestamp_column = self.metadata["timestamp_column"]
+
+    @property
+    def feature_names(self) -> List[str]:
+        if self.metadata is None:
+            raise RuntimeError("Feature store is empty. Call materialize() first.")
+        return self.metadata["feature_names"]
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def materialize(
+        self,
+        gold: Union[pd.DataFrame, str],
+        transform: Optional[FeatureTransform] = None,
+        input_names: Optional[List[str]] = None
+    ) -> int:
+        """
+        Gold 테이블에서 피처를 계산하여 오프라인/온라인 저장소에 기록
+
+        Args:
+            gold: Gold 레이어 DataFrame 또는 Parquet 경로. 엔티티/타임스탬프
+                컬럼과 입력 컬럼을 포함해야 함
+            transform: 파생 피처 변환 그래프 (scale 단계 제외). 없으면 입력 컬럼만 저장
+            input_names: 입력 컬럼 (기본: transform.input_names)
+
+        Returns:
+            기록한 행 수
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if isinstance(gold, str):
+            gold = pd.read_parquet(gold)
+        if transform is not None and any(step["op"] == "scale" for step in transform.steps):
+            # 저장소의 입력 컬럼은 원본 값이어야 서빙에서 모델 입력으로 그대로 사용 가능.
+            # 정규화는 모델별 feature_transform에서 수행
+            raise ValueError("Scale steps are model-specific and cannot be materialized")
+        input_names = list(input_names or (transform.input_names if transform else []))
+        if not input_names:
+            raise ValueError("input_names or transform is required")
+
+        entities = gold[self.entity_column].to_numpy()
+        if not np.issubdtype(entities.dtype, np.integer):
+            raise ValueError(f"{self.entity_column} must be an integer column")
+        timestamps = _to_utc_naive(gold[self.timestamp_column]).to_numpy("datetime64[ns]")
+
+        X = gold[input_names].to_numpy(dtype=np.float64)
+        features = transform.transform(X) if transform is not None else X
+        feature_names = transform.output_names if transform is not None else input_names
+        self._write_metadata(feature_names, transform)
+
+        table = pa.table({
+            self.entity_column: entities.astype(np.int64),
+            self.timestamp_column: timestamps,
+            **{name: features[:, j] for j, name in enumerate(feature_names)},
+            PARTITION_COLUMN: np.datetime_as_string(timestamps, unit="D"),
+        })
+        pq.write_to_dataset(
+            table, self.offline_path,
+            partition_cols=[PARTITION_COLUMN],
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet"
+        )
+        self._update_online(entities.astype(np.int64), timestamps.view(np.int64), features)
+
+        logger.info(f"Materialized {len(table)} rows ({len(feature_names)} features) to {self.root}")
+        return len(table)
+
+    def _write_metadata(self, feature_names: List[str], transform) -> None:
+        if self.metadata is not None and self.metadata["feature_names"] != list(feature_names):
+            raise ValueError(
+                f"Feature names do not match the store: {self.metadata['feature_names']}"
+            )
+        self.metadata = {
+            "entity_column": self.entity_column,
+            "timestamp_column": self.timestamp_column,
+            "feature_names": list(feature_names),
+            "transform": transform.to_dict() if transform is not None else None,
+        }
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.metadata, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.root, METADATA_FILE))
+
+    def _update_online(
+        self,
+        entities: np.ndarray,
+        timestamps: np.ndarray,
+        features: np.ndarray
+    ) -> None:
+        """기존 온라인 인덱스와 새 행을 합쳐 엔티티별 최신 행만 남긴 새 버전 기록"""
+        current = _current_version(self.online_path)
+        if current is not None:
+            old = _load_index(os.path.join(self.online_path, current), mmap_mode=None)
+            entities = np.concatenate([old["entities"], entities])
+            timestamps = np.concatenate([old["timestamps"], timestamps])
+            features = np.concatenate([old["features"], features])
+
+        # 엔티티 -> 시각 순으로 정렬한 뒤 엔티티별 마지막 (최신) 행 선택
+        order = np.lexsort((timestamps, entities))
+        entities, timestamps = entities[order], timestamps[order]
+        latest = np.append(entities[1:] != entities[:-1], True)
+
+        version = f"{time.time_ns()}-{os.getpid()}"
+        tmp_dir = os.path.join(self.online_path, f".{version}.tmp")
+        os.makedirs(tmp_dir)
+        np.save(os.path.join(tmp_dir, "entities.npy"), entities[latest])
+        np.save(os.path.join(tmp_dir, "timestamps.npy"), timestamps[latest])
+        np.save(os.path.join(tmp_dir, "features.npy"), np.ascontiguousarray(features[order][latest]))
+        os.rename(tmp_dir, os.path.join(self.online_path, version))
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.online_path, prefix=".")
+        with os.fdopen(fd, "w") as f:
+            f.write(version)
+        os.replace(tmp_path, os.path.join(self.online_path, "CURRENT"))
+
+        # 열려 있는 조회기가 있을 수 있으므로 직전 버전 하나는 남김
+        for name in sorted(os.listdir(self.online_path)):
+            if name not in ("CURRENT", version, current) and not name.startswith("."):
+                shutil.rmtree(os.path.join(self.online_path, name), ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # 학습용 조회
+    # ------------------------------------------------------------------
+
+    def get_historical_features(
+        self,
+        entity_df: pd.DataFrame,
+        features: Optional[List[str]] = None,
+        ttl: Optional[pd.Timedelta] = None
+    ) -> pd.DataFrame:
+        """
+        point-in-time 조인
+
+        entity_df의 각 행 (엔티티, 이벤트 시각)에 대해 이벤트 시각 이전 (같은 시각 포함)에
+        관측된 가장 최근 피처를 붙임. 이벤트 이후에 계산된 피처는 사용하지 않으므로
+        학습 데이터에 미래 정보가 새지 않음
+
+        Args:
+            entity_df: 엔티티/타임스탬프 컬럼 (+ 레이블 등)을 가진 DataFrame
+            features: 조인할 피처 이름 (기본: 전체)
+            ttl: 이벤트 시각보다 이만큼 이상 오래된 피처는 무시 (결측 처리)
+
+        Returns:
+            entity_df 순서를 유지하고 피처 컬럼과 feature_timestamp를 추가한 DataFrame
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        features = list(features or self.feature_names)
+        unknown = set(features) - set(self.feature_names)
+        if unknown:
+            raise ValueError(f"Unknown features: {sorted(unknown)}")
+
+        events = entity_df.copy()
+        events[self.timestamp_column] = _to_utc_naive(events[self.timestamp_column])
+        max_date = events[self.timestamp_column].max().strftime("%Y-%m-%d")
+
+        # 가장 늦은 이벤트 날짜 이후의 파티션은 읽지 않음
+        dataset = ds.dataset(
+            self.offline_path, format="parquet",
+            partitioning=ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.string())]), flavor="hive")
+        )
+        history = dataset.to_table(
+            columns=[self.entity_column, self.timestamp_column] + features,
+            filter=ds.field(PARTITION_COLUMN) <= max_date
+        ).to_pandas()
+        history = history.rename(columns={self.timestamp_column: FEATURE_TIMESTAMP})
+        history[FEATURE_TIMESTAMP] = history[FEATURE_TIMESTAMP].astype("datetime64[ns]")
+        events[self.timestamp_column] = events[self.timestamp_column].astype("datetime64[ns]")
+        history[self.entity_column] = history[self.entity_column].astype(np.int64)
+        events[self.entity_column] = events[self.entity_column].astype(np.int64)
+
+        events["_row"] = np.arange(len(events))
+        joined = pd.merge_asof(
+            events.sort_values(self.timestamp_column),
+            history.sort_values(FEATURE_TIMESTAMP),
+            left_on=self.timestamp_column,
+            right_on=FEATURE_TIMESTAMP,
+            by=self.entity_column,
+            direction="backward",
+            tolerance=ttl
+        )
+        joined = joined.sort_values("_row").drop(columns="_row").reset_index(drop=True)
+        logger.info(
+            f"Point-in-time join: {len(joined)} rows, "
+            f"{int(joined[FEATURE_TIMESTAMP].isna().sum())} without features"
+        )
+        return joined
+
+    def online(
+        self,
+        cache_size: int = 10000,
+        refresh_interval_s: Optional[float] = None
+    ) -> "OnlineFeatureLookup":
+        """서빙용 온라인 조회기 (refresh_interval_s: 새 버전 확인 간격, 초)"""
+        return OnlineFeatureLookup(
+            self.online_path, self.feature_names,
+            cache_size=cache_size, refresh_interval_s=refresh_interval_s
+        )
+
+
+def _to_utc_naive(column: pd.Series) -> pd.Series:
+    """타임스탬프를 UTC 기준 timezone 없는 값으로 통일"""
+    return pd.to_datetime(column, utc=True).dt.tz_localize(None)
+
+
+def _current_version(online_path: str) -> Optional[str]:
+    try:
+        with open(os.path.join(online_path, "CURRENT")) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _load_index(path: str, mmap_mode: Optional[str] = "r") -> Dict[str, np.ndarray]:
+    return {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in ("entities", "timestamps", "features")
+    }
+
+
+class OnlineFeatureLookup:
+    """
+    엔티티별 최신 피처 조회
+
+    정렬된 엔티티 배열을 메모리 맵으로 열어 이진 탐색하고, 조회 결과는
+    LRU 캐시에 보관함. 여러 요청 스레드에서 동시에 호출 가능.
+    refresh_interval_s가 주어지면 조회 시 그 간격마다 CURRENT를 확인하여
+    다시 materialize된 인덱스로 교체함 (백그라운드 스레드가 없으므로 pre-fork 워커에서도 동작)
+    """
+
+    def __init__(
+        self,
+        online_path: str,
+        feature_names: List[str],
+        cache_size: int = 10000,
+        refresh_interval_s: Optional[float] = None
+    ):
+        """
+        Args:
+            online_path: 온라인 인덱스 디렉토리 (<root>/online)
+            feature_names: 피처 컬럼 이름 (인덱스 순서)
+            cache_size: LRU 캐시 최대 엔티티 수
+            refresh_interval_s: 새 버전 확인 간격 (초, None이면 자동 교체 안 함)
+        """
+        self.online_path = online_path
+        self.feature_names = list(feature_names)
+        self.cache_size = cache_size
+        self.refresh_interval_s = refresh_interval_s
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[int, Optional[np.ndarray]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.version: Optional[str] = None
+        self._checked_at = 0.0
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """
+        새 버전이 기록되었으면 인덱스를 다시 열고 캐시를 비움
+
+        Returns:
+            인덱스 교체 여부
+        """
+        version = _current_version(self.online_path)
+        if version is None:
+            raise FileNotFoundError(f"No online index in {self.online_path}")
+        if version == self.version:
+            return False
+
+        index = _load_index(os.path.join(self.online_path, version))
+        with self._lock:
+            self._index = index
+            self._cache.clear()
+            self.version = version
+        logger.info(f"Online feature index loaded: {len(index['entities'])} entities ({version})")
+        return True
+
+    def _maybe_refresh(self) -> None:
+        """refresh_interval_s가 지났으면 새 버전 확인 (실패하면 현재 인덱스 유지)"""
+        if self.refresh_interval_s is None:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < self.refresh_interval_s:
+            return
+        self._checked_at = now
+        try:
+            self.refresh()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Online feature index refresh failed, keeping {self.version}: {e}")
+
+    def check_features(self, names: List[str]) -> None:
+        """
+        모델 입력 피처가 모두 인덱스에 있는지 확인 (서빙 시작 시 한 번)
+
+        Raises:
+            ValueError: 인덱스에 없는 피처가 있으면
+        """
+        missing = [name for name in names if name not in self.feature_names]
+        if missing:
+            raise ValueError(
+                f"Feature store is missing model features: {missing}. "
+                f"Available: {self.feature_names}"
+            )
+
+    def _lookup(self, entity_id: int) -> Optional[np.ndarray]:
+        entities = self._index["entities"]
+        pos = int(np.searchsorted(entities, entity_id))
+        if pos < len(entities) and entities[pos] == entity_id:
+            return np.array(self._index["features"][pos])
+        return None
+
+    def get(self, entity_id: int) -> Optional[np.ndarray]:
+        """
+        엔티티 하나의 최신 피처
+
+        Returns:
+            피처 벡터 (없는 엔티티는 None)
+        """
+        self._maybe_refresh()
+        return self._get(int(entity_id))
+
+    def _get(self, entity_id: int) -> Optional[np.ndarray]:
+        with self._lock:
+            if entity_id in self._cache:
+                self._cache.move_to_end(entity_id)
+                self.hits += 1
+                return self._cache[entity_id]
+
+            self.misses += 1
+            features = self._lookup(entity_id)
+            self._cache[entity_id] = features
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return features
+
+    def get_many(
+        self,
+        entity_ids: List[int],
+        features: Optional[List[str]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 엔티티의 피처 행렬
+
+        Args:
+            entity_ids: 엔티티 ID 리스트
+            features: 반환할 피처 이름 (기본: 전체, 지정한 순서로 반환)
+
+        Returns:
+            (피처 행렬 (없는 엔티티 행은 NaN), 엔티티 존재 여부 bool 배열)
+        """
+        self._maybe_refresh()
+        columns = (
+            [self.feature_names.index(name) for name in features]
+            if features is not None else slice(None)
+        )
+        n_features = len(features) if features is not None else len(self.feature_names)
+        X = np.full((len(entity_ids), n_features), np.nan)
+        found = np.zeros(len(entity_ids), dtype=bool)
+        for i, entity_id in enumerate(entity_ids):
+            row = self._get(int(entity_id))
+            if row is not None:
+                X[i] = row[columns]
+                found[i] = True
+        return X, found
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "version": self.version,
+                "n_entities": int(len(self._index["entities"])),
+                "cache_entries": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
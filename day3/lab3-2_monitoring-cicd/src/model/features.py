@@ -0,0 +1,312 @@
+"""
+Feature Transform Module
+
+학습 파이프라인의 전처리 (StandardScaler + 파생 피처)를 JSON으로 직렬화 가능한
+NumPy 연산 그래프로 표현하여, 서빙 시 pandas 없이 배치 단위로 실행
+"""
+
+import json
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SPEC_VERSION = 1
+
+SUPPORTED_OPS = ("scale", "ratio", "product", "distance", "linear")
+
+
+class FeatureTransform:
+    """
+    직렬화 가능한 피처 변환 그래프
+
+    각 단계는 이름이 있는 컬럼을 입력으로 받아 기존 컬럼을 갱신 (scale)하거나
+    새 컬럼을 추가함. transform()은 그래프를 컬럼 인덱스 기반 실행 계획으로
+    컴파일한 뒤, 미리 할당한 (column-major) 출력 배열에 ufunc의 out= 인자로
+    직접 기록하므로 중간 DataFrame/배열이 생기지 않음.
+
+    연산 순서는 Project 파이프라인의 pandas 코드와 같게 유지하여
+    학습과 서빙의 피처 값이 비트 단위로 일치하도록 함.
+    """
+
+    def __init__(self, input_names: List[str], steps: Optional[List[Dict]] = None):
+        """
+        변환 그래프 초기화
+
+        Args:
+            input_names: 입력 컬럼 이름 (순서대로)
+            steps: 변환 단계 리스트 (from_dict에서 사용)
+        """
+        self.input_names = list(input_names)
+        self.steps: List[Dict] = []
+        self._plan = None
+        for step in steps or []:
+            self._add(dict(step))
+
+    # ------------------------------------------------------------------
+    # 그래프 구성
+    # ------------------------------------------------------------------
+
+    def standard_scale(
+        self,
+        columns: Optional[List[str]] = None,
+        mean: Optional[List[float]] = None,
+        scale: Optional[List[float]] = None
+    ) -> "FeatureTransform":
+        """
+        표준화 단계 추가
+
+        mean/scale을 주지 않으면 fit()에서 계산. 파이프라인에서 이미 학습한
+        StandardScaler가 있다면 그 mean_/scale_을 넘겨 같은 통계를 사용
+        """
+        step = {"op": "scale", "columns": columns or list(self.output_names)}
+        if mean is not None and scale is not None:
+            step["mean"] = [float(v) for v in mean]
+            step["scale"] = [float(v) for v in scale]
+            step["fixed"] = True
+        return self._add(step)
+
+    def ratio(
+        self, name: str, numerator: str, denominator: str, eps: float = 1e-6
+    ) -> "FeatureTransform":
+        """name = numerator / (denominator + eps)"""
+        return self._add({
+            "op": "ratio", "name": name,
+            "inputs": [numerator, denominator], "eps": eps
+        })
+
+    def product(self, name: str, left: str, right: str) -> "FeatureTransform":
+        """name = left * right"""
+        return self._add({"op": "product", "name": name, "inputs": [left, right]})
+
+    def distance(
+        self, name: str, x: str, y: str, x0: float = 0.0, y0: float = 0.0
+    ) -> "FeatureTransform":
+        """name = sqrt((x - x0)^2 + (y - y0)^2)"""
+        return self._add({
+            "op": "distance", "name": name,
+            "inputs": [x, y], "origin": [x0, y0]
+        })
+
+    def linear(
+        self, name: str, weights: Dict[str, float], bias: float = 0.0
+    ) -> "FeatureTransform":
+        """name = sum(weight * column) + bias"""
+        return self._add({
+            "op": "linear", "name": name,
+            "inputs": list(weights), "weights": list(weights.values()), "bias": bias
+        })
+
+    def _add(self, step: Dict) -> "FeatureTransform":
+        op = step.get("op")
+        if op not in SUPPORTED_OPS:
+            raise ValueError(f"Unsupported op: {op}. Supported: {list(SUPPORTED_OPS)}")
+
+        available = self.output_names
+        for column in step.get("inputs", []) + step.get("columns", []):
+            if column not in available:
+                raise ValueError(f"Unknown column '{column}' in {op} step")
+        if "name" in step and step["name"] in available:
+            raise ValueError(f"Duplicate column name: {step['name']}")
+
+        self.steps.append(step)
+        self._plan = None
+        return self
+
+    @property
+    def output_names(self) -> List[str]:
+        """변환 결과 컬럼 이름"""
+        names = list(self.input_names)
+        names.extend(step["name"] for step in self.steps if "name" in step)
+        return names
+
+    @property
+    def is_fitted(self) -> bool:
+        """모든 scale 단계의 통계가 계산되었는지 여부"""
+        return all("mean" in step for step in self.steps if step["op"] == "scale")
+
+    # ------------------------------------------------------------------
+    # 학습 / 실행
+    # ------------------------------------------------------------------
+
+    def fit(self, X: np.ndarray) -> "FeatureTransform":
+        """
+        scale 단계의 평균/표준편차 계산
+
+        학습 파이프라인의 전처리와 같은 값이 되도록 sklearn StandardScaler로 계산
+        (서빙 경로에는 sklearn이 필요 없음)
+
+        Args:
+            X: 원본 입력 (n_samples, n_inputs)
+
+        Returns:
+            self
+        """
+        from sklearn.preprocessing import StandardScaler
+
+        for step in self.steps:
+            if step["op"] == "scale" and not step.get("fixed"):
+                step.pop("mean", None)
+                step.pop("scale", None)
+
+        for i, step in enumerate(self.steps):
+            if step["op"] != "scale" or step.get("fixed"):
+                continue
+            # 이전 단계까지 적용한 값으로 통계 계산
+            # (합산 순서가 메모리 배치에 따라 달라지지 않도록 C-order로 계산)
+            partial = FeatureTransform(self.input_names, self.steps[:i])
+            current = partial.transform(X)
+            names = partial.output_names
+            idx = [names.index(c) for c in step["columns"]]
+            scaler = StandardScaler().fit(np.ascontiguousarray(current[:, idx]))
+            step["mean"] = scaler.mean_.tolist()
+            step["scale"] = scaler.scale_.tolist()
+
+        self._plan = None
+        logger.info(
+            f"Feature transform fitted: {len(self.input_names)} -> "
+            f"{len(self.output_names)} features"
+        )
+        return self
+
+    def _compile(self):
+        """단계를 컬럼 인덱스 기반 실행 계획으로 변환"""
+        if not self.is_fitted:
+            raise RuntimeError("Feature transform is not fitted. Call fit() first.")
+
+        names = list(self.input_names)
+        plan = []
+        for step in self.steps:
+            op = step["op"]
+            if op == "scale":
+                idx = np.array([names.index(c) for c in step["columns"]])
+                plan.append((op, idx, (
+                    np.asarray(step["mean"], dtype=np.float64),
+                    np.asarray(step["scale"], dtype=np.float64)
+                )))
+                continue
+
+            inputs = [names.index(c) for c in step["inputs"]]
+            names.append(step["name"])
+            target = len(names) - 1
+            if op == "ratio":
+                params = step["eps"]
+            elif op == "distance":
+                params = tuple(step["origin"])
+            elif op == "linear":
+                params = (tuple(step["weights"]), step["bias"])
+            else:
+                params = None
+            plan.append((op, (inputs, target), params))
+
+        self._plan = (plan, len(names))
+        return self._plan
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        배치 변환 실행
+
+        Args:
+            X: 원본 입력 (n_samples, n_inputs)
+
+        Returns:
+            변환된 피처 (n_samples, n_outputs)
+        """
+        plan, n_outputs = self._plan or self._compile()
+
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        n_inputs = len(self.input_names)
+        if X.shape[1] != n_inputs:
+            raise ValueError(f"Expected {n_inputs} features, got {X.shape[1]}")
+
+        out = np.empty((X.shape[0], n_outputs), dtype=np.float64, order="F")
+        out[:, :n_inputs] = X
+        tmp = np.empty(X.shape[0], dtype=np.float64)
+
+        for op, where, params in plan:
+            if op == "scale":
+                mean, scale = params
+                out[:, where] = (out[:, where] - mean) / scale
+                continue
+
+            inputs, target = where
+            col = out[:, target]
+            if op == "ratio":
+                np.add(out[:, inputs[1]], params, out=tmp)
+                np.divide(out[:, inputs[0]], tmp, out=col)
+            elif op == "product":
+                np.multiply(out[:, inputs[0]], out[:, inputs[1]], out=col)
+            elif op == "distance":
+                x0, y0 = params
+                np.subtract(out[:, inputs[0]], x0, out=col)
+                np.square(col, out=col)
+                np.subtract(out[:, inputs[1]], y0, out=tmp)
+                np.square(tmp, out=tmp)
+                np.add(col, tmp, out=col)
+                np.sqrt(col, out=col)
+            elif op == "linear":
+                weights, bias = params
+                np.multiply(out[:, inputs[0]], weights[0], out=col)
+                for i, w in zip(inputs[1:], weights[1:]):
+                    np.multiply(out[:, i], w, out=tmp)
+                    np.add(col, tmp, out=col)
+                if bias:
+                    np.add(col, bias, out=col)
+
+        return out
+
+    # ------------------------------------------------------------------
+    # 직렬화
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": SPEC_VERSION,
+            "input_names": self.input_names,
+            "output_names": self.output_names,
+            "steps": self.steps
+        }
+
+    @classmethod
+    def from_dict(cls, spec: Dict) -> "FeatureTransform":
+        if spec.get("version") != SPEC_VERSION:
+            raise ValueError(f"Unsupported feature transform version: {spec.get('version')}")
+        return cls(spec["input_names"], spec["steps"])
+
+    def save(self, filepath: str) -> None:
+        """JSON으로 저장"""
+        with open(filepath, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logger.info(f"Feature transform saved to {filepath}")
+
+    @classmethod
+    def load(cls, filepath: str) -> "FeatureTransform":
+        """JSON에서 로드"""
+        with open(filepath) as f:
+            return cls.from_dict(json.load(f))
+
+
+def california_housing_transform(input_names: List[str]) -> FeatureTransform:
+    """
+    Project 파이프라인 (solution)의 전처리 + 피처 엔지니어링과 같은 변환 그래프
+
+    StandardScaler로 정규화한 뒤 7개 파생 피처를 추가 (8 -> 15 features)
+
+    Args:
+        input_names: 원본 특성 이름 (CaliforniaHousingModel.FEATURE_NAMES)
+    """
+    return (
+        FeatureTransform(input_names)
+        .standard_scale()
+        .ratio("rooms_per_household", "AveRooms", "AveOccup")
+        .ratio("bedrooms_ratio", "AveBedrms", "AveRooms")
+        .ratio("population_per_household", "Population", "AveOccup")
+        .distance("dist_to_bay", "Latitude", "Longitude")
+        .product("density", "Population", "AveOccup")
+        .product("income_rooms", "MedInc", "AveRooms")
+        .linear("location_score", {"Latitude": 0.5, "Longitude": 0.5})
+    )
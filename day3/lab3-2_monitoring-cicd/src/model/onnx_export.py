@@ -0,0 +1,440 @@
+"""
+ONNX Export Module
+
+CaliforniaHousingModel을 하나의 ONNX 그래프 (원본 특성 입력 -> 피처 변환 ->
+binning -> estimator)로 변환하고, onnxruntime 그래프 최적화를 적용해 저장한 뒤
+검증 데이터로 sklearn 예측과의 수치 일치 여부를 확인.
+최적화된 모델 (<stem>.onnx)과 일치 보고서 (<stem>.parity.json)는 모델 파일 옆에 저장
+
+(onnx, skl2onnx, onnxruntime이 설치된 환경에서 사용)
+"""
+
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ONNX_SUFFIX = ".onnx"
+PARITY_SUFFIX = ".parity.json"
+
+# 전처리 그래프가 사용하는 연산 (Unsqueeze/ReduceSum의 axes 입력)에 필요한 최소 opset
+MIN_OPSET = 13
+
+# optimize_onnx()가 적용하는 오프라인 그래프 최적화 수준 (OnnxSession의 optimization_level 이름)
+OPTIMIZATION_LEVEL = "extended"
+
+INPUT_NAME = "input"
+_FEATURES_NAME = "features"
+
+
+def onnx_paths(model_path: str) -> Tuple[str, str]:
+    """
+    모델 파일 옆의 ONNX 모델 / 일치 보고서 경로
+
+    Args:
+        model_path: 모델 파일 경로 (예: model.joblib) 또는 .onnx 경로
+
+    Returns:
+        (onnx 경로, 보고서 경로)
+    """
+    stem = os.path.splitext(model_path)[0]
+    return stem + ONNX_SUFFIX, stem + PARITY_SUFFIX
+
+
+def select_opset(target_opset: Optional[int] = None) -> int:
+    """
+    변환 opset 선택
+
+    설치된 onnx가 지원하는 최신 opset과 skl2onnx가 검증한 최신 opset 중 작은 값
+
+    Args:
+        target_opset: 지정 opset (선택). 지원 범위를 벗어나면 ValueError
+    """
+    import onnx
+    from skl2onnx import get_latest_tested_opset_version
+
+    latest = min(onnx.defs.onnx_opset_version(), get_latest_tested_opset_version())
+    opset = target_opset or latest
+    if not MIN_OPSET <= opset <= latest:
+        raise ValueError(f"target_opset must be between {MIN_OPSET} and {latest}, got {opset}")
+    return opset
+
+
+class _GraphBuilder:
+    """전처리 노드/상수 생성 도우미 (이름 충돌 방지용 접두사 사용)"""
+
+    def __init__(self, prefix: str = "pre"):
+        self.prefix = prefix
+        self.nodes = []
+        self.initializers = []
+        self._count = 0
+
+    def _name(self, hint: str) -> str:
+        self._count += 1
+        return f"{self.prefix}_{hint}_{self._count}"
+
+    def const(self, value, dtype=np.float64) -> str:
+        from onnx import numpy_helper
+
+        name = self._name("const")
+        self.initializers.append(numpy_helper.from_array(np.asarray(value, dtype=dtype), name))
+        return name
+
+    def op(self, op_type: str, inputs: List[str], output: Optional[str] = None, **attrs) -> str:
+        from onnx import helper
+
+        output = output or self._name(op_type.lower())
+        self.nodes.append(helper.make_node(op_type, inputs, [output], **attrs))
+        return output
+
+
+def _transform_nodes(builder: _GraphBuilder, transform, x: str) -> str:
+    """
+    FeatureTransform 단계를 열 단위 ONNX 노드로 변환 (float64, NumPy 구현과 같은 연산 순서)
+
+    Returns:
+        변환된 특성 (n_samples, n_outputs) 출력 이름
+    """
+    columns = [
+        builder.op("Slice", [
+            x,
+            builder.const([j], np.int64),
+            builder.const([j + 1], np.int64),
+            builder.const([1], np.int64)
+        ])
+        for j in range(len(transform.input_names))
+    ]
+    names = list(transform.input_names)
+
+    for step in transform.steps:
+        op = step["op"]
+        if op == "scale":
+            for column, mean, scale in zip(step["columns"], step["mean"], step["scale"]):
+                j = names.index(column)
+                centered = builder.op("Sub", [columns[j], builder.const([mean])])
+                columns[j] = builder.op("Div", [centered, builder.const([scale])])
+            continue
+
+        inputs = [columns[names.index(c)] for c in step["inputs"]]
+        if op == "ratio":
+            denominator = builder.op("Add", [inputs[1], builder.const([step["eps"]])])
+            column = builder.op("Div", [inputs[0], denominator])
+        elif op == "product":
+            column = builder.op("Mul", inputs)
+        elif op == "distance":
+            squares = []
+            for value, origin in zip(inputs, step["origin"]):
+                delta = builder.op("Sub", [value, builder.const([origin])])
+                squares.append(builder.op("Mul", [delta, delta]))
+            column = builder.op("Sqrt", [builder.op("Add", squares)])
+        elif op == "linear":
+            column = builder.op("Mul", [inputs[0], builder.const([step["weights"][0]])])
+            for value, weight in zip(inputs[1:], step["weights"][1:]):
+                term = builder.op("Mul", [value, builder.const([weight])])
+                column = builder.op("Add", [column, term])
+            if step["bias"]:
+                column = builder.op("Add", [column, builder.const([step["bias"]])])
+        else:
+            raise ValueError(f"Unsupported feature transform op for ONNX export: {op}")
+        columns.append(column)
+        names.append(step["name"])
+
+    return builder.op("Concat", columns, axis=1)
+
+
+def _binner_nodes(builder: _GraphBuilder, binner, x: str) -> str:
+    """
+    FeatureBinner.transform (searchsorted side="left")을 ONNX 노드로 변환
+
+    bin 코드 = 값보다 작은 경계 수. 특성별 경계 수가 다르므로 +inf로 채워 한 번에 비교
+
+    Returns:
+        bin 코드 (n_samples, n_features, float64) 출력 이름
+    """
+    from onnx import TensorProto
+
+    width = max(1, max(len(t) for t in binner.thresholds))
+    padded = np.full((len(binner.thresholds), width), np.inf)
+    for j, thresholds in enumerate(binner.thresholds):
+        padded[j, :len(thresholds)] = thresholds
+
+    expanded = builder.op("Unsqueeze", [x, builder.const([2], np.int64)])
+    below = builder.op("Less", [builder.const(padded), expanded])
+    counts = builder.op("Cast", [below], to=TensorProto.DOUBLE)
+    return builder.op("ReduceSum", [counts, builder.const([2], np.int64)], keepdims=0)
+
+
+def _hist_gradient_boosting_onnx(estimator, opset: int):
+    """
+    HistGradientBoostingRegressor를 TreeEnsembleRegressor 하나로 변환
+
+    이 모델은 항상 binning된 bin 코드 (결측 없음)를 입력으로 받으므로 결측값 분기 없이
+    "x <= 경계면 왼쪽" 분기만 기록함 (skl2onnx 변환기는 일부 sklearn/onnx 버전
+    조합에서 리프 노드 속성 타입 오류로 실패함)
+    """
+    from onnx import TensorProto, helper
+
+    if estimator.loss not in ("squared_error", "absolute_error", "quantile"):
+        raise ValueError(f"Unsupported loss for ONNX export: {estimator.loss}")
+
+    attrs = {key: [] for key in (
+        "nodes_treeids", "nodes_nodeids", "nodes_featureids", "nodes_modes", "nodes_values",
+        "nodes_truenodeids", "nodes_falsenodeids", "target_treeids", "target_nodeids",
+        "target_ids", "target_weights"
+    )}
+    for tree_id, predictor in enumerate(p for stage in estimator._predictors for p in stage):
+        for node_id, node in enumerate(predictor.nodes):
+            attrs["nodes_treeids"].append(tree_id)
+            attrs["nodes_nodeids"].append(node_id)
+            if node["is_leaf"]:
+                attrs["nodes_modes"].append("LEAF")
+                attrs["nodes_featureids"].append(0)
+                attrs["nodes_values"].append(0.0)
+                attrs["nodes_truenodeids"].append(0)
+                attrs["nodes_falsenodeids"].append(0)
+                attrs["target_treeids"].append(tree_id)
+                attrs["target_nodeids"].append(node_id)
+                attrs["target_ids"].append(0)
+                attrs["target_weights"].append(float(node["value"]))
+            else:
+                attrs["nodes_modes"].append("BRANCH_LEQ")
+                attrs["nodes_featureids"].append(int(node["feature_idx"]))
+                attrs["nodes_values"].append(float(node["num_threshold"]))
+                attrs["nodes_truenodeids"].append(int(node["left"]))
+                attrs["nodes_falsenodeids"].append(int(node["right"]))
+
+    ensemble = helper.make_node(
+        "TreeEnsembleRegressor", [_FEATURES_NAME], ["variable"], domain="ai.onnx.ml",
+        n_targets=1, aggregate_function="SUM", post_transform="NONE",
+        base_values=[float(np.ravel(estimator._baseline_prediction)[0])], **attrs
+    )
+    graph = helper.make_graph(
+        [ensemble], "hist_gradient_boosting",
+        [helper.make_tensor_value_info(
+            _FEATURES_NAME, TensorProto.FLOAT, [None, estimator.n_features_in_]
+        )],
+        [helper.make_tensor_value_info("variable", TensorProto.FLOAT, [None, 1])]
+    )
+    opsets = [helper.make_opsetid("", opset), helper.make_opsetid("ai.onnx.ml", 3)]
+    # 최신 IR 버전은 설치된 onnxruntime이 읽지 못할 수 있으므로 opset에 필요한 최소 버전 사용
+    return helper.make_model(
+        graph, opset_imports=opsets, ir_version=helper.find_min_ir_version_for(opsets)
+    )
+
+
+def model_to_onnx(model, target_opset: Optional[int] = None):
+    """
+    CaliforniaHousingModel을 원본 특성 (float64, n_samples x 8)을 입력으로 받는
+    ONNX 모델로 변환
+
+    피처 변환과 binning은 float64로 계산한 뒤 estimator 입력 (float32)으로 변환하여
+    sklearn 경로 (float64 변환 후 트리 내부에서 float32)와 같은 값을 사용.
+    입력을 float32로 받으면 bin 경계와 같은 값이 다른 bin으로 갈 수 있음
+
+    Args:
+        model: 학습된 CaliforniaHousingModel
+        target_opset: ONNX opset (기본: select_opset())
+
+    Returns:
+        검증된 onnx.ModelProto (최적화 전)
+    """
+    if not model.is_fitted:
+        raise RuntimeError("Model is not fitted. Call train() first.")
+    model.check_not_quantized("export to ONNX")
+
+    import onnx
+    from onnx import TensorProto, helper
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+
+    opset = select_opset(target_opset)
+    estimator = model.model
+    if model.model_type == "hist_gradient_boosting":
+        onnx_model = _hist_gradient_boosting_onnx(estimator, opset)
+    else:
+        onnx_model = convert_sklearn(
+            estimator,
+            initial_types=[(_FEATURES_NAME, FloatTensorType([None, estimator.n_features_in_]))],
+            target_opset=opset
+        )
+    graph = onnx_model.graph
+
+    if model.feature_transform is not None or model.binner is not None:
+        builder = _GraphBuilder()
+        x = INPUT_NAME
+        if model.feature_transform is not None:
+            x = _transform_nodes(builder, model.feature_transform, x)
+        if model.binner is not None:
+            x = _binner_nodes(builder, model.binner, x)
+        builder.op("Cast", [x], output=_FEATURES_NAME, to=TensorProto.FLOAT)
+
+        nodes = builder.nodes + list(graph.node)
+        del graph.node[:]
+        graph.node.extend(nodes)
+        graph.initializer.extend(builder.initializers)
+    else:
+        graph.node.insert(0, helper.make_node(
+            "Cast", [INPUT_NAME], [_FEATURES_NAME], to=TensorProto.FLOAT
+        ))
+
+    del graph.input[:]
+    graph.input.append(helper.make_tensor_value_info(
+        INPUT_NAME, TensorProto.DOUBLE, [None, len(model.FEATURE_NAMES)]
+    ))
+    # skl2onnx는 사용한 연산에 필요한 최소 opset을 기록하므로 전처리 노드 기준으로 올림
+    for entry in onnx_model.opset_import:
+        if entry.domain in ("", "ai.onnx"):
+            entry.version = max(entry.version, opset)
+
+    onnx_model.doc_string = f"CaliforniaHousingModel ({model.model_type})"
+    helper.set_model_props(onnx_model, {
+        "model_type": model.model_type,
+        "feature_names": json.dumps(model.FEATURE_NAMES),
+        "model_params": json.dumps(model.model_params, default=str),
+        "metrics": json.dumps(model.metrics, default=float),
+    })
+    onnx.checker.check_model(onnx_model)
+    return onnx_model
+
+
+def optimize_onnx(onnx_model, filepath: str) -> str:
+    """
+    onnxruntime 오프라인 그래프 최적화 (상수 접기, 중복 노드 제거, 노드 결합) 후 저장
+
+    ORT_ENABLE_EXTENDED까지 적용 (하드웨어별 레이아웃 변환은 제외하여 다른 CPU에서도 로드 가능)
+
+    Args:
+        onnx_model: onnx.ModelProto
+        filepath: 저장 경로
+
+    Returns:
+        filepath
+    """
+    import onnxruntime as ort
+
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    options.optimized_model_filepath = filepath
+    ort.InferenceSession(
+        onnx_model.SerializeToString(), options, providers=["CPUExecutionProvider"]
+    )
+    return filepath
+
+
+def check_parity(
+    model,
+    onnx_path: str,
+    X: np.ndarray,
+    atol: float = 1e-4,
+    rtol: float = 1e-4
+) -> Dict:
+    """
+    ONNX 모델과 sklearn 예측 비교
+
+    Args:
+        model: CaliforniaHousingModel
+        onnx_path: ONNX 모델 경로
+        X: 검증 데이터 (원본 특성)
+        atol, rtol: 행별 허용 오차 (|차이| <= atol + rtol * |sklearn 예측|)
+
+    Returns:
+        오차 통계 (max/mean/p99 절대 오차, 허용 오차를 넘은 행 비율 등)
+    """
+    import onnxruntime as ort
+
+    session = ort.InferenceSession(onnx_path, providers=["CPUExecutionProvider"])
+    X = np.asarray(X)
+    expected = model.predict(X)
+    actual = session.run(None, {INPUT_NAME: X.astype(np.float64)})[0].ravel()
+
+    error = np.abs(actual.astype(np.float64) - expected)
+    mismatched = error > atol + rtol * np.abs(expected)
+    return {
+        "n_samples": int(len(X)),
+        "max_abs_error": float(error.max()),
+        "mean_abs_error": float(error.mean()),
+        "p99_abs_error": float(np.percentile(error, 99)),
+        "mismatch_rate": float(mismatched.mean()),
+        "atol": atol,
+        "rtol": rtol,
+        "input_name": INPUT_NAME,
+        "output_name": session.get_outputs()[0].name,
+    }
+
+
+def export_onnx(
+    model,
+    filepath: str,
+    X_val: np.ndarray,
+    target_opset: Optional[int] = None,
+    atol: float = 1e-4,
+    rtol: float = 1e-4,
+    max_mismatch_rate: float = 0.001,
+    require_parity: bool = True
+) -> Dict:
+    """
+    ONNX 변환 + 그래프 최적화 + 수치 일치 확인
+
+    트리 런타임 구현 차이로 경계값에 매우 가까운 행은 다른 리프로 갈 수 있으므로
+    행별 허용 오차를 넘은 비율 (max_mismatch_rate)로 판정함
+
+    Args:
+        model: 학습된 CaliforniaHousingModel
+        filepath: 모델 파일 경로 (예: model.joblib). 같은 이름의 .onnx / .parity.json 저장
+        X_val: 일치 확인용 검증 데이터 (원본 특성)
+        target_opset: ONNX opset (기본: select_opset())
+        atol, rtol: 행별 허용 오차
+        max_mismatch_rate: 허용 오차를 넘는 행의 최대 비율
+        require_parity: True면 불일치 시 ONNX 파일을 지우고 RuntimeError
+
+    Returns:
+        일치 보고서 (passed, 오차 통계, opset, 경로, 버전)
+    """
+    model.check_not_quantized("export to ONNX")
+
+    import onnxruntime as ort
+    import skl2onnx
+
+    onnx_path, report_path = onnx_paths(filepath)
+    opset = select_opset(target_opset)
+    optimize_onnx(model_to_onnx(model, opset), onnx_path)
+
+    report = check_parity(model, onnx_path, X_val, atol=atol, rtol=rtol)
+    report.update({
+        "passed": report["mismatch_rate"] <= max_mismatch_rate,
+        "max_mismatch_rate": max_mismatch_rate,
+        "model_type": model.model_type,
+        "opset": opset,
+        "onnx_path": onnx_path,
+        "onnx_size_kb": os.path.getsize(onnx_path) / 1024,
+        # 저장된 그래프에 적용된 오프라인 최적화 수준 (OnnxSession이 다시 최적화하지 않음)
+        "optimization_level": OPTIMIZATION_LEVEL,
+        "skl2onnx_version": skl2onnx.__version__,
+        "onnxruntime_version": ort.__version__,
+        "exported_at": datetime.now().isoformat(),
+    })
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if not report["passed"]:
+        message = (
+            f"ONNX parity check failed: mismatch_rate={report['mismatch_rate']:.4%} "
+            f"(max {max_mismatch_rate:.4%}), max_abs_error={report['max_abs_error']:.3g}. "
+            f"See {report_path}"
+        )
+        if require_parity:
+            os.remove(onnx_path)
+            raise RuntimeError(message)
+        logger.warning(message)
+    else:
+        logger.info(
+            f"ONNX exported to {onnx_path} (opset {opset}, "
+            f"max_abs_error={report['max_abs_error']:.3g})"
+        )
+    return report
@@ -0,0 +1,227 @@
+"""
+Training Profiler Module
+
+학습 단계 (데이터 로드, 학습, 학습 세트 예측, 평가, 저장)별
+wall/CPU 시간과 메모리 사용량 기록
+"""
+
+import os
+import sys
+import time
+import logging
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PhaseStats:
+    """단계 하나의 측정 결과"""
+    name: str
+    wall_s: float
+    cpu_s: float
+    rss_mb: float
+    rss_delta_mb: float
+    peak_rss_mb: float
+    # tracemalloc이 켜진 경우 Python/NumPy 할당 최대값
+    traced_peak_mb: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _rss_mb() -> float:
+    """현재 RSS (MB, Linux /proc/self/statm)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        return 0.0
+
+
+def _reset_peak_rss() -> bool:
+    """
+    프로세스 최대 RSS (VmHWM) 초기화
+
+    Linux 4.0+에서 /proc/self/clear_refs에 5를 쓰면 초기화됨.
+    실패하면 단계별 최대값 대신 프로세스 시작 이후 최대값을 사용
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> float:
+    """최대 RSS (MB). VmHWM이 없으면 getrusage 값 사용"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # resource는 Unix 전용이므로 여기서 import (Windows에서도 trainer import 가능)
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    # Linux는 kB, macOS는 bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+class TrainingProfiler:
+    """
+    학습 단계별 프로파일러
+
+    사용 예:
+        profiler = TrainingProfiler()
+        with profiler.phase("load"):
+            ...
+        profiler.report()
+
+    단계는 중첩 가능하며 이름은 "train/fit"처럼 경로로 기록됨
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        Args:
+            trace_memory: tracemalloc으로 Python/NumPy 할당 최대값 측정
+                (할당마다 오버헤드가 있으므로 기본은 끔)
+        """
+        self.trace_memory = trace_memory
+        self.phases: List[PhaseStats] = []
+        self._stack: List[str] = []
+        # 열린 단계별 [최대 RSS, 최대 tracemalloc]. 하위 단계가 최대값을
+        # 초기화하므로 하위 단계 시작/종료 시 상위 단계로 전파
+        self._peaks: List[List[float]] = []
+
+    def _current_peaks(self) -> List[float]:
+        traced = tracemalloc.get_traced_memory()[1] / 2 ** 20 if tracemalloc.is_tracing() else 0.0
+        return [_peak_rss_mb(), traced]
+
+    def _propagate(self, peaks: List[float]) -> None:
+        for frame in self._peaks:
+            frame[0] = max(frame[0], peaks[0])
+            frame[1] = max(frame[1], peaks[1])
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """단계 측정 컨텍스트"""
+        self._propagate(self._current_peaks())
+        self._stack.append(name)
+        self._peaks.append([0.0, 0.0])
+        path = "/".join(self._stack)
+
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+        _reset_peak_rss()
+        rss_start = _rss_mb()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_s = time.perf_counter() - wall_start
+            cpu_s = time.process_time() - cpu_start
+            rss = _rss_mb()
+            peaks = self._current_peaks()
+            frame = self._peaks.pop()
+            peak_rss_mb = max(frame[0], peaks[0])
+            traced_peak_mb = max(frame[1], peaks[1]) if self.trace_memory else None
+            self._propagate(peaks)
+            if started_tracing:
+                tracemalloc.stop()
+
+            stats = PhaseStats(
+                name=path,
+                wall_s=wall_s,
+                cpu_s=cpu_s,
+                rss_mb=rss,
+                rss_delta_mb=rss - rss_start,
+                peak_rss_mb=peak_rss_mb,
+                traced_peak_mb=traced_peak_mb
+            )
+            self.phases.append(stats)
+            self._stack.pop()
+            logger.debug(
+                f"Phase {path}: wall={wall_s:.3f}s cpu={cpu_s:.3f}s "
+                f"rss={rss:.1f}MB peak={stats.peak_rss_mb:.1f}MB"
+            )
+
+    def report(self) -> Dict:
+        """
+        구조화된 결과
+
+        Returns:
+            {"phases": [단계별 결과], "total_wall_s": 최상위 단계 wall 시간 합}
+        """
+        top_level = [p for p in self.phases if "/" not in p.name]
+        return {
+            "phases": [p.to_dict() for p in self.phases],
+            "total_wall_s": sum(p.wall_s for p in top_level),
+        }
+
+    def metrics(self, prefix: str = "phase") -> Dict[str, float]:
+        """
+        평평한 메트릭 dict (예: phase_train.fit_wall_s)
+
+        Args:
+            prefix: 메트릭 이름 접두사
+        """
+        flat = {}
+        for p in self.phases:
+            key = f"{prefix}_{p.name.replace('/', '.')}"
+            flat[f"{key}_wall_s"] = p.wall_s
+            flat[f"{key}_cpu_s"] = p.cpu_s
+            flat[f"{key}_peak_rss_mb"] = p.peak_rss_mb
+            if p.traced_peak_mb is not None:
+                flat[f"{key}_traced_peak_mb"] = p.traced_peak_mb
+        return flat
+
+    def log_to_mlflow(self, prefix: str = "phase") -> bool:
+        """
+        현재 MLflow run에 단계별 메트릭 기록
+
+        Returns:
+            기록 여부 (mlflow 미설치 또는 활성 run이 없으면 False)
+        """
+        try:
+            import mlflow
+        except ImportError:
+            logger.warning("mlflow not installed. Skipping phase metrics export.")
+            return False
+        if mlflow.active_run() is None:
+            logger.warning("No active MLflow run. Skipping phase metrics export.")
+            return False
+
+        mlflow.log_metrics(self.metrics(prefix))
+        return True
+
+    def format_table(self) -> str:
+        """단계별 결과 표 (로그/콘솔 출력용)"""
+        lines = [f"{'phase':<28}{'wall_s':>10}{'cpu_s':>10}{'rss_mb':>10}{'peak_mb':>10}"]
+        for p in self.phases:
+            indent = "  " * p.name.count("/")
+            label = indent + p.name.rsplit("/", 1)[-1]
+            lines.append(
+                f"{label:<28}{p.wall_s:>10.3f}{p.cpu_s:>10.3f}"
+                f"{p.rss_mb:>10.1f}{p.peak_rss_mb:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+def profile_phase(profiler: Optional[TrainingProfiler], name: str):
+    """profiler가 없으면 아무것도 하지 않는 단계 컨텍스트"""
+    return profiler.phase(name) if profiler is not None else nullcontext()
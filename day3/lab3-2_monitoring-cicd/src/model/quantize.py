@@ -0,0 +1,315 @@
+"""
+Tree Quantization Module
+
+트리 앙상블 전용 양자화.
+특성별로 앙상블이 실제 사용하는 분할 경계를 최대 255개 절단점으로 모아
+분할 경계는 uint8 절단점 인덱스로, 리프 값은 float16으로 저장하고,
+입력은 uint8 bin 코드로 변환한 뒤 코드끼리 비교하여 추론함.
+
+bin 코드 = 값보다 작은 절단점 수 (FeatureBinner와 같은 규칙)이므로
+"x <= 절단점[k]"와 "코드 <= k"가 같음. 특성의 고유 경계가 절단점 수 이하이면
+분할 결과가 원본 트리와 정확히 같고, 리프 값의 float16 반올림만 오차가 됨
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+from sklearn.metrics import mean_absolute_error
+
+from .binning import MAX_BINS, FeatureBinner
+
+logger = logging.getLogger(__name__)
+
+# sklearn 트리 구조 (estimators_의 각 트리에 tree_가 있는 앙상블)
+QUANTIZABLE_MODELS = ("random_forest", "gradient_boosting")
+
+TREE_LEAF = -1
+
+
+def _ensemble_trees(estimator) -> List:
+    """앙상블의 sklearn Tree 목록"""
+    return [e.tree_ for e in np.ravel(estimator.estimators_)]
+
+
+def _tree_nbytes(tree) -> int:
+    """sklearn Tree의 노드/값 배열 크기 (bytes)"""
+    state = tree.__getstate__()
+    return int(state["nodes"].nbytes + state["values"].nbytes)
+
+
+def _split_thresholds(trees: List, n_features: int) -> List[np.ndarray]:
+    """특성별 분할 경계 (분할 노드마다 한 번씩)"""
+    features = np.concatenate([t.feature[t.children_left != TREE_LEAF] for t in trees])
+    thresholds = np.concatenate([t.threshold[t.children_left != TREE_LEAF] for t in trees])
+    return [thresholds[features == f] for f in range(n_features)]
+
+
+def learn_cut_points(
+    trees: List,
+    n_features: int,
+    max_cuts: int = MAX_BINS
+) -> List[np.ndarray]:
+    """
+    특성별 절단점 학습
+
+    고유 분할 경계가 max_cuts 이하이면 그대로 사용 (정확). 넘으면 경계 분포
+    (노드마다 한 번씩 센 값)의 분위수에 해당하는 실제 경계 값을 선택
+
+    Args:
+        trees: sklearn Tree 목록
+        n_features: 입력 특성 수
+        max_cuts: 특성당 최대 절단점 수 (uint8 코드 0 ~ max_cuts)
+
+    Returns:
+        특성별 정렬된 절단점 배열 목록
+    """
+    if not 1 <= max_cuts <= MAX_BINS:
+        raise ValueError(f"max_cuts must be between 1 and {MAX_BINS}")
+
+    cuts = []
+    for thresholds in _split_thresholds(trees, n_features):
+        distinct = np.unique(thresholds)
+        if len(distinct) > max_cuts:
+            percentiles = np.linspace(0, 100, num=max_cuts)
+            distinct = np.unique(np.percentile(thresholds, percentiles, method="inverted_cdf"))
+        cuts.append(distinct)
+    return cuts
+
+
+class QuantizedForest:
+    """
+    uint8 분할 경계 / float16 리프 값으로 저장된 트리 앙상블
+
+    모든 트리의 노드를 하나의 평평한 배열로 이어 붙이고, 리프는 자기 자신을
+    가리키게 하여 (경계 코드 255) 최대 깊이만큼 반복하면 모든 행이 리프에 도달함.
+    예측 = base + scale * (트리별 리프 값 합)
+    """
+
+    def __init__(
+        self,
+        binner: FeatureBinner,
+        roots: np.ndarray,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        value: np.ndarray,
+        max_depth: int,
+        base: float = 0.0,
+        scale: float = 1.0
+    ):
+        self.binner = binner
+        self.roots = roots
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.max_depth = max_depth
+        self.base = base
+        self.scale = scale
+        self.n_features_in_ = len(binner.thresholds)
+
+    @property
+    def nbytes(self) -> int:
+        """노드/값/절단점 배열 크기 (bytes)"""
+        arrays = (self.roots, self.feature, self.threshold, self.left, self.right, self.value)
+        return int(sum(a.nbytes for a in arrays) + sum(t.nbytes for t in self.binner.thresholds))
+
+    def bin(self, X: np.ndarray) -> np.ndarray:
+        """
+        uint8 bin 코드로 변환
+
+        sklearn 트리는 입력을 float32로 비교하므로 같은 값으로 변환한 뒤 코드 계산
+        """
+        return self.binner.transform(np.asarray(X, dtype=np.float32))
+
+    def predict_binned(self, codes: np.ndarray, batch_size: int = 4096) -> np.ndarray:
+        """
+        bin 코드로 예측
+
+        Args:
+            codes: bin() 결과 (n_samples, n_features) uint8
+            batch_size: 한 번에 순회할 행 수 (행 x 트리 노드 인덱스 메모리 제한)
+
+        Returns:
+            예측값 배열
+        """
+        codes = np.asarray(codes, dtype=np.uint8)
+        if codes.ndim == 1:
+            codes = codes.reshape(1, -1)
+
+        out = np.empty(len(codes))
+        for start in range(0, len(codes), batch_size):
+            chunk = codes[start:start + batch_size]
+            rows = np.arange(len(chunk))[:, None]
+            node = np.broadcast_to(self.roots, (len(chunk), len(self.roots)))
+            for _ in range(self.max_depth):
+                go_left = chunk[rows, self.feature[node]] <= self.threshold[node]
+                node = np.where(go_left, self.left[node], self.right[node])
+            leaves = self.value[node].sum(axis=1, dtype=np.float64)
+            out[start:start + len(chunk)] = self.base + self.scale * leaves
+        return out
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """원본 (모델 입력 공간) 특성으로 예측"""
+        return self.predict_binned(self.bin(X))
+
+
+def quantize_forest(estimator, model_type: str, max_cuts: int = MAX_BINS) -> QuantizedForest:
+    """
+    학습된 RandomForestRegressor / GradientBoostingRegressor 양자화
+
+    Args:
+        estimator: 학습된 앙상블
+        model_type: CaliforniaHousingModel 모델 유형
+        max_cuts: 특성당 최대 절단점 수
+
+    Returns:
+        QuantizedForest
+    """
+    if model_type not in QUANTIZABLE_MODELS:
+        raise ValueError(
+            f"Cannot quantize {model_type} models. Supported: {list(QUANTIZABLE_MODELS)}"
+        )
+
+    trees = _ensemble_trees(estimator)
+    n_features = estimator.n_features_in_
+    cuts = learn_cut_points(trees, n_features, max_cuts)
+    binner = FeatureBinner(max_bins=MAX_BINS)
+    binner.thresholds = cuts
+
+    counts = [tree.node_count for tree in trees]
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    total = int(sum(counts))
+    feature = np.zeros(total, dtype=np.uint8 if n_features <= 256 else np.uint16)
+    threshold = np.full(total, MAX_BINS, dtype=np.uint8)
+    left = np.empty(total, dtype=np.int32)
+    right = np.empty(total, dtype=np.int32)
+    value = np.empty(total, dtype=np.float16)
+
+    for tree, offset in zip(trees, offsets):
+        span = slice(offset, offset + tree.node_count)
+        nodes = np.arange(offset, offset + tree.node_count, dtype=np.int32)
+        split = tree.children_left != TREE_LEAF
+
+        feature[span][split] = tree.feature[split]
+        # 경계 t를 가장 가까운 절단점 인덱스로 (고유 경계 수 <= max_cuts면 정확히 일치)
+        for f in np.unique(tree.feature[split]):
+            mask = split & (tree.feature == f)
+            cut = cuts[f]
+            index = np.clip(np.searchsorted(cut, tree.threshold[mask]), 0, len(cut) - 1)
+            lower = np.clip(index - 1, 0, len(cut) - 1)
+            values = tree.threshold[mask]
+            closer = np.abs(cut[lower] - values) < np.abs(cut[index] - values)
+            threshold[span][mask] = np.where(closer, lower, index)
+
+        left[span] = np.where(split, tree.children_left + offset, nodes)
+        right[span] = np.where(split, tree.children_right + offset, nodes)
+        value[span] = tree.value[:, 0, 0]
+
+    if model_type == "random_forest":
+        base, scale = 0.0, 1.0 / len(trees)
+    else:
+        # init="zero"이면 초기 예측 0, 기본 (DummyRegressor)이면 학습 타겟 평균
+        init = getattr(estimator.init_, "constant_", 0.0)
+        base, scale = float(np.ravel(init)[0]), estimator.learning_rate
+
+    return QuantizedForest(
+        binner=binner,
+        roots=offsets.astype(np.int32),
+        feature=feature,
+        threshold=threshold,
+        left=left,
+        right=right,
+        value=value,
+        max_depth=max(tree.max_depth for tree in trees),
+        base=base,
+        scale=scale
+    )
+
+
+def quantize_model(
+    model,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+    max_cuts: int = MAX_BINS
+) -> Tuple[object, Dict]:
+    """
+    CaliforniaHousingModel 양자화 및 검증 세트 정확도 비교
+
+    Args:
+        model: 학습된 random_forest / gradient_boosting CaliforniaHousingModel
+        X_val, y_val: 검증 데이터 (원본 특성)
+        max_cuts: 특성당 최대 절단점 수
+
+    Returns:
+        (양자화된 CaliforniaHousingModel, 보고서)
+    """
+    from .trainer import CaliforniaHousingModel
+
+    if not model.is_fitted:
+        raise RuntimeError("Model is not fitted. Call train() first.")
+    model.check_not_quantized("quantize")
+
+    estimator = model.model
+    quantized_forest = quantize_forest(estimator, model.model_type, max_cuts)
+
+    quantized = CaliforniaHousingModel(
+        model_type=model.model_type,
+        model_params=dict(model.model_params),
+        feature_transform=model.feature_transform
+    )
+    quantized.model = quantized_forest
+    quantized.is_fitted = True
+    quantized.provenance = list(model.provenance)
+
+    original_pred = model.predict(X_val)
+    quantized_pred = quantized.predict(X_val)
+    original_bytes = sum(_tree_nbytes(tree) for tree in _ensemble_trees(estimator))
+    original_mae = float(mean_absolute_error(y_val, original_pred))
+    quantized_mae = float(mean_absolute_error(y_val, quantized_pred))
+    n_cuts = [len(c) for c in quantized_forest.binner.thresholds]
+
+    report = {
+        "model_type": model.model_type,
+        "n_trees": int(len(quantized_forest.roots)),
+        "n_nodes": int(len(quantized_forest.value)),
+        "max_cuts": max_cuts,
+        "n_cuts_per_feature": n_cuts,
+        # 모든 특성의 고유 경계가 절단점 수 이하이면 분할 결과가 원본과 같음
+        "exact_splits": bool(all(
+            len(np.unique(t)) <= max_cuts
+            for t in _split_thresholds(_ensemble_trees(estimator), estimator.n_features_in_)
+        )),
+        "original_bytes": int(original_bytes),
+        "quantized_bytes": quantized_forest.nbytes,
+        "compression_ratio": original_bytes / quantized_forest.nbytes,
+        "val_mae": original_mae,
+        "quantized_val_mae": quantized_mae,
+        "mae_delta": quantized_mae - original_mae,
+        "max_abs_pred_diff": float(np.max(np.abs(quantized_pred - original_pred))),
+    }
+    # 저장 메타데이터 (.chm 헤더 포함)에 양자화 사실을 기록하고, sklearn estimator가
+    # 필요한 API (export_onnx, compress, partial_retrain)는 이 값으로 거부함
+    quantized.quantization = {
+        "method": "uint8_splits_float16_leaves",
+        "max_cuts": max_cuts,
+        "n_cuts_per_feature": n_cuts,
+        "exact_splits": report["exact_splits"],
+        "compression_ratio": report["compression_ratio"],
+        "mae_delta": report["mae_delta"],
+    }
+    quantized.metrics = {
+        **model.metrics,
+        "quantized_val_mae": quantized_mae,
+        "quantization_mae_delta": report["mae_delta"],
+        "quantization_compression_ratio": report["compression_ratio"],
+    }
+
+    logger.info(
+        f"Quantized {report['n_trees']} trees: {original_bytes / 2 ** 20:.2f}MB -> "
+        f"{quantized_forest.nbytes / 2 ** 20:.2f}MB, MAE {original_mae:.4f} -> {quantized_mae:.4f}"
+    )
+    return quantized, report
@@ -0,0 +1,332 @@
+"""
+Model Search Module
+
+모델 유형 + 하이퍼파라미터 조합을 successive halving / Hyperband로 탐색.
+후보는 프로세스 풀에서 병렬로 학습되며, 학습/검증 배열은 공유 메모리로 전달됨
+"""
+
+import os
+import math
+import time
+import pickle
+import logging
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.metrics import mean_absolute_error
+
+from .shared import attach_worker, shared_arrays, worker_array
+
+logger = logging.getLogger(__name__)
+
+# 모델 유형별 하이퍼파라미터 후보
+DEFAULT_SEARCH_SPACE: Dict[str, Dict[str, List]] = {
+    "random_forest": {
+        "n_estimators": [50, 100, 200],
+        "max_depth": [6, 10, 16, None],
+        "min_samples_leaf": [1, 2, 4],
+        "max_features": [0.5, 1.0],
+    },
+    "gradient_boosting": {
+        "n_estimators": [100, 200, 400],
+        "max_depth": [3, 5, 7],
+        "learning_rate": [0.05, 0.1, 0.2],
+        "subsample": [0.8, 1.0],
+    },
+    "linear_regression": {},
+}
+
+
+@dataclass
+class Trial:
+    """후보 설정 하나와 단계별 결과"""
+    trial_id: int
+    model_type: str
+    params: Dict
+    scores: List[Tuple[int, float]] = field(default_factory=list)
+    fit_time_s: float = 0.0
+
+    @property
+    def last_score(self) -> float:
+        return self.scores[-1][1] if self.scores else math.inf
+
+    @property
+    def max_resource(self) -> int:
+        return self.scores[-1][0] if self.scores else 0
+
+
+@dataclass
+class SearchResult:
+    """탐색 결과"""
+    best_model: object
+    best_trial: Trial
+    leaderboard: List[Dict]
+    n_fits: int
+    elapsed_s: float
+
+
+def sample_configs(
+    space: Dict[str, Dict[str, List]],
+    n_configs: int,
+    random_state: int = 42
+) -> List[Tuple[str, Dict]]:
+    """
+    탐색 공간에서 중복 없이 설정 추출
+
+    모델 유형을 번갈아 선택하여 유형별로 고르게 추출
+
+    Args:
+        space: {모델 유형: {파라미터: 후보 리스트}}
+        n_configs: 추출할 설정 수
+        random_state: 랜덤 시드
+
+    Returns:
+        [(모델 유형, 파라미터)] 리스트
+    """
+    rng = np.random.RandomState(random_state)
+    pools = {}
+    for model_type, grid in space.items():
+        names = sorted(grid)
+        combos = [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+        pools[model_type] = [combos[i] for i in rng.permutation(len(combos))]
+
+    configs = []
+    for model_type in itertools.cycle(list(pools)):
+        if len(configs) >= n_configs or not any(pools.values()):
+            break
+        if pools[model_type]:
+            configs.append((model_type, pools[model_type].pop()))
+    return configs
+
+
+def _trial_params(model_type: str, params: Dict) -> Dict:
+    """후보 학습에 실제로 사용하는 파라미터 (탐색 파라미터 + n_jobs/random_state)"""
+    from .trainer import CaliforniaHousingModel
+
+    defaults = CaliforniaHousingModel.SUPPORTED_MODELS[model_type]().get_params()
+    trial_params = dict(params)
+    # 워커 수만큼 프로세스가 병렬이므로 후보 내부 병렬화는 끔
+    if "n_jobs" in defaults:
+        trial_params["n_jobs"] = 1
+    if "random_state" in defaults:
+        trial_params.setdefault("random_state", 42)
+    return trial_params
+
+
+def _run_trial(
+    model_type: str,
+    params: Dict,
+    n_samples: int,
+    return_model: bool
+) -> Tuple[float, float, Optional[bytes]]:
+    """
+    워커에서 후보 하나를 앞쪽 n_samples 행으로 학습하고 검증 MAE 계산
+
+    학습 데이터는 부모에서 섞어 두었으므로 앞쪽 행은 무작위 부분 표본
+    """
+    from .trainer import CaliforniaHousingModel
+
+    X_train, y_train = worker_array("X_train"), worker_array("y_train")
+    X_val, y_val = worker_array("X_val"), worker_array("y_val")
+
+    start = time.perf_counter()
+    model_class = CaliforniaHousingModel.SUPPORTED_MODELS[model_type]
+    estimator = model_class(**_trial_params(model_type, params))
+    estimator.fit(X_train[:n_samples], y_train[:n_samples])
+    fit_time_s = time.perf_counter() - start
+
+    score = mean_absolute_error(y_val, estimator.predict(X_val))
+    return score, fit_time_s, pickle.dumps(estimator) if return_model else None
+
+
+def _resource_schedule(n_train: int, min_resource: int, eta: int) -> List[int]:
+    """min_resource부터 eta배씩 늘려 n_train에서 끝나는 행 수 목록"""
+    n_rungs = max(1, int(math.floor(math.log(n_train / min_resource, eta))) + 1)
+    return [
+        min(n_train, int(round(n_train / eta ** (n_rungs - 1 - i))))
+        for i in range(n_rungs)
+    ]
+
+
+def _halving_bracket(
+    executor: ProcessPoolExecutor,
+    trials: List[Trial],
+    schedule: List[int],
+    eta: int
+) -> Tuple[Trial, bytes, int]:
+    """
+    한 bracket의 successive halving 실행
+
+    각 단계에서 모든 생존 후보를 같은 행 수로 학습하고 상위 1/eta만 다음 단계로 보냄.
+    마지막 단계 (전체 학습 데이터)의 최고 후보 모델을 반환.
+    """
+    survivors = list(trials)
+    n_fits = 0
+    models: Dict[int, bytes] = {}
+
+    for rung, n_samples in enumerate(schedule):
+        final = rung == len(schedule) - 1
+        futures = {
+            trial.trial_id: executor.submit(
+                _run_trial, trial.model_type, trial.params, n_samples, final
+            )
+            for trial in survivors
+        }
+        for trial in survivors:
+            score, fit_time_s, model_bytes = futures[trial.trial_id].result()
+            trial.scores.append((n_samples, score))
+            trial.fit_time_s += fit_time_s
+            if model_bytes is not None:
+                models[trial.trial_id] = model_bytes
+        n_fits += len(survivors)
+
+        survivors.sort(key=lambda t: t.last_score)
+        logger.info(
+            f"Rung {rung}: {len(survivors)} trials on {n_samples} rows, "
+            f"best MAE={survivors[0].last_score:.4f}"
+        )
+        if not final:
+            survivors = survivors[:max(1, len(survivors) // eta)]
+
+    best = survivors[0]
+    return best, models[best.trial_id], n_fits
+
+
+def search_models(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+    space: Optional[Dict[str, Dict[str, List]]] = None,
+    strategy: str = "halving",
+    n_configs: int = 27,
+    eta: int = 3,
+    min_resource: Optional[int] = None,
+    n_workers: Optional[int] = None,
+    random_state: int = 42
+) -> SearchResult:
+    """
+    모델 유형 + 하이퍼파라미터 탐색
+
+    strategy="halving": n_configs개 후보로 successive halving 한 번 실행
+    strategy="hyperband": 후보 수와 시작 행 수를 달리한 여러 bracket 실행
+
+    Args:
+        X_train, y_train: 학습 데이터
+        X_val, y_val: 검증 데이터 (후보 비교용)
+        space: 탐색 공간 (기본: DEFAULT_SEARCH_SPACE)
+        strategy: "halving" 또는 "hyperband"
+        n_configs: 첫 단계 후보 수 (hyperband는 가장 큰 bracket 기준)
+        eta: 단계마다 남기는 비율의 역수
+        min_resource: 첫 단계 학습 행 수 (기본: 학습 데이터 / eta^2)
+        n_workers: 프로세스 수 (기본: CPU 수)
+        random_state: 랜덤 시드
+
+    Returns:
+        SearchResult (최고 모델, 리더보드)
+    """
+    from .trainer import CaliforniaHousingModel
+
+    if strategy not in ("halving", "hyperband"):
+        raise ValueError(f"Unknown strategy: {strategy}. Supported: ['halving', 'hyperband']")
+    if eta < 2:
+        raise ValueError("eta must be >= 2")
+
+    space = space or DEFAULT_SEARCH_SPACE
+    unknown = set(space) - set(CaliforniaHousingModel.SUPPORTED_MODELS)
+    if unknown:
+        raise ValueError(f"Unsupported model types in search space: {sorted(unknown)}")
+
+    n_train = len(X_train)
+    min_resource = min_resource or max(eta, n_train // eta ** 2)
+    full_schedule = _resource_schedule(n_train, min_resource, eta)
+
+    if strategy == "halving":
+        brackets = [(n_configs, full_schedule)]
+    else:
+        # bracket s: 후보 n_configs / eta^(s_max - s)개, 단계 s+1개
+        s_max = len(full_schedule) - 1
+        brackets = [
+            (max(1, int(math.ceil(n_configs / eta ** (s_max - s)))), full_schedule[s_max - s:])
+            for s in range(s_max, -1, -1)
+        ]
+
+    # 부분 표본이 무작위가 되도록 학습 데이터를 한 번 섞어서 공유
+    order = np.random.RandomState(random_state).permutation(n_train)
+    arrays = {
+        "X_train": np.asarray(X_train, dtype=np.float64)[order],
+        "y_train": np.asarray(y_train, dtype=np.float64)[order],
+        "X_val": np.asarray(X_val, dtype=np.float64),
+        "y_val": np.asarray(y_val, dtype=np.float64),
+    }
+    start = time.perf_counter()
+    all_trials: List[Trial] = []
+    finalists: List[Tuple[Trial, bytes]] = []
+    n_fits = 0
+    n_workers = n_workers or os.cpu_count() or 1
+
+    with shared_arrays(arrays) as specs:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=attach_worker, initargs=(specs,)
+        ) as executor:
+            for bracket, (n_bracket, schedule) in enumerate(brackets):
+                configs = sample_configs(space, n_bracket, random_state + bracket)
+                trials = [
+                    Trial(trial_id=len(all_trials) + i, model_type=m, params=p)
+                    for i, (m, p) in enumerate(configs)
+                ]
+                all_trials.extend(trials)
+                best, model_bytes, fits = _halving_bracket(executor, trials, schedule, eta)
+                finalists.append((best, model_bytes))
+                n_fits += fits
+
+    best_trial, model_bytes = min(finalists, key=lambda f: f[0].last_score)
+    estimator = pickle.loads(model_bytes)
+    model_params = _trial_params(best_trial.model_type, best_trial.params)
+    if "n_jobs" in model_params:
+        # 워커에서는 단일 스레드로 학습했으므로 서빙용 기본값으로 되돌림
+        # (서빙 시 apply_thread_budget이 스레드 예산에 맞게 다시 설정)
+        model_params["n_jobs"] = -1
+        estimator.set_params(n_jobs=-1)
+    best_model = CaliforniaHousingModel(
+        model_type=best_trial.model_type,
+        model_params=model_params
+    )
+    best_model.model = estimator
+    best_model.is_fitted = True
+    best_model.metrics = {"val_mae": best_trial.last_score}
+
+    elapsed_s = time.perf_counter() - start
+    leaderboard = _leaderboard(all_trials)
+    logger.info(
+        f"Search finished: {len(all_trials)} trials, {n_fits} fits in {elapsed_s:.1f}s. "
+        f"Best: {best_trial.model_type} {best_trial.params} MAE={best_trial.last_score:.4f}"
+    )
+    return SearchResult(
+        best_model=best_model,
+        best_trial=best_trial,
+        leaderboard=leaderboard,
+        n_fits=n_fits,
+        elapsed_s=elapsed_s
+    )
+
+
+def _leaderboard(trials: List[Trial]) -> List[Dict]:
+    """더 많은 행으로 평가된 후보를 먼저, 같은 단계에서는 MAE 순으로 정렬"""
+    ranked = sorted(trials, key=lambda t: (-t.max_resource, t.last_score))
+    return [
+        {
+            "rank": rank,
+            "trial_id": t.trial_id,
+            "model_type": t.model_type,
+            "params": t.params,
+            "n_samples": t.max_resource,
+            "val_mae": round(t.last_score, 6),
+            "rungs": len(t.scores),
+            "fit_time_s": round(t.fit_time_s, 3),
+        }
+        for rank, t in enumerate(ranked, start=1)
+    ]
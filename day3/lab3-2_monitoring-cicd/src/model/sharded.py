@@ -0,0 +1,246 @@
+"""
+Sharded Forest Training Module
+
+학습 데이터를 shard로 나눠 shard마다 독립적인 서브 포레스트를 학습하고
+(다른 시드), estimators_를 합쳐 하나의 Random Forest 모델로 만듦.
+
+각 워커는 자기 shard만 읽으므로 워커당 메모리는 shard 크기로 제한되며,
+프로세스 풀 (train_sharded) 또는 여러 노드 (scripts/9_train_sharded.py,
+KFP ParallelFor 태스크) 어디서든 같은 shard 분할로 학습한 뒤 merge_models()로 합침
+"""
+
+import os
+import copy
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .shared import attach_worker, shared_arrays, worker_array
+
+logger = logging.getLogger(__name__)
+
+# 트리를 독립적으로 학습하여 합칠 수 있는 (배깅) 모델
+MERGEABLE_MODELS = ("random_forest",)
+
+
+def shard_rows(
+    n_samples: int,
+    n_shards: int,
+    shard: int,
+    random_state: int = 42
+) -> np.ndarray:
+    """
+    shard의 행 인덱스 (정렬됨)
+
+    전체 행을 한 번 섞은 뒤 연속 구간으로 나누므로 같은 인자로 호출하면
+    어느 프로세스/노드에서든 같은 분할을 얻음
+
+    Args:
+        n_samples: 전체 행 수
+        n_shards: shard 수
+        shard: shard 번호 (0 ~ n_shards-1)
+        random_state: 셔플 랜덤 시드
+
+    Returns:
+        행 인덱스 배열
+    """
+    if not 0 <= shard < n_shards:
+        raise ValueError(f"shard must be in [0, {n_shards}), got {shard}")
+    order = np.random.RandomState(random_state).permutation(n_samples)
+    bounds = np.linspace(0, n_samples, n_shards + 1).astype(int)
+    return np.sort(order[bounds[shard]:bounds[shard + 1]])
+
+
+def shard_estimators(n_estimators: int, n_shards: int) -> List[int]:
+    """트리 수를 shard에 고르게 배분 (앞쪽 shard가 나머지를 가짐)"""
+    if n_estimators < n_shards:
+        raise ValueError(f"n_estimators ({n_estimators}) must be >= n_shards ({n_shards})")
+    base, extra = divmod(n_estimators, n_shards)
+    return [base + (1 if i < extra else 0) for i in range(n_shards)]
+
+
+def fit_shard(
+    X: np.ndarray,
+    y: np.ndarray,
+    shard: int,
+    n_estimators: int,
+    model_params: Optional[Dict] = None,
+    random_state: int = 42
+):
+    """
+    shard 하나로 서브 포레스트 학습
+
+    Args:
+        X: shard 특성
+        y: shard 타겟
+        shard: shard 번호 (시드와 provenance에 사용)
+        n_estimators: 서브 포레스트 트리 수
+        model_params: Random Forest 하이퍼파라미터 (n_estimators/random_state 제외)
+        random_state: 기본 시드 (shard 시드는 random_state + shard)
+
+    Returns:
+        학습된 CaliforniaHousingModel
+    """
+    from .trainer import CaliforniaHousingModel
+
+    params = dict(model_params or CaliforniaHousingModel(model_type="random_forest").model_params)
+    params.update(n_estimators=n_estimators, random_state=random_state + shard)
+
+    model = CaliforniaHousingModel(model_type="random_forest", model_params=params)
+    model.train(X, y, data_tag=f"shard-{shard}")
+    return model
+
+
+def merge_models(models: List, model_params: Optional[Dict] = None):
+    """
+    서브 포레스트 모델을 하나의 모델로 병합
+
+    트리 객체는 복사하지 않고 공유함 (입력 모델은 변경되지 않음).
+    provenance는 shard별 기록을 병합된 트리 인덱스 범위로 다시 매핑함
+
+    Args:
+        models: 학습된 CaliforniaHousingModel 리스트 (같은 모델 유형/특성/피처 변환)
+        model_params: 병합 모델에 기록할 하이퍼파라미터 (기본: 첫 모델 기준)
+
+    Returns:
+        병합된 CaliforniaHousingModel
+    """
+    from .trainer import CaliforniaHousingModel
+
+    if not models:
+        raise ValueError("No models to merge")
+    first = models[0]
+    if first.model_type not in MERGEABLE_MODELS:
+        raise ValueError(
+            f"Cannot merge {first.model_type} models. Supported: {list(MERGEABLE_MODELS)}"
+        )
+
+    transform_spec = first.feature_transform.to_dict() if first.feature_transform else None
+    for model in models:
+        if not model.is_fitted:
+            raise RuntimeError("All models must be fitted before merging.")
+        if model.model_type != first.model_type:
+            raise ValueError("All models must have the same model_type")
+        if model.model.n_features_in_ != first.model.n_features_in_:
+            raise ValueError("All models must be trained on the same number of features")
+        spec = model.feature_transform.to_dict() if model.feature_transform else None
+        if spec != transform_spec:
+            raise ValueError("All models must share the same fitted feature_transform")
+
+    params = dict(model_params or first.model_params)
+    forest = copy.copy(first.model)
+    forest.estimators_ = [tree for model in models for tree in model.model.estimators_]
+    forest.n_estimators = params["n_estimators"] = len(forest.estimators_)
+    if "n_jobs" in params:
+        forest.n_jobs = params["n_jobs"]
+    merged = CaliforniaHousingModel(
+        model_type=first.model_type,
+        model_params=params,
+        feature_transform=copy.deepcopy(first.feature_transform)
+    )
+    merged.model = forest
+    merged.is_fitted = True
+
+    offset = 0
+    for model in models:
+        for record in model.provenance:
+            start, end = record["estimators"]
+            merged.provenance.append({
+                **record, "mode": "shard", "estimators": [start + offset, end + offset]
+            })
+        offset += len(model.model.estimators_)
+    merged.metrics = {
+        "n_shards": len(models),
+        "n_train_rows": sum(r["n_samples"] for r in merged.provenance),
+    }
+
+    logger.info(f"Merged {len(models)} sub-forests into {forest.n_estimators} trees")
+    return merged
+
+
+def _fit_worker_shard(
+    shard: int,
+    bounds: Tuple[int, int],
+    n_estimators: int,
+    model_params: Dict,
+    random_state: int
+):
+    """워커에서 공유 배열의 shard 구간으로 서브 포레스트 학습"""
+    start, end = bounds
+    X, y = worker_array("X"), worker_array("y")
+    return fit_shard(X[start:end], y[start:end], shard, n_estimators, model_params, random_state)
+
+
+def train_sharded(
+    X: np.ndarray,
+    y: np.ndarray,
+    n_shards: int = 4,
+    n_estimators: Optional[int] = None,
+    model_params: Optional[Dict] = None,
+    feature_transform=None,
+    n_workers: Optional[int] = None,
+    random_state: int = 42
+):
+    """
+    프로세스 풀에서 shard별 서브 포레스트를 학습하고 병합
+
+    학습 데이터를 한 번 섞어 공유 메모리에 올리고, 각 워커는 자기 shard의
+    연속 구간 (뷰)만 사용함. feature_transform은 전체 데이터로 한 번 학습하여
+    모든 shard에 같은 변환이 적용되도록 함
+
+    Args:
+        X: 학습 특성
+        y: 학습 타겟
+        n_shards: shard 수
+        n_estimators: 전체 트리 수 (기본: model_params 또는 기본값의 n_estimators)
+        model_params: Random Forest 하이퍼파라미터
+        feature_transform: 피처 변환 그래프 (선택)
+        n_workers: 프로세스 수 (기본: min(n_shards, CPU 수))
+        random_state: 셔플 및 shard 시드
+
+    Returns:
+        병합된 CaliforniaHousingModel
+    """
+    from .trainer import CaliforniaHousingModel
+
+    params = dict(model_params or CaliforniaHousingModel(model_type="random_forest").model_params)
+    n_estimators = n_estimators or params.get("n_estimators", 100)
+    per_shard = shard_estimators(n_estimators, n_shards)
+    # shard 수만큼 프로세스가 병렬이므로 shard 내부 병렬화는 끔
+    worker_params = {**params, "n_jobs": 1}
+
+    X = np.asarray(X, dtype=np.float64)
+    if feature_transform is not None:
+        feature_transform.fit(X)
+        X = feature_transform.transform(X)
+
+    order = np.random.RandomState(random_state).permutation(len(X))
+    bounds = np.linspace(0, len(X), n_shards + 1).astype(int)
+    arrays = {"X": X[order], "y": np.asarray(y, dtype=np.float64)[order]}
+    n_workers = n_workers or min(n_shards, os.cpu_count() or 1)
+
+    start = time.perf_counter()
+    with shared_arrays(arrays) as specs:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=attach_worker, initargs=(specs,)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _fit_worker_shard, shard, (bounds[shard], bounds[shard + 1]),
+                    per_shard[shard], worker_params, random_state
+                )
+                for shard in range(n_shards)
+            ]
+            shard_models = [future.result() for future in futures]
+
+    merged = merge_models(shard_models, model_params={**params, "n_estimators": n_estimators})
+    merged.feature_transform = feature_transform
+    merged.metrics["fit_time_s"] = time.perf_counter() - start
+    logger.info(
+        f"Sharded training: {n_shards} shards x ~{per_shard[0]} trees "
+        f"in {merged.metrics['fit_time_s']:.1f}s"
+    )
+    return merged
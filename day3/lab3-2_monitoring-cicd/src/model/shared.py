@@ -0,0 +1,66 @@
+"""
+Shared Memory Arrays Module
+
+프로세스 풀 워커에 학습 배열을 복사 없이 전달하기 위한 공유 메모리 유틸리티
+(모델 탐색, 교차 검증에서 사용)
+"""
+
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+# 워커 프로세스에서 공유 메모리에 연결한 배열
+_worker_arrays: Dict[str, np.ndarray] = {}
+_worker_segments: List[shared_memory.SharedMemory] = []
+
+# {이름: (세그먼트 이름, shape, dtype)}
+ArraySpecs = Dict[str, Tuple[str, Tuple[int, ...], str]]
+
+
+@contextmanager
+def shared_arrays(arrays: Dict[str, np.ndarray]) -> Iterator[ArraySpecs]:
+    """
+    배열을 공유 메모리에 복사하고 워커 연결 정보를 제공
+
+    with 블록이 끝나면 세그먼트를 해제 (unlink)
+
+    Args:
+        arrays: {이름: 배열}
+
+    Yields:
+        attach_worker()에 전달할 연결 정보
+    """
+    segments = []
+    specs: ArraySpecs = {}
+    try:
+        for key, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            segment = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            segments.append(segment)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+            specs[key] = (segment.name, array.shape, array.dtype.str)
+        yield specs
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def attach_worker(specs: ArraySpecs) -> None:
+    """
+    워커 초기화 함수: 공유 메모리 세그먼트에 연결 (복사 없음)
+
+    ProcessPoolExecutor(initializer=attach_worker, initargs=(specs,))로 사용
+    """
+    for key, (name, shape, dtype) in specs.items():
+        # 워커는 부모의 resource tracker를 공유하므로 정리 (unlink)는 부모가 담당
+        segment = shared_memory.SharedMemory(name=name)
+        _worker_segments.append(segment)
+        _worker_arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)
+
+
+def worker_array(key: str) -> np.ndarray:
+    """워커에서 연결된 공유 배열 조회"""
+    return _worker_arrays[key]
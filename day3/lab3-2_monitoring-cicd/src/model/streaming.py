@@ -0,0 +1,226 @@
+"""
+Streaming Training Module
+
+메모리에 올릴 수 없는 크기의 Parquet 데이터를 배치 단위로 읽어
+partial_fit으로 학습/평가 (out-of-core)
+"""
+
+import os
+import glob
+import time
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TARGET_COLUMN = "target"
+
+
+def _resolve_paths(paths: Union[str, List[str]]) -> List[str]:
+    """디렉토리, glob 패턴, 파일 리스트를 Parquet 파일 목록으로 변환"""
+    if isinstance(paths, str):
+        if os.path.isdir(paths):
+            paths = sorted(glob.glob(os.path.join(paths, "*.parquet")))
+        else:
+            paths = sorted(glob.glob(paths))
+    if not paths:
+        raise FileNotFoundError("No Parquet files found")
+    return list(paths)
+
+
+def iter_parquet_batches(
+    paths: Union[str, List[str]],
+    feature_names: List[str],
+    target_column: str = TARGET_COLUMN,
+    batch_size: int = 10000,
+    holdout_every: Optional[int] = None,
+    holdout: bool = False
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Parquet 파일을 (X, y) 배치로 순차 읽기
+
+    한 번에 batch_size 행만 메모리에 올림. holdout_every가 주어지면 전체 행 번호가
+    holdout_every의 배수인 행을 평가용으로 분리 (holdout=True면 평가 행만 반환)
+
+    Args:
+        paths: Parquet 디렉토리, glob 패턴 또는 파일 리스트
+        feature_names: 특성 컬럼 이름
+        target_column: 타겟 컬럼 이름
+        batch_size: 배치당 행 수
+        holdout_every: 평가용 행 간격 (None이면 분리하지 않음)
+        holdout: True면 평가 행, False면 학습 행
+
+    Yields:
+        (X, y) 배치
+    """
+    import pyarrow.parquet as pq
+
+    columns = list(feature_names) + [target_column]
+    row_offset = 0
+    for path in _resolve_paths(paths):
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            X = np.column_stack([
+                batch.column(name).to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+                for name in feature_names
+            ])
+            y = batch.column(target_column).to_numpy(zero_copy_only=False).astype(np.float64)
+
+            if holdout_every:
+                is_holdout = (np.arange(row_offset, row_offset + len(y)) % holdout_every) == 0
+                mask = is_holdout if holdout else ~is_holdout
+                X, y = X[mask], y[mask]
+            row_offset += batch.num_rows
+
+            if len(y):
+                yield X, y
+
+
+class StreamingMetrics:
+    """배치별 누적합으로 MAE/MSE/RMSE/R² 계산"""
+
+    def __init__(self):
+        self.n = 0
+        self.abs_error = 0.0
+        self.sq_error = 0.0
+        self.y_sum = 0.0
+        self.y_sq_sum = 0.0
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        error = y_true - y_pred
+        self.n += len(y_true)
+        self.abs_error += float(np.abs(error).sum())
+        self.sq_error += float(np.dot(error, error))
+        self.y_sum += float(y_true.sum())
+        self.y_sq_sum += float(np.dot(y_true, y_true))
+
+    def result(self) -> Dict[str, float]:
+        if self.n == 0:
+            raise ValueError("No samples evaluated")
+        mse = self.sq_error / self.n
+        total = self.y_sq_sum - self.y_sum ** 2 / self.n
+        return {
+            "mae": self.abs_error / self.n,
+            "mse": mse,
+            "rmse": float(np.sqrt(mse)),
+            "r2": 1.0 - self.sq_error / total if total > 0 else 0.0,
+        }
+
+
+def train_streaming(
+    paths: Union[str, List[str]],
+    model_type: str = "sgd_regressor",
+    model_params: Optional[Dict] = None,
+    target_column: str = TARGET_COLUMN,
+    batch_size: int = 10000,
+    n_epochs: int = 5,
+    holdout_every: Optional[int] = 5
+):
+    """
+    Parquet 배치 스트림으로 partial_fit 학습
+
+    1) 첫 번째 패스: StandardScaler.partial_fit으로 표준화 통계 계산
+       (모델의 feature_transform으로 저장되어 predict()에서도 적용)
+    2) 이후 n_epochs 패스: 표준화된 배치로 partial_fit
+
+    Args:
+        paths: Parquet 디렉토리, glob 패턴 또는 파일 리스트
+        model_type: partial_fit을 지원하는 모델 유형 (sgd_regressor)
+        model_params: 모델 하이퍼파라미터
+        target_column: 타겟 컬럼 이름
+        batch_size: 배치당 행 수
+        n_epochs: 전체 데이터 반복 횟수
+        holdout_every: 평가용 행 간격 (None이면 평가 생략)
+
+    Returns:
+        (학습된 CaliforniaHousingModel, 평가 메트릭)
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    from .features import FeatureTransform
+    from .trainer import CaliforniaHousingModel
+
+    model = CaliforniaHousingModel(model_type=model_type, model_params=model_params)
+    estimator = model.SUPPORTED_MODELS[model_type](**model.model_params)
+    if not hasattr(estimator, "partial_fit"):
+        raise ValueError(
+            f"{model_type} does not support partial_fit; "
+            f"streaming training from Parquet requires sgd_regressor"
+        )
+
+    names = CaliforniaHousingModel.FEATURE_NAMES
+    batches = dict(
+        paths=paths, feature_names=names, target_column=target_column,
+        batch_size=batch_size, holdout_every=holdout_every
+    )
+
+    start = time.perf_counter()
+    scaler = StandardScaler()
+    n_rows = 0
+    for X, _ in iter_parquet_batches(**batches):
+        scaler.partial_fit(X)
+        n_rows += len(X)
+    model.feature_transform = FeatureTransform(names).standard_scale(
+        mean=scaler.mean_, scale=scaler.scale_
+    )
+
+    for epoch in range(n_epochs):
+        for X, y in iter_parquet_batches(**batches):
+            estimator.partial_fit(model.feature_transform.transform(X), y)
+        logger.info(f"Streaming epoch {epoch + 1}/{n_epochs} done")
+
+    model.model = estimator
+    model.is_fitted = True
+    model.provenance = [CaliforniaHousingModel._provenance_record(
+        None, None,
+        mode="streaming",
+        data_tag=paths if isinstance(paths, str) else ",".join(paths),
+        start=0,
+        end=1,
+        n_samples=n_rows
+    )]
+    fit_time_s = time.perf_counter() - start
+
+    metrics = {"fit_time_s": fit_time_s, "n_train_rows": n_rows}
+    if holdout_every:
+        metrics.update(evaluate_streaming(
+            model, paths, target_column=target_column,
+            batch_size=batch_size, holdout_every=holdout_every
+        ))
+    model.metrics = metrics
+    logger.info(f"Streaming training completed on {n_rows} rows in {fit_time_s:.1f}s")
+    return model, metrics
+
+
+def evaluate_streaming(
+    model,
+    paths: Union[str, List[str]],
+    target_column: str = TARGET_COLUMN,
+    batch_size: int = 10000,
+    holdout_every: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    Parquet 배치 스트림으로 모델 평가 (evaluate()와 같은 메트릭)
+
+    Args:
+        model: 학습된 CaliforniaHousingModel
+        paths: Parquet 디렉토리, glob 패턴 또는 파일 리스트
+        target_column: 타겟 컬럼 이름
+        batch_size: 배치당 행 수
+        holdout_every: 주어지면 해당 간격의 평가 행만 사용
+
+    Returns:
+        {"mae", "mse", "rmse", "r2"}
+    """
+    accumulator = StreamingMetrics()
+    for X, y in iter_parquet_batches(
+        paths, model.FEATURE_NAMES, target_column=target_column,
+        batch_size=batch_size, holdout_every=holdout_every, holdout=True
+    ):
+        accumulator.update(y, model.predict(X))
+
+    metrics = accumulator.result()
+    logger.info(f"Streaming evaluation: MAE={metrics['mae']:.4f}, R²={metrics['r2']:.4f}")
+    return metrics
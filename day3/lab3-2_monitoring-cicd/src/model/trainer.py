@@ -5,28 +5,71 @@ California Housing 데이터셋을 사용한 회귀 모델 학습 및 추론
 """
 
 import os
+import time
 import logging
+import importlib
+from collections.abc import Mapping
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import joblib
-from sklearn.datasets import fetch_california_housing
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+from .artifact import ARTIFACT_SUFFIX, ModelArtifact, is_artifact, write_artifact
+from .binning import FeatureBinner, cached_binned_features
+from .dataset import content_hash, load_california_housing
+from .features import FeatureTransform
+from .profiling import TrainingProfiler, profile_phase
 
 logger = logging.getLogger(__name__)
 
 
+class _EstimatorRegistry(Mapping):
+    """
+    모델 유형 -> estimator 클래스
+
+    클래스는 처음 조회할 때 import하므로, 모델 유형 검사나 ONNX 서빙처럼
+    estimator가 필요 없는 경로는 sklearn 학습 모듈을 읽지 않음
+    """
+
+    def __init__(self, paths: Dict[str, str]):
+        self._paths = paths
+
+    def __getitem__(self, model_type: str):
+        module, _, name = self._paths[model_type].rpartition(".")
+        return getattr(importlib.import_module(module), name)
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+def _regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[float, float, float]:
+    """(MAE, MSE, R²)"""
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+    return (
+        mean_absolute_error(y_true, y_pred),
+        mean_squared_error(y_true, y_pred),
+        r2_score(y_true, y_pred)
+    )
+
+
 class CaliforniaHousingModel:
     """California Housing 가격 예측 모델"""
 
-    SUPPORTED_MODELS = {
-        "random_forest": RandomForestRegressor,
-        "gradient_boosting": GradientBoostingRegressor,
-        "linear_regression": LinearRegression,
-    }
+    SUPPORTED_MODELS = _EstimatorRegistry({
+        "random_forest": "sklearn.ensemble.RandomForestRegressor",
+        "gradient_boosting": "sklearn.ensemble.GradientBoostingRegressor",
+        "hist_gradient_boosting": "sklearn.ensemble.HistGradientBoostingRegressor",
+        "linear_regression": "sklearn.linear_model.LinearRegression",
+        "sgd_regressor": "sklearn.linear_model.SGDRegressor",
+    })
+
+    # 입력을 uint8 bin 코드로 변환하여 학습/예측하는 모델
+    BINNED_MODELS = ("hist_gradient_boosting",)
 
     FEATURE_NAMES = [
         "MedInc", "HouseAge", "AveRooms", "AveBedrms",
@@ -36,14 +79,18 @@ class CaliforniaHousingModel:
     def __init__(
         self,
         model_type: str = "random_forest",
-        model_params: Optional[Dict] = None
+        model_params: Optional[Dict] = None,
+        feature_transform: Optional[FeatureTransform] = None
     ):
         """
         모델 초기화
 
         Args:
-            model_type: 모델 유형 (random_forest, gradient_boosting, linear_regression)
+            model_type: 모델 유형 (random_forest, gradient_boosting,
+                hist_gradient_boosting, linear_regression, sgd_regressor)
             model_params: 모델 하이퍼파라미터
+            feature_transform: 원본 특성에 적용할 피처 변환 그래프 (선택).
+                train()에서 학습되고 predict()에서 같은 변환이 적용됨
         """
         if model_type not in self.SUPPORTED_MODELS:
             raise ValueError(
@@ -53,9 +100,48 @@ class CaliforniaHousingModel:
 
         self.model_type = model_type
         self.model_params = model_params or self._get_default_params(model_type)
+        self.feature_transform = feature_transform
+        self.binner: Optional[FeatureBinner] = None
+        # 아티팩트에서 로드한 경우 estimator는 처음 접근할 때 읽음
+        self._artifact: Optional[ModelArtifact] = None
         self.model = None
         self.is_fitted = False
         self.metrics = {}
+        # 학습 데이터 배치별 기록 (어떤 데이터가 어떤 estimator를 학습했는지)
+        self.provenance: List[Dict] = []
+        # 양자화 정보 (quantize() 결과 모델이면 설정됨, estimator는 QuantizedForest)
+        self.quantization: Optional[Dict] = None
+
+    @property
+    def model(self):
+        """학습된 estimator (아티팩트에서 로드한 경우 첫 접근 시 페이로드 로드)"""
+        if self._model is None and self._artifact is not None:
+            self._model = self._artifact.load_estimator()
+            self._artifact = None
+        return self._model
+
+    @model.setter
+    def model(self, value) -> None:
+        self._model = value
+        self._artifact = None
+
+    @property
+    def is_quantized(self) -> bool:
+        """estimator가 QuantizedForest인지 (model_type은 원본 유형 유지)"""
+        return self.quantization is not None
+
+    def check_not_quantized(self, action: str) -> None:
+        """
+        sklearn estimator가 필요한 작업 전에 양자화 모델이면 ValueError
+
+        Args:
+            action: 오류 메시지에 표시할 작업 이름
+        """
+        if self.is_quantized:
+            raise ValueError(
+                f"Cannot {action} a quantized {self.model_type} model. "
+                f"Use the original (unquantized) model instead."
+            )
 
     def _get_default_params(self, model_type: str) -> Dict:
         """모델별 기본 하이퍼파라미터"""
@@ -72,7 +158,19 @@ class CaliforniaHousingModel:
                 "learning_rate": 0.1,
                 "random_state": 42
             },
-            "linear_regression": {}
+            "hist_gradient_boosting": {
+                "max_iter": 200,
+                "learning_rate": 0.1,
+                "max_leaf_nodes": 31,
+                "random_state": 42
+            },
+            "linear_regression": {},
+            "sgd_regressor": {
+                "alpha": 1e-4,
+                "learning_rate": "invscaling",
+                "eta0": 0.01,
+                "random_state": 42
+            }
         }
         return defaults.get(model_type, {})
 
@@ -84,6 +182,9 @@ class CaliforniaHousingModel:
         """
         California Housing 데이터 로드 및 분할
 
+        로컬 데이터셋 캐시 (DATASET_CACHE_DIR)를 사용하므로 두 번째 호출부터는
+        다운로드/파싱/분할 없이 메모리 맵 뷰를 반환
+
         Args:
             test_size: 테스트 세트 비율
             random_state: 랜덤 시드
@@ -91,21 +192,117 @@ class CaliforniaHousingModel:
         Returns:
             X_train, X_test, y_train, y_test
         """
-        data = fetch_california_housing()
-        X_train, X_test, y_train, y_test = train_test_split(
-            data.data, data.target,
-            test_size=test_size,
-            random_state=random_state
-        )
+        dataset = load_california_housing(test_size=test_size, random_state=random_state)
+        X_train, X_test, y_train, y_test = dataset.split()
         logger.info(f"Data loaded: train={len(X_train)}, test={len(X_test)}")
         return X_train, X_test, y_train, y_test
 
+    @classmethod
+    def search(
+        cls,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: np.ndarray,
+        y_val: np.ndarray,
+        **kwargs
+    ):
+        """
+        모델 유형 + 하이퍼파라미터 자동 탐색 (successive halving / Hyperband)
+
+        Args:
+            X_train, y_train: 학습 데이터
+            X_val, y_val: 후보 비교용 검증 데이터
+            **kwargs: search_models() 옵션 (space, strategy, n_configs, eta, n_workers 등)
+
+        Returns:
+            SearchResult (best_model은 학습된 CaliforniaHousingModel, leaderboard)
+        """
+        from .search import search_models
+
+        return search_models(X_train, y_train, X_val, y_val, **kwargs)
+
+    def cross_validate(self, X: np.ndarray, y: np.ndarray, **kwargs):
+        """
+        현재 모델 설정으로 k-fold 교차 검증 (fold 병렬 실행)
+
+        모델 자체는 학습하지 않으며, 평균/표준편차 메트릭 (cv_mae_mean 등)을
+        self.metrics에 추가함
+
+        Args:
+            X: 특성
+            y: 타겟
+            **kwargs: cross_validate() 옵션 (n_splits, n_workers, cache_dir 등)
+
+        Returns:
+            CVResult (fold별 메트릭, 평균, 표준편차)
+        """
+        from .cv import cross_validate
+
+        result = cross_validate(
+            X, y,
+            model_type=self.model_type,
+            model_params=self.model_params,
+            feature_transform=self.feature_transform,
+            **kwargs
+        )
+        self.metrics.update(result.summary())
+        return result
+
+    def compress(self, X_val: np.ndarray, y_val: np.ndarray, **kwargs):
+        """
+        지연시간 예산에 맞춘 포레스트 축소 (트리 부분집합 / 깊이 절단 / distillation)
+
+        Args:
+            X_val, y_val: 후보 비교용 검증 데이터 (X_select가 없으면 절반은 트리 순서 선택에 사용)
+            **kwargs: compress_forest() 옵션 (tolerance, p99_budget_ms, X_train, X_select 등)
+
+        Returns:
+            CompressionResult (model은 선택된 CaliforniaHousingModel, frontier)
+        """
+        from .compress import compress_forest
+
+        return compress_forest(self, X_val, y_val, **kwargs)
+
+    def export_onnx(self, filepath: str, X_val: np.ndarray, **kwargs) -> Dict:
+        """
+        ONNX 변환 (피처 변환/binning 포함) 및 sklearn 예측과의 일치 확인
+
+        Args:
+            filepath: 모델 파일 경로. 같은 이름의 .onnx / .parity.json을 옆에 저장
+            X_val: 일치 확인용 검증 데이터
+            **kwargs: export_onnx() 옵션 (target_opset, atol, rtol 등)
+
+        Returns:
+            일치 보고서
+        """
+        from .onnx_export import export_onnx
+
+        return export_onnx(self, filepath, X_val, **kwargs)
+
+    def quantize(self, X_val: np.ndarray, y_val: np.ndarray, **kwargs):
+        """
+        트리 앙상블 양자화 (uint8 분할 경계, float16 리프 값)
+
+        Args:
+            X_val, y_val: 정확도 비교용 검증 데이터
+            **kwargs: quantize_model() 옵션 (max_cuts)
+
+        Returns:
+            (양자화된 CaliforniaHousingModel, 보고서)
+        """
+        from .quantize import quantize_model
+
+        return quantize_model(self, X_val, y_val, **kwargs)
+
     def train(
         self,
         X_train: np.ndarray,
         y_train: np.ndarray,
         X_val: Optional[np.ndarray] = None,
-        y_val: Optional[np.ndarray] = None
+        y_val: Optional[np.ndarray] = None,
+        data_tag: Optional[str] = None,
+        X_train_binned: Optional[np.ndarray] = None,
+        profiler: Optional[TrainingProfiler] = None
     ) -> Dict[str, float]:
         """
         모델 학습
@@ -115,33 +312,180 @@ class CaliforniaHousingModel:
             y_train: 학습 데이터 타겟
             X_val: 검증 데이터 특성 (선택)
             y_val: 검증 데이터 타겟 (선택)
+            data_tag: 학습 데이터 식별자 (provenance 기록용, 선택)
+            X_train_binned: X_train의 캐시된 bin 코드 (hist_gradient_boosting,
+                self.binner로 만든 것이어야 함). 없으면 binner를 학습하여 계산
+            profiler: 단계별 시간/메모리 기록 (선택, transform/bin/fit/
+                train_predict/val_predict 단계)
 
         Returns:
             학습 메트릭
         """
+        X_raw = X_train
+        if self.feature_transform is not None:
+            with profile_phase(profiler, "transform"):
+                self.feature_transform.fit(X_train)
+                X_train = self.feature_transform.transform(X_train)
+                if X_val is not None:
+                    X_val = self.feature_transform.transform(X_val)
+
+        if self.model_type in self.BINNED_MODELS:
+            with profile_phase(profiler, "bin"):
+                if X_train_binned is None or self.binner is None:
+                    self.binner = FeatureBinner().fit(X_train)
+                    X_train_binned = self.binner.transform(X_train)
+                X_train = X_train_binned
+                if X_val is not None:
+                    X_val = self.binner.transform(X_val)
+
         model_class = self.SUPPORTED_MODELS[self.model_type]
         self.model = model_class(**self.model_params)
 
         logger.info(f"Training {self.model_type} model...")
-        self.model.fit(X_train, y_train)
+        with profile_phase(profiler, "fit"):
+            self.model.fit(X_train, y_train)
         self.is_fitted = True
+        self.provenance = [self._provenance_record(
+            X_raw, y_train, "full", data_tag, 0, self._n_estimators_fitted()
+        )]
 
         # 학습 메트릭 계산
-        train_pred = self.model.predict(X_train)
-        self.metrics["train_mae"] = mean_absolute_error(y_train, train_pred)
-        self.metrics["train_mse"] = mean_squared_error(y_train, train_pred)
-        self.metrics["train_r2"] = r2_score(y_train, train_pred)
+        with profile_phase(profiler, "train_predict"):
+            train_pred = self.model.predict(X_train)
+        (
+            self.metrics["train_mae"], self.metrics["train_mse"], self.metrics["train_r2"]
+        ) = _regression_metrics(y_train, train_pred)
 
         # 검증 메트릭 계산 (제공된 경우)
         if X_val is not None and y_val is not None:
-            val_pred = self.model.predict(X_val)
-            self.metrics["val_mae"] = mean_absolute_error(y_val, val_pred)
-            self.metrics["val_mse"] = mean_squared_error(y_val, val_pred)
-            self.metrics["val_r2"] = r2_score(y_val, val_pred)
+            with profile_phase(profiler, "val_predict"):
+                val_pred = self.model.predict(X_val)
+            (
+                self.metrics["val_mae"], self.metrics["val_mse"], self.metrics["val_r2"]
+            ) = _regression_metrics(y_val, val_pred)
 
         logger.info(f"Training completed. MAE={self.metrics['train_mae']:.4f}")
         return self.metrics
 
+    def partial_retrain(
+        self,
+        X_new: np.ndarray,
+        y_new: np.ndarray,
+        n_new_estimators: Optional[int] = None,
+        max_estimators: Optional[int] = None,
+        data_tag: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        새 데이터로 증분 재학습 (warm_start)
+
+        - random_forest: 새 데이터로 트리를 추가하고 가장 오래된 트리를 제거
+        - gradient_boosting: 기존 모델의 잔차에 이어서 부스팅 단계 추가
+        기존 estimator는 다시 학습하지 않으므로 시간은 새 데이터 크기에 비례.
+        피처 변환 통계는 기존 estimator와 맞추기 위해 다시 계산하지 않음.
+
+        Args:
+            X_new: 새 데이터 특성
+            y_new: 새 데이터 타겟
+            n_new_estimators: 추가할 트리/단계 수
+                (기본: 현재 개수 x 새 데이터 비율, 최소 1)
+            max_estimators: 포레스트 최대 트리 수 (기본: 현재 트리 수 유지).
+                초과분은 가장 오래된 트리부터 제거
+            data_tag: 새 데이터 식별자 (provenance 기록용)
+
+        Returns:
+            재학습 메트릭
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Model is not fitted. Call train() first.")
+        self.check_not_quantized("incrementally retrain")
+        if self.model_type not in ("random_forest", "gradient_boosting"):
+            raise ValueError(
+                f"Incremental retraining is not supported for {self.model_type}"
+            )
+
+        X_fit = np.asarray(X_new)
+        if self.feature_transform is not None:
+            X_fit = self.feature_transform.transform(X_fit)
+
+        n_current = self._n_estimators_fitted()
+        if n_new_estimators is None:
+            n_seen = sum(record["n_samples"] for record in self.provenance) or len(X_fit)
+            n_new_estimators = max(1, int(round(n_current * len(X_fit) / n_seen)))
+
+        start = time.perf_counter()
+        self.model.set_params(warm_start=True, n_estimators=n_current + n_new_estimators)
+        self.model.fit(X_fit, y_new)
+        self.model.set_params(warm_start=False)
+        fit_time_s = time.perf_counter() - start
+
+        self.provenance.append(self._provenance_record(
+            X_new, y_new, "incremental", data_tag,
+            n_current, n_current + n_new_estimators
+        ))
+
+        n_retired = 0
+        if self.model_type == "random_forest":
+            max_estimators = max_estimators or n_current
+            n_retired = max(0, len(self.model.estimators_) - max_estimators)
+            if n_retired:
+                self._retire_oldest_trees(n_retired)
+
+        self.model_params["n_estimators"] = self._n_estimators_fitted()
+        metrics = {
+            "n_new_estimators": n_new_estimators,
+            "n_retired_estimators": n_retired,
+            "n_estimators": self._n_estimators_fitted(),
+            "fit_time_s": fit_time_s,
+        }
+        logger.info(
+            f"Incremental retrain ({self.model_type}): +{n_new_estimators} "
+            f"-{n_retired} estimators on {len(X_fit)} rows in {fit_time_s:.2f}s"
+        )
+        return metrics
+
+    def _n_estimators_fitted(self) -> int:
+        """학습된 트리/부스팅 단계 수 (선형 모델은 1)"""
+        estimators = getattr(self.model, "estimators_", None)
+        return len(estimators) if estimators is not None else 1
+
+    def _retire_oldest_trees(self, n_retired: int) -> None:
+        """포레스트의 앞쪽 (가장 오래된) 트리 제거 및 provenance 범위 갱신"""
+        self.model.estimators_ = self.model.estimators_[n_retired:]
+        self.model.n_estimators = len(self.model.estimators_)
+
+        kept = []
+        for record in self.provenance:
+            start, end = record["estimators"]
+            start, end = max(0, start - n_retired), max(0, end - n_retired)
+            if end > start:
+                kept.append({**record, "estimators": [start, end]})
+        self.provenance = kept
+
+    @staticmethod
+    def _provenance_record(
+        X: Optional[np.ndarray],
+        y: Optional[np.ndarray],
+        mode: str,
+        data_tag: Optional[str],
+        start: int,
+        end: int,
+        n_samples: Optional[int] = None
+    ) -> Dict:
+        """
+        학습 배치 기록 (estimators는 [시작, 끝) 인덱스)
+
+        데이터를 메모리에 올리지 않는 스트리밍 학습은 X/y 대신 n_samples를
+        전달 (content_hash는 None)
+        """
+        return {
+            "mode": mode,
+            "data_tag": data_tag,
+            "content_hash": content_hash(np.asarray(X), np.asarray(y)) if X is not None else None,
+            "n_samples": len(X) if X is not None else n_samples,
+            "trained_at": datetime.utcnow().isoformat(),
+            "estimators": [start, end],
+        }
+
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
         예측 수행
@@ -164,6 +508,11 @@ class CaliforniaHousingModel:
                 f"Expected {len(self.FEATURE_NAMES)} features, got {X.shape[1]}"
             )
 
+        if self.feature_transform is not None:
+            X = self.feature_transform.transform(X)
+        if self.binner is not None:
+            X = self.binner.transform(X)
+
         return self.model.predict(X)
 
     def evaluate(
@@ -183,41 +532,121 @@ class CaliforniaHousingModel:
         """
         predictions = self.predict(X_test)
 
+        mae, mse, r2 = _regression_metrics(y_test, predictions)
         metrics = {
-            "mae": mean_absolute_error(y_test, predictions),
-            "mse": mean_squared_error(y_test, predictions),
-            "rmse": np.sqrt(mean_squared_error(y_test, predictions)),
-            "r2": r2_score(y_test, predictions)
+            "mae": mae,
+            "mse": mse,
+            "rmse": np.sqrt(mse),
+            "r2": r2
         }
 
         logger.info(f"Evaluation: MAE={metrics['mae']:.4f}, R²={metrics['r2']:.4f}")
         return metrics
 
-    def save(self, filepath: str) -> None:
-        """모델 저장"""
+    def _metadata(self) -> Dict:
+        """estimator를 제외한 모델 상태 (저장/메타데이터용)"""
+        return {
+            "model_type": self.model_type,
+            "model_params": self.model_params,
+            "metrics": self.metrics,
+            "feature_names": self.FEATURE_NAMES,
+            "provenance": self.provenance,
+            "quantization": self.quantization,
+            "binner": self.binner.to_dict() if self.binner is not None else None,
+            "feature_transform": (
+                self.feature_transform.to_dict()
+                if self.feature_transform is not None else None
+            )
+        }
+
+    def save(self, filepath: str, compress: int = 0) -> None:
+        """
+        모델 저장
+
+        경로가 ARTIFACT_SUFFIX (.chm)로 끝나면 아티팩트 포맷 (JSON 헤더 + 압축
+        트리 배열 블록, src.model.artifact)으로, 아니면 joblib으로 저장
+
+        Args:
+            filepath: 저장 경로
+            compress: 압축 수준. joblib은 0이면 배열을 비압축으로 저장하여
+                load(mmap_mode="r")로 메모리 매핑 가능. 아티팩트는 0이면 기본 수준 (6)
+        """
         if not self.is_fitted:
             raise RuntimeError("Model is not fitted. Cannot save.")
 
+        if filepath.endswith(ARTIFACT_SUFFIX):
+            write_artifact(filepath, self.model, self._metadata(), compresslevel=compress or 6)
+            logger.info(f"Model saved to {filepath}")
+            return
+
         os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
-        joblib.dump({
-            "model": self.model,
-            "model_type": self.model_type,
-            "model_params": self.model_params,
-            "metrics": self.metrics
-        }, filepath)
+        joblib.dump({"model": self.model, **self._metadata()}, filepath, compress=compress)
         logger.info(f"Model saved to {filepath}")
 
-    @classmethod
-    def load(cls, filepath: str) -> "CaliforniaHousingModel":
-        """모델 로드"""
+    @staticmethod
+    def read_metadata(filepath: str) -> Dict:
+        """
+        모델을 로드하지 않고 메타데이터 읽기
+
+        아티팩트 포맷은 JSON 헤더만 읽음. joblib 파일은 헤더가 없으므로
+        전체를 로드한 뒤 estimator를 제외한 값을 반환
+
+        Args:
+            filepath: 모델 파일 경로
+
+        Returns:
+            model_type, model_params, metrics, feature_names 등
+        """
+        if is_artifact(filepath):
+            return ModelArtifact(filepath).header
         data = joblib.load(filepath)
+        data.pop("model", None)
+        return data
+
+    @classmethod
+    def load(
+        cls,
+        filepath: str,
+        mmap_mode: Optional[str] = None
+    ) -> "CaliforniaHousingModel":
+        """
+        모델 로드
+
+        아티팩트 포맷은 헤더만 읽고, estimator (트리 배열)는 model에 처음
+        접근할 때 로드함
 
+        Args:
+            filepath: 모델 파일 경로
+            mmap_mode: 비압축 배열의 메모리 매핑 모드 (예: "r", joblib 전용).
+                매핑된 배열은 워커 간에 페이지 캐시를 공유함. sklearn 트리는
+                로드 시 노드 배열을 자체 버퍼로 복사하므로, 포레스트의 공유는
+                fork 전 부모 프로세스에서 로드하여 얻음 (src.serving.prefork)
+        """
+        artifact = None
+        if is_artifact(filepath):
+            artifact = ModelArtifact(filepath)
+            data = artifact.header
+        else:
+            data = joblib.load(filepath, mmap_mode=mmap_mode)
+
+        transform_spec = data.get("feature_transform")
         instance = cls(
             model_type=data["model_type"],
-            model_params=data["model_params"]
+            model_params=data["model_params"],
+            feature_transform=(
+                FeatureTransform.from_dict(transform_spec)
+                if transform_spec is not None else None
+            )
         )
-        instance.model = data["model"]
+        if artifact is not None:
+            instance._artifact = artifact
+        else:
+            instance.model = data["model"]
         instance.metrics = data.get("metrics", {})
+        instance.provenance = data.get("provenance", [])
+        instance.quantization = data.get("quantization")
+        if data.get("binner") is not None:
+            instance.binner = FeatureBinner.from_dict(data["binner"])
         instance.is_fitted = True
 
         logger.info(f"Model loaded from {filepath}")
@@ -225,28 +654,79 @@ class CaliforniaHousingModel:
 
 
 def train_model(
-    model_type: str = "random_forest",
+    model_type: Optional[str] = None,
     test_size: float = 0.2,
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    feature_transform: Optional[FeatureTransform] = None,
+    data_path: Optional[str] = None,
+    profiler: Optional[TrainingProfiler] = None
 ) -> Tuple[CaliforniaHousingModel, Dict[str, float]]:
     """
     모델 학습 편의 함수
 
     Args:
-        model_type: 모델 유형
+        model_type: 모델 유형 (기본: random_forest, data_path가 주어지면 sgd_regressor)
         test_size: 테스트 세트 비율
         save_path: 모델 저장 경로 (선택)
+        feature_transform: 피처 변환 그래프 (선택)
+        data_path: 메모리보다 큰 Parquet 데이터 경로 (선택). 주어지면
+            partial_fit 스트리밍 학습 (sgd_regressor)
+        profiler: 단계별 시간/메모리 기록 (선택, load/train/evaluate/save 단계).
+            결과는 profiler.report() 또는 profiler.log_to_mlflow()로 확인
 
     Returns:
         학습된 모델과 평가 메트릭
     """
-    model = CaliforniaHousingModel(model_type=model_type)
-    X_train, X_test, y_train, y_test = model.load_data(test_size=test_size)
+    if model_type is None:
+        model_type = "sgd_regressor" if data_path is not None else "random_forest"
+
+    if data_path is not None:
+        from .streaming import train_streaming
 
-    model.train(X_train, y_train, X_test, y_test)
-    metrics = model.evaluate(X_test, y_test)
+        with profile_phase(profiler, "train"):
+            model, metrics = train_streaming(
+                data_path,
+                model_type=model_type,
+                holdout_every=max(2, int(round(1 / test_size)))
+            )
+        if save_path:
+            with profile_phase(profiler, "save"):
+                model.save(save_path)
+        return model, metrics
+
+    if model_type == "sgd_regressor" and feature_transform is None:
+        # SGD는 특성 스케일에 민감하므로 표준화
+        feature_transform = FeatureTransform(CaliforniaHousingModel.FEATURE_NAMES).standard_scale()
+
+    model = CaliforniaHousingModel(
+        model_type=model_type,
+        feature_transform=feature_transform
+    )
+
+    X_train_binned = None
+    with profile_phase(profiler, "load"):
+        if model_type in CaliforniaHousingModel.BINNED_MODELS and feature_transform is None:
+            # bin 코드는 데이터셋 캐시에 uint8로 저장되어 재사용됨
+            dataset = load_california_housing(test_size=test_size)
+            X_train, X_test, y_train, y_test = dataset.split()
+            model.binner, X_train_binned, _ = cached_binned_features(dataset)
+        else:
+            X_train, X_test, y_train, y_test = model.load_data(test_size=test_size)
+
+    with profile_phase(profiler, "train"):
+        model.train(
+            X_train, y_train, X_test, y_test,
+            X_train_binned=X_train_binned, profiler=profiler
+        )
+
+    with profile_phase(profiler, "evaluate"):
+        metrics = model.evaluate(X_test, y_test)
 
     if save_path:
-        model.save(save_path)
+        with profile_phase(profiler, "save"):
+            model.save(save_path)
+
+    if profiler is not None:
+        logger.info(f"Training phases:\n{profiler.format_table()}")
 
     return model, metrics
@@ -1,13 +1,23 @@
-"""Monitoring and drift detection module"""
+"""
+Monitoring and drift detection module
 
-from .drift import (
-    DriftDetector,
-    DriftResult,
-    DriftLevel,
-    ModelMetrics,
-    ModelMonitor,
-    calculate_drift_score
-)
+하위 모듈은 처음 접근할 때 import (PEP 562). 서빙 프로세스가
+PredictionLogger만 쓸 때 드리프트 감지용 scipy를 읽지 않도록 함
+"""
+
+import importlib
+
+# 공개 이름 -> 정의된 하위 모듈
+_EXPORTS = {
+    "DriftDetector": "drift",
+    "DriftResult": "drift",
+    "DriftLevel": "drift",
+    "ModelMetrics": "drift",
+    "ModelMonitor": "drift",
+    "calculate_drift_score": "drift",
+    "PredictionLogger": "prediction_log",
+    "read_prediction_log": "prediction_log",
+}
 
 __all__ = [
     "DriftDetector",
@@ -15,5 +25,19 @@ __all__ = [
     "DriftLevel",
     "ModelMetrics",
     "ModelMonitor",
-    "calculate_drift_score"
+    "calculate_drift_score",
+    "PredictionLogger",
+    "read_prediction_log"
 ]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,7 +10,6 @@ from dataclasses import dataclass
 from enum import Enum
 
 import numpy as np
-from scipy import stats
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +115,9 @@ class DriftDetector:
         Returns:
             (전체 드리프트 여부, 특성별 결과 리스트)
         """
+        # scipy는 드리프트 감지에만 필요하므로 서빙 콜드 스타트에서 제외
+        from scipy.stats import ks_2samp
+
         if self.reference_data is None:
             raise RuntimeError("Reference data not set. Call set_reference() first.")
 
@@ -135,7 +137,7 @@ class DriftDetector:
             cur_feature = current_data[:, i]
 
             # KS Test
-            statistic, p_value = stats.ks_2samp(ref_feature, cur_feature)
+            statistic, p_value = ks_2samp(ref_feature, cur_feature)
 
             drift_detected = p_value < self.significance_level
             drift_level = self._get_drift_level(p_value)
@@ -0,0 +1,307 @@
+"""
+Prediction Logging Module
+
+서빙된 예측 (입력, 출력, 모델 버전, 시각)을 메모리에 버퍼링하고
+백그라운드 스레드에서 롤링 Parquet 파일로 기록
+"""
+
+import os
+import glob
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+IN_PROGRESS_SUFFIX = ".inprogress"
+
+
+class PredictionLogger:
+    """
+    비동기 예측 로그 기록기
+
+    log()는 배열을 복사하여 버퍼에 추가만 하므로 요청 경로에서 I/O가 없음.
+    백그라운드 스레드가 버퍼를 Parquet row group으로 기록하고, 파일 크기나
+    경과 시간이 기준을 넘으면 새 파일로 교체함. 기록 중인 파일은
+    '.inprogress' 접미사를 가지며 닫힌 뒤에만 '.parquet'으로 보임.
+    버퍼가 가득 차면 요청을 막지 않고 해당 예측을 버림 (dropped_rows).
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        feature_names: Optional[List[str]] = None,
+        row_group_size: int = 10000,
+        flush_interval_s: float = 5.0,
+        max_file_bytes: int = 128 * 1024 * 1024,
+        max_file_age_s: float = 3600.0,
+        max_buffer_rows: int = 200000
+    ):
+        """
+        예측 로그 기록기 초기화
+
+        Args:
+            directory: Parquet 파일 저장 디렉토리
+            feature_names: 입력 특성 컬럼 이름 (기본: feature_0, feature_1, ...)
+            row_group_size: 이 행 수가 쌓이면 즉시 기록
+            flush_interval_s: 주기적 기록 간격 (초)
+            max_file_bytes: 파일 교체 기준 크기
+            max_file_age_s: 파일 교체 기준 경과 시간 (초)
+            max_buffer_rows: 메모리 버퍼 최대 행 수 (초과분은 버림)
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("pyarrow is required for PredictionLogger")
+
+        self.directory = directory
+        self.feature_names = feature_names
+        self.row_group_size = row_group_size
+        self.flush_interval_s = flush_interval_s
+        self.max_file_bytes = max_file_bytes
+        self.max_file_age_s = max_file_age_s
+        self.max_buffer_rows = max_buffer_rows
+
+        self.logged_rows = 0
+        self.written_rows = 0
+        self.dropped_rows = 0
+        self.files_written = 0
+        self.write_errors = 0
+
+        self._buffer: List[Tuple[float, str, np.ndarray, np.ndarray]] = []
+        self._buffered_rows = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+
+        self._writer = None
+        self._schema = None
+        self._file_path: Optional[str] = None
+        self._file_opened_at = 0.0
+        self._file_seq = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="prediction-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def log(
+        self,
+        inputs: np.ndarray,
+        outputs: np.ndarray,
+        model_version: str
+    ) -> bool:
+        """
+        예측 결과를 버퍼에 추가 (I/O 없음)
+
+        Args:
+            inputs: 입력 특성 (n_samples, n_features)
+            outputs: 예측값 (n_samples,)
+            model_version: 모델 버전
+
+        Returns:
+            버퍼에 추가되었는지 여부 (버퍼가 가득 차면 False)
+        """
+        n_rows = len(outputs)
+        if n_rows == 0:
+            return True
+
+        # 호출자가 입력 버퍼를 재사용할 수 있으므로 복사
+        entry = (
+            time.time(),
+            model_version,
+            np.array(inputs, dtype=np.float64, copy=True).reshape(n_rows, -1),
+            np.array(outputs, dtype=np.float64, copy=True).reshape(n_rows)
+        )
+
+        with self._lock:
+            if self._buffered_rows + n_rows > self.max_buffer_rows:
+                self.dropped_rows += n_rows
+                return False
+            self._buffer.append(entry)
+            self._buffered_rows += n_rows
+            self.logged_rows += n_rows
+            should_flush = self._buffered_rows >= self.row_group_size
+
+        if should_flush:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> None:
+        """버퍼를 즉시 기록 요청하고 완료될 때까지 대기"""
+        if self._stopped.is_set():
+            return
+        with self._lock:
+            target_rows = self.logged_rows
+        errors = self.write_errors
+
+        self._wakeup.set()
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            if self.written_rows >= target_rows or self.write_errors > errors:
+                return
+            time.sleep(0.01)
+
+    def close(self) -> None:
+        """남은 버퍼를 기록하고 현재 파일을 닫음"""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join()
+
+    def get_stats(self) -> Dict:
+        """기록 통계"""
+        with self._lock:
+            buffered_rows = self._buffered_rows
+        return {
+            "logged_rows": self.logged_rows,
+            "written_rows": self.written_rows,
+            "buffered_rows": buffered_rows,
+            "dropped_rows": self.dropped_rows,
+            "files_written": self.files_written,
+            "write_errors": self.write_errors
+        }
+
+    def _run(self) -> None:
+        """백그라운드 기록 루프"""
+        while not self._stopped.is_set():
+            self._wakeup.wait(timeout=self.flush_interval_s)
+            self._wakeup.clear()
+            self._write_pending()
+            self._maybe_rotate()
+
+        self._write_pending()
+        self._close_file()
+
+    def _write_pending(self) -> None:
+        """버퍼를 비우고 row group 단위로 기록"""
+        with self._lock:
+            entries, self._buffer = self._buffer, []
+            self._buffered_rows = 0
+
+        if not entries:
+            return
+
+        try:
+            table = self._to_table(entries)
+            for start in range(0, table.num_rows, self.row_group_size):
+                chunk = table.slice(start, self.row_group_size)
+                self._ensure_file(chunk.schema)
+                self._writer.write_table(chunk)
+            self.written_rows += table.num_rows
+        except Exception as e:
+            self.write_errors += 1
+            logger.error(f"Prediction log write failed: {e}")
+
+    def _to_table(self, entries):
+        """버퍼 항목을 컬럼형 Arrow 테이블로 변환"""
+        import pyarrow as pa
+
+        counts = [len(entry[3]) for entry in entries]
+        inputs = np.concatenate([entry[2] for entry in entries])
+        outputs = np.concatenate([entry[3] for entry in entries])
+        timestamps = np.repeat(
+            np.array([entry[0] for entry in entries]) * 1e6, counts
+        ).astype("int64")
+        versions = pa.DictionaryArray.from_arrays(
+            pa.array(np.repeat(np.arange(len(entries)), counts), type=pa.int32()),
+            pa.array([entry[1] for entry in entries])
+        )
+
+        names = self.feature_names or [f"feature_{i}" for i in range(inputs.shape[1])]
+        columns = {
+            "timestamp": pa.array(timestamps, type=pa.timestamp("us", tz="UTC")),
+            "model_version": versions,
+        }
+        for i, name in enumerate(names):
+            columns[name] = pa.array(inputs[:, i])
+        columns["prediction"] = pa.array(outputs)
+        return pa.table(columns)
+
+    def _ensure_file(self, schema) -> None:
+        """현재 파일이 없거나 스키마가 바뀌면 새 파일 열기"""
+        import pyarrow.parquet as pq
+
+        if self._writer is not None and schema.equals(self._schema):
+            return
+        self._close_file()
+
+        self._file_seq += 1
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        self._file_path = os.path.join(
+            self.directory,
+            f"predictions-{stamp}-{os.getpid()}-{self._file_seq:05d}.parquet"
+        )
+        self._writer = pq.ParquetWriter(
+            self._file_path + IN_PROGRESS_SUFFIX, schema, compression="snappy"
+        )
+        self._schema = schema
+        self._file_opened_at = time.time()
+
+    def _maybe_rotate(self) -> None:
+        """크기 또는 경과 시간 기준으로 파일 교체"""
+        if self._writer is None:
+            return
+        size = os.path.getsize(self._file_path + IN_PROGRESS_SUFFIX)
+        age = time.time() - self._file_opened_at
+        if size >= self.max_file_bytes or age >= self.max_file_age_s:
+            self._close_file()
+
+    def _close_file(self) -> None:
+        """현재 파일을 닫고 완료 파일로 이름 변경"""
+        if self._writer is None:
+            return
+        self._writer.close()
+        os.replace(self._file_path + IN_PROGRESS_SUFFIX, self._file_path)
+        self.files_written += 1
+        logger.info(f"Prediction log file closed: {self._file_path}")
+        self._writer = None
+        self._schema = None
+
+
+def read_prediction_log(
+    directory: str,
+    since: Optional[datetime] = None,
+    model_version: Optional[str] = None
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    완료된 예측 로그 파일 읽기 (드리프트 감지 / 재학습용)
+
+    Args:
+        directory: 예측 로그 디렉토리
+        since: 이 시각 이후의 예측만 (UTC)
+        model_version: 특정 모델 버전만
+
+    Returns:
+        (입력 특성 배열, 예측값 배열, 특성 이름 리스트)
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    files = sorted(glob.glob(os.path.join(directory, "predictions-*.parquet")))
+    if not files:
+        return np.empty((0, 0)), np.empty(0), []
+
+    table = pa.concat_tables([pq.read_table(f) for f in files])
+    if since is not None:
+        table = table.filter(pc.greater_equal(
+            table["timestamp"], pa.scalar(since, type=pa.timestamp("us", tz="UTC"))
+        ))
+    if model_version is not None:
+        table = table.filter(pc.equal(table["model_version"].cast(pa.string()), model_version))
+
+    feature_names = [
+        name for name in table.column_names
+        if name not in ("timestamp", "model_version", "prediction")
+    ]
+    inputs = np.column_stack([
+        table[name].to_numpy() for name in feature_names
+    ]) if table.num_rows else np.empty((0, len(feature_names)))
+    return inputs, table["prediction"].to_numpy(), feature_names
@@ -1,13 +1,32 @@
-"""Model serving API module"""
+"""
+Model serving API module
 
-from .api import (
-    ModelServer,
-    PredictionRequest,
-    PredictionResponse,
-    HealthResponse,
-    validate_input,
-    create_app
-)
+하위 모듈은 처음 접근할 때 import (PEP 562). 진입점 (main.py)은 필요한
+하위 모듈만 직접 import하므로 콜드 스타트에 쓰지 않는 모듈을 읽지 않음
+"""
+
+import importlib
+
+# 공개 이름 -> 정의된 하위 모듈
+_EXPORTS = {
+    "ModelServer": "api",
+    "PredictionRequest": "api",
+    "PredictionResponse": "api",
+    "HealthResponse": "api",
+    "validate_input": "api",
+    "create_app": "api",
+    "AdmissionController": "admission",
+    "OverloadedError": "admission",
+    "OnnxSession": "onnx_session",
+    "load_onnx_model": "onnx_session",
+    "stream_predictions": "stream",
+    "memory_usage": "prefork",
+    "serve_prefork": "prefork",
+    "SamplingProfiler": "profiler",
+    "ThreadBudget": "threads",
+    "apply_thread_budget": "threads",
+    "plan_thread_budget": "threads",
+}
 
 __all__ = [
     "ModelServer",
@@ -15,5 +34,28 @@ __all__ = [
     "PredictionResponse",
     "HealthResponse",
     "validate_input",
-    "create_app"
+    "create_app",
+    "AdmissionController",
+    "OverloadedError",
+    "OnnxSession",
+    "load_onnx_model",
+    "memory_usage",
+    "serve_prefork",
+    "SamplingProfiler",
+    "ThreadBudget",
+    "apply_thread_budget",
+    "plan_thread_budget",
+    "stream_predictions"
 ]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,240 @@
+"""
+Admission Control Module
+
+지연시간 SLO 기반 동시성 제한 및 부하 차단 (load shedding)
+"""
+
+import os
+import math
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Deque, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OverloadedError(RuntimeError):
+    """과부하로 요청이 거부됨"""
+
+    def __init__(self, retry_after: int, reason: str = "overloaded"):
+        super().__init__(f"Server overloaded ({reason}), retry after {retry_after}s")
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionController:
+    """
+    AIMD 적응형 동시성 제한기
+
+    측정된 예측 지연시간이 SLO 이하이면 한도를 천천히 늘리고 (additive increase),
+    SLO를 초과하면 한도를 비율로 줄임 (multiplicative decrease).
+    한도를 넘는 요청은 제한된 크기의 대기열에서 기다리며, 대기열이 가득 차거나
+    대기 시간이 초과되면 즉시 거부됨.
+
+    이벤트 루프 안에서만 사용하므로 별도의 잠금이 필요 없음.
+    다른 스레드 (gRPC 처리 스레드 등)에서는 admit_threadsafe()를 사용.
+    """
+
+    def __init__(
+        self,
+        latency_slo_ms: float = 100.0,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        max_queue: int = 32,
+        queue_timeout_s: float = 1.0,
+        backoff_ratio: float = 0.9,
+        ewma_alpha: float = 0.2
+    ):
+        """
+        제어기 초기화
+
+        Args:
+            latency_slo_ms: 목표 예측 지연시간 (ms)
+            initial_limit: 초기 동시 처리 한도
+            min_limit: 최소 동시 처리 한도
+            max_limit: 최대 동시 처리 한도
+            max_queue: 최대 대기 요청 수
+            queue_timeout_s: 대기열 최대 대기 시간 (초)
+            backoff_ratio: SLO 초과 시 한도 감소 비율
+            ewma_alpha: 지연시간 지수이동평균 가중치
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Require 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+
+        self.latency_slo_ms = latency_slo_ms
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.queue_timeout_s = queue_timeout_s
+        self.backoff_ratio = backoff_ratio
+        self.ewma_alpha = ewma_alpha
+
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        self.latency_ewma_ms = 0.0
+        self.admitted_count = 0
+        self.shed_count = 0
+        self.timeout_count = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+
+    @property
+    def effective_limit(self) -> int:
+        """현재 적용되는 정수 동시 처리 한도"""
+        return max(self.min_limit, int(self.limit))
+
+    @property
+    def queue_depth(self) -> int:
+        """대기 중인 요청 수"""
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """대기열 소진 예상 시간 기반 Retry-After (초)"""
+        latency_s = max(self.latency_ewma_ms, self.latency_slo_ms) / 1000
+        estimate = (self.queue_depth + 1) * latency_s / self.effective_limit
+        return max(1, math.ceil(estimate))
+
+    async def acquire(self) -> None:
+        """
+        처리 슬롯 획득
+
+        Raises:
+            OverloadedError: 대기열이 가득 찼거나 대기 시간이 초과된 경우
+        """
+        if self.in_flight < self.effective_limit and not self._waiters:
+            self.in_flight += 1
+            self.admitted_count += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.shed_count += 1
+            raise OverloadedError(self.retry_after(), reason="queue full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait([waiter], timeout=self.queue_timeout_s)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        if not waiter.done():
+            self._abandon(waiter)
+            self.shed_count += 1
+            self.timeout_count += 1
+            raise OverloadedError(self.retry_after(), reason="queue timeout")
+
+        # release()에서 슬롯이 이미 이전됨
+        self.admitted_count += 1
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        """대기 취소 (이미 슬롯을 넘겨받았다면 반환)"""
+        if waiter.done() and not waiter.cancelled():
+            self.in_flight -= 1
+            self._wake_waiters()
+            return
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, latency_ms: float) -> None:
+        """
+        처리 슬롯 반환 및 한도 조정
+
+        Args:
+            latency_ms: 해당 요청의 측정 지연시간 (ms)
+        """
+        self.in_flight -= 1
+        self._record_latency(latency_ms)
+        self._wake_waiters()
+
+    def _record_latency(self, latency_ms: float) -> None:
+        """지연시간을 반영하여 AIMD로 한도 조정"""
+        if self.latency_ewma_ms == 0.0:
+            self.latency_ewma_ms = latency_ms
+        else:
+            self.latency_ewma_ms += self.ewma_alpha * (latency_ms - self.latency_ewma_ms)
+
+        if latency_ms > self.latency_slo_ms:
+            # 동시에 끝난 느린 요청들로 인해 연속 감소하지 않도록
+            # 평균 지연시간 한 주기에 한 번만 감소
+            now = time.monotonic()
+            if (now - self._last_decrease) * 1000 >= self.latency_ewma_ms:
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                self._last_decrease = now
+                logger.debug(f"Concurrency limit decreased to {self.limit:.2f}")
+        else:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def _wake_waiters(self) -> None:
+        """한도 여유만큼 대기 요청에 슬롯 이전"""
+        while self._waiters and self.in_flight < self.effective_limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """슬롯을 획득하고 블록 실행 시간을 지연시간으로 기록"""
+        await self.acquire()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release((time.perf_counter() - start_time) * 1000)
+
+    @contextmanager
+    def admit_threadsafe(self, loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+        """
+        이벤트 루프 밖의 스레드에서 슬롯을 획득하고 블록 실행 시간을 기록
+
+        제어기 상태는 loop에서만 바뀌도록 acquire/release를 loop로 넘기고,
+        블록 (예측)은 호출한 스레드에서 실행
+
+        Args:
+            loop: 제어기를 사용하는 이벤트 루프 (앱의 루프)
+
+        Raises:
+            OverloadedError: 대기열이 가득 찼거나 대기 시간이 초과된 경우
+        """
+        asyncio.run_coroutine_threadsafe(self.acquire(), loop).result()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            loop.call_soon_threadsafe(self.release, (time.perf_counter() - start_time) * 1000)
+
+    def get_metrics(self) -> Dict:
+        """오토스케일링용 제어기 메트릭"""
+        return {
+            "concurrency_limit": self.effective_limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "admitted_count": self.admitted_count,
+            "shed_count": self.shed_count,
+            "timeout_count": self.timeout_count,
+            "latency_ewma_ms": round(self.latency_ewma_ms, 3),
+            "latency_slo_ms": self.latency_slo_ms
+        }
+
+    @classmethod
+    def from_env(cls, environ: Optional[Dict[str, str]] = None) -> "AdmissionController":
+        """환경 변수 (ADMISSION_*)에서 제어기 생성"""
+        env = os.environ if environ is None else environ
+        return cls(
+            latency_slo_ms=float(env.get("ADMISSION_LATENCY_SLO_MS", 100.0)),
+            initial_limit=int(env.get("ADMISSION_INITIAL_LIMIT", 8)),
+            max_limit=int(env.get("ADMISSION_MAX_LIMIT", 64)),
+            max_queue=int(env.get("ADMISSION_MAX_QUEUE", 32)),
+            queue_timeout_s=float(env.get("ADMISSION_QUEUE_TIMEOUT_S", 1.0))
+        )
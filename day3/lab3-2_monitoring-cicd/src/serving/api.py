@@ -5,14 +5,18 @@ FastAPI 기반 모델 서빙 엔드포인트
 """
 
 import os
+import hmac
 import time
+import asyncio
 import logging
-from typing import List, Optional
+from typing import Callable, List, Optional
 from datetime import datetime
 
 import numpy as np
 from pydantic import BaseModel, Field
 
+from .admission import AdmissionController, OverloadedError
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +51,34 @@ class PredictionResponse(BaseModel):
     )
 
 
+class EntityPredictionRequest(BaseModel):
+    """엔티티 ID 기반 예측 요청 스키마 (피처는 온라인 피처 저장소에서 조회)"""
+
+    entity_ids: List[int] = Field(
+        ...,
+        description="Entity IDs to look up in the online feature store",
+        example=[1001, 1002]
+    )
+
+
+class EntityPredictionResponse(BaseModel):
+    """엔티티 ID 기반 예측 응답 스키마"""
+
+    predictions: List[Optional[float]] = Field(
+        ...,
+        description="Predicted house prices (null for entities without features)"
+    )
+    missing_entities: List[int] = Field(
+        default_factory=list,
+        description="Entity IDs not found in the feature store"
+    )
+    model_version: str = "v1.0"
+    latency_ms: float
+    timestamp: str = Field(
+        default_factory=lambda: datetime.utcnow().isoformat()
+    )
+
+
 class HealthResponse(BaseModel):
     """헬스 체크 응답"""
 
@@ -61,19 +93,37 @@ class HealthResponse(BaseModel):
 class ModelServer:
     """모델 서버 클래스"""
 
-    def __init__(self, model=None, model_version: str = "v1.0"):
+    def __init__(
+        self,
+        model=None,
+        model_version: str = "v1.0",
+        prediction_logger=None,
+        feature_lookup=None
+    ):
         """
         모델 서버 초기화
 
         Args:
             model: 학습된 모델 인스턴스
             model_version: 모델 버전
+            prediction_logger: 예측 로그 기록기 (PredictionLogger, 선택)
+            feature_lookup: 온라인 피처 조회기 (OnlineFeatureLookup, 선택).
+                모델의 FEATURE_NAMES가 모두 있어야 함 (없으면 ValueError)
         """
         self.model = model
         self.model_version = model_version
+        self.prediction_logger = prediction_logger
+        self.feature_lookup = feature_lookup
+        # 피처 저장소에 모델 입력 피처가 없으면 요청마다 실패하지 않도록 시작 시 거부
+        model_features = getattr(model, "FEATURE_NAMES", None)
+        if feature_lookup is not None and model_features:
+            feature_lookup.check_features(model_features)
         self.request_count = 0
         self.error_count = 0
         self.total_latency = 0.0
+        # predict() 단계별 누적 시간 (입력 변환 / 모델 예측 / 응답 생성)
+        self.stage_count = 0
+        self.stage_latency = {"convert": 0.0, "model": 0.0, "response": 0.0}
 
     @property
     def is_ready(self) -> bool:
@@ -90,30 +140,94 @@ class ModelServer:
         Returns:
             예측 응답
         """
+        start_time = time.time()
+        t0 = time.perf_counter()
+        X = np.array(instances)
+        t1 = time.perf_counter()
+        predictions = self.predict_array(X)
+        t2 = time.perf_counter()
+        latency_ms = (time.time() - start_time) * 1000
+
+        response = PredictionResponse(
+            predictions=predictions.tolist(),
+            model_version=self.model_version,
+            latency_ms=round(latency_ms, 3)
+        )
+        t3 = time.perf_counter()
+
+        self.stage_count += 1
+        self.stage_latency["convert"] += (t1 - t0) * 1000
+        self.stage_latency["model"] += (t2 - t1) * 1000
+        self.stage_latency["response"] += (t3 - t2) * 1000
+        return response
+
+    def predict_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        배열 입력에 대한 예측 수행 (응답 객체 생성 없음)
+
+        스트리밍/배치 경로에서 pydantic 응답 없이 예측값만 필요할 때 사용
+
+        Args:
+            X: 입력 특성 배열 (n_samples, n_features)
+
+        Returns:
+            예측값 배열
+        """
         if not self.is_ready:
             raise RuntimeError("Model is not loaded")
 
         start_time = time.time()
 
         try:
-            X = np.array(instances)
-            predictions = self.model.predict(X)
+            predictions = np.asarray(self.model.predict(X))
             latency_ms = (time.time() - start_time) * 1000
 
             self.request_count += 1
             self.total_latency += latency_ms
 
-            return PredictionResponse(
-                predictions=predictions.tolist(),
-                model_version=self.model_version,
-                latency_ms=round(latency_ms, 3)
-            )
+            if self.prediction_logger is not None:
+                self.prediction_logger.log(X, predictions, self.model_version)
+
+            return predictions
 
         except Exception as e:
             self.error_count += 1
             logger.error(f"Prediction error: {e}")
             raise
 
+    def predict_entities(self, entity_ids: List[int]) -> EntityPredictionResponse:
+        """
+        온라인 피처 저장소에서 엔티티 피처를 조회하여 예측
+
+        모델 입력 컬럼 (model.FEATURE_NAMES)을 이름으로 조회하므로 저장소에
+        학습 때와 같은 피처가 있으면 클라이언트는 엔티티 ID만 보내면 됨
+
+        Args:
+            entity_ids: 엔티티 ID 리스트
+
+        Returns:
+            예측 응답 (피처가 없는 엔티티는 null)
+        """
+        if self.feature_lookup is None:
+            raise RuntimeError("Feature store is not configured")
+
+        start_time = time.time()
+        X, found = self.feature_lookup.get_many(
+            entity_ids, features=getattr(self.model, "FEATURE_NAMES", None)
+        )
+        predictions: List[Optional[float]] = [None] * len(entity_ids)
+        if found.any():
+            values = self.predict_array(X[found])
+            for i, value in zip(np.flatnonzero(found), values.tolist()):
+                predictions[i] = value
+
+        return EntityPredictionResponse(
+            predictions=predictions,
+            missing_entities=[e for e, ok in zip(entity_ids, found) if not ok],
+            model_version=self.model_version,
+            latency_ms=round((time.time() - start_time) * 1000, 3)
+        )
+
     def health_check(self) -> HealthResponse:
         """헬스 체크"""
         return HealthResponse(
@@ -133,7 +247,7 @@ class ModelServer:
             if (self.request_count + self.error_count) > 0 else 0
         )
 
-        return {
+        metrics = {
             "request_count": self.request_count,
             "error_count": self.error_count,
             "error_rate": round(error_rate, 4),
@@ -141,6 +255,16 @@ class ModelServer:
             "model_version": self.model_version,
             "model_loaded": self.is_ready
         }
+        if self.stage_count > 0:
+            metrics["stage_latency_ms"] = {
+                stage: round(total / self.stage_count, 3)
+                for stage, total in self.stage_latency.items()
+            }
+        if self.prediction_logger is not None:
+            metrics["prediction_log"] = self.prediction_logger.get_stats()
+        if self.feature_lookup is not None:
+            metrics["feature_store"] = self.feature_lookup.get_stats()
+        return metrics
 
 
 def validate_input(instances: List[List[float]]) -> bool:
@@ -173,19 +297,46 @@ def validate_input(instances: List[List[float]]) -> bool:
     return True
 
 
-def create_app(model=None, model_version: str = "v1.0"):
+def create_app(
+    model=None,
+    model_version: str = "v1.0",
+    admission: Optional[AdmissionController] = None,
+    prediction_logger=None,
+    grpc_port: Optional[int] = None,
+    profile_token: Optional[str] = None,
+    feature_lookup=None,
+    prediction_logger_factory: Optional[Callable] = None
+):
     """
     FastAPI 앱 생성 (FastAPI가 설치된 환경에서 사용)
 
     Args:
         model: 학습된 모델
         model_version: 모델 버전
+        admission: 요청 승인 제어기 (None이면 기본 설정으로 생성). /predict,
+            /predict/entities, /predict/stream (청크마다), gRPC 추론에 공통 적용
+        prediction_logger: 예측 로그 기록기 (PredictionLogger, 선택)
+        grpc_port: OIP V2 gRPC 서버 포트 (None이면 gRPC 비활성화).
+            같은 프로세스에서 같은 ModelServer를 공유하여 실행되며, 서버는
+            startup 이벤트에서 생성됨. pre-fork 모드에서는 사용하지 않음 (한 포트)
+        profile_token: /debug/profile 접근 토큰 (None이면 엔드포인트 비활성화).
+            요청의 X-Profile-Token 헤더와 일치해야 함
+        feature_lookup: 온라인 피처 조회기 (OnlineFeatureLookup, 선택).
+            주어지면 /predict/entities 엔드포인트 활성화
+        prediction_logger_factory: 예측 로그 기록기를 만드는 함수 (선택).
+            기록 스레드는 fork 후 사라지므로 앱을 실행하는 프로세스 (pre-fork
+            워커마다)의 startup에서 호출됨. prediction_logger 대신 사용
 
     Returns:
         FastAPI 앱 인스턴스
     """
     try:
-        from fastapi import FastAPI, HTTPException
+        from fastapi import FastAPI, HTTPException, Request
+        from fastapi.concurrency import run_in_threadpool
+        from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+        from starlette.requests import ClientDisconnect
+
+        from .stream import DEFAULT_CHUNK_SIZE, resolve_format, stream_predictions
 
         app = FastAPI(
             title="California Housing Model API",
@@ -193,7 +344,65 @@ def create_app(model=None, model_version: str = "v1.0"):
             version=model_version
         )
 
-        server = ModelServer(model=model, model_version=model_version)
+        server = ModelServer(
+            model=model,
+            model_version=model_version,
+            prediction_logger=prediction_logger,
+            feature_lookup=feature_lookup
+        )
+        admission = admission or AdmissionController()
+
+        class BodyStreamingResponse(StreamingResponse):
+            """
+            요청 본문을 읽으면서 응답을 스트리밍하는 응답 클래스
+
+            기본 StreamingResponse는 연결 종료 감지를 위해 receive()를
+            동시에 호출하므로 스트리밍 중인 요청 본문 메시지를 가로챔.
+            대신 업로드 중 종료는 request.stream()의 ClientDisconnect로,
+            응답 전송 중 종료는 send()의 OSError로 감지해 남은 청크를
+            예측하지 않고 스트림을 닫음.
+            """
+
+            async def __call__(self, scope, receive, send):
+                try:
+                    await self.stream_response(send)
+                except (ClientDisconnect, OSError) as e:
+                    logger.info(f"Stream client disconnected: {type(e).__name__}")
+                    await self.body_iterator.aclose()
+                    return
+                if self.background is not None:
+                    await self.background()
+
+        app.state.grpc_server = None
+        if grpc_port is not None:
+            from .grpc_server import create_grpc_server
+
+            # gRPC core는 초기화 후 fork를 지원하지 않으므로 서버 생성/바인딩은
+            # 앱을 실행하는 프로세스의 startup에서 수행 (pre-fork 부모에서 만들지 않음).
+            # gRPC 요청도 HTTP와 같은 승인 제어기를 앱 이벤트 루프에서 공유
+            @app.on_event("startup")
+            async def start_grpc_server():
+                app.state.grpc_server = create_grpc_server(
+                    server, port=grpc_port,
+                    admission=admission, loop=asyncio.get_running_loop()
+                )
+                app.state.grpc_server.start()
+
+            @app.on_event("shutdown")
+            def stop_grpc_server():
+                if app.state.grpc_server is not None:
+                    app.state.grpc_server.stop(grace=5).wait()
+
+        if prediction_logger_factory is not None:
+            @app.on_event("startup")
+            def start_prediction_logger():
+                server.prediction_logger = prediction_logger_factory()
+
+        if prediction_logger is not None or prediction_logger_factory is not None:
+            @app.on_event("shutdown")
+            def close_prediction_logger():
+                if server.prediction_logger is not None:
+                    server.prediction_logger.close()
 
         @app.get("/health", response_model=HealthResponse)
         def health():
@@ -201,20 +410,113 @@ def create_app(model=None, model_version: str = "v1.0"):
 
         @app.get("/metrics")
         def metrics():
-            return server.get_metrics()
+            return {**server.get_metrics(), "admission": admission.get_metrics()}
 
         @app.post("/predict", response_model=PredictionResponse)
-        def predict(request: PredictionRequest):
+        async def predict(request: PredictionRequest):
             if not validate_input(request.instances):
                 raise HTTPException(
                     status_code=400,
                     detail="Invalid input: expected 8 features per instance"
                 )
             try:
-                return server.predict(request.instances)
+                async with admission.admit():
+                    return await run_in_threadpool(server.predict, request.instances)
+            except OverloadedError as e:
+                raise HTTPException(
+                    status_code=503,
+                    detail=str(e),
+                    headers={"Retry-After": str(e.retry_after)}
+                )
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
+        @app.post("/predict/stream")
+        async def predict_stream(request: Request, chunk_size: int = DEFAULT_CHUNK_SIZE):
+            fmt = resolve_format(request.headers.get("content-type"))
+            if fmt is None:
+                raise HTTPException(
+                    status_code=415,
+                    detail="Content-Type must be application/x-ndjson or text/csv"
+                )
+            if not 1 <= chunk_size <= 10000:
+                raise HTTPException(
+                    status_code=400,
+                    detail="chunk_size must be between 1 and 10000"
+                )
+            if not server.is_ready:
+                raise HTTPException(status_code=503, detail="Model is not loaded")
+
+            return BodyStreamingResponse(
+                stream_predictions(
+                    request.stream(),
+                    server.predict_array,
+                    fmt=fmt,
+                    chunk_size=chunk_size,
+                    model_version=server.model_version,
+                    admission=admission
+                ),
+                media_type="application/x-ndjson"
+            )
+
+        if feature_lookup is not None:
+            @app.post("/predict/entities", response_model=EntityPredictionResponse)
+            async def predict_entities(request: EntityPredictionRequest):
+                if not request.entity_ids:
+                    raise HTTPException(status_code=400, detail="entity_ids must not be empty")
+                try:
+                    async with admission.admit():
+                        return await run_in_threadpool(server.predict_entities, request.entity_ids)
+                except OverloadedError as e:
+                    raise HTTPException(
+                        status_code=503,
+                        detail=str(e),
+                        headers={"Retry-After": str(e.retry_after)}
+                    )
+                except Exception as e:
+                    raise HTTPException(status_code=500, detail=str(e))
+
+        if profile_token:
+            from .profiler import (
+                ProfilerBusyError, SamplingProfiler, to_collapsed, to_speedscope
+            )
+
+            profiler = SamplingProfiler()
+
+            @app.get("/debug/profile")
+            async def debug_profile(
+                request: Request,
+                seconds: float = 5.0,
+                format: str = "collapsed"
+            ):
+                # 헤더는 latin-1로 디코딩되므로 바이트로 비교 (비ASCII str 비교는 TypeError)
+                token = request.headers.get("x-profile-token", "").encode("latin-1")
+                if not hmac.compare_digest(token, profile_token.encode()):
+                    raise HTTPException(status_code=403, detail="Invalid profile token")
+                if not 0 < seconds <= 60:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="seconds must be between 0 and 60"
+                    )
+                if format not in ("collapsed", "speedscope"):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="format must be 'collapsed' or 'speedscope'"
+                    )
+
+                # 샘플링은 별도 스레드에서 실행되므로 이벤트 루프는 계속 요청 처리
+                try:
+                    stacks, info = await run_in_threadpool(profiler.profile, seconds)
+                except ProfilerBusyError as e:
+                    raise HTTPException(status_code=409, detail=str(e))
+
+                if format == "speedscope":
+                    return JSONResponse(
+                        to_speedscope(stacks, info, name=f"model-server-{os.getpid()}"),
+                        headers={"Content-Disposition": "attachment; filename=profile.speedscope.json"}
+                    )
+                return PlainTextResponse(to_collapsed(stacks))
+
         return app
 
     except ImportError:
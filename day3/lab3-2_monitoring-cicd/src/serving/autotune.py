@@ -0,0 +1,427 @@
+"""
+Serving Autotune Module
+
+앱을 프로세스 안에서 띄우고 요청 혼합을 재생하여 백엔드, 추론 스레드 수,
+동시 처리 한도 조합을 탐색 (오프라인 튜닝용). 요청 배치 크기는 서버 설정이
+아닌 워크로드 (클라이언트가 요청에 담는 행 수)이므로 배치 크기별로 비교
+"""
+
+import os
+import csv
+import json
+import time
+import asyncio
+import logging
+import itertools
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .admission import AdmissionController
+from .threads import ThreadBudget, apply_thread_budget, available_cpus
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("sklearn", "onnx")
+
+
+@dataclass
+class ServingConfig:
+    """탐색 대상 서빙 설정 하나 (batch_size는 재생할 워크로드의 요청당 행 수)"""
+    backend: str = "sklearn"
+    batch_size: int = 1
+    threads: int = 1
+    admission_limit: int = 8
+
+    def to_env(self) -> Dict[str, str]:
+        """main.py가 읽는 환경 변수로 변환 (batch_size는 서버 설정이 아니므로 제외)"""
+        return {
+            "ADMISSION_INITIAL_LIMIT": str(self.admission_limit),
+            "ADMISSION_MAX_LIMIT": str(self.admission_limit),
+            "INFERENCE_THREADS": str(self.threads),
+            "MODEL_BACKEND": self.backend,
+        }
+
+
+@dataclass
+class Measurement:
+    """설정 x 동시 요청 수 하나에 대한 측정 결과"""
+    config: ServingConfig
+    concurrency: int
+    requests: int
+    rows: int
+    elapsed_s: float
+    p50_ms: float
+    p99_ms: float
+    rejected: int = 0
+    errors: int = 0
+
+    @property
+    def requests_per_s(self) -> float:
+        return self.requests / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def to_row(self) -> Dict:
+        return {
+            **asdict(self.config),
+            "concurrency": self.concurrency,
+            "requests": self.requests,
+            "rows_per_s": round(self.rows_per_s, 1),
+            "requests_per_s": round(self.requests_per_s, 1),
+            "p50_ms": round(self.p50_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+
+class OnnxBackend:
+    """
+    onnxruntime 세션을 CaliforniaHousingModel과 같은 predict() 인터페이스로 감쌈
+
+    (skl2onnx, onnxruntime이 설치된 환경에서 사용)
+    """
+
+    def __init__(self, model, budget: ThreadBudget):
+        from ..model.onnx_export import model_to_onnx
+        from .onnx_session import OnnxSession
+
+        # 피처 변환과 binning은 그래프 안에서 실행되므로 원본 특성을 그대로 입력
+        onnx_model = model_to_onnx(model)
+        self.session = OnnxSession.from_budget(onnx_model.SerializeToString(), budget)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.session.predict(X)
+
+
+def synthetic_request_mix(
+    n_rows: int = 10000,
+    n_features: int = 8,
+    seed: int = 42
+) -> np.ndarray:
+    """
+    합성 요청 행 생성 (California Housing 특성 범위와 비슷한 분포)
+
+    Args:
+        n_rows: 행 수
+        n_features: 특성 수
+        seed: 랜덤 시드
+
+    Returns:
+        (n_rows, n_features) 배열
+    """
+    rng = np.random.RandomState(seed)
+    low = np.array([0.5, 1.0, 1.0, 0.5, 3.0, 1.0, 32.5, -124.3])[:n_features]
+    high = np.array([15.0, 52.0, 10.0, 2.0, 5000.0, 6.0, 42.0, -114.3])[:n_features]
+    return low + rng.rand(n_rows, n_features) * (high - low)
+
+
+def load_request_mix(path: str) -> np.ndarray:
+    """
+    기록된 요청 행 로드
+
+    Args:
+        path: 예측 로그 디렉토리 (PredictionLogger) 또는
+            {"instances": [[...], ...]} 형식의 JSONL 파일
+
+    Returns:
+        (n_rows, n_features) 배열
+    """
+    if os.path.isdir(path):
+        from ..monitoring.prediction_log import read_prediction_log
+
+        X, _, _ = read_prediction_log(path)
+    else:
+        rows = []
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    rows.extend(json.loads(line)["instances"])
+        X = np.asarray(rows, dtype=np.float64)
+
+    if len(X) == 0:
+        raise ValueError(f"No recorded requests found in {path}")
+    logger.info(f"Loaded {len(X)} recorded rows from {path}")
+    return X
+
+
+def build_backend(model, config: ServingConfig, budget: ThreadBudget):
+    """설정의 백엔드에 맞는 예측 객체 생성"""
+    if config.backend == "sklearn":
+        return model
+    if config.backend == "onnx":
+        return OnnxBackend(model, budget)
+    raise ValueError(f"Unknown backend: {config.backend}. Supported: {list(BACKENDS)}")
+
+
+async def replay(
+    app,
+    rows: np.ndarray,
+    batch_size: int,
+    concurrency: int,
+    n_requests: int
+) -> Dict:
+    """
+    닫힌 루프 (closed-loop) 부하 재생
+
+    concurrency개의 가상 클라이언트가 응답을 받는 즉시 다음 요청을 보냄.
+    요청은 rows를 batch_size 행씩 순서대로 잘라 만듦.
+
+    Args:
+        app: ASGI 앱 (create_app 결과)
+        rows: 요청 행 풀
+        batch_size: 요청당 행 수
+        concurrency: 동시 클라이언트 수
+        n_requests: 총 요청 수
+
+    Returns:
+        {"latencies_ms", "rows", "rejected", "errors", "elapsed_s"}
+    """
+    import httpx
+
+    n_batches = max(1, len(rows) // batch_size)
+    payloads = [
+        {"instances": rows[i * batch_size:(i + 1) * batch_size].tolist()}
+        for i in range(min(n_batches, n_requests))
+    ]
+    schedule = itertools.islice(itertools.cycle(payloads), n_requests)
+
+    latencies: List[float] = []
+    stats = {"rows": 0, "rejected": 0, "errors": 0}
+
+    async def client(http):
+        for payload in schedule:
+            start = time.perf_counter()
+            response = await http.post("/predict", json=payload)
+            latency_ms = (time.perf_counter() - start) * 1000
+            if response.status_code == 200:
+                latencies.append(latency_ms)
+                stats["rows"] += len(payload["instances"])
+            elif response.status_code == 503:
+                stats["rejected"] += 1
+            else:
+                stats["errors"] += 1
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://autotune") as http:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(http) for _ in range(concurrency)))
+        elapsed_s = time.perf_counter() - start
+
+    return {"latencies_ms": latencies, "elapsed_s": elapsed_s, **stats}
+
+
+def measure(
+    model,
+    config: ServingConfig,
+    rows: np.ndarray,
+    concurrency: int,
+    n_requests: int,
+    latency_slo_ms: float = 100.0
+) -> Measurement:
+    """
+    설정 하나를 적용한 앱을 띄워 주어진 동시 요청 수로 측정
+
+    Args:
+        model: 학습된 모델 (CaliforniaHousingModel)
+        config: 서빙 설정
+        rows: 요청 행 풀
+        concurrency: 동시 클라이언트 수
+        n_requests: 총 요청 수
+        latency_slo_ms: 승인 제어기의 지연시간 SLO
+
+    Returns:
+        측정 결과
+    """
+    from .api import create_app
+
+    budget = ThreadBudget(
+        n_cores=available_cpus(),
+        n_workers=1,
+        concurrency=config.admission_limit,
+        joblib_n_jobs=config.threads,
+        openmp_threads=config.threads,
+        blas_threads=config.threads,
+        onnx_intra_op_threads=config.threads
+    )
+    apply_thread_budget(budget, model)
+    backend = build_backend(model, config, budget)
+
+    admission = AdmissionController(
+        latency_slo_ms=latency_slo_ms,
+        initial_limit=config.admission_limit,
+        max_limit=config.admission_limit,
+        max_queue=max(32, concurrency)
+    )
+    app = create_app(model=backend, model_version="autotune", admission=admission)
+
+    result = asyncio.run(
+        replay(app, rows, config.batch_size, concurrency, n_requests)
+    )
+    latencies = result["latencies_ms"] or [float("inf")]
+    return Measurement(
+        config=config,
+        concurrency=concurrency,
+        requests=len(result["latencies_ms"]),
+        rows=result["rows"],
+        elapsed_s=result["elapsed_s"],
+        p50_ms=float(np.percentile(latencies, 50)),
+        p99_ms=float(np.percentile(latencies, 99)),
+        rejected=result["rejected"],
+        errors=result["errors"]
+    )
+
+
+def config_grid(
+    backends: Iterable[str] = ("sklearn",),
+    batch_sizes: Iterable[int] = (1, 8, 32),
+    threads: Iterable[int] = (1, 2, 4),
+    admission_limits: Iterable[int] = (2, 8)
+) -> List[ServingConfig]:
+    """설정 공간의 모든 조합"""
+    return [
+        ServingConfig(backend=b, batch_size=bs, threads=t, admission_limit=limit)
+        for b, bs, t, limit in itertools.product(
+            backends, batch_sizes, threads, admission_limits
+        )
+    ]
+
+
+def sweep(
+    model,
+    configs: List[ServingConfig],
+    rows: np.ndarray,
+    concurrency_levels: Iterable[int] = (1, 2, 4, 8, 16, 32),
+    n_requests: int = 200,
+    p99_target_ms: float = 50.0
+) -> List[Measurement]:
+    """
+    설정별로 동시 요청 수를 늘려가며 측정
+
+    p99가 목표를 넘으면 그 설정의 동시 요청 수 증가를 멈춤 (포화).
+    사용할 수 없는 백엔드 (패키지 미설치)는 건너뜀.
+
+    Args:
+        model: 학습된 모델
+        configs: 탐색할 설정 리스트
+        rows: 요청 행 풀
+        concurrency_levels: 동시 클라이언트 수 (오름차순)
+        n_requests: 측정당 총 요청 수
+        p99_target_ms: 목표 p99 지연시간 (ms)
+
+    Returns:
+        전체 측정 결과
+    """
+    results: List[Measurement] = []
+    unavailable = set()
+
+    for config in configs:
+        if config.backend in unavailable:
+            continue
+        for concurrency in sorted(concurrency_levels):
+            try:
+                result = measure(
+                    model, config, rows, concurrency, n_requests,
+                    latency_slo_ms=p99_target_ms
+                )
+            except ImportError as e:
+                logger.warning(f"Backend '{config.backend}' unavailable, skipping: {e}")
+                unavailable.add(config.backend)
+                break
+
+            results.append(result)
+            logger.info(
+                f"{config} c={concurrency}: {result.rows_per_s:.0f} rows/s, "
+                f"p99={result.p99_ms:.2f}ms, rejected={result.rejected}"
+            )
+            if result.p99_ms > p99_target_ms:
+                break
+
+    return results
+
+
+def best_config(
+    results: List[Measurement],
+    p99_target_ms: float,
+    batch_size: Optional[int] = None
+) -> Optional[Measurement]:
+    """
+    같은 워크로드 (요청 배치 크기)에서 p99 목표를 지키면서 처리량
+    (requests/s)이 가장 높은 측정 결과
+
+    배치 크기가 다른 측정끼리 rows/s로 비교하면 항상 가장 큰 클라이언트
+    배치가 선택되므로, 여러 배치 크기를 측정했다면 batch_size를 지정해야 함.
+    거부되거나 실패한 요청이 있는 측정은 제외
+
+    Args:
+        results: 측정 결과
+        p99_target_ms: 목표 p99 지연시간 (ms)
+        batch_size: 비교할 워크로드의 요청당 행 수 (결과가 한 가지면 생략 가능)
+
+    Returns:
+        최적 측정 결과 (목표를 만족하는 결과가 없으면 None)
+    """
+    if batch_size is None:
+        batch_sizes = {r.config.batch_size for r in results}
+        if len(batch_sizes) > 1:
+            raise ValueError(
+                f"Results cover several request batch sizes {sorted(batch_sizes)}; "
+                f"pass batch_size to compare configs on the same workload"
+            )
+    else:
+        results = [r for r in results if r.config.batch_size == batch_size]
+
+    candidates = [
+        r for r in results
+        if r.p99_ms <= p99_target_ms and r.rejected == 0 and r.errors == 0
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda r: r.requests_per_s)
+
+
+def write_results(
+    results: List[Measurement],
+    best: Optional[Measurement],
+    p99_target_ms: float,
+    output_dir: str
+) -> Dict[str, str]:
+    """
+    측정 테이블 (CSV)과 추천 설정 (JSON) 저장
+
+    추천 설정의 batch_size는 서버 설정이 아니므로 "workload"로 따로 기록
+
+    Returns:
+        {"table": CSV 경로, "config": JSON 경로}
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    table_path = os.path.join(output_dir, "autotune_results.csv")
+    config_path = os.path.join(output_dir, "serving_config.json")
+
+    rows = [r.to_row() for r in results]
+    with open(table_path, "w", newline="") as f:
+        if rows:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    recommendation = {"p99_target_ms": p99_target_ms, "found": best is not None}
+    if best is not None:
+        config = asdict(best.config)
+        recommendation.update({
+            **{k: v for k, v in config.items() if k != "batch_size"},
+            "workload": {"batch_size": config["batch_size"], "concurrency": best.concurrency},
+            "requests_per_s": round(best.requests_per_s, 1),
+            "rows_per_s": round(best.rows_per_s, 1),
+            "p99_ms": round(best.p99_ms, 3),
+            "env": best.config.to_env(),
+        })
+    with open(config_path, "w") as f:
+        json.dump(recommendation, f, indent=2)
+
+    logger.info(f"Autotune results saved to {table_path}, {config_path}")
+    return {"table": table_path, "config": config_path}
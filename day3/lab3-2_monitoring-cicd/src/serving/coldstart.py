@@ -0,0 +1,151 @@
+"""
+Cold Start Import Budget Module
+
+`python -X importtime`으로 서빙 진입점이 import하는 모듈의 시간을 측정하고
+예산 (ms)과 금지 모듈 (서빙에 필요 없는 학습/분석 의존성) 기준으로 검사.
+Knative/KServe scale-from-zero에서는 import 시간이 그대로 첫 요청 지연이 됨
+"""
+
+import os
+import sys
+import logging
+import subprocess
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# src/main.py가 모델 로드 전에 import하는 모듈
+SERVING_IMPORTS = (
+    "uvicorn",
+    "src.serving.api",
+    "src.serving.admission",
+    "src.serving.threads",
+    "src.serving.prefork",
+    "src.serving.onnx_session",
+    "src.monitoring.prediction_log",
+)
+
+# 서빙 import 단계에서 읽히면 안 되는 패키지 (모델 로드/학습/드리프트 분석에서만 필요)
+FORBIDDEN_PACKAGES = ("sklearn", "scipy", "pandas", "pyarrow", "onnx", "skl2onnx", "mlflow")
+
+DEFAULT_BUDGET_MS = 1000.0
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@dataclass
+class ImportProfile:
+    """import 한 번의 -X importtime 측정 결과"""
+    total_ms: float
+    # 모듈 이름 -> (self ms, cumulative ms)
+    modules: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+    @property
+    def packages(self) -> List[str]:
+        """읽힌 최상위 패키지 이름"""
+        return sorted({name.split(".")[0] for name in self.modules})
+
+    def slowest(self, n: int = 10) -> List[Tuple[str, float]]:
+        """self 시간 기준 가장 느린 모듈 n개 (이름, ms)"""
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][0], reverse=True)
+        return [(name, times[0]) for name, times in ranked[:n]]
+
+
+def _run_importtime(statement: str, python: str) -> List[Tuple[str, int, float, float]]:
+    """
+    -X importtime 출력 파싱
+
+    Returns:
+        (모듈 이름, 들여쓰기 깊이, self ms, cumulative ms) 목록 (import 순서)
+    """
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", statement],
+        cwd=_PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed: {statement}\n{result.stderr[-2000:]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # 헤더 줄
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(self_us) / 1000, int(cumulative_us) / 1000))
+    return entries
+
+
+def measure_import_time(
+    modules: Sequence[str] = SERVING_IMPORTS,
+    python: str = sys.executable,
+    repeat: int = 3
+) -> ImportProfile:
+    """
+    새 인터프리터에서 modules를 import하는 시간 측정
+
+    인터프리터 시작 시 읽히는 모듈 (site 등)은 빈 실행의 결과를 빼서 제외하고,
+    디스크 캐시 영향을 줄이기 위해 repeat번 중 가장 빠른 결과를 사용
+
+    Args:
+        modules: import할 모듈 이름
+        python: 측정할 Python 실행 파일
+        repeat: 반복 횟수
+
+    Returns:
+        ImportProfile
+    """
+    startup = {name for name, _, _, _ in _run_importtime("pass", python)}
+    statement = "; ".join(f"import {module}" for module in modules)
+
+    best: Optional[ImportProfile] = None
+    for _ in range(max(repeat, 1)):
+        entries = [e for e in _run_importtime(statement, python) if e[0] not in startup]
+        profile = ImportProfile(
+            total_ms=sum(cumulative for _, depth, _, cumulative in entries if depth == 0),
+            modules={name: (self_ms, cumulative) for name, _, self_ms, cumulative in entries}
+        )
+        if best is None or profile.total_ms < best.total_ms:
+            best = profile
+    return best
+
+
+def check_import_budget(
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    modules: Sequence[str] = SERVING_IMPORTS,
+    forbidden: Sequence[str] = FORBIDDEN_PACKAGES,
+    python: str = sys.executable,
+    repeat: int = 3
+) -> Tuple[ImportProfile, List[str]]:
+    """
+    서빙 import 시간 예산 검사
+
+    Args:
+        budget_ms: 허용 import 시간 (ms)
+        modules: import할 모듈 이름
+        forbidden: 읽히면 안 되는 최상위 패키지
+        python: 측정할 Python 실행 파일
+        repeat: 반복 횟수
+
+    Returns:
+        (측정 결과, 위반 사항 목록 (비어 있으면 통과))
+    """
+    profile = measure_import_time(modules, python=python, repeat=repeat)
+
+    violations = []
+    if profile.total_ms > budget_ms:
+        violations.append(f"import time {profile.total_ms:.0f}ms exceeds budget {budget_ms:.0f}ms")
+    loaded = sorted(set(profile.packages) & set(forbidden))
+    if loaded:
+        violations.append(f"forbidden packages imported: {loaded}")
+
+    logger.info(
+        f"Serving imports: {profile.total_ms:.0f}ms (budget {budget_ms:.0f}ms), "
+        f"{len(profile.modules)} modules"
+    )
+    return profile, violations
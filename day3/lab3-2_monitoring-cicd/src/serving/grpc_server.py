@@ -0,0 +1,214 @@
+"""
+gRPC Inference Module
+
+Open Inference Protocol (V2) 텐서 메시지 기반 gRPC 서버.
+HTTP API와 같은 ModelServer 인스턴스를 공유하므로 메트릭도 공유됨
+(grpcio, grpcio-tools가 설치된 환경에서 사용)
+"""
+
+import os
+import sys
+import logging
+from contextlib import nullcontext
+from concurrent import futures
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from .admission import OverloadedError
+
+logger = logging.getLogger(__name__)
+
+PROTO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "protos")
+PROTO_FILE = "grpc_predict_v2.proto"
+
+# OIP 데이터 타입 <-> NumPy dtype / InferTensorContents 필드
+DATATYPES = {
+    "FP32": (np.float32, "fp32_contents"),
+    "FP64": (np.float64, "fp64_contents"),
+    "INT32": (np.int32, "int_contents"),
+    "INT64": (np.int64, "int64_contents"),
+}
+
+_protos = None
+
+
+class InferenceError(ValueError):
+    """잘못된 추론 요청"""
+
+
+def load_protos() -> Tuple[object, object]:
+    """
+    grpc_predict_v2.proto를 런타임에 로드 (생성 코드 없이 grpc_tools 사용)
+
+    Returns:
+        (메시지 모듈, 서비스 모듈)
+    """
+    global _protos
+    if _protos is None:
+        import grpc
+
+        if PROTO_DIR not in sys.path:
+            sys.path.append(PROTO_DIR)
+        _protos = grpc.protos_and_services(PROTO_FILE)
+    return _protos
+
+
+def decode_input(request, n_features: Optional[int] = None) -> np.ndarray:
+    """
+    ModelInferRequest의 첫 번째 입력 텐서를 (n_samples, n_features) 배열로 변환
+
+    raw_input_contents (little-endian 바이트)와 타입별 contents 필드를 모두 지원.
+    n_features가 주어지면 특성 수가 다른 요청을 모델 호출 전에 InferenceError로 거부
+    """
+    if len(request.inputs) != 1:
+        raise InferenceError(f"Expected 1 input tensor, got {len(request.inputs)}")
+
+    tensor = request.inputs[0]
+    if tensor.datatype not in DATATYPES:
+        raise InferenceError(f"Unsupported datatype: {tensor.datatype}")
+    dtype, field = DATATYPES[tensor.datatype]
+    shape = tuple(tensor.shape)
+
+    if request.raw_input_contents:
+        data = np.frombuffer(
+            request.raw_input_contents[0], dtype=np.dtype(dtype).newbyteorder("<")
+        )
+    else:
+        data = np.asarray(getattr(tensor.contents, field), dtype=dtype)
+
+    if int(np.prod(shape)) != data.size:
+        raise InferenceError(
+            f"Tensor shape {list(shape)} does not match {data.size} elements"
+        )
+    data = data.reshape(shape)
+    if data.ndim == 1:
+        data = data.reshape(1, -1)
+    if data.ndim != 2:
+        raise InferenceError(f"Expected a 2-D tensor, got shape {list(shape)}")
+    if n_features is not None and data.shape[1] != n_features:
+        raise InferenceError(f"Expected {n_features} features, got {data.shape[1]}")
+    return data
+
+
+def encode_output(protos, request, predictions: np.ndarray, model_version: str):
+    """예측값을 ModelInferResponse로 변환 (요청이 raw이면 응답도 raw)"""
+    predictions = np.asarray(predictions, dtype=np.float64)
+    output = protos.ModelInferResponse.InferOutputTensor(
+        name="predictions",
+        datatype="FP64",
+        shape=[len(predictions)]
+    )
+    response = protos.ModelInferResponse(
+        model_name=request.model_name,
+        model_version=model_version,
+        id=request.id,
+        outputs=[output]
+    )
+    if request.raw_input_contents:
+        response.raw_output_contents.append(predictions.astype("<f8").tobytes())
+    else:
+        response.outputs[0].contents.fp64_contents.extend(predictions.tolist())
+    return response
+
+
+def create_grpc_server(
+    server,
+    port: int = 8081,
+    model_name: str = "california-housing",
+    max_workers: int = 8,
+    admission=None,
+    loop=None
+):
+    """
+    OIP V2 gRPC 서버 생성 (start()는 호출자가 수행)
+
+    Args:
+        server: HTTP API와 공유할 ModelServer 인스턴스
+        port: gRPC 포트 (0이면 임의 포트, 실제 포트는 server.bound_port)
+        model_name: 요청의 model_name과 비교할 모델 이름
+        max_workers: gRPC 처리 스레드 수
+        admission: HTTP API와 공유할 AdmissionController (선택).
+            과부하로 거부된 요청은 UNAVAILABLE + retry-after 트레일러
+        loop: admission을 사용하는 이벤트 루프 (admission이 주어지면 필수)
+
+    Returns:
+        grpc.Server 인스턴스
+    """
+    import grpc
+
+    if admission is not None and loop is None:
+        raise ValueError("loop is required when admission is given")
+
+    protos, services = load_protos()
+    feature_names = getattr(server.model, "FEATURE_NAMES", None)
+    n_features = len(feature_names) if feature_names else getattr(server.model, "n_features_in_", None)
+
+    class InferenceServicer(services.GRPCInferenceServiceServicer):
+        """ModelServer를 감싸는 OIP V2 서비스"""
+
+        def _check_model(self, name, context):
+            if name and name != model_name:
+                context.abort(grpc.StatusCode.NOT_FOUND, f"Unknown model: {name}")
+
+        def _infer(self, request):
+            X = decode_input(request, n_features=n_features)
+            with admission.admit_threadsafe(loop) if admission is not None else nullcontext():
+                predictions = server.predict_array(X)
+            return encode_output(protos, request, predictions, server.model_version)
+
+        def ServerLive(self, request, context):
+            return protos.ServerLiveResponse(live=True)
+
+        def ServerReady(self, request, context):
+            return protos.ServerReadyResponse(ready=server.is_ready)
+
+        def ModelReady(self, request, context):
+            self._check_model(request.name, context)
+            return protos.ModelReadyResponse(ready=server.is_ready)
+
+        def ModelMetadata(self, request, context):
+            self._check_model(request.name, context)
+            tensor = protos.ModelMetadataResponse.TensorMetadata
+            return protos.ModelMetadataResponse(
+                name=model_name,
+                versions=[server.model_version],
+                platform="sklearn",
+                inputs=[tensor(name="input-0", datatype="FP64", shape=[-1, 8])],
+                outputs=[tensor(name="predictions", datatype="FP64", shape=[-1])]
+            )
+
+        def ModelInfer(self, request, context):
+            self._check_model(request.model_name, context)
+            if not server.is_ready:
+                context.abort(grpc.StatusCode.UNAVAILABLE, "Model is not loaded")
+            try:
+                return self._infer(request)
+            except InferenceError as e:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+            except OverloadedError as e:
+                context.set_trailing_metadata((("retry-after", str(e.retry_after)),))
+                context.abort(grpc.StatusCode.UNAVAILABLE, str(e))
+            except Exception as e:
+                context.abort(grpc.StatusCode.INTERNAL, str(e))
+
+        def ModelStreamInfer(self, request_iterator, context) -> Iterator:
+            # 스트림은 요청마다 응답 하나를 보내고, 오류가 나도 스트림은 유지
+            for request in request_iterator:
+                if request.model_name and request.model_name != model_name:
+                    yield protos.ModelStreamInferResponse(
+                        error_message=f"Unknown model: {request.model_name}"
+                    )
+                    continue
+                try:
+                    yield protos.ModelStreamInferResponse(
+                        infer_response=self._infer(request)
+                    )
+                except Exception as e:
+                    yield protos.ModelStreamInferResponse(error_message=str(e))
+
+    grpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    services.add_GRPCInferenceServiceServicer_to_server(InferenceServicer(), grpc_server)
+    grpc_server.bound_port = grpc_server.add_insecure_port(f"[::]:{port}")
+    logger.info(f"gRPC inference server configured on port {grpc_server.bound_port}")
+    return grpc_server
@@ -0,0 +1,340 @@
+"""
+ONNX Runtime Session Module
+
+튜닝된 SessionOptions (그래프 최적화 수준, intra/inter-op 스레드, 실행 모드)로
+onnxruntime 세션을 만들고, 최적화된 그래프를 디스크에 캐시하여 재시작 시
+최적화 단계를 건너뜀.
+
+입력/출력 버퍼는 배치 크기 등급 (batch_classes)별로 미리 할당하고 IO binding으로
+바인딩하므로, 정상 상태의 predict()는 입력 dtype 변환 복사본이나 출력 텐서를
+새로 할당하지 않음 (out 인자를 주면 결과 배열도 할당하지 않음)
+
+(onnxruntime이 설치된 환경에서 사용)
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+OPTIMIZATION_LEVELS = ("disable", "basic", "extended", "all")
+EXECUTION_MODES = ("sequential", "parallel")
+
+# 버퍼 용량 등급. 요청 행 수 이상인 가장 작은 등급의 버퍼를 사용하고,
+# 가장 큰 등급보다 큰 요청은 그 크기로 나눠 실행
+DEFAULT_BATCH_CLASSES = (1, 16, 128, 1024, 8192)
+
+_TENSOR_TYPES = {
+    "tensor(double)": np.float64,
+    "tensor(float)": np.float32,
+    "tensor(float16)": np.float16,
+    "tensor(int64)": np.int64,
+    "tensor(int32)": np.int32,
+    "tensor(uint8)": np.uint8,
+}
+
+
+def optimized_cache_path(model_path: str, optimization_level: str) -> str:
+    """
+    최적화된 그래프 캐시 경로
+
+    최적화 결과는 onnxruntime 버전과 최적화 수준에 따라 다르므로 파일 이름에 포함
+    """
+    import onnxruntime as ort
+
+    stem = os.path.splitext(model_path)[0]
+    return f"{stem}.opt-{optimization_level}-ort{ort.__version__}.onnx"
+
+
+class _Binding:
+    """배치 크기 등급 하나의 IO binding과 미리 할당된 입력/출력 버퍼"""
+
+    def __init__(
+        self,
+        session,
+        capacity: int,
+        input_dtype,
+        n_features: int,
+        output_dtype,
+        output_tail
+    ):
+        self.capacity = capacity
+        self.io_binding = session.io_binding()
+        self.input = np.empty((capacity, n_features), dtype=input_dtype)
+        self.output = np.empty((capacity,) + tuple(output_tail), dtype=output_dtype)
+        # 현재 바인딩된 행 수 (같은 행 수면 다시 바인딩하지 않음)
+        self.bound_rows = 0
+
+
+class OnnxSession:
+    """
+    튜닝된 onnxruntime 세션 (CaliforniaHousingModel과 같은 predict() 인터페이스)
+
+    사용 예:
+        session = OnnxSession("model.onnx", intra_op_threads=2)
+        predictions = session.predict(X)
+    """
+
+    def __init__(
+        self,
+        model: Union[str, bytes],
+        intra_op_threads: int = 1,
+        inter_op_threads: int = 1,
+        execution_mode: str = "sequential",
+        optimization_level: str = "extended",
+        cache_optimized: bool = True,
+        batch_classes: Sequence[int] = DEFAULT_BATCH_CLASSES,
+        pre_optimized: Optional[str] = None
+    ):
+        """
+        Args:
+            model: ONNX 모델 경로 또는 직렬화된 바이트
+            intra_op_threads: 연산 내부 병렬 스레드 수
+            inter_op_threads: 연산 간 병렬 스레드 수 (execution_mode="parallel"일 때 사용)
+            execution_mode: sequential / parallel
+            optimization_level: disable / basic / extended / all
+                (all은 현재 CPU에 맞춘 레이아웃 변환을 포함하므로 캐시는 같은 노드에서만 재사용)
+            cache_optimized: 최적화된 그래프를 모델 옆에 저장하고 다음 로드에 재사용
+                (model이 경로이고 디렉토리에 쓸 수 있을 때만. 읽기 전용 마운트면 캐시 없이 로드)
+            batch_classes: 버퍼 용량 등급 (행 수)
+            pre_optimized: 그래프에 이미 오프라인으로 적용된 최적화 수준
+                (export_onnx()는 extended). optimization_level이 이 수준 이하이면
+                다시 최적화하지 않고 캐시도 만들지 않음
+        """
+        import onnxruntime as ort
+
+        if optimization_level not in OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"Unknown optimization_level: {optimization_level}. "
+                f"Supported: {list(OPTIMIZATION_LEVELS)}"
+            )
+        if pre_optimized is not None and pre_optimized not in OPTIMIZATION_LEVELS:
+            raise ValueError(
+                f"Unknown pre_optimized: {pre_optimized}. "
+                f"Supported: {list(OPTIMIZATION_LEVELS)}"
+            )
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Unknown execution_mode: {execution_mode}. Supported: {list(EXECUTION_MODES)}"
+            )
+
+        self.model_path = model if isinstance(model, str) else None
+        self.optimization_level = optimization_level
+        self.pre_optimized = pre_optimized
+        self.batch_classes = tuple(sorted(set(batch_classes)))
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = inter_op_threads
+        options.execution_mode = (
+            ort.ExecutionMode.ORT_PARALLEL if execution_mode == "parallel"
+            else ort.ExecutionMode.ORT_SEQUENTIAL
+        )
+        levels = {
+            "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+            "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+            "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+            "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+        }
+        options.graph_optimization_level = levels[optimization_level]
+
+        source = model
+        self.cache_hit = False
+        already_optimized = (
+            pre_optimized is not None
+            and OPTIMIZATION_LEVELS.index(optimization_level) <= OPTIMIZATION_LEVELS.index(pre_optimized)
+        )
+        cache_path = None
+        if already_optimized:
+            # export_onnx()가 같은 수준으로 최적화해 저장한 그래프는 다시 최적화하지 않음
+            options.graph_optimization_level = levels["disable"]
+        elif self.model_path is not None and cache_optimized and optimization_level != "disable":
+            cache_path = optimized_cache_path(self.model_path, optimization_level)
+            if (
+                os.path.exists(cache_path)
+                and os.path.getmtime(cache_path) >= os.path.getmtime(self.model_path)
+            ):
+                # 이미 최적화된 그래프이므로 다시 최적화하지 않음
+                source = cache_path
+                options.graph_optimization_level = levels["disable"]
+                self.cache_hit = True
+            elif os.access(os.path.dirname(os.path.abspath(cache_path)), os.W_OK):
+                options.optimized_model_filepath = cache_path
+            else:
+                logger.info(f"Model directory is not writable, optimized graph cache disabled: {cache_path}")
+
+        start = time.perf_counter()
+        try:
+            self.session = ort.InferenceSession(source, options, providers=["CPUExecutionProvider"])
+        except Exception as e:
+            if not options.optimized_model_filepath:
+                raise
+            # 캐시 쓰기 실패로 서버 시작이 실패하지 않도록 캐시 없이 다시 생성
+            logger.warning(f"Failed to write optimized graph cache {cache_path}, loading without it: {e}")
+            options.optimized_model_filepath = ""
+            self.session = ort.InferenceSession(source, options, providers=["CPUExecutionProvider"])
+        self.load_s = time.perf_counter() - start
+
+        inputs = self.session.get_inputs()
+        outputs = self.session.get_outputs()
+        if len(inputs) != 1:
+            raise ValueError(f"Expected a single model input, got {len(inputs)}")
+        self.input_name = inputs[0].name
+        self.input_dtype = _TENSOR_TYPES[inputs[0].type]
+        self.n_features = inputs[0].shape[1]
+        self.output_name = outputs[0].name
+        self.output_dtype = _TENSOR_TYPES[outputs[0].type]
+        self.output_tail = tuple(outputs[0].shape[1:])
+        # 출력의 배치 외 차원이 고정되어 있어야 버퍼를 미리 할당할 수 있음
+        self.use_io_binding = isinstance(self.n_features, int) and all(
+            isinstance(d, int) for d in self.output_tail
+        )
+
+        self.metadata = dict(self.session.get_modelmeta().custom_metadata_map)
+        self._pool: Dict[int, List[_Binding]] = {c: [] for c in self.batch_classes}
+        self._n_bindings = {c: 0 for c in self.batch_classes}
+        self._lock = threading.Lock()
+
+        logger.info(
+            f"ONNX session ready in {self.load_s * 1000:.1f}ms "
+            f"(optimization={optimization_level}, cache_hit={self.cache_hit}, "
+            f"intra={intra_op_threads}, inter={inter_op_threads}, mode={execution_mode})"
+        )
+
+    @classmethod
+    def from_budget(cls, model: Union[str, bytes], budget, **kwargs) -> "OnnxSession":
+        """스레드 예산 (ThreadBudget)의 onnx 스레드 수로 세션 생성"""
+        return cls(
+            model,
+            intra_op_threads=budget.onnx_intra_op_threads,
+            inter_op_threads=budget.onnx_inter_op_threads,
+            **kwargs
+        )
+
+    @property
+    def FEATURE_NAMES(self) -> Optional[List[str]]:
+        """export_onnx()가 기록한 입력 특성 이름 (없으면 None)"""
+        names = self.metadata.get("feature_names")
+        return json.loads(names) if names else None
+
+    def _acquire(self, n_rows: int) -> _Binding:
+        capacity = next(c for c in self.batch_classes if c >= n_rows)
+        with self._lock:
+            pool = self._pool[capacity]
+            if pool:
+                return pool.pop()
+            self._n_bindings[capacity] += 1
+        return _Binding(
+            self.session, capacity, self.input_dtype, self.n_features,
+            self.output_dtype, self.output_tail
+        )
+
+    def _release(self, binding: _Binding) -> None:
+        with self._lock:
+            self._pool[binding.capacity].append(binding)
+
+    def _run_bound(self, X: np.ndarray, out: np.ndarray) -> None:
+        """미리 할당된 버퍼로 실행 (X 행 수 <= 가장 큰 등급)"""
+        n_rows = len(X)
+        binding = self._acquire(n_rows)
+        try:
+            inputs = binding.input[:n_rows]
+            outputs = binding.output[:n_rows]
+            np.copyto(inputs, X, casting="same_kind")
+
+            io_binding = binding.io_binding
+            if binding.bound_rows != n_rows:
+                io_binding.bind_input(
+                    self.input_name, "cpu", 0, self.input_dtype, inputs.shape,
+                    inputs.ctypes.data
+                )
+                io_binding.bind_output(
+                    self.output_name, "cpu", 0, self.output_dtype, outputs.shape,
+                    outputs.ctypes.data
+                )
+                binding.bound_rows = n_rows
+            self.session.run_with_iobinding(io_binding)
+            np.copyto(out, outputs.reshape(n_rows, -1)[:, 0])
+        finally:
+            self._release(binding)
+
+    def predict(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        예측 수행
+
+        Args:
+            X: 입력 특성 (n_samples, n_features)
+            out: 결과를 기록할 (n_samples,) 배열 (선택)
+
+        Returns:
+            예측값 배열 (첫 번째 출력의 첫 열)
+        """
+        X = np.asarray(X)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if out is None:
+            out = np.empty(len(X))
+
+        if not self.use_io_binding:
+            X = X.astype(self.input_dtype, copy=False)
+            result = self.session.run([self.output_name], {self.input_name: X})[0]
+            np.copyto(out, result.reshape(len(X), -1)[:, 0])
+            return out
+
+        step = self.batch_classes[-1]
+        for start in range(0, len(X), step):
+            self._run_bound(X[start:start + step], out[start:start + step])
+        return out
+
+    def get_stats(self) -> Dict:
+        """세션 로드 시간, 캐시 적중 여부, 등급별 버퍼 수"""
+        with self._lock:
+            bindings = {str(c): n for c, n in self._n_bindings.items() if n}
+        return {
+            "load_s": self.load_s,
+            "cache_hit": self.cache_hit,
+            "pre_optimized": self.pre_optimized,
+            "optimization_level": self.optimization_level,
+            "io_binding": self.use_io_binding,
+            "bindings": bindings,
+        }
+
+
+def load_onnx_model(model_path: str, budget=None, require_parity: bool = True, **kwargs) -> OnnxSession:
+    """
+    모델 파일 옆에 export_onnx()로 저장된 ONNX 모델을 세션으로 로드
+
+    Args:
+        model_path: 모델 파일 경로 (예: model.joblib) 또는 .onnx 경로
+        budget: 스레드 예산 (ThreadBudget, 선택)
+        require_parity: 일치 보고서가 없거나 실패면 RuntimeError
+        **kwargs: OnnxSession 옵션
+
+    Returns:
+        OnnxSession
+    """
+    from ..model.onnx_export import onnx_paths
+
+    onnx_path, report_path = onnx_paths(model_path)
+    report = {}
+    if os.path.exists(report_path):
+        with open(report_path) as f:
+            report = json.load(f)
+    if require_parity:
+        if not report:
+            raise RuntimeError(f"ONNX parity report not found: {report_path}. Run export_onnx() first.")
+        if not report.get("passed"):
+            raise RuntimeError(f"ONNX parity check did not pass: {report_path}")
+
+    # export_onnx()가 적용한 오프라인 최적화 수준 (이하 수준은 다시 최적화하지 않음)
+    kwargs.setdefault("pre_optimized", report.get("optimization_level"))
+
+    if budget is not None:
+        return OnnxSession.from_budget(onnx_path, budget, **kwargs)
+    return OnnxSession(onnx_path, **kwargs)
@@ -0,0 +1,147 @@
+"""
+Pre-fork Serving Module
+
+부모 프로세스에서 모델을 한 번 로드한 뒤 워커를 fork하여
+읽기 전용 모델 페이지를 copy-on-write로 공유
+"""
+
+import os
+import gc
+import signal
+import socket
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SMAPS_FIELDS = (
+    "Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty"
+)
+
+
+def memory_usage(pid: Optional[int] = None) -> Dict[str, int]:
+    """
+    프로세스 메모리 사용량 (kB, Linux /proc/<pid>/smaps_rollup)
+
+    여러 워커의 실제 메모리 합계는 RSS가 아니라 PSS 합으로 비교해야 함
+    (공유 페이지가 프로세스 수로 나뉘어 계산됨)
+
+    Args:
+        pid: 프로세스 ID (기본: 현재 프로세스)
+
+    Returns:
+        {"Rss", "Pss", "Shared_Clean", ...} 값 (kB)
+    """
+    path = f"/proc/{pid or os.getpid()}/smaps_rollup"
+    usage = {}
+    with open(path) as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in SMAPS_FIELDS:
+                usage[key] = int(rest.split()[0])
+    return usage
+
+
+def freeze_for_fork() -> None:
+    """
+    fork 전에 현재 객체를 GC 추적 대상에서 제외
+
+    자식 프로세스의 GC가 상속받은 객체 헤더를 건드려 공유 페이지가
+    복사되는 것을 방지 (gc.freeze)
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    """워커들이 공유할 리스닝 소켓 생성"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app, sock: socket.socket, log_level: str) -> None:
+    """자식 프로세스에서 uvicorn 서버 실행"""
+    import uvicorn
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    config = uvicorn.Config(app, log_level=log_level, access_log=True)
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+
+
+def serve_prefork(
+    app,
+    n_workers: int,
+    host: str = "0.0.0.0",
+    port: int = 8080,
+    log_level: str = "info"
+) -> None:
+    """
+    pre-fork 방식으로 여러 uvicorn 워커 실행
+
+    uvicorn --workers는 워커마다 앱을 새로 import하므로 모델이 워커 수만큼
+    복제됨. 여기서는 이미 모델이 로드된 앱을 fork하여 트리 배열 등
+    읽기 전용 페이지를 공유하고, 종료된 워커는 다시 fork함.
+
+    Args:
+        app: 모델이 로드된 ASGI 앱 (create_app 결과)
+        n_workers: 워커 프로세스 수
+        host: 바인드 주소
+        port: 포트
+        log_level: uvicorn 로그 레벨
+    """
+    sock = _bind_socket(host, port)
+    freeze_for_fork()
+
+    workers: Dict[int, int] = {}
+    shutting_down = False
+
+    def spawn(slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _run_worker(app, sock, log_level)
+            finally:
+                os._exit(0)
+        workers[pid] = slot
+        logger.info(f"Worker {slot} started (pid={pid})")
+
+    def shutdown(signum, frame) -> None:
+        nonlocal shutting_down
+        shutting_down = True
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    logger.info(f"Pre-fork server on {host}:{port} with {n_workers} workers")
+    for slot in range(n_workers):
+        spawn(slot)
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+
+        slot = workers.pop(pid, None)
+        if slot is None:
+            continue
+        if not shutting_down:
+            logger.warning(f"Worker {slot} (pid={pid}) exited with status {status}, restarting")
+            spawn(slot)
+
+    sock.close()
+    logger.info("Pre-fork server stopped")
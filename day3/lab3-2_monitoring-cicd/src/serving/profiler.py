@@ -0,0 +1,171 @@
+"""
+Sampling Profiler Module
+
+요청 시에만 실행되는 Python 스택 샘플링 프로파일러.
+유휴 상태에서는 스레드도 훅도 없으므로 오버헤드가 없음
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (프레임 이름, 파일, 줄 번호) 튜플의 스택 (root -> leaf)
+Stack = Tuple[Tuple[str, str, int], ...]
+
+
+class ProfilerBusyError(RuntimeError):
+    """이미 프로파일링이 실행 중"""
+
+
+class SamplingProfiler:
+    """
+    sys._current_frames() 기반 스택 샘플러
+
+    profile()을 호출한 스레드가 그 동안에만 interval_s 간격으로 다른 모든
+    스레드의 스택을 수집함. 같은 스택은 합쳐서 세므로 메모리는 고유 스택 수에 비례.
+    프로세스당 한 번에 하나의 프로파일만 실행됨.
+    """
+
+    def __init__(self, interval_s: float = 0.005, max_depth: int = 128):
+        """
+        프로파일러 초기화
+
+        Args:
+            interval_s: 샘플링 간격 (초)
+            max_depth: 스택당 최대 프레임 수 (leaf 쪽 유지)
+        """
+        self.interval_s = interval_s
+        self.max_depth = max_depth
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._lock.locked()
+
+    def profile(self, seconds: float) -> Tuple[Counter, Dict]:
+        """
+        현재 스레드를 제외한 모든 스레드의 스택을 seconds 동안 샘플링
+
+        Args:
+            seconds: 샘플링 시간 (초)
+
+        Returns:
+            (스택별 샘플 수, {"samples", "duration_s", "interval_s"})
+
+        Raises:
+            ProfilerBusyError: 다른 프로파일이 실행 중인 경우
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+
+        try:
+            stacks: Counter = Counter()
+            own_thread = threading.get_ident()
+            n_samples = 0
+            start = time.perf_counter()
+            deadline = start + seconds
+
+            while time.perf_counter() < deadline:
+                names = {t.ident: t.name for t in threading.enumerate()}
+                for thread_id, frame in sys._current_frames().items():
+                    if thread_id == own_thread:
+                        continue
+                    stacks[self._walk(frame, names.get(thread_id, str(thread_id)))] += 1
+                n_samples += 1
+                time.sleep(self.interval_s)
+
+            duration_s = time.perf_counter() - start
+        finally:
+            self._lock.release()
+
+        logger.info(
+            f"Profile finished: {n_samples} samples, {len(stacks)} unique stacks "
+            f"in {duration_s:.2f}s"
+        )
+        return stacks, {
+            "samples": n_samples,
+            "duration_s": duration_s,
+            "interval_s": self.interval_s
+        }
+
+    def _walk(self, frame, thread_name: str) -> Stack:
+        """leaf 프레임에서 root까지 거슬러 올라가 root -> leaf 스택 생성"""
+        frames = []
+        while frame is not None and len(frames) < self.max_depth:
+            code = frame.f_code
+            frames.append((code.co_name, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        frames.append((f"thread:{thread_name}", "", 0))
+        return tuple(reversed(frames))
+
+
+def _frame_label(frame: Tuple[str, str, int]) -> str:
+    name, filename, line = frame
+    if not filename:
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def to_collapsed(stacks: Counter) -> str:
+    """
+    collapsed-stack 형식 (flamegraph.pl, speedscope 호환)
+
+    한 줄에 "root;child;leaf count"
+    """
+    lines = [
+        ";".join(_frame_label(f).replace(";", ":") for f in stack) + f" {count}"
+        for stack, count in stacks.most_common()
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def to_speedscope(stacks: Counter, info: Dict, name: str = "model-server") -> Dict:
+    """
+    speedscope sampled profile 형식 (https://www.speedscope.app)
+
+    Args:
+        stacks: profile()의 스택별 샘플 수
+        info: profile()의 실행 정보
+        name: 프로파일 이름
+
+    Returns:
+        JSON 직렬화 가능한 dict
+    """
+    frame_index: Dict[Tuple[str, str, int], int] = {}
+    frames = []
+    samples = []
+    weights = []
+    # 실제 샘플 간격 (sleep 오차 포함)
+    period_s = info["duration_s"] / max(1, info["samples"])
+
+    for stack, count in stacks.most_common():
+        indices = []
+        for frame in stack:
+            if frame not in frame_index:
+                frame_index[frame] = len(frames)
+                frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+            indices.append(frame_index[frame])
+        samples.append(indices)
+        weights.append(count * period_s)
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights
+        }],
+        "name": name,
+        "exporter": "src.serving.profiler"
+    }
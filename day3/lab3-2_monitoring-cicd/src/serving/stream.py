@@ -0,0 +1,234 @@
+"""
+Streaming Prediction Module
+
+대용량 배치를 NDJSON/CSV 청크 업로드로 받아 고정 크기 청크 단위로 예측하고
+결과를 스트리밍으로 반환 (메모리 사용량 제한)
+"""
+
+import json
+import asyncio
+import logging
+from typing import AsyncIterator, Callable, List, Optional
+
+import numpy as np
+
+from .admission import AdmissionController, OverloadedError
+
+logger = logging.getLogger(__name__)
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_LINE_BYTES = 64 * 1024
+
+CONTENT_TYPES = {
+    "application/x-ndjson": NDJSON,
+    "application/ndjson": NDJSON,
+    "application/jsonlines": NDJSON,
+    "text/csv": CSV,
+}
+
+
+class StreamFormatError(ValueError):
+    """스트리밍 입력 형식 오류"""
+
+    def __init__(self, message: str, line_number: int):
+        super().__init__(f"line {line_number}: {message}")
+        self.line_number = line_number
+
+
+def resolve_format(content_type: Optional[str]) -> Optional[str]:
+    """
+    Content-Type 헤더에서 입력 형식 결정
+
+    Args:
+        content_type: 요청 Content-Type 헤더 값
+
+    Returns:
+        'ndjson', 'csv' 또는 지원하지 않는 경우 None
+    """
+    if not content_type:
+        return None
+    media_type = content_type.split(";")[0].strip().lower()
+    return CONTENT_TYPES.get(media_type)
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[bytes]:
+    """
+    바이트 청크 스트림을 줄 단위로 분리
+
+    다음 청크는 현재 줄들이 모두 소비된 뒤에만 읽으므로
+    업로드 속도가 처리 속도에 맞춰 조절됨 (back-pressure)
+
+    Args:
+        chunks: 요청 본문 바이트 청크 스트림
+        max_line_bytes: 한 줄의 최대 크기 (초과 시 오류)
+
+    Yields:
+        개행 문자가 제거된 한 줄
+    """
+    buffer = b""
+    line_number = 0
+
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            yield line.rstrip(b"\r")
+        if len(buffer) > max_line_bytes:
+            raise StreamFormatError(
+                f"line exceeds {max_line_bytes} bytes", line_number + 1
+            )
+
+    if buffer.strip():
+        yield buffer.rstrip(b"\r")
+
+
+def parse_ndjson_line(line: bytes, line_number: int) -> List[float]:
+    """NDJSON 한 줄 (JSON 배열 또는 {"instance": [...]}) 파싱"""
+    try:
+        value = json.loads(line)
+    except ValueError as e:
+        raise StreamFormatError(f"invalid JSON ({e})", line_number)
+
+    if isinstance(value, dict):
+        value = value.get("instance")
+    if not isinstance(value, list) or not all(
+        isinstance(x, (int, float)) and not isinstance(x, bool) for x in value
+    ):
+        raise StreamFormatError("expected a JSON array of numbers", line_number)
+    return value
+
+
+def parse_csv_line(line: bytes, line_number: int) -> List[float]:
+    """CSV 한 줄 파싱"""
+    try:
+        return [float(x) for x in line.split(b",")]
+    except ValueError:
+        raise StreamFormatError("non-numeric CSV value", line_number)
+
+
+async def stream_predictions(
+    chunks: AsyncIterator[bytes],
+    predict_fn: Callable[[np.ndarray], np.ndarray],
+    fmt: str = NDJSON,
+    n_features: int = 8,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    model_version: str = "v1.0",
+    admission: Optional[AdmissionController] = None
+) -> AsyncIterator[bytes]:
+    """
+    청크 단위 스트리밍 예측
+
+    입력 행을 chunk_size개씩 모아 예측하고 청크마다 NDJSON 한 줄을 반환.
+    메모리에는 한 번에 최대 한 청크만 유지되며, 예측은 이벤트 루프를
+    막지 않도록 스레드에서 실행됨.
+    응답이 이미 시작된 뒤 입력 오류가 발생하면 {"error": ...} 줄로 종료하고,
+    predict_fn이 청크를 거부하면 (예: CSV의 inf) 해당 청크만
+    {"offset", "rows", "error"} 줄로 대체한 뒤 다음 청크를 계속 처리.
+    admission이 주어지면 청크마다 /predict와 같은 슬롯을 획득하며, 과부하로
+    거부되면 {"error", "retry_after", "rows_scored"} 줄로 종료
+    (응답 상태가 이미 전송되었으므로 503 대신 사용, rows_scored 행부터 재시도).
+
+    Args:
+        chunks: 요청 본문 바이트 청크 스트림
+        predict_fn: 배열 입력 예측 함수 (예: ModelServer.predict_array)
+        fmt: 입력 형식 ('ndjson' 또는 'csv')
+        n_features: 행당 특성 수
+        chunk_size: 한 번에 예측할 행 수
+        model_version: 응답에 포함할 모델 버전
+        admission: 청크 예측 승인 제어기 (선택)
+
+    Yields:
+        {"offset", "predictions", "model_version"} NDJSON 줄 (bytes)
+    """
+    if fmt not in (NDJSON, CSV):
+        raise ValueError(f"Unsupported stream format: {fmt}")
+
+    parse_line = parse_ndjson_line if fmt == NDJSON else parse_csv_line
+    batch = np.empty((chunk_size, n_features), dtype=np.float64)
+    filled = 0
+    offset = 0
+    line_number = 0
+
+    async def predict(n_rows: int) -> np.ndarray:
+        if admission is None:
+            return await asyncio.to_thread(predict_fn, batch[:n_rows])
+        async with admission.admit():
+            return await asyncio.to_thread(predict_fn, batch[:n_rows])
+
+    async def flush(n_rows: int) -> bytes:
+        try:
+            predictions = await predict(n_rows)
+        except OverloadedError:
+            raise
+        except Exception as e:
+            logger.warning(f"Stream chunk at offset {offset} failed: {e}")
+            return (json.dumps({
+                "offset": offset,
+                "rows": n_rows,
+                "error": f"prediction failed: {e}",
+                "model_version": model_version
+            }) + "\n").encode()
+        return (json.dumps({
+            "offset": offset,
+            "predictions": np.asarray(predictions).tolist(),
+            "model_version": model_version
+        }) + "\n").encode()
+
+    try:
+        async for line in iter_lines(chunks):
+            line_number += 1
+            if not line.strip():
+                continue
+
+            # CSV 헤더 행은 건너뜀
+            if fmt == CSV and line_number == 1:
+                try:
+                    float(line.split(b",")[0])
+                except ValueError:
+                    continue
+
+            row = parse_line(line, line_number)
+            if len(row) != n_features:
+                raise StreamFormatError(
+                    f"expected {n_features} features, got {len(row)}",
+                    line_number
+                )
+
+            batch[filled] = row
+            filled += 1
+            if filled == chunk_size:
+                yield await flush(filled)
+                offset += filled
+                filled = 0
+
+        if filled:
+            yield await flush(filled)
+            offset += filled
+
+    except StreamFormatError as e:
+        logger.warning(f"Stream aborted: {e}")
+        yield (json.dumps({
+            "error": str(e),
+            "line": e.line_number,
+            "rows_scored": offset
+        }) + "\n").encode()
+        return
+    except OverloadedError as e:
+        logger.warning(f"Stream aborted after {offset} rows: {e}")
+        yield (json.dumps({
+            "error": str(e),
+            "retry_after": e.retry_after,
+            "rows_scored": offset
+        }) + "\n").encode()
+        return
+
+    logger.info(f"Stream prediction completed: {offset} rows")
@@ -0,0 +1,192 @@
+"""
+Inference Thread Budget Module
+
+워커 수와 CPU 코어 수에 맞춰 백엔드별 (joblib, OpenMP, BLAS, onnxruntime)
+추론 스레드 수를 제한하여 CPU 과다 구독 (oversubscription) 방지
+"""
+
+import os
+import logging
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 네이티브 라이브러리가 로드되기 전에 읽는 스레드 수 환경 변수
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+@dataclass
+class ThreadBudget:
+    """추론 스레드 배분 결과"""
+    n_cores: int
+    n_workers: int
+    concurrency: int
+    joblib_n_jobs: int
+    openmp_threads: int
+    blas_threads: int
+    onnx_intra_op_threads: int
+    onnx_inter_op_threads: int = 1
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def available_cpus() -> int:
+    """
+    현재 프로세스가 사용할 수 있는 CPU 수
+
+    CPU affinity와 cgroup CPU quota (Kubernetes limits)를 반영함
+    """
+    try:
+        n_cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        n_cpus = os.cpu_count() or 1
+
+    # cgroup v2: "max 100000" 또는 "200000 100000"
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()[:2]
+        if quota != "max":
+            n_cpus = min(n_cpus, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+
+    return max(1, n_cpus)
+
+
+def plan_thread_budget(
+    n_workers: Optional[int] = None,
+    n_cores: Optional[int] = None,
+    concurrency: int = 1
+) -> ThreadBudget:
+    """
+    추론 스레드 예산 계산
+
+    코어를 (워커 수 x 워커당 동시 요청 수)로 나눈 만큼만 요청당 스레드를 사용
+
+    Args:
+        n_workers: uvicorn 워커 프로세스 수 (기본: WEB_CONCURRENCY 또는 1)
+        n_cores: 사용 가능한 코어 수 (기본: available_cpus())
+        concurrency: 워커당 동시에 실행되는 예측 요청 수
+
+    Returns:
+        백엔드별 스레드 수
+    """
+    n_workers = n_workers or int(os.environ.get("WEB_CONCURRENCY", 1))
+    n_cores = n_cores or available_cpus()
+    concurrency = max(1, concurrency)
+
+    per_request = max(1, n_cores // (n_workers * concurrency))
+
+    return ThreadBudget(
+        n_cores=n_cores,
+        n_workers=n_workers,
+        concurrency=concurrency,
+        joblib_n_jobs=per_request,
+        openmp_threads=per_request,
+        blas_threads=per_request,
+        onnx_intra_op_threads=per_request
+    )
+
+
+def set_estimator_n_jobs(estimator, n_jobs: int) -> int:
+    """
+    추정기 (및 하위 추정기)의 n_jobs 설정
+
+    Args:
+        estimator: sklearn 추정기 또는 CaliforniaHousingModel
+        n_jobs: 설정할 병렬 작업 수
+
+    Returns:
+        n_jobs가 변경된 추정기 수
+    """
+    # CaliforniaHousingModel 래퍼인 경우 내부 sklearn 모델 사용
+    estimator = getattr(estimator, "model", estimator)
+    if estimator is None:
+        return 0
+
+    updated = 0
+    if hasattr(estimator, "n_jobs"):
+        estimator.n_jobs = n_jobs
+        updated += 1
+    # GradientBoosting의 estimators_는 2차원 ndarray
+    sub_estimators = getattr(estimator, "estimators_", None)
+    if sub_estimators is None:
+        sub_estimators = []
+    for sub_estimator in getattr(sub_estimators, "flat", sub_estimators):
+        if hasattr(sub_estimator, "n_jobs"):
+            sub_estimator.n_jobs = n_jobs
+            updated += 1
+    return updated
+
+
+def apply_thread_budget(budget: ThreadBudget, model=None) -> Dict:
+    """
+    스레드 예산 적용
+
+    - 환경 변수: 이후 로드되는 OpenMP/BLAS 라이브러리 및 자식 프로세스용
+    - threadpoolctl: 이미 로드된 OpenMP/BLAS 스레드 풀 제한
+    - 모델 n_jobs: joblib 병렬 예측 제한
+
+    Args:
+        budget: plan_thread_budget() 결과
+        model: n_jobs를 조정할 모델 (선택)
+
+    Returns:
+        적용 결과 리포트
+    """
+    for name in THREAD_ENV_VARS:
+        threads = budget.blas_threads if name != "OMP_NUM_THREADS" else budget.openmp_threads
+        os.environ[name] = str(threads)
+
+    limited_pools = []
+    try:
+        from threadpoolctl import threadpool_info, threadpool_limits
+
+        threadpool_limits(limits=budget.blas_threads, user_api="blas")
+        threadpool_limits(limits=budget.openmp_threads, user_api="openmp")
+        limited_pools = [
+            f"{pool['internal_api']}={pool['num_threads']}" for pool in threadpool_info()
+        ]
+    except ImportError:
+        logger.warning("threadpoolctl not installed. Relying on environment variables only.")
+
+    n_estimators = set_estimator_n_jobs(model, budget.joblib_n_jobs) if model is not None else 0
+
+    report = {
+        **budget.to_dict(),
+        "estimators_updated": n_estimators,
+        "native_thread_pools": limited_pools
+    }
+    logger.info(
+        f"Thread budget: cores={budget.n_cores}, workers={budget.n_workers}, "
+        f"concurrency={budget.concurrency} -> n_jobs={budget.joblib_n_jobs}, "
+        f"omp={budget.openmp_threads}, blas={budget.blas_threads}, "
+        f"onnx_intra={budget.onnx_intra_op_threads}"
+    )
+    return report
+
+
+def onnx_session_options(budget: ThreadBudget):
+    """
+    스레드 예산이 반영된 onnxruntime SessionOptions 생성
+
+    Args:
+        budget: plan_thread_budget() 결과
+
+    Returns:
+        onnxruntime.SessionOptions
+    """
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = budget.onnx_intra_op_threads
+    options.inter_op_num_threads = budget.onnx_inter_op_threads
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    return options
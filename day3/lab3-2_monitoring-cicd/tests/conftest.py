@@ -32,3 +32,52 @@ def sample_batch_features():
         [5.6431, 52.0, 5.817352, 1.073059, 558.0, 2.547945, 37.85, -122.25],
         [3.8462, 35.0, 6.281853, 1.081081, 565.0, 2.181467, 37.85, -122.26]
     ]
+
+
+@pytest.fixture(scope="session")
+def synthetic_data():
+    """합성 회귀 데이터 (네트워크 없이 사용 가능한 8개 특성)"""
+    rng = np.random.RandomState(42)
+    X = rng.rand(500, 8) * 10
+    y = X[:, 0] * 0.5 + X[:, 1] * 0.1 + rng.randn(500) * 0.1 + 1.0
+    return X, y
+
+
+@pytest.fixture(scope="session")
+def fitted_model(synthetic_data):
+    """합성 데이터로 학습된 Random Forest 모델"""
+    from src.model.trainer import CaliforniaHousingModel
+
+    X, y = synthetic_data
+    model = CaliforniaHousingModel(
+        model_type="random_forest",
+        model_params={"n_estimators": 10, "max_depth": 5, "random_state": 42}
+    )
+    model.train(X, y)
+    return model
+
+
+@pytest.fixture
+def thread_budget_sandbox(monkeypatch):
+    """
+    apply_thread_budget()가 바꾸는 프로세스 전역 상태 (스레드 환경 변수,
+    threadpoolctl 스레드 풀 제한)를 테스트 후 원래대로 복원
+    """
+    from src.serving.threads import THREAD_ENV_VARS
+
+    # setenv가 원래 값 (없으면 없음)을 기록하므로 테스트 후 복원됨
+    for name in THREAD_ENV_VARS:
+        monkeypatch.setenv(name, os.environ.get(name, ""))
+
+    try:
+        from threadpoolctl import threadpool_info, threadpool_limits
+    except ImportError:
+        yield
+        return
+
+    # sklearn이 로드하는 OpenMP 런타임도 복원 대상에 포함되도록 먼저 로드
+    import sklearn.ensemble  # noqa: F401
+
+    original = {pool["prefix"]: pool["num_threads"] for pool in threadpool_info()}
+    yield
+    threadpool_limits(limits=original)
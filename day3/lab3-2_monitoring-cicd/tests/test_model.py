@@ -4,9 +4,22 @@ Test cases for model training module
 
 import pytest
 import numpy as np
+import pandas as pd
 import os
 import tempfile
 
+from src.model.binning import cached_binned_features
+from src.model.compress import compress_forest, pareto_frontier, truncate_tree
+from src.model.cv import cross_validate, fold_assignments
+from src.model.dataset import cached_dataset
+from src.model.feature_store import FeatureStore
+from src.model.features import FeatureTransform, california_housing_transform
+from src.model.onnx_export import onnx_paths
+from src.model.profiling import TrainingProfiler
+from src.model.quantize import learn_cut_points
+from src.model.search import sample_configs, search_models
+from src.model.sharded import merge_models, shard_rows, train_sharded
+from src.model.streaming import iter_parquet_batches
 from src.model.trainer import CaliforniaHousingModel, train_model
 
 
@@ -160,6 +173,21 @@ class TestCaliforniaHousingModel:
         finally:
             os.unlink(filepath)
 
+    def test_load_with_mmap(self, synthetic_data, tmp_path):
+        """메모리 매핑 로드 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+        model.train(X, y)
+
+        filepath = str(tmp_path / "model.joblib")
+        model.save(filepath)
+        loaded_model = CaliforniaHousingModel.load(filepath, mmap_mode="r")
+
+        assert isinstance(loaded_model.model.coef_, np.memmap)
+        np.testing.assert_array_almost_equal(
+            model.predict(X[:5]), loaded_model.predict(X[:5])
+        )
+
     def test_save_without_training(self):
         """학습 없이 저장 시 오류 테스트"""
         model = CaliforniaHousingModel()
@@ -199,3 +227,960 @@ class TestTrainModel:
             assert loaded.is_fitted is True
         finally:
             os.unlink(filepath)
+
+
+class TestFeatureTransform:
+    """FeatureTransform 테스트"""
+
+    def test_parity_with_pandas_pipeline(self, synthetic_data):
+        """Project 파이프라인 (StandardScaler + pandas 파생 피처)과 값 일치 테스트"""
+        pd = pytest.importorskip("pandas")
+        from sklearn.preprocessing import StandardScaler
+
+        X, _ = synthetic_data
+        names = CaliforniaHousingModel.FEATURE_NAMES
+
+        scaler = StandardScaler().fit(X)
+        df = pd.DataFrame(scaler.transform(X), columns=names)
+        df["rooms_per_household"] = df["AveRooms"] / (df["AveOccup"] + 1e-6)
+        df["bedrooms_ratio"] = df["AveBedrms"] / (df["AveRooms"] + 1e-6)
+        df["population_per_household"] = df["Population"] / (df["AveOccup"] + 1e-6)
+        df["dist_to_bay"] = np.sqrt(df["Latitude"]**2 + df["Longitude"]**2)
+        df["density"] = df["Population"] * df["AveOccup"]
+        df["income_rooms"] = df["MedInc"] * df["AveRooms"]
+        df["location_score"] = df["Latitude"] * 0.5 + df["Longitude"] * 0.5
+
+        transform = california_housing_transform(names).fit(X)
+
+        assert transform.output_names == list(df.columns)
+        np.testing.assert_array_equal(transform.transform(X), df.to_numpy())
+
+    def test_serialization_roundtrip(self, synthetic_data, tmp_path):
+        """JSON 저장/로드 후 같은 결과 테스트"""
+        X, _ = synthetic_data
+        transform = (
+            FeatureTransform(["a", "b", "c"])
+            .standard_scale(["a", "b"])
+            .distance("d", "a", "b", x0=1.0, y0=-1.0)
+            .linear("l", {"a": 2.0, "c": -1.0}, bias=0.5)
+            .fit(X[:, :3])
+        )
+
+        filepath = str(tmp_path / "transform.json")
+        transform.save(filepath)
+        loaded = FeatureTransform.load(filepath)
+
+        np.testing.assert_array_equal(loaded.transform(X[:, :3]), transform.transform(X[:, :3]))
+        assert loaded.output_names == ["a", "b", "c", "d", "l"]
+
+    def test_unknown_column(self):
+        """존재하지 않는 컬럼 참조 오류 테스트"""
+        with pytest.raises(ValueError) as exc_info:
+            FeatureTransform(["a", "b"]).ratio("r", "a", "missing")
+
+        assert "Unknown column" in str(exc_info.value)
+
+    def test_transform_before_fit(self):
+        """fit 전에 변환 시 오류 테스트"""
+        transform = FeatureTransform(["a"]).standard_scale()
+
+        with pytest.raises(RuntimeError):
+            transform.transform(np.ones((2, 1)))
+
+    def test_model_with_transform(self, synthetic_data, tmp_path):
+        """피처 변환이 포함된 모델 학습/저장/로드 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type="linear_regression",
+            feature_transform=california_housing_transform(
+                CaliforniaHousingModel.FEATURE_NAMES
+            )
+        )
+        model.train(X, y)
+
+        assert model.model.n_features_in_ == 15
+        assert len(model.predict(X[:3])) == 3
+
+        filepath = str(tmp_path / "model.joblib")
+        model.save(filepath)
+        loaded = CaliforniaHousingModel.load(filepath)
+
+        np.testing.assert_array_equal(loaded.predict(X[:10]), model.predict(X[:10]))
+
+    def test_fixed_scaler_statistics(self, synthetic_data):
+        """파이프라인에서 학습한 StandardScaler 통계 사용 테스트"""
+        from sklearn.preprocessing import StandardScaler
+
+        X, _ = synthetic_data
+        scaler = StandardScaler().fit(X[:100])
+        transform = FeatureTransform([f"f{i}" for i in range(8)]).standard_scale(
+            mean=scaler.mean_, scale=scaler.scale_
+        )
+
+        transform.fit(X)
+
+        np.testing.assert_array_equal(transform.transform(X), scaler.transform(X))
+
+
+class TestDatasetCache:
+    """로컬 데이터셋 캐시 테스트"""
+
+    @pytest.fixture
+    def loader(self, synthetic_data):
+        X, y = synthetic_data
+        calls = []
+
+        def load():
+            calls.append(1)
+            return X, y, [f"f{i}" for i in range(X.shape[1])]
+
+        load.calls = calls
+        return load
+
+    def test_split_matches_train_test_split(self, loader, synthetic_data, tmp_path):
+        """캐시 분할이 train_test_split과 같은지 테스트"""
+        from sklearn.model_selection import train_test_split
+
+        X, y = synthetic_data
+        dataset = cached_dataset("synthetic", loader, cache_dir=str(tmp_path))
+
+        expected = train_test_split(X, y, test_size=0.2, random_state=42)
+        for actual, wanted in zip(dataset.split(), expected):
+            np.testing.assert_array_equal(actual, wanted)
+        np.testing.assert_array_equal(dataset.X_train, X[dataset.train_index])
+
+    def test_second_load_uses_mmap_cache(self, loader, tmp_path):
+        """두 번째 로드는 원본 로더 없이 메모리 맵 뷰 반환 테스트"""
+        first = cached_dataset("synthetic", loader, cache_dir=str(tmp_path))
+        second = cached_dataset("synthetic", loader, cache_dir=str(tmp_path))
+
+        assert len(loader.calls) == 1
+        assert second.path == first.path
+        assert isinstance(second.X, np.memmap)
+        assert np.shares_memory(second.X_train, second.X)
+        assert second.to_frame("test").shape == (100, 9)
+
+    def test_cache_key_depends_on_content_and_split(self, loader, synthetic_data, tmp_path):
+        """내용 해시와 분할 설정에 따른 캐시 키 테스트"""
+        X, y = synthetic_data
+        base = cached_dataset("synthetic", loader, cache_dir=str(tmp_path))
+        other_split = cached_dataset(
+            "synthetic", loader, test_size=0.3, cache_dir=str(tmp_path)
+        )
+        changed = cached_dataset(
+            "synthetic", lambda: (X + 1, y, ["f"] * 8),
+            cache_dir=str(tmp_path), refresh=True
+        )
+
+        assert len({base.path, other_split.path, changed.path}) == 3
+        assert changed.content_hash != base.content_hash
+        assert other_split.content_hash == base.content_hash
+
+
+class TestModelSearch:
+    """successive halving 모델 탐색 테스트"""
+
+    SPACE = {
+        "random_forest": {"n_estimators": [5, 10], "max_depth": [2, 4, 6]},
+        "linear_regression": {},
+    }
+
+    def test_sample_configs(self):
+        """모델 유형별 고른 설정 추출 테스트"""
+        configs = sample_configs(self.SPACE, 4)
+
+        assert len(configs) == 4
+        assert [m for m, _ in configs].count("linear_regression") == 1
+        assert len({str(p) for m, p in configs if m == "random_forest"}) == 3
+
+    def test_halving_search(self, synthetic_data):
+        """successive halving 탐색 및 결과 모델 테스트"""
+        X, y = synthetic_data
+        result = CaliforniaHousingModel.search(
+            X[:400], y[:400], X[400:], y[400:],
+            space=self.SPACE, n_configs=7, eta=2, min_resource=100, n_workers=2
+        )
+
+        # 100 -> 200 -> 400행 단계에서 7 -> 3 -> 1개 후보
+        assert result.n_fits == 7 + 3 + 1
+        assert len(result.leaderboard) == 7
+        top = result.leaderboard[0]
+        assert top["n_samples"] == 400
+        assert top["model_type"] == result.best_trial.model_type
+        assert top["val_mae"] == pytest.approx(result.best_model.metrics["val_mae"], abs=1e-6)
+
+        predictions = result.best_model.predict(X[400:])
+        assert predictions.shape == (100,)
+
+        # 기록된 파라미터로 반환된 estimator를 재현할 수 있어야 함 (n_jobs는 서빙 기본값)
+        estimator_params = result.best_model.model.get_params()
+        for name, value in result.best_model.model_params.items():
+            assert estimator_params[name] == value
+        if "n_jobs" in estimator_params:
+            assert estimator_params["n_jobs"] == -1
+        if "random_state" in estimator_params:
+            assert result.best_model.model_params["random_state"] == 42
+
+    def test_hyperband_search(self, synthetic_data):
+        """Hyperband bracket 실행 테스트"""
+        X, y = synthetic_data
+        result = search_models(
+            X[:400], y[:400], X[400:], y[400:],
+            space=self.SPACE, strategy="hyperband",
+            n_configs=4, eta=2, min_resource=100, n_workers=2
+        )
+
+        assert result.best_model.is_fitted
+        assert result.leaderboard[0]["n_samples"] == 400
+
+    def test_invalid_search_options(self, synthetic_data):
+        """잘못된 탐색 옵션 테스트"""
+        X, y = synthetic_data
+        with pytest.raises(ValueError, match="strategy"):
+            search_models(X, y, X, y, strategy="grid")
+        with pytest.raises(ValueError, match="Unsupported model types"):
+            search_models(X, y, X, y, space={"xgboost": {}})
+
+
+class TestCrossValidation:
+    """병렬 k-fold 교차 검증 테스트"""
+
+    def test_fold_assignments(self):
+        """fold 분할 및 캐시 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            folds = fold_assignments(103, n_splits=4, random_state=7, cache_dir=tmpdir)
+
+            assert folds.shape == (103,)
+            assert sorted(np.bincount(folds)) == [25, 26, 26, 26]
+            assert fold_assignments(103, n_splits=4, random_state=7) is folds
+            assert os.path.exists(os.path.join(tmpdir, "folds_103_4_7.npy"))
+
+    def test_fold_assignments_many_splits(self):
+        """int8 범위를 넘는 fold 수 (n_splits > 128) 테스트"""
+        folds = fold_assignments(400, n_splits=200, random_state=7)
+
+        assert folds.dtype == np.int32
+        assert folds.min() == 0 and folds.max() == 199
+        assert (np.bincount(folds) == 2).all()
+        assert fold_assignments(256, n_splits=128, random_state=7).max() == 127
+
+    def test_matches_sequential_kfold(self, synthetic_data):
+        """sklearn KFold 순차 실행과 같은 fold 메트릭 테스트"""
+        from sklearn.linear_model import LinearRegression
+        from sklearn.metrics import mean_absolute_error
+        from sklearn.model_selection import KFold
+
+        X, y = synthetic_data
+        result = cross_validate(
+            X, y, model_type="linear_regression", n_splits=5, n_workers=2
+        )
+
+        splitter = KFold(n_splits=5, shuffle=True, random_state=42)
+        expected = [
+            mean_absolute_error(y[test], LinearRegression().fit(X[train], y[train]).predict(X[test]))
+            for train, test in splitter.split(X)
+        ]
+        assert [f["mae"] for f in result.folds] == pytest.approx(expected)
+        assert result.mean["mae"] == pytest.approx(np.mean(expected))
+        assert sum(f["n_test"] for f in result.folds) == len(X)
+
+    def test_model_cross_validate(self, synthetic_data):
+        """모델 설정 + 피처 변환으로 교차 검증 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 5, "max_depth": 4, "random_state": 42},
+            feature_transform=FeatureTransform(CaliforniaHousingModel.FEATURE_NAMES).standard_scale()
+        )
+        result = model.cross_validate(X, y, n_splits=3, n_workers=3)
+
+        assert len(result.folds) == 3
+        assert result.std["r2"] >= 0
+        assert model.metrics["cv_r2_mean"] == result.mean["r2"]
+        assert not model.is_fitted
+
+    def test_invalid_splits(self, synthetic_data):
+        """잘못된 fold 수 테스트"""
+        X, y = synthetic_data
+        with pytest.raises(ValueError, match="n_splits"):
+            cross_validate(X, y, n_splits=1)
+
+
+class TestModelArtifact:
+    """자체 기술 아티팩트 포맷 테스트"""
+
+    @pytest.mark.parametrize("model_type,params", [
+        ("random_forest", {"n_estimators": 5, "max_depth": 4, "random_state": 42}),
+        ("gradient_boosting", {"n_estimators": 10, "max_depth": 3, "random_state": 42}),
+        ("linear_regression", {}),
+    ])
+    def test_roundtrip(self, synthetic_data, model_type, params):
+        """저장 후 로드한 모델의 예측 일치 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(model_type=model_type, model_params=params)
+        model.train(X, y)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "model.chm")
+            model.save(filepath)
+            loaded = CaliforniaHousingModel.load(filepath)
+
+            np.testing.assert_array_equal(loaded.predict(X[:50]), model.predict(X[:50]))
+            assert loaded.metrics == pytest.approx(model.metrics)
+
+    def test_metadata_without_payload(self, fitted_model):
+        """헤더만 읽기 및 지연 로드 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "model.chm")
+            fitted_model.save(filepath)
+
+            header = CaliforniaHousingModel.read_metadata(filepath)
+            assert header["model_type"] == "random_forest"
+            assert header["feature_names"] == CaliforniaHousingModel.FEATURE_NAMES
+            assert header["payload"]["n_trees"] == 10
+
+            # 페이로드를 손상시켜도 메타데이터와 로드는 동작하고, estimator 접근 시 검출됨
+            with open(filepath, "r+b") as f:
+                f.seek(-10, os.SEEK_END)
+                f.write(b"\x00" * 10)
+            loaded = CaliforniaHousingModel.load(filepath)
+            assert loaded.metrics == pytest.approx(fitted_model.metrics)
+            with pytest.raises(ValueError, match="checksum"):
+                loaded.predict(np.zeros((1, 8)))
+
+    def test_joblib_metadata(self, fitted_model):
+        """joblib 파일의 메타데이터 읽기 테스트"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "model.joblib")
+            fitted_model.save(filepath)
+
+            metadata = CaliforniaHousingModel.read_metadata(filepath)
+            assert metadata["model_type"] == "random_forest"
+            assert "model" not in metadata
+
+
+class TestTrainingProfiler:
+    """학습 단계 프로파일러 테스트"""
+
+    def test_nested_phases(self):
+        """중첩 단계 기록 및 메트릭 테스트"""
+        profiler = TrainingProfiler(trace_memory=True)
+        with profiler.phase("train"):
+            with profiler.phase("fit"):
+                block = np.ones(2 ** 21)  # 16MB
+            del block
+
+        names = [p["name"] for p in profiler.report()["phases"]]
+        assert names == ["train/fit", "train"]
+
+        fit, train = profiler.phases
+        assert fit.traced_peak_mb >= 16
+        assert train.traced_peak_mb >= fit.traced_peak_mb
+        assert train.peak_rss_mb >= fit.peak_rss_mb > 0
+        assert train.wall_s >= fit.wall_s
+
+        metrics = profiler.metrics()
+        assert "phase_train.fit_wall_s" in metrics
+        assert "phase_train_cpu_s" in metrics
+
+    def test_model_train_phases(self, synthetic_data):
+        """CaliforniaHousingModel.train 단계 기록 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 5, "random_state": 42},
+            feature_transform=FeatureTransform(CaliforniaHousingModel.FEATURE_NAMES).standard_scale()
+        )
+        profiler = TrainingProfiler()
+        model.train(X[:400], y[:400], X[400:], y[400:], profiler=profiler)
+
+        names = [p.name for p in profiler.phases]
+        assert names == ["transform", "fit", "train_predict", "val_predict"]
+        assert "fit" in profiler.format_table()
+
+    def test_mlflow_export_without_run(self):
+        """MLflow 미설치/활성 run 없음 처리 테스트"""
+        profiler = TrainingProfiler()
+        with profiler.phase("load"):
+            pass
+        assert profiler.log_to_mlflow() is False
+
+
+class TestShardedTraining:
+    """shard 분할 포레스트 학습 테스트"""
+
+    def test_shard_rows_partition(self):
+        """shard 행이 전체를 겹치지 않게 나누는지 테스트"""
+        shards = [shard_rows(103, 4, shard) for shard in range(4)]
+
+        assert sorted(np.concatenate(shards).tolist()) == list(range(103))
+        assert [len(rows) for rows in shards] == [25, 26, 26, 26]
+        np.testing.assert_array_equal(shard_rows(103, 4, 2), shards[2])
+
+    def test_train_sharded(self, synthetic_data):
+        """프로세스 풀 shard 학습 및 병합 테스트"""
+        X, y = synthetic_data
+        model = train_sharded(
+            X[:400], y[:400], n_shards=3, n_estimators=10,
+            model_params={"max_depth": 6}, n_workers=2
+        )
+
+        assert len(model.model.estimators_) == 10
+        assert model.model_params["n_estimators"] == 10
+        assert [r["estimators"] for r in model.provenance] == [[0, 4], [4, 7], [7, 10]]
+        assert sum(r["n_samples"] for r in model.provenance) == 400
+        assert model.evaluate(X[400:], y[400:])["r2"] > 0.8
+
+    def test_merge_matches_tree_average(self, synthetic_data):
+        """병합 모델 예측이 서브 포레스트 트리 평균과 같은지 테스트"""
+        X, y = synthetic_data
+        params = {"n_estimators": 4, "max_depth": 4, "random_state": 0}
+        first = CaliforniaHousingModel(model_params=dict(params))
+        first.train(X[:250], y[:250])
+        second = CaliforniaHousingModel(model_params={**params, "n_estimators": 2})
+        second.train(X[250:], y[250:])
+
+        merged = merge_models([first, second])
+        expected = (first.predict(X) * 4 + second.predict(X) * 2) / 6
+        np.testing.assert_allclose(merged.predict(X), expected)
+        assert len(first.model.estimators_) == 4
+
+    def test_merge_rejects_boosting(self, synthetic_data):
+        """부스팅 모델 병합 거부 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type="gradient_boosting", model_params={"n_estimators": 5}
+        )
+        model.train(X, y)
+        with pytest.raises(ValueError, match="Cannot merge"):
+            merge_models([model, model])
+
+
+class TestModelCompression:
+    """포레스트 축소 (부분집합 / 깊이 절단 / distillation) 테스트"""
+
+    def test_truncate_matches_shallow_tree(self, synthetic_data):
+        """깊이 절단 트리가 같은 데이터로 학습한 얕은 트리와 같은 예측을 하는지 테스트"""
+        import copy
+        from sklearn.tree import DecisionTreeRegressor
+
+        X, y = synthetic_data
+        deep = DecisionTreeRegressor(max_depth=10, random_state=0).fit(X, y)
+        shallow = DecisionTreeRegressor(max_depth=3, random_state=0).fit(X, y)
+
+        truncated = copy.copy(deep)
+        truncated.tree_ = truncate_tree(deep.tree_, 3)
+
+        assert truncated.tree_.node_count == shallow.tree_.node_count
+        assert truncated.tree_.max_depth == 3
+        np.testing.assert_allclose(truncated.predict(X), shallow.predict(X))
+
+    def test_compress_within_tolerance(self, synthetic_data):
+        """선택된 모델이 허용 범위 안에서 기준보다 작은지 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(model_params={"n_estimators": 20, "max_depth": 8})
+        model.train(X[:300], y[:300])
+
+        result = model.compress(
+            X[350:400], y[350:400], tolerance=0.05,
+            tree_counts=[2, 5, 10], depths=[4], n_latency_requests=20,
+            X_select=X[300:350], y_select=y[300:350]
+        )
+
+        assert result.selected.mae <= result.baseline.mae * 1.05
+        assert result.selected.n_nodes <= result.baseline.n_nodes
+        assert result.model.is_fitted
+        # 후보 MAE는 트리 순서 선택에 쓰지 않은 데이터로 측정
+        np.testing.assert_allclose(
+            result.model.evaluate(X[350:400], y[350:400])["mae"], result.selected.mae
+        )
+        # 원본 모델은 변경되지 않음
+        assert len(model.model.estimators_) == 20
+
+        p99s = [c["p99_ms"] for c in result.frontier_table()]
+        maes = [c["mae"] for c in result.frontier_table()]
+        assert p99s == sorted(p99s)
+        assert maes == sorted(maes, reverse=True)
+
+    def test_compress_splits_selection_data(self, synthetic_data, monkeypatch):
+        """X_select가 없으면 검증 데이터를 나눠 트리 순서 선택과 MAE 측정에 따로 쓰는지 테스트"""
+        import src.model.compress as compress_module
+
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(model_params={"n_estimators": 10, "max_depth": 6})
+        model.train(X[:300], y[:300])
+        seen = {}
+        original_order = compress_module.greedy_tree_order
+
+        def recording_order(forest, X_input, y_input):
+            seen["select_rows"] = len(y_input)
+            seen["select_targets"] = set(np.round(y_input, 8))
+            return original_order(forest, X_input, y_input)
+
+        monkeypatch.setattr(compress_module, "greedy_tree_order", recording_order)
+        result = compress_forest(
+            model, X[300:400], y[300:400], tree_counts=[5], depths=[], n_latency_requests=10
+        )
+
+        assert seen["select_rows"] == 50
+        val_rows = [i for i in range(300, 400) if round(y[i], 8) not in seen["select_targets"]]
+        assert len(val_rows) == 50
+        np.testing.assert_allclose(
+            model.evaluate(X[val_rows], y[val_rows])["mae"], result.baseline.mae
+        )
+
+    def test_distill_candidates(self, synthetic_data):
+        """X_train이 주어지면 distillation 후보가 추가되는지 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(model_params={"n_estimators": 10, "max_depth": 6})
+        model.train(X[:300], y[:300])
+
+        result = compress_forest(
+            model, X[300:400], y[300:400], tree_counts=[5], depths=[],
+            X_train=X[:300], distill_configs=[{"n_estimators": 3, "max_depth": 4}],
+            n_latency_requests=10
+        )
+
+        methods = {c.method for c in result.candidates}
+        assert "distill" in methods
+        names = {c.name for c in result.candidates}
+        assert {c.name for c in pareto_frontier(result.candidates)} <= names
+        assert not any("depth" in name for name in names if name.startswith("subset"))
+
+    def test_compress_rejects_boosting(self, synthetic_data):
+        """부스팅 모델 압축 거부 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type="gradient_boosting", model_params={"n_estimators": 5}
+        )
+        model.train(X, y)
+        with pytest.raises(ValueError, match="random_forest only"):
+            model.compress(X, y)
+
+
+class TestOnnxExport:
+    """ONNX 변환 및 수치 일치 확인 테스트"""
+
+    def test_onnx_paths(self):
+        """ONNX 파일과 보고서가 모델 파일 옆에 저장되는지 테스트"""
+        assert onnx_paths("/models/model.joblib") == (
+            "/models/model.onnx", "/models/model.parity.json"
+        )
+        assert onnx_paths("model.chm")[0] == "model.onnx"
+
+    @pytest.mark.parametrize("model_type", list(CaliforniaHousingModel.SUPPORTED_MODELS))
+    def test_export_parity(self, synthetic_data, model_type):
+        """모든 모델 유형이 피처 변환을 포함해 sklearn 예측과 일치하는지 테스트"""
+        pytest.importorskip("skl2onnx")
+        ort = pytest.importorskip("onnxruntime")
+        X, y = synthetic_data
+        # 파생 피처까지 다시 표준화하여 SGD가 발산하지 않도록 함
+        transform = california_housing_transform(CaliforniaHousingModel.FEATURE_NAMES)
+        model = CaliforniaHousingModel(
+            model_type=model_type, feature_transform=transform.standard_scale()
+        )
+        if model_type == "random_forest":
+            model.model_params["n_estimators"] = 10
+        model.train(X[:400], y[:400])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report = model.export_onnx(os.path.join(tmpdir, "model.joblib"), X[400:])
+            onnx_path, report_path = onnx_paths(os.path.join(tmpdir, "model.joblib"))
+
+            assert report["passed"]
+            assert report["mismatch_rate"] == 0.0
+            assert os.path.exists(report_path)
+
+            session = ort.InferenceSession(onnx_path, providers=["CPUExecutionProvider"])
+            onnx_pred = session.run(None, {"input": X[400:]})[0].ravel()
+            np.testing.assert_allclose(onnx_pred, model.predict(X[400:]), rtol=1e-4, atol=1e-4)
+
+    def test_parity_failure(self, synthetic_data):
+        """허용 오차를 넘으면 ONNX 파일을 지우고 보고서는 남기는지 테스트"""
+        pytest.importorskip("skl2onnx")
+        pytest.importorskip("onnxruntime")
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+        model.train(X[:400], y[:400])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "model.joblib")
+            with pytest.raises(RuntimeError, match="parity check failed"):
+                model.export_onnx(filepath, X[400:], atol=0.0, rtol=0.0, max_mismatch_rate=0.0)
+
+            onnx_path, report_path = onnx_paths(filepath)
+            assert not os.path.exists(onnx_path)
+            with open(report_path) as f:
+                assert f.read().count('"passed": false') == 1
+
+
+class TestTreeQuantization:
+    """트리 양자화 (uint8 분할 경계 / float16 리프) 테스트"""
+
+    @pytest.mark.parametrize("model_type", ["random_forest", "gradient_boosting"])
+    def test_exact_splits(self, synthetic_data, model_type):
+        """고유 경계가 절단점 수 이하이면 리프 값 반올림 오차만 남는지 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type=model_type,
+            model_params={"n_estimators": 5, "max_depth": 4, "random_state": 0}
+        )
+        model.train(X[:400], y[:400])
+
+        quantized, report = model.quantize(X[400:], y[400:])
+
+        assert report["exact_splits"]
+        assert report["max_abs_pred_diff"] < 1e-2
+        assert abs(report["mae_delta"]) < 1e-2
+        assert report["compression_ratio"] > 4
+        assert quantized.model.threshold.dtype == np.uint8
+        assert quantized.model.value.dtype == np.float16
+        np.testing.assert_array_equal(
+            quantized.model.predict_binned(quantized.model.bin(X[400:])),
+            quantized.predict(X[400:])
+        )
+
+    def test_cut_points_limit(self, synthetic_data):
+        """절단점 수가 max_cuts를 넘지 않고 경계 값 중에서 선택되는지 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(model_params={"n_estimators": 20, "random_state": 0})
+        model.train(X, y)
+        trees = [e.tree_ for e in model.model.estimators_]
+
+        cuts = learn_cut_points(trees, X.shape[1], max_cuts=16)
+        used = np.concatenate([t.threshold[t.children_left != -1] for t in trees])
+
+        assert all(len(c) <= 16 for c in cuts)
+        assert np.isin(np.concatenate(cuts), used).all()
+
+    def test_quantized_save_load(self, synthetic_data):
+        """양자화 모델 저장/로드 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_params={"n_estimators": 10, "max_depth": 6, "random_state": 0},
+            feature_transform=california_housing_transform(CaliforniaHousingModel.FEATURE_NAMES)
+        )
+        model.train(X[:400], y[:400])
+        quantized, report = model.quantize(X[400:], y[400:], max_cuts=32)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "model.chm")
+            quantized.save(path)
+            loaded = CaliforniaHousingModel.load(path)
+            np.testing.assert_array_equal(loaded.predict(X[400:]), quantized.predict(X[400:]))
+            assert CaliforniaHousingModel.read_metadata(path)["quantization"]["max_cuts"] == 32
+        assert loaded.metrics["quantized_val_mae"] == report["quantized_val_mae"]
+        assert loaded.is_quantized and not model.is_quantized
+
+    def test_quantized_rejects_estimator_apis(self, synthetic_data):
+        """sklearn estimator가 필요한 API가 양자화 모델을 명확한 오류로 거부하는지 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_params={"n_estimators": 5, "max_depth": 4, "random_state": 0}
+        )
+        model.train(X[:400], y[:400])
+        quantized, _ = model.quantize(X[400:], y[400:])
+
+        with pytest.raises(ValueError, match="quantized"):
+            quantized.compress(X[400:], y[400:])
+        with pytest.raises(ValueError, match="quantized"):
+            quantized.partial_retrain(X[:50], y[:50])
+        with pytest.raises(ValueError, match="quantized"):
+            quantized.quantize(X[400:], y[400:])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError, match="quantized"):
+                quantized.export_onnx(os.path.join(tmpdir, "model.joblib"), X[400:])
+
+    def test_rejects_linear(self, synthetic_data):
+        """트리 앙상블이 아닌 모델 양자화 거부 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+        model.train(X, y)
+        with pytest.raises(ValueError, match="Cannot quantize"):
+            model.quantize(X, y)
+
+
+def gold_snapshot(day, offset, n_entities=5, seed=0):
+    """엔티티별 Gold 테이블 스냅샷 (MedInc = offset + 엔티티 번호)"""
+    rng = np.random.RandomState(seed)
+    frame = pd.DataFrame(
+        rng.rand(n_entities, 8) + 1.0, columns=CaliforniaHousingModel.FEATURE_NAMES
+    )
+    frame["MedInc"] = offset + np.arange(n_entities)
+    frame["entity_id"] = np.arange(n_entities)
+    frame["event_timestamp"] = pd.Timestamp(day)
+    return frame
+
+
+class TestFeatureStore:
+    """오프라인/온라인 피처 저장소 테스트"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        transform = FeatureTransform(CaliforniaHousingModel.FEATURE_NAMES).ratio(
+            "rooms_per_household", "AveRooms", "AveOccup"
+        )
+        store = FeatureStore(str(tmp_path))
+        store.materialize(gold_snapshot("2024-01-01", 0.0), transform=transform)
+        store.materialize(gold_snapshot("2024-01-03", 100.0), transform=transform)
+        return store
+
+    def test_point_in_time_join(self, store):
+        """이벤트 시각 이전의 최신 피처만 조인되는지 테스트"""
+        events = pd.DataFrame({
+            "entity_id": [1, 1, 2, 7],
+            "event_timestamp": pd.to_datetime(
+                ["2024-01-02", "2024-01-03", "2023-12-31", "2024-01-05"]
+            ),
+            "label": [0.1, 0.2, 0.3, 0.4],
+        })
+        joined = store.get_historical_features(events)
+
+        assert joined["label"].tolist() == [0.1, 0.2, 0.3, 0.4]
+        assert joined["MedInc"].iloc[0] == 1.0      # 01-03 피처는 미래 값이므로 제외
+        assert joined["MedInc"].iloc[1] == 101.0    # 같은 시각 피처는 사용
+        assert joined["MedInc"].iloc[2:].isna().all()
+        assert "rooms_per_household" in joined
+
+        stale = store.get_historical_features(events.iloc[:1], ttl=pd.Timedelta(hours=12))
+        assert stale["MedInc"].isna().all()
+
+    def test_online_lookup(self, store):
+        """엔티티별 최신 피처 조회 및 LRU 캐시 테스트"""
+        lookup = store.online(cache_size=2)
+        X, found = lookup.get_many([3, 42, 3], features=["MedInc", "HouseAge"])
+
+        assert found.tolist() == [True, False, True]
+        assert X[0, 0] == 103.0
+        assert np.isnan(X[1]).all()
+        assert lookup.get_stats()["hits"] == 1
+
+        for entity_id in range(4):
+            lookup.get(entity_id)
+        assert lookup.get_stats()["cache_entries"] == 2
+
+    def test_online_refresh(self, store):
+        """새 버전 기록 후 조회기 갱신 테스트"""
+        lookup = store.online()
+        assert lookup.get(0)[0] == 100.0
+
+        store.materialize(
+            gold_snapshot("2024-01-04", 200.0, n_entities=1),
+            transform=FeatureTransform(CaliforniaHousingModel.FEATURE_NAMES).ratio(
+                "rooms_per_household", "AveRooms", "AveOccup"
+            )
+        )
+        assert lookup.refresh()
+        assert lookup.get(0)[0] == 200.0
+        assert lookup.get(1)[0] == 101.0
+
+    def test_rejects_scale_steps(self, tmp_path):
+        """모델별 정규화 단계 저장 거부 테스트"""
+        transform = FeatureTransform(CaliforniaHousingModel.FEATURE_NAMES).standard_scale()
+        with pytest.raises(ValueError, match="Scale steps"):
+            FeatureStore(str(tmp_path)).materialize(gold_snapshot("2024-01-01", 0.0), transform)
+
+
+class TestIncrementalRetrain:
+    """warm_start 증분 재학습 테스트"""
+
+    def _train(self, model_type, synthetic_data, **params):
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type=model_type,
+            model_params={"n_estimators": 10, "max_depth": 3, "random_state": 42, **params}
+        )
+        model.train(X[:400], y[:400], data_tag="base")
+        return model
+
+    def test_forest_adds_and_retires_trees(self, synthetic_data):
+        """포레스트 트리 추가 및 오래된 트리 제거 테스트"""
+        X, y = synthetic_data
+        model = self._train("random_forest", synthetic_data)
+        newest_base_tree = model.model.estimators_[-1]
+
+        metrics = model.partial_retrain(X[400:], y[400:], data_tag="recent")
+
+        # 새 데이터 100행 / 기존 400행 -> 트리 round(10 x 0.25) = 2개 추가, 2개 제거
+        assert metrics["n_new_estimators"] == 2
+        assert metrics["n_retired_estimators"] == 2
+        assert metrics["n_estimators"] == 10
+        assert model.model.estimators_[-3] is newest_base_tree
+
+        base, recent = model.provenance
+        assert base["data_tag"] == "base" and recent["data_tag"] == "recent"
+        assert base["estimators"] == [0, 8]
+        assert recent["estimators"] == [8, 10]
+        assert recent["n_samples"] == 100
+        assert model.predict(X[:5]).shape == (5,)
+
+    def test_forest_fully_replaced(self, synthetic_data):
+        """모든 트리가 교체되면 기존 배치 기록 제거 테스트"""
+        X, y = synthetic_data
+        model = self._train("random_forest", synthetic_data)
+
+        model.partial_retrain(X[400:], y[400:], n_new_estimators=10, data_tag="recent")
+
+        assert [r["data_tag"] for r in model.provenance] == ["recent"]
+        assert model.provenance[0]["estimators"] == [0, 10]
+
+    def test_boosting_continues_stages(self, synthetic_data, tmp_path):
+        """부스팅 단계 이어서 학습 및 provenance 저장 테스트"""
+        X, y = synthetic_data
+        model = self._train("gradient_boosting", synthetic_data)
+        first_stage = model.model.estimators_[0, 0]
+
+        model.partial_retrain(X[400:], y[400:], n_new_estimators=5)
+
+        assert model.model.estimators_.shape[0] == 15
+        assert model.model.estimators_[0, 0] is first_stage
+        assert model.provenance[-1]["estimators"] == [10, 15]
+
+        path = str(tmp_path / "model.joblib")
+        model.save(path)
+        loaded = CaliforniaHousingModel.load(path)
+        assert loaded.provenance == model.provenance
+        assert loaded.model_params["n_estimators"] == 15
+
+    def test_linear_regression_not_supported(self, synthetic_data):
+        """선형 모델 증분 재학습 미지원 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+        model.train(X, y)
+
+        with pytest.raises(ValueError, match="not supported"):
+            model.partial_retrain(X, y)
+
+
+class TestHistGradientBoosting:
+    """uint8 bin 코드 기반 히스토그램 부스팅 테스트"""
+
+    def test_binner_matches_sklearn_binning(self, synthetic_data):
+        """사전 bin 코드로 학습한 모델이 원본 학습 결과와 같은지 테스트"""
+        from sklearn.ensemble import HistGradientBoostingRegressor
+
+        X, y = synthetic_data
+        params = {"max_iter": 20, "random_state": 42}
+        model = CaliforniaHousingModel(model_type="hist_gradient_boosting", model_params=params)
+        model.train(X[:400], y[:400])
+
+        reference = HistGradientBoostingRegressor(**params).fit(X[:400], y[:400])
+
+        assert model.binner.transform(X).dtype == np.uint8
+        np.testing.assert_allclose(model.predict(X[400:]), reference.predict(X[400:]))
+
+    def test_cached_binned_features(self, synthetic_data, tmp_path):
+        """데이터셋 캐시의 uint8 bin 코드 재사용 테스트"""
+        X, y = synthetic_data
+        dataset = cached_dataset(
+            "synthetic", lambda: (X, y, [f"f{i}" for i in range(8)]), cache_dir=str(tmp_path)
+        )
+
+        binner, train_codes, test_codes = cached_binned_features(dataset, max_bins=64)
+        _, cached_train_codes, _ = cached_binned_features(dataset, max_bins=64)
+
+        assert isinstance(cached_train_codes, np.memmap)
+        assert not [name for name in os.listdir(dataset.path) if name.endswith(".tmp")]
+        assert train_codes.shape == (400, 8) and test_codes.shape == (100, 8)
+        assert train_codes.max() < 64
+        np.testing.assert_array_equal(cached_train_codes, binner.transform(dataset.X_train))
+
+        model = CaliforniaHousingModel(
+            model_type="hist_gradient_boosting", model_params={"max_iter": 10}
+        )
+        model.binner = binner
+        model.train(dataset.X_train, dataset.y_train, X_train_binned=train_codes)
+        assert model.evaluate(dataset.X_test, dataset.y_test)["r2"] > 0.5
+
+    def test_cached_binned_features_interrupted(self, synthetic_data, tmp_path, monkeypatch):
+        """코드 파일 기록 중 중단되면 다음 호출에서 다시 계산되는지 테스트"""
+        X, y = synthetic_data
+        dataset = cached_dataset(
+            "synthetic", lambda: (X, y, [f"f{i}" for i in range(8)]), cache_dir=str(tmp_path)
+        )
+        open_memmap = np.lib.format.open_memmap
+
+        def crash(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(np.lib.format, "open_memmap", crash)
+        with pytest.raises(OSError):
+            cached_binned_features(dataset, max_bins=64)
+        monkeypatch.setattr(np.lib.format, "open_memmap", open_memmap)
+
+        assert not os.path.exists(os.path.join(dataset.path, "X_binned_64.npy"))
+        binner, train_codes, _ = cached_binned_features(dataset, max_bins=64)
+        np.testing.assert_array_equal(train_codes, binner.transform(dataset.X_train))
+
+    def test_save_and_load_binner(self, synthetic_data, tmp_path):
+        """binner 저장/로드 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type="hist_gradient_boosting", model_params={"max_iter": 10}
+        )
+        model.train(X, y)
+        path = str(tmp_path / "hgb.joblib")
+        model.save(path)
+
+        loaded = CaliforniaHousingModel.load(path)
+
+        np.testing.assert_array_equal(loaded.predict(X[:10]), model.predict(X[:10]))
+
+
+class TestStreamingTraining:
+    """Parquet 스트리밍 partial_fit 학습 테스트"""
+
+    @pytest.fixture
+    def parquet_dir(self, synthetic_data, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        X, y = synthetic_data
+        for i, start in enumerate(range(0, 500, 200)):
+            columns = {
+                name: X[start:start + 200, j]
+                for j, name in enumerate(CaliforniaHousingModel.FEATURE_NAMES)
+            }
+            columns["target"] = y[start:start + 200]
+            pq.write_table(pa.table(columns), str(tmp_path / f"part-{i}.parquet"))
+        return str(tmp_path)
+
+    def test_iter_batches_holdout(self, parquet_dir):
+        """배치 읽기 및 평가 행 분리 테스트"""
+        names = CaliforniaHousingModel.FEATURE_NAMES
+        train_rows = sum(len(y) for _, y in iter_parquet_batches(
+            parquet_dir, names, batch_size=64, holdout_every=5
+        ))
+        holdout_rows = sum(len(y) for _, y in iter_parquet_batches(
+            parquet_dir, names, batch_size=64, holdout_every=5, holdout=True
+        ))
+
+        assert (train_rows, holdout_rows) == (400, 100)
+
+    def test_train_streaming(self, parquet_dir, synthetic_data):
+        """partial_fit 스트리밍 학습 및 평가 테스트"""
+        X, y = synthetic_data
+        model, metrics = train_model(model_type="sgd_regressor", data_path=parquet_dir)
+
+        assert metrics["n_train_rows"] == 400
+        assert metrics["r2"] > 0.9
+        assert model.feature_transform is not None
+
+        # 스트리밍 평가는 같은 행에 대한 evaluate()와 일치
+        holdout = np.arange(500) % 5 == 0
+        in_memory = model.evaluate(X[holdout], y[holdout])
+        for key in ("mae", "mse", "r2"):
+            assert metrics[key] == pytest.approx(in_memory[key])
+
+    def test_streaming_defaults_to_sgd(self, parquet_dir):
+        """data_path만 주면 sgd_regressor로 학습하고 provenance 기록 테스트"""
+        model, _ = train_model(data_path=parquet_dir)
+
+        assert model.model_type == "sgd_regressor"
+        record, = model.provenance
+        assert record["mode"] == "streaming"
+        assert record["n_samples"] == 400
+        assert record["trained_at"] is not None
+
+        with pytest.raises(ValueError, match="requires sgd_regressor"):
+            train_model(model_type="random_forest", data_path=parquet_dir)
@@ -13,6 +13,7 @@ from src.monitoring.drift import (
     ModelMonitor,
     calculate_drift_score
 )
+from src.monitoring.prediction_log import PredictionLogger, read_prediction_log
 
 
 class TestDriftDetector:
@@ -282,3 +283,73 @@ class TestCalculateDriftScore:
         score = calculate_drift_score(reference, current)
 
         assert score > 0.5  # 대부분의 특성에서 드리프트 발생해야 함
+
+
+class TestPredictionLogger:
+    """PredictionLogger 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def require_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_log_and_read(self, tmp_path):
+        """예측 기록 후 읽기 테스트"""
+        prediction_logger = PredictionLogger(
+            str(tmp_path), feature_names=["a", "b"], flush_interval_s=60
+        )
+        inputs = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+        prediction_logger.log(inputs, np.array([0.5, 0.6]), "v1")
+        prediction_logger.log(inputs[:1], np.array([0.7]), "v2")
+        prediction_logger.close()
+
+        X, predictions, names = read_prediction_log(str(tmp_path))
+
+        assert names == ["a", "b"]
+        np.testing.assert_array_equal(X, [[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]])
+        np.testing.assert_array_equal(predictions, [0.5, 0.6, 0.7])
+
+        X_v2, _, _ = read_prediction_log(str(tmp_path), model_version="v2")
+        assert len(X_v2) == 1
+
+    def test_input_buffer_is_copied(self, tmp_path):
+        """호출자가 입력 버퍼를 재사용해도 기록 값이 유지되는지 테스트"""
+        prediction_logger = PredictionLogger(str(tmp_path), flush_interval_s=60)
+        inputs = np.ones((3, 2))
+
+        prediction_logger.log(inputs, np.zeros(3), "v1")
+        inputs[:] = -1
+        prediction_logger.close()
+
+        X, _, _ = read_prediction_log(str(tmp_path))
+        assert (X == 1).all()
+
+    def test_drop_when_buffer_full(self, tmp_path):
+        """버퍼가 가득 차면 버리고 계속 진행하는지 테스트"""
+        prediction_logger = PredictionLogger(
+            str(tmp_path), flush_interval_s=60, max_buffer_rows=5
+        )
+
+        assert prediction_logger.log(np.ones((4, 2)), np.zeros(4), "v1") is True
+        assert prediction_logger.log(np.ones((4, 2)), np.zeros(4), "v1") is False
+        prediction_logger.close()
+
+        stats = prediction_logger.get_stats()
+        assert stats["dropped_rows"] == 4
+        assert stats["written_rows"] == 4
+
+    def test_rotation_by_size(self, tmp_path):
+        """파일 크기 기준 교체 테스트"""
+        prediction_logger = PredictionLogger(
+            str(tmp_path), flush_interval_s=60, max_file_bytes=1
+        )
+
+        for _ in range(3):
+            prediction_logger.log(np.ones((10, 2)), np.zeros(10), "v1")
+            prediction_logger.flush()
+        prediction_logger.close()
+
+        assert prediction_logger.get_stats()["files_written"] == 3
+        assert not list(tmp_path.glob("*.inprogress"))
+        X, _, _ = read_prediction_log(str(tmp_path))
+        assert len(X) == 30
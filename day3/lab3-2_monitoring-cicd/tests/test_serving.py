@@ -2,6 +2,10 @@
 Test cases for serving API module
 """
 
+import os
+import json
+import asyncio
+
 import pytest
 import numpy as np
 
@@ -12,6 +16,34 @@ from src.serving.api import (
     HealthResponse,
     validate_input
 )
+from src.serving.admission import AdmissionController, OverloadedError
+from src.serving.prefork import memory_usage
+from src.serving.profiler import (
+    ProfilerBusyError,
+    SamplingProfiler,
+    to_collapsed,
+    to_speedscope
+)
+from src.serving.autotune import (
+    Measurement,
+    ServingConfig,
+    best_config,
+    build_backend,
+    config_grid,
+    measure,
+    write_results
+)
+from src.serving.threads import (
+    apply_thread_budget,
+    plan_thread_budget,
+    set_estimator_n_jobs
+)
+from src.serving.stream import (
+    StreamFormatError,
+    iter_lines,
+    resolve_format,
+    stream_predictions
+)
 from src.model.trainer import CaliforniaHousingModel
 
 
@@ -170,3 +202,944 @@ class TestPredictionResponse:
         assert response.model_version == "v1.0"
         assert response.latency_ms == 10.5
         assert response.timestamp is not None
+
+
+async def _chunks(payload: bytes, size: int):
+    """요청 본문을 임의 크기 청크로 분할"""
+    for i in range(0, len(payload), size):
+        yield payload[i:i + size]
+
+
+def _collect(agen) -> list:
+    """비동기 제너레이터 결과를 NDJSON 객체 리스트로 수집"""
+    async def run():
+        return [json.loads(line) async for line in agen]
+    return asyncio.run(run())
+
+
+class TestStreamPredictions:
+    """스트리밍 예측 테스트"""
+
+    def test_resolve_format(self):
+        """Content-Type 해석 테스트"""
+        assert resolve_format("application/x-ndjson") == "ndjson"
+        assert resolve_format("text/csv; charset=utf-8") == "csv"
+        assert resolve_format("application/json") is None
+        assert resolve_format(None) is None
+
+    def test_iter_lines_across_chunks(self):
+        """청크 경계를 넘는 줄 분리 테스트"""
+        async def run():
+            return [line async for line in iter_lines(_chunks(b"ab\r\ncd\nef", 3))]
+
+        assert asyncio.run(run()) == [b"ab", b"cd", b"ef"]
+
+    def test_iter_lines_too_long(self):
+        """최대 줄 길이 초과 테스트"""
+        async def run():
+            return [line async for line in iter_lines(_chunks(b"x" * 100, 10), 50)]
+
+        with pytest.raises(StreamFormatError):
+            asyncio.run(run())
+
+    def test_ndjson_chunks(self, fitted_model, synthetic_data):
+        """NDJSON 입력의 청크 단위 예측 테스트"""
+        X, _ = synthetic_data
+        server = ModelServer(model=fitted_model)
+        payload = "".join(json.dumps(row) + "\n" for row in X[:25].tolist()).encode()
+
+        lines = _collect(stream_predictions(
+            _chunks(payload, 97), server.predict_array, fmt="ndjson", chunk_size=10
+        ))
+
+        assert [line["offset"] for line in lines] == [0, 10, 20]
+        predictions = [p for line in lines for p in line["predictions"]]
+        np.testing.assert_array_almost_equal(predictions, fitted_model.predict(X[:25]))
+        assert server.request_count == 3
+
+    def test_csv_with_header(self, fitted_model, synthetic_data):
+        """헤더가 있는 CSV 입력 테스트"""
+        X, _ = synthetic_data
+        header = ",".join(CaliforniaHousingModel.FEATURE_NAMES)
+        rows = "\n".join(",".join(str(v) for v in row) for row in X[:5].tolist())
+        payload = f"{header}\n{rows}\n".encode()
+        server = ModelServer(model=fitted_model)
+
+        lines = _collect(stream_predictions(
+            _chunks(payload, 64), server.predict_array, fmt="csv"
+        ))
+
+        assert len(lines) == 1
+        np.testing.assert_array_almost_equal(
+            lines[0]["predictions"], fitted_model.predict(X[:5])
+        )
+
+    def test_invalid_row_emits_error(self, fitted_model):
+        """잘못된 행에서 오류 줄로 종료 테스트"""
+        server = ModelServer(model=fitted_model)
+        payload = b"[1, 2, 3, 4, 5, 6, 7, 8]\n[1, 2, 3]\n"
+
+        lines = _collect(stream_predictions(
+            _chunks(payload, 8), server.predict_array, chunk_size=1
+        ))
+
+        assert len(lines[0]["predictions"]) == 1
+        assert lines[-1]["line"] == 2
+        assert lines[-1]["rows_scored"] == 1
+        assert "expected 8 features" in lines[-1]["error"]
+
+    def test_rejected_chunk_emits_error(self, fitted_model, synthetic_data):
+        """예측이 거부된 청크만 오류 줄로 대체하고 계속 처리 테스트"""
+        X, _ = synthetic_data
+        server = ModelServer(model=fitted_model)
+        rows = [",".join(str(x) for x in row) for row in X[:4].tolist()]
+        rows[2] = ",".join(["inf"] * 8)
+        payload = ("\n".join(rows) + "\n").encode()
+
+        lines = _collect(stream_predictions(
+            _chunks(payload, 16), server.predict_array, fmt="csv", chunk_size=2
+        ))
+
+        assert len(lines) == 2
+        assert lines[0]["offset"] == 0 and len(lines[0]["predictions"]) == 2
+        assert lines[1]["offset"] == 2 and lines[1]["rows"] == 2
+        assert "prediction failed" in lines[1]["error"]
+
+    def test_stream_admission_per_chunk(self, fitted_model, synthetic_data):
+        """청크마다 승인 제어를 거치고 과부하 시 재시도 위치를 담은 오류 줄로 종료 테스트"""
+        X, _ = synthetic_data
+        server = ModelServer(model=fitted_model)
+        admission = AdmissionController(initial_limit=1, max_limit=1, max_queue=0)
+        payload = "\n".join(json.dumps(row) for row in X[:6].tolist()).encode()
+
+        async def run():
+            agen = stream_predictions(
+                _chunks(payload, 64), server.predict_array, chunk_size=2, admission=admission
+            )
+            lines = [json.loads(await agen.__anext__())]
+            # 다른 요청이 유일한 슬롯을 차지
+            await admission.acquire()
+            lines += [json.loads(line) async for line in agen]
+            return lines
+
+        lines = asyncio.run(run())
+
+        assert len(lines) == 2
+        assert len(lines[0]["predictions"]) == 2
+        assert lines[1]["rows_scored"] == 2
+        assert lines[1]["retry_after"] >= 1
+        assert admission.admitted_count == 2
+        assert admission.shed_count == 1
+
+    def test_stream_client_disconnect(self, fitted_model, synthetic_data):
+        """업로드 중 연결 종료 시 남은 본문을 예측하지 않고 종료 테스트"""
+        pytest.importorskip("fastapi")
+        from src.serving.api import create_app
+
+        X, _ = synthetic_data
+        app = create_app(model=fitted_model)
+        messages = [
+            {"type": "http.request", "body": (json.dumps(X[0].tolist()) + "\n").encode(), "more_body": True},
+            {"type": "http.disconnect"},
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": "/predict/stream",
+            "raw_path": b"/predict/stream",
+            "query_string": b"chunk_size=10",
+            "root_path": "",
+            "headers": [(b"content-type", b"application/x-ndjson")],
+            "client": ("test", 1),
+            "server": ("test", 80),
+        }
+        asyncio.run(app(scope, receive, send))
+
+        bodies = [m for m in sent if m["type"] == "http.response.body" and m.get("body")]
+        assert bodies == []
+
+    def test_stream_endpoint(self, fitted_model, synthetic_data):
+        """/predict/stream 엔드포인트 테스트"""
+        testclient = pytest.importorskip("fastapi.testclient")
+        from src.serving.api import create_app
+
+        X, _ = synthetic_data
+        client = testclient.TestClient(create_app(model=fitted_model))
+        payload = "\n".join(json.dumps(row) for row in X[:50].tolist())
+
+        response = client.post(
+            "/predict/stream?chunk_size=20",
+            content=payload,
+            headers={"content-type": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["offset"] for line in lines] == [0, 20, 40]
+
+        response = client.post("/predict/stream", content=payload)
+        assert response.status_code == 415
+
+
+class TestAdmissionController:
+    """AdmissionController 테스트"""
+
+    def test_admit_within_limit(self):
+        """한도 내 요청 승인 테스트"""
+        controller = AdmissionController(initial_limit=2)
+
+        async def run():
+            async with controller.admit():
+                assert controller.in_flight == 1
+
+        asyncio.run(run())
+
+        metrics = controller.get_metrics()
+        assert metrics["admitted_count"] == 1
+        assert metrics["in_flight"] == 0
+        assert metrics["shed_count"] == 0
+
+    def test_shed_when_queue_full(self):
+        """대기열이 가득 찬 경우 즉시 거부 테스트"""
+        controller = AdmissionController(initial_limit=1, max_queue=0)
+
+        async def run():
+            await controller.acquire()
+            with pytest.raises(OverloadedError) as exc_info:
+                await controller.acquire()
+            return exc_info.value
+
+        error = asyncio.run(run())
+
+        assert error.reason == "queue full"
+        assert error.retry_after >= 1
+        assert controller.shed_count == 1
+
+    def test_queue_timeout(self):
+        """대기 시간 초과 시 거부 테스트"""
+        controller = AdmissionController(initial_limit=1, queue_timeout_s=0.01)
+
+        async def run():
+            await controller.acquire()
+            with pytest.raises(OverloadedError):
+                await controller.acquire()
+
+        asyncio.run(run())
+
+        assert controller.timeout_count == 1
+        assert controller.queue_depth == 0
+
+    def test_waiter_gets_released_slot(self):
+        """슬롯 반환 시 대기 요청이 승인되는지 테스트"""
+        controller = AdmissionController(initial_limit=1, queue_timeout_s=1.0)
+
+        async def run():
+            await controller.acquire()
+            waiter = asyncio.ensure_future(controller.acquire())
+            await asyncio.sleep(0)
+            assert controller.queue_depth == 1
+            controller.release(latency_ms=1.0)
+            await waiter
+            assert controller.in_flight == 1
+
+        asyncio.run(run())
+
+        assert controller.admitted_count == 2
+
+    def test_aimd_limit_adjustment(self):
+        """지연시간에 따른 한도 증감 테스트"""
+        controller = AdmissionController(latency_slo_ms=50, initial_limit=10)
+
+        controller.in_flight = 1
+        controller.release(latency_ms=500.0)
+        assert controller.effective_limit == 9
+
+        for _ in range(50):
+            controller.in_flight = 1
+            controller.release(latency_ms=1.0)
+        assert controller.effective_limit > 9
+
+    def test_invalid_limits(self):
+        """잘못된 한도 설정 테스트"""
+        with pytest.raises(ValueError):
+            AdmissionController(initial_limit=100, max_limit=10)
+
+
+class TestThreadBudget:
+    """추론 스레드 예산 테스트"""
+
+    def test_plan_divides_cores(self):
+        """코어를 워커와 동시 요청 수로 나누는지 테스트"""
+        budget = plan_thread_budget(n_workers=2, n_cores=16, concurrency=2)
+
+        assert budget.joblib_n_jobs == 4
+        assert budget.blas_threads == 4
+        assert budget.onnx_intra_op_threads == 4
+
+    def test_plan_at_least_one_thread(self):
+        """코어보다 동시 요청이 많아도 최소 1개 스레드"""
+        budget = plan_thread_budget(n_workers=4, n_cores=2, concurrency=8)
+
+        assert budget.joblib_n_jobs == 1
+        assert budget.openmp_threads == 1
+
+    def test_apply_sets_model_n_jobs(self, synthetic_data, thread_budget_sandbox):
+        """모델 n_jobs 적용 테스트"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 5, "n_jobs": -1, "random_state": 42}
+        )
+        model.train(X, y)
+
+        budget = plan_thread_budget(n_workers=1, n_cores=4, concurrency=2)
+        report = apply_thread_budget(budget, model)
+
+        assert model.model.n_jobs == 2
+        assert report["estimators_updated"] == 1
+        assert report["joblib_n_jobs"] == 2
+
+    def test_set_n_jobs_without_attribute(self, synthetic_data):
+        """n_jobs가 없는 모델은 변경하지 않음"""
+        X, y = synthetic_data
+        model = CaliforniaHousingModel(
+            model_type="gradient_boosting",
+            model_params={"n_estimators": 5}
+        )
+        model.train(X, y)
+
+        assert set_estimator_n_jobs(model, 1) == 0
+
+
+class TestPrefork:
+    """pre-fork 서빙 유틸리티 테스트"""
+
+    def test_memory_usage(self):
+        """프로세스 메모리 사용량 조회 테스트"""
+        if not os.path.exists("/proc/self/smaps_rollup"):
+            pytest.skip("smaps_rollup not available")
+
+        usage = memory_usage()
+
+        assert usage["Rss"] > 0
+        assert 0 < usage["Pss"] <= usage["Rss"]
+
+    def test_prediction_logger_created_at_startup(self, fitted_model, synthetic_data):
+        """예측 로그 기록기를 앱 startup에서 생성하고 shutdown에서 닫는지 테스트"""
+        testclient = pytest.importorskip("fastapi.testclient")
+        from src.serving.api import create_app
+
+        class RecordingLogger:
+            def __init__(self):
+                self.rows = 0
+                self.closed = False
+
+            def log(self, inputs, outputs, model_version):
+                self.rows += len(outputs)
+
+            def close(self):
+                self.closed = True
+
+            def get_stats(self):
+                return {"logged_rows": self.rows}
+
+        created = []
+
+        def factory():
+            created.append(RecordingLogger())
+            return created[-1]
+
+        X, _ = synthetic_data
+        app = create_app(model=fitted_model, prediction_logger_factory=factory)
+        assert created == []
+
+        with testclient.TestClient(app) as client:
+            response = client.post("/predict", json={"instances": X[:3].tolist()})
+            assert response.status_code == 200
+            assert client.get("/metrics").json()["prediction_log"]["logged_rows"] == 3
+
+        assert len(created) == 1 and created[0].closed
+
+    def test_prediction_logging_in_prefork_mode(self, fitted_model, tmp_path, monkeypatch):
+        """WEB_CONCURRENCY > 1에서도 PREDICTION_LOG_DIR이 워커별 기록기로 전달되는지 테스트"""
+        pytest.importorskip("pyarrow")
+        import src.serving.api as api_module
+        import src.serving.prefork as prefork_module
+        import src.serving.threads as threads_module
+        from src.main import main
+
+        model_path = str(tmp_path / "model.joblib")
+        fitted_model.save(model_path)
+        calls = {}
+
+        def fake_create_app(**kwargs):
+            calls["create_app"] = kwargs
+            return object()
+
+        monkeypatch.setenv("MODEL_PATH", model_path)
+        monkeypatch.setenv("WEB_CONCURRENCY", "2")
+        monkeypatch.setenv("PREDICTION_LOG_DIR", str(tmp_path / "logs"))
+        monkeypatch.setattr(api_module, "create_app", fake_create_app)
+        monkeypatch.setattr(prefork_module, "serve_prefork", lambda app, n_workers, **kwargs: None)
+        monkeypatch.setattr(threads_module, "apply_thread_budget", lambda budget, model=None: {})
+
+        main()
+
+        factory = calls["create_app"]["prediction_logger_factory"]
+        assert factory is not None
+        prediction_logger = factory()
+        try:
+            assert prediction_logger.directory == str(tmp_path / "logs")
+        finally:
+            prediction_logger.close()
+
+
+class TestGrpcServer:
+    """OIP V2 gRPC 서버 테스트"""
+
+    @pytest.fixture
+    def grpc_stub(self, fitted_model):
+        """임의 포트에서 실행되는 gRPC 서버와 클라이언트 stub"""
+        grpc = pytest.importorskip("grpc")
+        pytest.importorskip("grpc_tools")
+        from src.serving.grpc_server import create_grpc_server, load_protos
+
+        server = ModelServer(model=fitted_model, model_version="v2.0")
+        grpc_server = create_grpc_server(server, port=0)
+        grpc_server.start()
+
+        protos, services = load_protos()
+        channel = grpc.insecure_channel(f"localhost:{grpc_server.bound_port}")
+        yield services.GRPCInferenceServiceStub(channel), protos, server
+
+        channel.close()
+        grpc_server.stop(grace=None)
+
+    def _request(self, protos, X, raw=False):
+        tensor = protos.ModelInferRequest.InferInputTensor(
+            name="input-0", datatype="FP32", shape=list(X.shape)
+        )
+        request = protos.ModelInferRequest(model_name="california-housing", inputs=[tensor])
+        if raw:
+            request.raw_input_contents.append(X.astype("<f4").tobytes())
+        else:
+            request.inputs[0].contents.fp32_contents.extend(X.ravel().tolist())
+        return request
+
+    def test_model_infer_contents(self, grpc_stub, fitted_model, synthetic_data):
+        """타입별 contents 필드 추론 테스트"""
+        stub, protos, server = grpc_stub
+        X = synthetic_data[0][:4].astype(np.float32)
+
+        response = stub.ModelInfer(self._request(protos, X))
+
+        assert response.model_version == "v2.0"
+        np.testing.assert_array_almost_equal(
+            response.outputs[0].contents.fp64_contents, fitted_model.predict(X)
+        )
+        assert server.request_count == 1
+
+    def test_model_infer_raw(self, grpc_stub, fitted_model, synthetic_data):
+        """raw_input_contents 추론 테스트"""
+        stub, protos, _ = grpc_stub
+        X = synthetic_data[0][:3].astype(np.float32)
+
+        response = stub.ModelInfer(self._request(protos, X, raw=True))
+
+        predictions = np.frombuffer(response.raw_output_contents[0], dtype="<f8")
+        np.testing.assert_array_almost_equal(predictions, fitted_model.predict(X))
+
+    def test_model_infer_bad_shape(self, grpc_stub):
+        """잘못된 shape 요청 테스트"""
+        grpc = pytest.importorskip("grpc")
+        stub, protos, _ = grpc_stub
+        request = self._request(protos, np.ones((2, 8), dtype=np.float32))
+        request.inputs[0].shape[:] = [3, 8]
+
+        with pytest.raises(grpc.RpcError) as exc_info:
+            stub.ModelInfer(request)
+
+        assert exc_info.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+    def test_model_infer_wrong_feature_count(self, grpc_stub):
+        """특성 수가 다른 요청은 INTERNAL이 아닌 INVALID_ARGUMENT 테스트"""
+        grpc = pytest.importorskip("grpc")
+        stub, protos, server = grpc_stub
+
+        with pytest.raises(grpc.RpcError) as exc_info:
+            stub.ModelInfer(self._request(protos, np.ones((2, 5), dtype=np.float32)))
+
+        assert exc_info.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+        assert "Expected 8 features" in exc_info.value.details()
+        assert server.error_count == 0
+
+    def test_model_infer_admission(self, fitted_model, synthetic_data):
+        """gRPC 추론이 HTTP와 같은 승인 제어기를 거치는지 테스트"""
+        import threading
+
+        grpc = pytest.importorskip("grpc")
+        pytest.importorskip("grpc_tools")
+        from src.serving.grpc_server import create_grpc_server, load_protos
+
+        # 앱 이벤트 루프 역할
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        server = ModelServer(model=fitted_model)
+        admission = AdmissionController(initial_limit=1, max_limit=1, max_queue=0)
+        grpc_server = create_grpc_server(server, port=0, admission=admission, loop=loop)
+        grpc_server.start()
+        protos, services = load_protos()
+        channel = grpc.insecure_channel(f"localhost:{grpc_server.bound_port}")
+        stub = services.GRPCInferenceServiceStub(channel)
+        request = self._request(protos, synthetic_data[0][:2].astype(np.float32))
+
+        try:
+            stub.ModelInfer(request)
+            assert admission.admitted_count == 1
+
+            asyncio.run_coroutine_threadsafe(admission.acquire(), loop).result()
+            with pytest.raises(grpc.RpcError) as exc_info:
+                stub.ModelInfer(request)
+
+            assert exc_info.value.code() == grpc.StatusCode.UNAVAILABLE
+            assert ("retry-after", "1") in exc_info.value.trailing_metadata()
+            assert admission.shed_count == 1
+        finally:
+            channel.close()
+            grpc_server.stop(grace=None)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def test_stream_infer(self, grpc_stub, synthetic_data):
+        """양방향 스트리밍 추론 테스트"""
+        stub, protos, server = grpc_stub
+        X = synthetic_data[0][:6].astype(np.float32)
+        requests = [self._request(protos, X[i:i + 2], raw=True) for i in range(0, 6, 2)]
+        requests.append(protos.ModelInferRequest(model_name="unknown"))
+
+        responses = list(stub.ModelStreamInfer(iter(requests)))
+
+        assert len(responses) == 4
+        assert all(not r.error_message for r in responses[:3])
+        assert "Unknown model" in responses[3].error_message
+        assert server.request_count == 3
+
+    def test_server_created_at_startup(self, fitted_model):
+        """gRPC 서버가 앱 생성 시가 아니라 startup에서 생성되는지 테스트 (fork 안전)"""
+        pytest.importorskip("grpc")
+        pytest.importorskip("grpc_tools")
+        testclient = pytest.importorskip("fastapi.testclient")
+        from src.serving.api import create_app
+
+        app = create_app(model=fitted_model, grpc_port=0)
+
+        assert app.state.grpc_server is None
+        with testclient.TestClient(app):
+            assert app.state.grpc_server.bound_port > 0
+
+    def test_disabled_in_prefork_mode(self, fitted_model, tmp_path, monkeypatch):
+        """WEB_CONCURRENCY > 1이면 GRPC_PORT를 무시하는지 테스트"""
+        import src.serving.api as api_module
+        import src.serving.prefork as prefork_module
+        import src.serving.threads as threads_module
+        from src.main import main
+
+        model_path = str(tmp_path / "model.joblib")
+        fitted_model.save(model_path)
+        calls = {}
+
+        def fake_create_app(**kwargs):
+            calls["create_app"] = kwargs
+            return object()
+
+        def fake_serve_prefork(app, n_workers, **kwargs):
+            calls["n_workers"] = n_workers
+
+        monkeypatch.setenv("MODEL_PATH", model_path)
+        monkeypatch.setenv("WEB_CONCURRENCY", "2")
+        monkeypatch.setenv("GRPC_PORT", "9081")
+        monkeypatch.setattr(api_module, "create_app", fake_create_app)
+        monkeypatch.setattr(prefork_module, "serve_prefork", fake_serve_prefork)
+        monkeypatch.setattr(threads_module, "apply_thread_budget", lambda budget, model=None: {})
+
+        main()
+
+        assert calls["n_workers"] == 2
+        assert calls["create_app"]["grpc_port"] is None
+
+
+class TestSamplingProfiler:
+    """샘플링 프로파일러 테스트"""
+
+    @staticmethod
+    def _busy_worker(stop):
+        while not stop.is_set():
+            sum(i * i for i in range(1000))
+
+    def test_profile_captures_other_threads(self):
+        """다른 스레드 스택 수집 및 형식 변환 테스트"""
+        import threading
+
+        stop = threading.Event()
+        worker = threading.Thread(target=self._busy_worker, args=(stop,), name="busy")
+        worker.start()
+        try:
+            stacks, info = SamplingProfiler(interval_s=0.002).profile(0.2)
+        finally:
+            stop.set()
+            worker.join()
+
+        assert info["samples"] > 0
+        collapsed = to_collapsed(stacks)
+        assert any(
+            line.startswith("thread:busy;") and "_busy_worker" in line
+            for line in collapsed.splitlines()
+        )
+
+        speedscope = to_speedscope(stacks, info)
+        profile = speedscope["profiles"][0]
+        assert len(profile["samples"]) == len(profile["weights"]) == len(stacks)
+        assert max(max(s) for s in profile["samples"]) < len(speedscope["shared"]["frames"])
+
+    def test_profile_busy(self):
+        """동시 프로파일 거부 테스트"""
+        profiler = SamplingProfiler()
+        profiler._lock.acquire()
+        try:
+            with pytest.raises(ProfilerBusyError):
+                profiler.profile(0.01)
+        finally:
+            profiler._lock.release()
+
+    def test_profile_endpoint(self, fitted_model):
+        """/debug/profile 엔드포인트 접근 제어 테스트"""
+        testclient = pytest.importorskip("fastapi.testclient")
+        from src.serving.api import create_app
+
+        disabled = testclient.TestClient(create_app(model=fitted_model))
+        assert disabled.get("/debug/profile?seconds=0.1").status_code == 404
+
+        client = testclient.TestClient(create_app(model=fitted_model, profile_token="secret"))
+        assert client.get("/debug/profile?seconds=0.1").status_code == 403
+        non_ascii = {"x-profile-token": "s\xe9cret".encode("latin-1")}
+        assert client.get("/debug/profile?seconds=0.1", headers=non_ascii).status_code == 403
+
+        headers = {"x-profile-token": "secret"}
+        assert client.get("/debug/profile?seconds=120", headers=headers).status_code == 400
+
+        response = client.get("/debug/profile?seconds=0.1", headers=headers)
+        assert response.status_code == 200
+        assert response.text.startswith("thread:")
+
+        response = client.get(
+            "/debug/profile?seconds=0.1&format=speedscope", headers=headers
+        )
+        assert response.json()["profiles"][0]["type"] == "sampled"
+
+    def test_stage_latency_metrics(self, fitted_model, synthetic_data):
+        """predict() 단계별 지연시간 메트릭 테스트"""
+        server = ModelServer(model=fitted_model)
+        server.predict(synthetic_data[0][:5].tolist())
+
+        stages = server.get_metrics()["stage_latency_ms"]
+
+        assert set(stages) == {"convert", "model", "response"}
+        assert stages["model"] > 0
+
+
+class TestFeatureLookup:
+    """온라인 피처 조회 서빙 테스트"""
+
+    @staticmethod
+    def _store(path, X, entity_ids=(10, 11, 12), day="2024-01-01"):
+        import pandas as pd
+        from src.model.feature_store import FeatureStore
+
+        gold = pd.DataFrame(X, columns=CaliforniaHousingModel.FEATURE_NAMES)
+        gold["entity_id"] = list(entity_ids)
+        gold["event_timestamp"] = pd.Timestamp(day)
+        store = FeatureStore(path)
+        store.materialize(gold, input_names=CaliforniaHousingModel.FEATURE_NAMES)
+        return store
+
+    def test_predict_entities_endpoint(self, fitted_model, synthetic_data, tmp_path):
+        """/predict/entities 온라인 피처 조회 예측 테스트"""
+        testclient = pytest.importorskip("fastapi.testclient")
+        from src.serving.api import create_app
+
+        X = synthetic_data[0][:3]
+        store = self._store(str(tmp_path), X)
+
+        client = testclient.TestClient(
+            create_app(model=fitted_model, feature_lookup=store.online())
+        )
+        response = client.post("/predict/entities", json={"entity_ids": [12, 99, 10]})
+
+        assert response.status_code == 200
+        body = response.json()
+        expected = fitted_model.predict(X)
+        assert body["predictions"][0] == pytest.approx(expected[2])
+        assert body["predictions"][1] is None
+        assert body["predictions"][2] == pytest.approx(expected[0])
+        assert body["missing_entities"] == [99]
+        assert client.get("/metrics").json()["feature_store"]["n_entities"] == 3
+
+    def test_refresh_on_new_version(self, fitted_model, synthetic_data, tmp_path):
+        """다시 materialize된 피처를 refresh 간격 후 반영하는지 테스트"""
+        X = synthetic_data[0][:3]
+        store = self._store(str(tmp_path), X)
+        lookup = store.online(refresh_interval_s=0.0)
+        server = ModelServer(model=fitted_model, feature_lookup=lookup)
+        before = server.predict_entities([10]).predictions[0]
+
+        self._store(str(tmp_path), X[::-1], day="2024-01-02")
+        after = server.predict_entities([10]).predictions[0]
+
+        assert before == pytest.approx(fitted_model.predict(X[:1])[0])
+        assert after == pytest.approx(fitted_model.predict(X[2:3])[0])
+        assert lookup.version == store.online().version
+
+    def test_missing_model_features_rejected(self, fitted_model, synthetic_data, tmp_path):
+        """모델 입력 피처가 없는 저장소는 시작 시 거부하는지 테스트"""
+        from src.model.feature_store import OnlineFeatureLookup
+
+        store = self._store(str(tmp_path), synthetic_data[0][:3])
+        lookup = OnlineFeatureLookup(store.online_path, store.feature_names[:-1])
+
+        with pytest.raises(ValueError, match="missing model features"):
+            ModelServer(model=fitted_model, feature_lookup=lookup)
+
+
+class TestAutotune:
+    """서빙 설정 오토튜너 테스트"""
+
+    def test_config_grid(self):
+        """설정 조합 생성 테스트"""
+        configs = config_grid(batch_sizes=(1, 8), threads=(1, 2, 4), admission_limits=(4,))
+
+        assert len(configs) == 6
+        assert configs[0] == ServingConfig(batch_size=1, threads=1, admission_limit=4)
+
+    def test_measure(self, synthetic_data, thread_budget_sandbox):
+        """프로세스 내 앱 측정 테스트"""
+        X, y = synthetic_data
+        # measure()는 모델 n_jobs를 바꾸므로 공유 fixture 대신 로컬 모델 사용
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 10, "max_depth": 5, "random_state": 42}
+        )
+        model.train(X, y)
+        config = ServingConfig(batch_size=4, threads=1, admission_limit=2)
+
+        result = measure(model, config, X, concurrency=2, n_requests=10)
+
+        assert result.requests == 10
+        assert result.rows == 40
+        assert result.rejected == 0 and result.errors == 0
+        assert 0 < result.p50_ms <= result.p99_ms
+
+    def test_best_config_respects_p99_target(self, tmp_path):
+        """p99 목표 내 최대 처리량 설정 선택 테스트"""
+        def result(threads, requests, p99_ms, rejected=0, batch_size=8):
+            return Measurement(
+                config=ServingConfig(batch_size=batch_size, threads=threads), concurrency=4,
+                requests=requests, rows=requests * batch_size, elapsed_s=1.0,
+                p50_ms=p99_ms / 2, p99_ms=p99_ms, rejected=rejected
+            )
+
+        results = [result(1, 100, 5.0), result(2, 150, 20.0), result(4, 400, 80.0),
+                   result(8, 300, 10.0, rejected=3)]
+
+        best = best_config(results, p99_target_ms=50.0)
+        paths = write_results(results, best, 50.0, str(tmp_path))
+
+        assert best.config.threads == 2
+        with open(paths["config"]) as f:
+            config = json.load(f)
+        assert config["env"]["INFERENCE_THREADS"] == "2"
+        assert config["workload"]["batch_size"] == 8
+        assert "batch_size" not in config
+        with open(paths["table"]) as f:
+            assert len(f.readlines()) == 5
+        assert best_config(results, p99_target_ms=1.0) is None
+
+    def test_best_config_compares_same_workload(self):
+        """요청 배치 크기가 다른 측정끼리는 비교하지 않음 테스트"""
+        def result(batch_size, threads, requests):
+            return Measurement(
+                config=ServingConfig(batch_size=batch_size, threads=threads), concurrency=4,
+                requests=requests, rows=requests * batch_size, elapsed_s=1.0,
+                p50_ms=1.0, p99_ms=2.0
+            )
+
+        # batch 32는 rows/s가 가장 높지만 서버 설정으로 고를 수 없는 값
+        results = [result(1, 1, 500), result(1, 2, 800), result(32, 1, 100)]
+
+        with pytest.raises(ValueError, match="batch_size"):
+            best_config(results, p99_target_ms=50.0)
+        assert best_config(results, 50.0, batch_size=1).config.threads == 2
+        assert best_config(results, 50.0, batch_size=32).config.threads == 1
+
+
+class TestOnnxSession:
+    """튜닝된 onnxruntime 세션 테스트"""
+
+    @pytest.fixture
+    def model_path(self, fitted_model, synthetic_data, tmp_path):
+        pytest.importorskip("onnxruntime")
+        pytest.importorskip("onnx")
+        X, _ = synthetic_data
+        path = str(tmp_path / "model.joblib")
+        fitted_model.export_onnx(path, X[:100])
+        return path
+
+    def test_predict_matches_model(self, model_path, fitted_model, synthetic_data):
+        """sklearn 모델과 예측 일치 테스트"""
+        from src.serving.onnx_session import load_onnx_model
+
+        X, _ = synthetic_data
+        session = load_onnx_model(model_path)
+
+        np.testing.assert_allclose(session.predict(X), fitted_model.predict(X), atol=1e-4)
+        np.testing.assert_allclose(session.predict(X[0]), fitted_model.predict(X[:1]), atol=1e-4)
+        assert session.FEATURE_NAMES == CaliforniaHousingModel.FEATURE_NAMES
+
+    def test_optimized_graph_cached(self, model_path):
+        """최적화된 그래프 캐시 재사용 테스트"""
+        from src.model.onnx_export import onnx_paths
+        from src.serving.onnx_session import OnnxSession, optimized_cache_path
+
+        onnx_path, _ = onnx_paths(model_path)
+        first = OnnxSession(onnx_path)
+        second = OnnxSession(onnx_path)
+
+        assert os.path.exists(optimized_cache_path(onnx_path, "extended"))
+        assert not first.cache_hit and second.cache_hit
+
+    def test_export_graph_not_reoptimized(self, model_path):
+        """export_onnx()가 최적화한 그래프는 다시 최적화하거나 캐시하지 않는지 테스트"""
+        from src.serving.onnx_session import load_onnx_model
+
+        session = load_onnx_model(model_path)
+
+        assert session.get_stats()["pre_optimized"] == "extended"
+        assert not any(".opt-" in name for name in os.listdir(os.path.dirname(model_path)))
+        assert load_onnx_model(model_path, optimization_level="all").pre_optimized == "extended"
+
+    def test_unwritable_cache_dir(self, model_path, synthetic_data, tmp_path, monkeypatch):
+        """캐시를 쓸 수 없는 (읽기 전용) 위치면 캐시 없이 로드하는지 테스트"""
+        import src.serving.onnx_session as onnx_session
+        from src.model.onnx_export import onnx_paths
+
+        X, _ = synthetic_data
+        onnx_path = onnx_paths(model_path)[0]
+        missing = str(tmp_path / "read-only" / "model.opt.onnx")
+        monkeypatch.setattr(onnx_session, "optimized_cache_path", lambda path, level: missing)
+
+        # 쓰기 권한 검사에서 걸리는 경우
+        expected = onnx_session.OnnxSession(onnx_path).predict(X[:5])
+        # 권한 검사는 통과했지만 onnxruntime이 캐시 쓰기에 실패하는 경우
+        monkeypatch.setattr(onnx_session.os, "access", lambda path, mode: True)
+        session = onnx_session.OnnxSession(onnx_path)
+
+        np.testing.assert_array_equal(session.predict(X[:5]), expected)
+        assert not session.cache_hit and not os.path.exists(missing)
+
+    def test_buffers_reused(self, model_path, synthetic_data):
+        """배치 크기 등급별 버퍼 재사용 및 큰 요청 분할 테스트"""
+        from src.model.onnx_export import onnx_paths
+        from src.serving.onnx_session import OnnxSession
+
+        X, _ = synthetic_data
+        session = OnnxSession(onnx_paths(model_path)[0], batch_classes=(1, 16, 128))
+        expected = session.predict(X)
+        out = np.empty(len(X))
+
+        for _ in range(3):
+            session.predict(X[:1])
+            session.predict(X[:10])
+            session.predict(X, out=out)
+
+        np.testing.assert_array_equal(out, expected)
+        assert session.get_stats()["bindings"] == {"1": 1, "16": 1, "128": 1}
+
+    def test_requires_parity_report(self, model_path):
+        """일치 보고서가 없거나 실패면 로드 거부 테스트"""
+        from src.model.onnx_export import onnx_paths
+        from src.serving.onnx_session import load_onnx_model
+
+        _, report_path = onnx_paths(model_path)
+        with open(report_path) as f:
+            report = json.load(f)
+        with open(report_path, "w") as f:
+            json.dump({**report, "passed": False}, f)
+
+        with pytest.raises(RuntimeError):
+            load_onnx_model(model_path)
+        os.remove(report_path)
+        with pytest.raises(RuntimeError):
+            load_onnx_model(model_path)
+        assert load_onnx_model(model_path, require_parity=False).predict(np.zeros((1, 8))).shape == (1,)
+
+    def test_autotune_onnx_backend(self, fitted_model, synthetic_data):
+        """오토튜너 onnx 백엔드 테스트"""
+        pytest.importorskip("onnxruntime")
+        X, _ = synthetic_data
+        config = ServingConfig(backend="onnx", batch_size=4, threads=1, admission_limit=2)
+
+        backend = build_backend(fitted_model, config, plan_thread_budget(n_cores=2, concurrency=2))
+
+        np.testing.assert_allclose(backend.predict(X[:8]), fitted_model.predict(X[:8]), atol=1e-4)
+        assert config.to_env()["MODEL_BACKEND"] == "onnx"
+
+
+class TestColdStart:
+    """서빙 콜드 스타트 import 예산 테스트"""
+
+    def test_serving_imports_within_budget(self):
+        """서빙 진입점 import가 예산 내이고 학습/분석 패키지를 읽지 않는지 테스트"""
+        from src.serving.coldstart import DEFAULT_BUDGET_MS, check_import_budget
+
+        budget_ms = float(os.environ.get("IMPORT_TIME_BUDGET_MS", DEFAULT_BUDGET_MS))
+        profile, violations = check_import_budget(budget_ms=budget_ms)
+
+        assert violations == [], profile.slowest()
+        assert "src.serving.api" in profile.modules
+
+    def test_budget_violations_reported(self):
+        """예산 초과와 금지 패키지 import 보고 테스트"""
+        from src.serving.coldstart import check_import_budget
+
+        profile, violations = check_import_budget(
+            budget_ms=0.001, modules=["src.monitoring.drift"], forbidden=["numpy"], repeat=1
+        )
+
+        assert profile.total_ms > 0
+        assert len(violations) == 2
+        assert "numpy" in violations[1]
+
+    def test_lazy_package_exports(self):
+        """패키지 재노출 이름의 지연 import 테스트"""
+        import src.model
+        import src.monitoring
+        import src.serving
+
+        assert src.model.FeatureBinner.__module__ == "src.model.binning"
+        assert src.monitoring.PredictionLogger.__module__ == "src.monitoring.prediction_log"
+        assert src.serving.ThreadBudget.__module__ == "src.serving.threads"
+        assert "CaliforniaHousingModel" in dir(src.model)
+        with pytest.raises(AttributeError):
+            src.serving.missing_name
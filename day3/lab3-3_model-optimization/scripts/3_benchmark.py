@@ -1,348 +1,360 @@
 #!/usr/bin/env python3
 """
 Lab 3-3: Benchmark & MLflow
-원본, ONNX, 양자화 모델의 성능 벤치마크 및 MLflow 기록
+원본, ONNX, 양자화 모델의 꼬리 지연시간 벤치마크 (선택: MLflow 기록)
 
-실행: 
-  export MLFLOW_TRACKING_URI=http://mlflow-server.kubeflow-user${USER_NUM}.svc.cluster.local:5000
+백엔드 x 스레드 수 x 배치 크기 조합마다 호출 단위 지연시간을 측정하여
+p50/p95/p99와 처리량을 기록합니다. 각 백엔드는 새 프로세스에서 측정하므로
+콜드 로드 시간 (런타임 import + 모델 로드)과 최대 메모리가 서로 섞이지 않습니다.
+sklearn과 onnxruntime 모두 load_backend() 안에서 처음 import되도록 이 스크립트는
+모듈 최상위에서 sklearn을 import하지 않습니다 (spawn된 자식이 다시 import하므로).
+네트워크 없이 실행되며 결과는 JSON으로 저장합니다.
+
+실행:
   python scripts/3_benchmark.py
+  python scripts/3_benchmark.py --batch-sizes 1 32 --threads 1 4 --requests 1000
+
+  # (선택) MLflow 기록
+  export MLFLOW_TRACKING_URI=http://mlflow-server.kubeflow-user${USER_NUM}.svc.cluster.local:5000
+  python scripts/3_benchmark.py --mlflow
 
-사전 요구: 
+사전 요구:
   - python scripts/1_onnx_conversion.py 실행 완료
-  - python scripts/2_quantization.py 실행 완료
-  - IRSA 설정 완료 (S3 접근용)
+  - python scripts/2_quantization.py 실행 완료 (없으면 quantized 백엔드 건너뜀)
 """
 
 import os
+import sys
+import json
 import time
-import boto3
 import pickle
+import argparse
+import platform
+import resource
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-from sklearn.datasets import load_iris
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score
-
-import onnxruntime as ort
-import mlflow
-from mlflow import MlflowClient
-
-def measure_inference_time(predict_fn, X, n_iterations=1000):
-    """추론 시간 측정 (밀리초 단위)"""
-    # 워밍업
-    for _ in range(10):
-        predict_fn(X)
-    
-    # 실제 측정
+
+# 백엔드 이름 -> 모델 파일
+BACKENDS = {
+    'sklearn': 'model_original.pkl',
+    'onnx': 'model_optimized.onnx',
+    'quantized': 'model_quantized.onnx',
+}
+
+
+def rss_mb():
+    """현재 RSS (MB, Linux /proc/self/statm)"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError):
+        return 0.0
+
+
+def peak_rss_mb():
+    """
+    프로세스 최대 RSS (MB)
+
+    Linux는 /proc/self/status의 VmHWM을 사용 (ru_maxrss는 exec 후에도 부모의
+    최댓값을 이어받아 spawn된 측정 프로세스에서 부풀려짐).
+    그 외에는 ru_maxrss (Linux는 kB, macOS는 bytes 단위)
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if platform.system() == 'Darwin' else peak / 1024
+
+
+def latency_summary(latencies_ms, batch_size):
+    """호출 단위 지연시간 (ms) 요약"""
+    latencies_ms = np.asarray(latencies_ms)
+    return {
+        'batch_size': batch_size,
+        'n_requests': len(latencies_ms),
+        'mean_ms': float(latencies_ms.mean()),
+        'p50_ms': float(np.percentile(latencies_ms, 50)),
+        'p95_ms': float(np.percentile(latencies_ms, 95)),
+        'p99_ms': float(np.percentile(latencies_ms, 99)),
+        'max_ms': float(latencies_ms.max()),
+        'rows_per_s': float(batch_size * len(latencies_ms) / (latencies_ms.sum() / 1000)),
+    }
+
+
+def measure_latency(predict_fn, X, batch_size, n_requests=500, n_warmup=20):
+    """
+    호출 단위 지연시간 측정
+
+    같은 배치를 반복하지 않도록 테스트 데이터에서 시작 위치를 바꿔가며
+    배치를 미리 만들어 두고 (측정 구간에서 복사하지 않음) 호출마다 시간을 잽니다.
+    """
+    offsets = np.arange(min(len(X), 16))
+    batches = [np.ascontiguousarray(X[(np.arange(batch_size) + i) % len(X)]) for i in offsets]
+
+    for i in range(n_warmup):
+        predict_fn(batches[i % len(batches)])
+
+    latencies = np.empty(n_requests)
+    for i in range(n_requests):
+        batch = batches[i % len(batches)]
+        start = time.perf_counter()
+        predict_fn(batch)
+        latencies[i] = (time.perf_counter() - start) * 1000
+    return latency_summary(latencies, batch_size)
+
+
+def load_backend(backend, path, n_threads):
+    """
+    백엔드 모델 로드 (런타임 import 포함)
+
+    Returns:
+        (predict_fn, 입력 dtype)
+    """
+    if backend == 'sklearn':
+        import sklearn  # noqa: F401  (onnxruntime과 같이 콜드 로드 시간에 포함)
+
+        with open(path, 'rb') as f:
+            model = pickle.load(f)
+        if hasattr(model, 'n_jobs'):
+            model.n_jobs = n_threads
+        return model.predict, np.float64
+
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = n_threads
+    options.inter_op_num_threads = 1
+    session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+    input_name = session.get_inputs()[0].name
+    output_name = session.get_outputs()[0].name
+
+    def predict(x):
+        return session.run([output_name], {input_name: x})[0]
+
+    return predict, np.float32
+
+
+def benchmark_backend(backend, path, X, y, batch_sizes, thread_counts, n_requests):
+    """
+    백엔드 하나의 전체 측정 (새 프로세스에서 실행)
+
+    Returns:
+        {"backend", "model_size_kb", "cold_start", "accuracy", "peak_rss_mb", "runs"}
+    """
+    rss_start = rss_mb()
+
+    # 콜드 로드: 런타임 import + 모델 로드 (첫 추론은 따로 측정)
+    start = time.perf_counter()
+    predict, dtype = load_backend(backend, path, thread_counts[0])
+    load_s = time.perf_counter() - start
+    rss_after_load_mb = rss_mb() - rss_start
+    X = np.ascontiguousarray(X, dtype=dtype)
     start = time.perf_counter()
-    for _ in range(n_iterations):
-        predict_fn(X)
-    end = time.perf_counter()
-    
-    return ((end - start) / n_iterations) * 1000  # ms로 변환
+    predict(X[:1])
+    first_predict_ms = (time.perf_counter() - start) * 1000
 
-def main():
+    cold_start = {
+        'load_s': load_s,
+        'first_predict_ms': first_predict_ms,
+        'rss_after_load_mb': rss_after_load_mb,
+    }
+    # ONNX 백엔드 프로세스에 sklearn을 읽지 않도록 NumPy로 계산
+    accuracy = float(np.mean(np.ravel(predict(X)) == y))
+
+    runs = []
+    for n_threads in thread_counts:
+        if n_threads != thread_counts[0]:
+            predict, _ = load_backend(backend, path, n_threads)
+        for batch_size in batch_sizes:
+            result = measure_latency(predict, X, batch_size, n_requests)
+            runs.append({'threads': n_threads, **result})
 
-    # ⚠️ 강사가 제공한 본인의 AWS 자격 증명으로 변경!
-    AWS_ACCESS_KEY_ID = "YOUR_AWS_ACCESS_KEY_ID"          # 수정 필요!
-    AWS_SECRET_ACCESS_KEY = "YOUR_AWS_SECRET_ACCESS_KEY"  # 수정 필요!
-    AWS_REGION = "ap-northeast-2"
+    return {
+        'backend': backend,
+        'model_path': path,
+        'model_size_kb': os.path.getsize(path) / 1024,
+        'cold_start': cold_start,
+        'accuracy': accuracy,
+        'peak_rss_mb': peak_rss_mb(),
+        'runs': runs,
+    }
+
+
+def run_backend(isolate, *args):
+    """백엔드를 새 프로세스 (spawn)에서 측정. isolate=False면 현재 프로세스에서 측정"""
+    if not isolate:
+        return benchmark_backend(*args)
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(benchmark_backend, *args).result()
 
-    # ⚠️ 본인의 사용자 번호로 변경!
-    USER_NUM = "YOUR_USER_NUM"
-    NAMESPACE = f"kubeflow-user{USER_NUM}"
 
-    # 환경 변수 설정
-    os.environ["AWS_ACCESS_KEY_ID"] = AWS_ACCESS_KEY_ID
-    os.environ["AWS_SECRET_ACCESS_KEY"] = AWS_SECRET_ACCESS_KEY
-    os.environ["AWS_DEFAULT_REGION"] = AWS_REGION
+def flat_metrics(results):
+    """MLflow용 평평한 메트릭 (예: onnx_t1_b32_p99_ms)"""
+    metrics = {}
+    for result in results:
+        backend = result['backend']
+        metrics[f'{backend}_size_kb'] = result['model_size_kb']
+        metrics[f'{backend}_accuracy'] = result['accuracy']
+        metrics[f'{backend}_peak_rss_mb'] = result['peak_rss_mb']
+        metrics[f'{backend}_load_s'] = result['cold_start']['load_s']
+        metrics[f'{backend}_first_predict_ms'] = result['cold_start']['first_predict_ms']
+        for run in result['runs']:
+            key = f"{backend}_t{run['threads']}_b{run['batch_size']}"
+            for stat in ('p50_ms', 'p95_ms', 'p99_ms', 'rows_per_s'):
+                metrics[f'{key}_{stat}'] = run[stat]
+    return metrics
 
-    print(f"✅ 사용자 설정 완료:")
+
+def log_to_mlflow(report, output_path, experiment_name):
+    """MLflow 기록 (선택). 실패해도 벤치마크 결과는 유지"""
+    try:
+        import mlflow
+    except ImportError:
+        print("   ⚠️ mlflow가 설치되지 않아 기록을 건너뜁니다.")
+        return False
+
+    try:
+        mlflow.set_experiment(experiment_name)
+        with mlflow.start_run(run_name='benchmark-results') as run:
+            mlflow.log_params(report['config'])
+            mlflow.log_metrics(flat_metrics(report['results']))
+            mlflow.log_artifact(output_path)
+        print(f"   ✅ MLflow 기록 완료 (Run ID: {run.info.run_id})")
+        return True
+    except Exception as e:
+        print(f"   ⚠️ MLflow 기록 실패: {e}")
+        return False
+
+
+def main():
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Lab 3-3 꼬리 지연시간 벤치마크')
+    parser.add_argument('--outputs-dir', default='outputs', help='모델 파일 디렉토리')
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument('--batch-sizes', nargs='+', type=int, default=[1, 8, 32, 128])
+    parser.add_argument('--threads', nargs='+', type=int, default=sorted({1, cpu_count}))
+    parser.add_argument('--requests', type=int, default=500, help='조합당 측정 호출 수')
+    parser.add_argument('--output', default='outputs/benchmark_results.json')
+    parser.add_argument('--no-isolate', action='store_true',
+                        help='현재 프로세스에서 측정 (sklearn이 이미 import되어 콜드 로드 비교 불가)')
+    parser.add_argument('--mlflow', action='store_true', help='MLflow에 결과 기록')
+    parser.add_argument('--experiment-name', default='lab3-3-model-optimization')
+    args = parser.parse_args()
 
     print("=" * 60)
-    print("Lab 3-3: Benchmark & MLflow 기록")
+    print("Lab 3-3: Benchmark")
     print("=" * 60)
-    
+
     # =========================================================================
     # Step 0: 사전 확인
     # =========================================================================
     print("\n🔍 Step 0: 사전 확인")
     print("-" * 40)
-    
-    # 파일 존재 확인
-    files = {
-        'original': 'outputs/model_original.pkl',
-        'onnx': 'outputs/model_optimized.onnx',
-        'quantized': 'outputs/model_quantized.onnx'
-    }
-    
-    for name, path in files.items():
+
+    backends = {}
+    for backend in args.backends:
+        path = os.path.join(args.outputs_dir, BACKENDS[backend])
         if not os.path.exists(path):
-            print(f"   ❌ 오류: {path} 파일이 없습니다.")
-            print("   먼저 1_onnx_conversion.py와 2_quantization.py를 실행하세요.")
-            return
-        print(f"   ✅ {name}: {path}")
-    
-    # AWS 자격 증명 확인 (IRSA)
-    print("\n   AWS 자격 증명 확인...")
-    try:
-        import boto3
-        sts = boto3.client('sts')
-        identity = sts.get_caller_identity()
-        print(f"   ✅ AWS Identity: {identity['Arn']}")
-    except Exception as e:
-        print(f"   ⚠️ AWS 자격 증명 경고: {e}")
-        print("   MLflow 아티팩트 저장이 실패할 수 있습니다.")
-        print("   IRSA 설정을 확인하세요.")
-    
-    # =========================================================================
-    # Step 1: 모델 및 데이터 로드
-    # =========================================================================
-    print("\n📂 Step 1: 모델 및 데이터 로드")
-    print("-" * 40)
-    
-    # 테스트 데이터 준비
+            print(f"   ⚠️ {backend}: {path} 파일이 없어 건너뜁니다.")
+            continue
+        if backend != 'sklearn':
+            try:
+                import onnxruntime  # noqa: F401
+            except ImportError:
+                print(f"   ⚠️ {backend}: onnxruntime이 설치되지 않아 건너뜁니다.")
+                continue
+        backends[backend] = path
+        print(f"   ✅ {backend}: {path}")
+
+    if not backends:
+        print("   ❌ 측정할 모델이 없습니다.")
+        print("   먼저 1_onnx_conversion.py와 2_quantization.py를 실행하세요.")
+        return 1
+
+    # 테스트 데이터 (Iris는 sklearn에 포함되어 네트워크 불필요)
+    from sklearn.datasets import load_iris
+    from sklearn.model_selection import train_test_split
+
     iris = load_iris()
-    X, y = iris.data, iris.target
-    _, X_test, _, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-    X_test_float32 = X_test.astype(np.float32)
-    
-    print(f"   테스트 샘플 수: {len(X_test)}")
-    
-    # 원본 sklearn 모델 로드
-    with open(files['original'], 'rb') as f:
-        sklearn_model = pickle.load(f)
-    
-    # ONNX 모델 로드
-    onnx_session = ort.InferenceSession(
-        files['onnx'], 
-        providers=['CPUExecutionProvider']
-    )
-    input_name = onnx_session.get_inputs()[0].name
-    
-    # 양자화 모델 로드
-    quant_session = ort.InferenceSession(
-        files['quantized'], 
-        providers=['CPUExecutionProvider']
+    _, X_test, _, y_test = train_test_split(
+        iris.data, iris.target, test_size=0.2, random_state=42
     )
-    
-    print("   ✅ 모든 모델 로드 완료")
-    
-    # =========================================================================
-    # Step 2: 모델 크기 비교
-    # =========================================================================
-    print("\n📏 Step 2: 모델 크기 비교")
-    print("-" * 40)
-    
-    original_size = os.path.getsize(files['original']) / 1024
-    onnx_size = os.path.getsize(files['onnx']) / 1024
-    quant_size = os.path.getsize(files['quantized']) / 1024
-    
-    print(f"   원본 sklearn: {original_size:.2f} KB")
-    print(f"   ONNX: {onnx_size:.2f} KB ({((onnx_size/original_size)-1)*100:+.1f}%)")
-    print(f"   양자화: {quant_size:.2f} KB ({((quant_size/original_size)-1)*100:+.1f}%)")
-    
-    # =========================================================================
-    # Step 3: 추론 속도 벤치마크
-    # =========================================================================
-    print("\n⚡ Step 3: 추론 속도 벤치마크")
-    print("-" * 40)
-    
-    n_iterations = 1000
-    print(f"   반복 횟수: {n_iterations}회")
-    
-    # 원본 sklearn 추론
-    print("\n   원본 sklearn 측정 중...")
-    original_time = measure_inference_time(
-        lambda x: sklearn_model.predict(x), 
-        X_test, 
-        n_iterations
-    )
-    
-    # ONNX 추론
-    print("   ONNX Runtime 측정 중...")
-    onnx_time = measure_inference_time(
-        lambda x: onnx_session.run(None, {input_name: x.astype(np.float32)}),
-        X_test,
-        n_iterations
-    )
-    
-    # 양자화 모델 추론
-    print("   양자화 모델 측정 중...")
-    quant_time = measure_inference_time(
-        lambda x: quant_session.run(None, {input_name: x.astype(np.float32)}),
-        X_test,
-        n_iterations
-    )
-    
-    # 속도 향상 계산
-    onnx_speedup = original_time / onnx_time
-    quant_speedup = original_time / quant_time
-    
-    print(f"\n   📊 벤치마크 결과:")
-    print(f"   {'모델':<15} {'추론 시간':<15} {'속도 향상':<10}")
-    print(f"   {'-' * 40}")
-    print(f"   {'원본 sklearn':<15} {original_time:.4f} ms{'':<6} 1.0x")
-    print(f"   {'ONNX':<15} {onnx_time:.4f} ms{'':<6} {onnx_speedup:.1f}x")
-    print(f"   {'양자화':<15} {quant_time:.4f} ms{'':<6} {quant_speedup:.1f}x")
-    
+
     # =========================================================================
-    # Step 4: 정확도 검증
+    # Step 1: 백엔드별 측정
     # =========================================================================
-    print("\n🎯 Step 4: 정확도 검증")
+    print("\n⚡ Step 1: 백엔드별 측정")
     print("-" * 40)
-    
-    # 예측
-    original_pred = sklearn_model.predict(X_test)
-    onnx_pred = onnx_session.run(None, {input_name: X_test_float32})[0]
-    quant_pred = quant_session.run(None, {input_name: X_test_float32})[0]
-    
-    # 정확도 계산
-    test_accuracy = accuracy_score(y_test, original_pred)
-    onnx_accuracy = accuracy_score(y_test, onnx_pred)
-    quant_accuracy = accuracy_score(y_test, quant_pred)
-    
-    print(f"   원본 sklearn 정확도: {test_accuracy:.4f}")
-    print(f"   ONNX 정확도: {onnx_accuracy:.4f}")
-    print(f"   양자화 정확도: {quant_accuracy:.4f}")
-    
+    print(f"   배치 크기: {args.batch_sizes}, 스레드: {args.threads}, 조합당 {args.requests}회")
+
+    results = []
+    for backend, path in backends.items():
+        print(f"\n   {backend} 측정 중...")
+        results.append(run_backend(
+            not args.no_isolate, backend, path, X_test, y_test,
+            args.batch_sizes, args.threads, args.requests
+        ))
+
     # =========================================================================
-    # Step 5: MLflow 기록
+    # Step 2: 결과
     # =========================================================================
-    print("\n📝 Step 5: MLflow 기록")
+    print("\n📊 Step 2: 결과")
     print("-" * 40)
-    
-    # MLflow 서버 URI 설정
-    mlflow_uri = os.environ.get(
-        'MLFLOW_TRACKING_URI',
-        'http://mlflow-server.kubeflow-user${USER_NUM}.svc.cluster.local:5000'
-    )
-    mlflow.set_tracking_uri(mlflow_uri)
-    print(f"   MLflow URI: {mlflow_uri}")
+    print(f"   {'백엔드':<11}{'크기 KB':>9}{'로드 s':>9}{'첫 추론 ms':>11}{'최대 MB':>9}{'정확도':>8}")
+    for r in results:
+        print(
+            f"   {r['backend']:<11}{r['model_size_kb']:>9.1f}{r['cold_start']['load_s']:>9.3f}"
+            f"{r['cold_start']['first_predict_ms']:>11.2f}{r['peak_rss_mb']:>9.1f}{r['accuracy']:>8.4f}"
+        )
 
+    print(f"\n   {'백엔드':<11}{'스레드':>6}{'배치':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'rows/s':>12}")
+    for r in results:
+        for run in r['runs']:
+            print(
+                f"   {r['backend']:<11}{run['threads']:>6}{run['batch_size']:>6}"
+                f"{run['p50_ms']:>10.3f}{run['p95_ms']:>10.3f}{run['p99_ms']:>10.3f}"
+                f"{run['rows_per_s']:>12.0f}"
+            )
+
+    report = {
+        'config': {
+            'batch_sizes': args.batch_sizes,
+            'threads': args.threads,
+            'n_requests': args.requests,
+            'test_samples': len(X_test),
+            'isolated': not args.no_isolate,
+        },
+        'environment': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'cpu_count': cpu_count,
+        },
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n   📁 {args.output}")
 
-    try:
-        s3_client = boto3.client('s3', region_name=AWS_REGION)
-
-        S3_BUCKET = f"mlops-training-user{USER_NUM}"
-
-        print(f"✅ USER_NUM: {USER_NUM}")
-        print(f"✅ NAMESPACE: {NAMESPACE}")
-        print(f"✅ AWS Region: {AWS_REGION}")
-        print(f"✅ S3 Bucket: {S3_BUCKET}")
-        
-        # S3 버킷 접근 테스트
-        s3_client.head_bucket(Bucket=S3_BUCKET)
-        
-        print("="*60)
-        print("  AWS Credentials 설정 완료!")
-        print("="*60)
-        print(f"✅ AWS Access Key: {AWS_ACCESS_KEY_ID[:4]}****")
-        print(f"✅ S3 접근 테스트: 성공!")
-        print("")
-        print("이제 3.2 실험을 실행할 수 있습니다!")
-        
-    except Exception as e:
-        print(f"❌ 오류: {e}")
-        print(f"")
-        print(f"해결 방법:")
-        print(f"1. AWS_ACCESS_KEY_ID와 AWS_SECRET_ACCESS_KEY를 정확히 입력하세요")
-        print(f"2. 강사가 제공한 자격 증명이 맞는지 확인하세요")
-        print(f"3. S3 버킷({S3_BUCKET})에 접근 권한이 있는지 확인하세요")
-
-    # MLflow 클라이언트 생성
-    client = MlflowClient()
-
-    # ✅ 사용자별 고유한 실험 이름 사용!
-    EXPERIMENT_NAME = f"lab3-3-model-optimization-user{USER_NUM}"
-
-    # 사용자별 S3 artifact location 설정
-    artifact_location = f"s3://{S3_BUCKET}/mlflow-artifacts"
-
-    # 실험이 이미 존재하는지 확인
-    experiment = client.get_experiment_by_name(EXPERIMENT_NAME)
-
-    if experiment is None:
-        # 실험이 없으면 생성
-        experiment_id = client.create_experiment(
-            name=EXPERIMENT_NAME,
-            artifact_location=artifact_location
-        )
-        print(f"\n✅ 새 실험 생성: {EXPERIMENT_NAME}")
-        experiment = client.get_experiment(experiment_id)
-    else:
-        print(f"\n✅ 기존 실험 사용: {EXPERIMENT_NAME}")
-        experiment_id = experiment.experiment_id
-
-    # MLflow에 실험 설정
-    mlflow.set_experiment(EXPERIMENT_NAME)
-
-    # 결과 출력
-    experiment = client.get_experiment(experiment_id)
-    print(f"\n📋 실험 정보:")
-    print(f"   Name: {experiment.name}")
-    print(f"   ID: {experiment.experiment_id}")
-    print(f"   Artifact Location: {experiment.artifact_location}")
-    print(f"   Lifecycle Stage: {experiment.lifecycle_stage}")
-
-    # 검증
-    if S3_BUCKET in experiment.artifact_location and experiment.lifecycle_stage == "active":
-        print(f"\n🎉 SUCCESS: 실험이 올바르게 설정되었습니다!")
-    else:
-        print(f"\n❌ ERROR: 문제가 있습니다!")
-    
-    # MLflow Run 시작
-    with mlflow.start_run(run_name="benchmark-results") as run:
-        # 크기 메트릭
-        mlflow.log_metric("original_size_kb", original_size)
-        mlflow.log_metric("onnx_size_kb", onnx_size)
-        mlflow.log_metric("quantized_size_kb", quant_size)
-        
-        # 속도 메트릭
-        mlflow.log_metric("original_inference_ms", original_time)
-        mlflow.log_metric("onnx_inference_ms", onnx_time)
-        mlflow.log_metric("quantized_inference_ms", quant_time)
-        mlflow.log_metric("onnx_speedup", onnx_speedup)
-        mlflow.log_metric("quantized_speedup", quant_speedup)
-        
-        # 정확도 메트릭
-        mlflow.log_metric("original_accuracy", test_accuracy)
-        mlflow.log_metric("onnx_accuracy", onnx_accuracy)
-        mlflow.log_metric("quantized_accuracy", quant_accuracy)
-        
-        # 파라미터
-        mlflow.log_param("n_iterations", n_iterations)
-        mlflow.log_param("test_samples", len(X_test))
-        mlflow.log_param("quantization_type", "dynamic_uint8")
-        
-        # 아티팩트 (모델 파일)
-        print("\n   아티팩트 업로드 중...")
-        try:
-            mlflow.log_artifact(files['onnx'])
-            mlflow.log_artifact(files['quantized'])
-            print("   ✅ 아티팩트 업로드 완료")
-        except Exception as e:
-            print(f"   ⚠️ 아티팩트 업로드 실패: {e}")
-            print("   IRSA 설정을 확인하세요.")
-        
-        print(f"\n   ✅ MLflow 기록 완료!")
-        print(f"   Run ID: {run.info.run_id}")
-        print(f"   실험: {EXPERIMENT_NAME}")
-    
     # =========================================================================
-    # 최종 결과 요약
+    # Step 3: (선택) MLflow 기록
     # =========================================================================
-    print("\n" + "=" * 60)
-    print("📋 최종 결과 요약")
-    print("=" * 60)
-    print(f"   {'모델':<15} {'크기':<12} {'추론 시간':<15} {'속도 향상':<10} {'정확도':<10}")
-    print(f"   {'-' * 62}")
-    print(f"   {'원본 sklearn':<15} {original_size:.2f} KB{'':<4} {original_time:.4f} ms{'':<6} {'1.0x':<10} {test_accuracy:.4f}")
-    print(f"   {'ONNX':<15} {onnx_size:.2f} KB{'':<4} {onnx_time:.4f} ms{'':<6} {onnx_speedup:.1f}x{'':<6} {onnx_accuracy:.4f}")
-    print(f"   {'양자화':<15} {quant_size:.2f} KB{'':<4} {quant_time:.4f} ms{'':<6} {quant_speedup:.1f}x{'':<6} {quant_accuracy:.4f}")
-    print("=" * 60)
-    
-    print("\n✅ Lab 3-3 실습 완료!")
-    print("   MLflow UI에서 실험 결과를 확인하세요.")
+    if args.mlflow:
+        print("\n📝 Step 3: MLflow 기록")
+        print("-" * 40)
+        log_to_mlflow(report, args.output, args.experiment_name)
+
+    print("\n✅ Lab 3-3 벤치마크 완료!")
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())